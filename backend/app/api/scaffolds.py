@@ -90,6 +90,10 @@ from app.geometry import (
     generate_porous_disc_from_dict,
     generate_primitive_from_dict,
     check_manifold_available,
+    MemoryBudgetExceeded,
+    memory_budget,
+    TessellationPolicy,
+    tessellation_policy,
     # Tubular 7
     generate_tubular_conduit_from_dict,
     generate_vascular_perfusion_dish_from_dict,
@@ -186,6 +190,13 @@ class GenerateRequest(BaseModel):
     params: Dict[str, Any] = Field(default_factory=dict, description="Type-specific parameters")
     preview_only: bool = Field(default=False, description="Skip final boolean operations for speed")
     invert: bool = Field(default=False, description="Invert geometry (swap solid/void spaces)")
+    printer_resolution_um: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=2000,
+        description="Target printer resolution (um) for adaptive tessellation. "
+                    "Defaults to the server setting; 0 disables adaptive tessellation.",
+    )
 
 
 class MeshResponse(BaseModel):
@@ -194,12 +205,17 @@ class MeshResponse(BaseModel):
     vertices: List[float] = Field(description="Flattened vertex array [x,y,z,...]")
     indices: List[int] = Field(description="Triangle indices")
     normals: List[float] = Field(description="Vertex normals [nx,ny,nz,...]")
+    decimated: bool = Field(
+        default=False,
+        description="Whether this viewer mesh was decimated to the triangle budget "
+                    "(the STL is always full resolution)",
+    )
 
 
 class StatsResponse(BaseModel):
     """Generation statistics."""
 
-    triangle_count: int = Field(description="Number of triangles")
+    triangle_count: int = Field(description="Number of triangles in the full-resolution model")
     volume_mm3: float = Field(description="Volume in cubic millimeters")
     generation_time_ms: float = Field(description="Generation time in milliseconds")
 
@@ -1474,6 +1490,49 @@ def _cache_scaffold(scaffold_id: str, manifold, stl_bytes: bytes, metadata: Dict
     _scaffold_cache[scaffold_id] = (manifold, stl_bytes, metadata)
 
 
+def _generate_scaffold_output(request: GenerateRequest, max_triangles: int, start_time: float):
+    """
+    Generate a scaffold and the mesh data the response needs from it.
+
+    Runs in a worker thread, so generation, inversion, viewer mesh
+    decimation and STL export all count towards the request timeout and
+    none of them blocks the event loop.
+
+    Args:
+        request: Generation request
+        max_triangles: Triangle budget of the viewer mesh
+        start_time: Request start (time.time()) for the generation time
+
+    Returns:
+        Tuple of (manifold, stats_dict, generation_time_ms, mesh_dict,
+        (bbox_min, bbox_max), stl_bytes)
+    """
+    manifold, gen_stats = _generate_scaffold(request.type, request.params, request.preview_only)
+
+    # Apply inversion if requested (swap solid/void spaces)
+    if request.invert:
+        # Open TPMS surfaces use MarchingCubesMeshWrapper, not manifold3d.Manifold
+        # Boolean operations are not supported on marching-cubes meshes
+        if not isinstance(manifold, m3d.Manifold):
+            logger.warning(f"Inversion not supported for {request.type} (non-manifold mesh)")
+            raise HTTPException(
+                status_code=400,
+                detail=f"Inversion is not supported for {request.type.value} surfaces. "
+                       "Open TPMS surfaces are zero-thickness sheets; set solid_mode "
+                       "to 'sheet' or 'network' to generate an invertible solid.",
+            )
+        logger.info("Applying geometry inversion...")
+        manifold = _invert_manifold(manifold, padding_mm=1.0)
+
+    generation_time_ms = (time.time() - start_time) * 1000
+
+    # Convert to mesh data, decimated to the viewer budget
+    mesh_dict = manifold_to_mesh_dict(manifold, max_triangles=max_triangles)
+    bounding_box = get_bounding_box(manifold)
+    stl_bytes = manifold_to_stl_binary(manifold)
+    return manifold, gen_stats, generation_time_ms, mesh_dict, bounding_box, stl_bytes
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -1501,43 +1560,39 @@ async def generate_scaffold(request: GenerateRequest) -> GenerateResponse:
     start_time = time.time()
 
     try:
-        # Generate the scaffold with timeout
-        # Run synchronous generation in thread pool with asyncio timeout
-        manifold, gen_stats = await asyncio.wait_for(
-            asyncio.to_thread(
-                _generate_scaffold,
-                request.type,
-                request.params,
-                request.preview_only,
-            ),
-            timeout=timeout_seconds,
+        # Boolean operations inside this block are checked against the
+        # per-request memory budget (the context follows asyncio.to_thread)
+        printer_resolution_um = (
+            request.printer_resolution_um
+            if request.printer_resolution_um is not None
+            else settings.printer_resolution_um
         )
-
-        # Apply inversion if requested (swap solid/void spaces)
-        if request.invert:
-            # TPMS surfaces use _MarchingCubesMeshWrapper, not manifold3d.Manifold
-            # Boolean operations are not supported on marching-cubes meshes
-            if not isinstance(manifold, m3d.Manifold):
-                logger.warning(f"Inversion not supported for {request.type} (non-manifold mesh)")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Inversion is not supported for {request.type.value} scaffolds. "
-                           "TPMS surfaces are thin sheets and cannot be inverted.",
+        policy = TessellationPolicy(printer_resolution_um=printer_resolution_um) if printer_resolution_um > 0 else None
+
+        with memory_budget(settings.max_request_memory_mb, settings.max_process_memory_mb) as budget, tessellation_policy(policy):
+            # Generation, inversion, viewer mesh decimation and STL export all
+            # run in the thread pool under one timeout, off the event loop
+            manifold, gen_stats, generation_time_ms, mesh_dict, (bbox_min, bbox_max), stl_bytes = (
+                await asyncio.wait_for(
+                    asyncio.to_thread(
+                        _generate_scaffold_output,
+                        request,
+                        settings.max_triangles,
+                        start_time,
+                    ),
+                    timeout=timeout_seconds,
                 )
-            logger.info("Applying geometry inversion...")
-            manifold = _invert_manifold(manifold, padding_mm=1.0)
-
-        generation_time_ms = (time.time() - start_time) * 1000
-        logger.info(f"Scaffold generated successfully in {generation_time_ms:.2f}ms")
-
-        # Convert to mesh data
-        mesh_dict = manifold_to_mesh_dict(manifold)
+            )
 
-        # Get bounding box
-        bbox_min, bbox_max = get_bounding_box(manifold)
+        if budget is not None:
+            gen_stats["peak_boolean_estimate_mb"] = budget.peak_mb
+            logger.info(
+                f"Scaffold generated successfully in {generation_time_ms:.2f}ms "
+                f"(largest estimated boolean {budget.peak_mb:.0f}/{budget.limit_mb:.0f} MB)"
+            )
+        else:
+            logger.info(f"Scaffold generated successfully in {generation_time_ms:.2f}ms")
 
-        # Generate STL and encode
-        stl_bytes = manifold_to_stl_binary(manifold)
         stl_base64 = stl_to_base64(stl_bytes)
 
         # Generate scaffold ID and cache
@@ -1561,10 +1616,11 @@ async def generate_scaffold(request: GenerateRequest) -> GenerateResponse:
                 vertices=mesh_dict["vertices"],
                 indices=mesh_dict["indices"],
                 normals=mesh_dict["normals"],
+                decimated=mesh_dict["decimated"],
             ),
             stl_base64=stl_base64,
             stats=StatsResponse(
-                triangle_count=mesh_dict["triangle_count"],
+                triangle_count=mesh_dict["source_triangle_count"],
                 volume_mm3=gen_stats.get("volume_mm3", 0.0),
                 generation_time_ms=generation_time_ms,
             ),
@@ -1582,6 +1638,9 @@ async def generate_scaffold(request: GenerateRequest) -> GenerateResponse:
             status_code=408,
             detail=f"Generation timed out after {timeout_seconds} seconds. Try reducing resolution or complexity.",
         )
+    except MemoryBudgetExceeded as e:
+        logger.warning(f"Scaffold generation exceeded memory budget: {e}")
+        raise HTTPException(status_code=507, detail=str(e))
     except ValueError as e:
         logger.error(f"Invalid parameters for scaffold generation: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -18,6 +18,7 @@ from pydantic import BaseModel, Field, model_validator
 
 from app.config import get_settings
 from app.core.logging import get_logger
+from app.geometry.memory_budget import MemoryBudgetExceeded, memory_budget
 from app.geometry.stl_export import (
     manifold_to_mesh_dict,
     manifold_to_stl_binary,
@@ -28,6 +29,7 @@ from app.geometry.tiling import (
     tile_scaffold_onto_surface,
     TilingParams,
     TilingMode,
+    RefinementMode,
     TargetShape,
 )
 
@@ -80,6 +82,14 @@ class TileRequest(BaseModel):
         default=0.5, gt=0, le=10,
         description="Target edge length before warping (mm). Smaller = smoother.",
     )
+    refinement: Literal["uniform", "adaptive"] = Field(
+        default="uniform",
+        description="'uniform' refines everywhere; 'adaptive' only where the surface bends the sheet",
+    )
+    refine_tolerance_mm: float = Field(
+        default=0.02, gt=0, le=5,
+        description="Adaptive refinement: max deviation of a warped edge from the surface (mm)",
+    )
 
     @model_validator(mode="after")
     def validate_torus_radii(self):
@@ -93,6 +103,7 @@ class TileMeshResponse(BaseModel):
     vertices: List[float]
     indices: List[int]
     normals: List[float]
+    decimated: bool = False  # Viewer mesh decimated to the triangle budget; STL is full resolution
 
 
 class TileStatsResponse(BaseModel):
@@ -121,6 +132,32 @@ class TileResponse(BaseModel):
 # Endpoint
 # ---------------------------------------------------------------------------
 
+def _tile_and_convert(
+    source_manifold: Any,
+    tiling_params: TilingParams,
+    scaffold_id: str,
+    max_triangles: int,
+    start_time: float,
+):
+    """
+    Tile a scaffold and build the viewer mesh and STL of the result.
+
+    Runs in a worker thread, so decimation and STL export count towards the
+    request timeout and do not block the event loop.
+
+    Returns:
+        Tuple of (manifold, tiling_stats, generation_time_ms, mesh_dict,
+        (bbox_min, bbox_max), stl_bytes)
+    """
+    tiled_manifold, tiling_stats = tile_scaffold_onto_surface(source_manifold, tiling_params, scaffold_id)
+    generation_time_ms = (time.time() - start_time) * 1000
+
+    mesh_dict = manifold_to_mesh_dict(tiled_manifold, max_triangles=max_triangles)
+    bounding_box = get_bounding_box(tiled_manifold)
+    stl_bytes = manifold_to_stl_binary(tiled_manifold)
+    return tiled_manifold, tiling_stats, generation_time_ms, mesh_dict, bounding_box, stl_bytes
+
+
 @router.post("/tiling", response_model=TileResponse)
 async def tile_scaffold(request: TileRequest) -> TileResponse:
     """
@@ -129,7 +166,9 @@ async def tile_scaffold(request: TileRequest) -> TileResponse:
     Workflow:
         1. Retrieve source scaffold from cache by scaffold_id
         2. Build tiling parameters
-        3. Run tiling (flat tile -> refine -> UV normalise -> warp)
+        3. Run tiling (flat tile -> refine -> UV normalise -> warp); the
+           refined flat sheet is reused while only the surface changes.
+           The viewer mesh and STL are built in the same worker thread
         4. Return tiled mesh + STL
     """
     settings = get_settings()
@@ -163,16 +202,30 @@ async def tile_scaffold(request: TileRequest) -> TileResponse:
         num_tiles_v=request.num_tiles_v,
         num_layers=request.num_layers,
         layer_spacing_mm=request.layer_spacing_mm,
+        refinement=RefinementMode(request.refinement),
         refine_edge_length_mm=request.refine_edge_length_mm,
+        refine_tolerance_mm=request.refine_tolerance_mm,
     )
 
     # 3. Run tiling with timeout
     start_time = time.time()
     try:
-        tiled_manifold, tiling_stats = await asyncio.wait_for(
-            asyncio.to_thread(tile_scaffold_onto_surface, source_manifold, tiling_params),
-            timeout=timeout_seconds,
-        )
+        with memory_budget(settings.max_request_memory_mb, settings.max_process_memory_mb):
+            # Viewer mesh decimation and STL export run in the same worker
+            # thread, under the same timeout, off the event loop
+            tiled_manifold, tiling_stats, generation_time_ms, mesh_dict, (bbox_min, bbox_max), stl_bytes = (
+                await asyncio.wait_for(
+                    asyncio.to_thread(
+                        _tile_and_convert,
+                        source_manifold,
+                        tiling_params,
+                        request.scaffold_id,
+                        settings.max_triangles,
+                        start_time,
+                    ),
+                    timeout=timeout_seconds,
+                )
+            )
     except asyncio.TimeoutError:
         elapsed = time.time() - start_time
         logger.error(f"Tiling timed out after {elapsed:.1f}s (limit: {timeout_seconds}s)")
@@ -180,19 +233,18 @@ async def tile_scaffold(request: TileRequest) -> TileResponse:
             status_code=408,
             detail=f"Tiling timed out after {timeout_seconds}s. Try fewer tiles or larger edge length.",
         )
+    except MemoryBudgetExceeded as e:
+        logger.warning(f"Tiling exceeded memory budget: {e}")
+        raise HTTPException(status_code=507, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.exception(f"Tiling failed: {e}")
         raise HTTPException(status_code=500, detail=f"Tiling failed: {str(e)}")
 
-    generation_time_ms = (time.time() - start_time) * 1000
     logger.info(f"Tiling completed in {generation_time_ms:.0f}ms")
 
     # 4. Convert to response format
-    mesh_dict = manifold_to_mesh_dict(tiled_manifold)
-    bbox_min, bbox_max = get_bounding_box(tiled_manifold)
-    stl_bytes = manifold_to_stl_binary(tiled_manifold)
     stl_b64 = stl_to_base64(stl_bytes)
 
     # Cache the tiled result
@@ -220,10 +272,11 @@ async def tile_scaffold(request: TileRequest) -> TileResponse:
             vertices=mesh_dict["vertices"],
             indices=mesh_dict["indices"],
             normals=mesh_dict["normals"],
+            decimated=mesh_dict["decimated"],
         ),
         stl_base64=stl_b64,
         stats=TileStatsResponse(
-            triangle_count=mesh_dict["triangle_count"],
+            triangle_count=mesh_dict["source_triangle_count"],
             volume_mm3=tiling_stats.get("volume_mm3", 0.0),
             generation_time_ms=generation_time_ms,
             target_shape=tiling_stats.get("target_shape", request.target_shape),
@@ -17,8 +17,11 @@ class Settings(BaseSettings):
 
     # Generation settings
     default_resolution: int = 16
-    max_triangles: int = 500000
+    max_triangles: int = 500000  # Triangle budget of viewer meshes; larger ones are decimated, STL stays full (0 = off)
     generation_timeout_seconds: int = 60  # Timeout for scaffold generation (must be multiple of 30)
+    max_request_memory_mb: int = 4096  # Per-request memory budget for boolean operations (0 = unlimited)
+    max_process_memory_mb: int = 0  # RSS ceiling of the whole API process, shared by all requests (0 = 90% of the container or machine memory, -1 = none)
+    printer_resolution_um: float = 100.0  # Default target printer resolution for adaptive tessellation (0 = off)
 
     @field_validator('generation_timeout_seconds')
     @classmethod
@@ -64,10 +64,32 @@ from .core import (
     batch_union,
     tree_union,
     tree_union_parallel,
+    union_groups,
     union_pair,
+    budgeted_difference,
+    slab_difference,
+    slab_peak_bytes,
     check_manifold_available,
     get_manifold_module,
 )
+from .memory_budget import (
+    MemoryBudget,
+    MemoryBudgetExceeded,
+    memory_budget,
+    estimate_boolean_peak_bytes,
+)
+from .tessellation import (
+    TessellationPolicy,
+    tessellation_policy,
+    adaptive_cylinder,
+    adaptive_sphere,
+)
+from .stage_cache import (
+    StageCache,
+    StagedBuild,
+    get_stage_cache,
+)
+from .decimation import decimate_mesh
 
 # Legacy generators
 from .vascular import (
@@ -161,6 +183,10 @@ from .lattice import (
     SchwarzPParams,
     generate_schwarz_p,
     generate_schwarz_p_from_dict,
+    TPMSParams,
+    generate_tpms,
+    generate_tpms_from_dict,
+    list_tpms_surfaces,
     OctetTrussParams,
     generate_octet_truss,
     generate_octet_truss_from_dict,
@@ -266,9 +292,29 @@ __all__ = [
     "batch_union",
     "tree_union",
     "tree_union_parallel",
+    "union_groups",
     "union_pair",
+    "budgeted_difference",
+    "slab_difference",
+    "slab_peak_bytes",
     "check_manifold_available",
     "get_manifold_module",
+    # Memory budget
+    "MemoryBudget",
+    "MemoryBudgetExceeded",
+    "memory_budget",
+    "estimate_boolean_peak_bytes",
+    # Adaptive tessellation
+    "TessellationPolicy",
+    "tessellation_policy",
+    "adaptive_cylinder",
+    "adaptive_sphere",
+    # Memoized generator stages
+    "StageCache",
+    "StagedBuild",
+    "get_stage_cache",
+    # Viewer mesh decimation
+    "decimate_mesh",
     # Vascular network
     "VascularParams",
     "make_cyl",
@@ -338,6 +384,10 @@ __all__ = [
     "SchwarzPParams",
     "generate_schwarz_p",
     "generate_schwarz_p_from_dict",
+    "TPMSParams",
+    "generate_tpms",
+    "generate_tpms_from_dict",
+    "list_tpms_surfaces",
     "OctetTrussParams",
     "generate_octet_truss",
     "generate_octet_truss_from_dict",
@@ -3,13 +3,25 @@ Geometry core utilities for efficient boolean operations.
 
 Provides tree reduction and parallel processing for combining manifold geometries.
 These functions are critical for performance when unioning hundreds of segments.
+
+All unions and budgeted_difference check the active per-request memory budget
+(see memory_budget.py) before running, so an oversized boolean fails cleanly
+instead of getting the API process OOM-killed.
 """
 
 from __future__ import annotations
-from typing import List, Optional, Callable, TypeVar
+from typing import List, Optional, Callable, Sequence, TypeVar
 from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import multiprocessing as mp
 
+from .memory_budget import (
+    MemoryBudgetExceeded,
+    check_boolean_budget,
+    estimate_boolean_peak_bytes,
+    get_active_budget,
+)
+
 try:
     import manifold3d as m3d
     HAS_MANIFOLD = True
@@ -59,6 +71,8 @@ def tree_union(manifolds: List[Manifold]) -> Optional[Manifold]:
     if len(manifolds) == 1:
         return manifolds[0]
 
+    check_boolean_budget(manifolds, "union")
+
     current = list(manifolds)
     while len(current) > 1:
         next_level = []
@@ -98,6 +112,8 @@ def tree_union_parallel(
     if len(manifolds) == 1:
         return manifolds[0]
 
+    check_boolean_budget(manifolds, "union")
+
     own_executor = executor is None
     if own_executor:
         executor = ThreadPoolExecutor(max_workers=mp.cpu_count())
@@ -160,6 +176,8 @@ def batch_union(
     if len(manifolds) <= batch_size:
         return tree_union_parallel(manifolds)
 
+    check_boolean_budget(manifolds, "union")
+
     # Process in batches with parallel tree union
     with ThreadPoolExecutor(max_workers=mp.cpu_count()) as executor:
         batches = []
@@ -178,6 +196,238 @@ def batch_union(
         return tree_union_parallel(batches, executor)
 
 
+def union_groups(
+    groups: Sequence[Callable[[], List[Manifold]]],
+    max_workers: Optional[int] = None,
+) -> List[Manifold]:
+    """
+    Build independent groups of manifolds and union each group concurrently.
+
+    Meant for geometry that splits into disjoint-ish parts, such as the
+    subtrees of a branching network: each group's parts are created and
+    unioned on a worker thread, and the caller combines the (far fewer)
+    group results. Workers run in a copy of the caller's context, so they
+    see its memory budget and tessellation policy.
+
+    Args:
+        groups: Callables returning the parts of one group each
+        max_workers: Groups built concurrently (default: CPU count)
+
+    Returns:
+        One manifold per non-empty group, in group order
+    """
+    workers = max(1, min(max_workers or mp.cpu_count(), len(groups)))
+
+    def build(group: Callable[[], List[Manifold]]) -> Optional[Manifold]:
+        parts = group()
+        if workers == 1:
+            return batch_union(parts)
+        combined = tree_union(parts)
+        if combined is not None:
+            # Booleans are lazy; force evaluation so the work happens on this thread
+            combined.num_tri()
+        return combined
+
+    if workers == 1:
+        results = [build(group) for group in groups]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, build, group)
+                for group in groups
+            ]
+            results = [future.result() for future in futures]
+    return [result for result in results if result is not None]
+
+
+def _slab_planes(base: Manifold, num_slabs: int) -> tuple:
+    """Axis and slab boundaries splitting base along its longest axis."""
+    bb = base.bounding_box()
+    extents = [bb[3] - bb[0], bb[4] - bb[1], bb[5] - bb[2]]
+    axis = max(range(3), key=lambda i: extents[i])
+    lo, hi = bb[axis], bb[axis + 3]
+    bounds = [lo + (hi - lo) * i / num_slabs for i in range(num_slabs)] + [hi]
+    return axis, bounds
+
+
+def _slab_operands(
+    operands: Sequence[Manifold],
+    axis: int,
+    bounds: List[float],
+    pad: float,
+) -> List[List[int]]:
+    """Indices of the operands whose bounding box reaches into each slab."""
+    boxes = [op.bounding_box() for op in operands]
+    return [
+        [
+            k for k, bb in enumerate(boxes)
+            if bb[axis] <= end + pad and bb[axis + 3] >= start - pad
+        ]
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+def _as_operands(cutter) -> List[Manifold]:
+    """Cutter operands, from a single manifold or a sequence of them."""
+    if isinstance(cutter, m3d.Manifold):
+        return [cutter]
+    return [op for op in cutter if not op.is_empty()]
+
+
+def slab_difference(
+    base: Manifold,
+    cutter: Manifold | Sequence[Manifold],
+    num_slabs: int,
+) -> Manifold:
+    """
+    Compute base - cutter one slab at a time along the longest axis of base.
+
+    Given the cutter as separate operands (e.g. the pore list before it is
+    unioned), each slab unions only the operands reaching into it, so no
+    boolean ever holds the whole cutter. The cut pieces only meet in a thin
+    overlap around the slab planes and are recombined with a single batch
+    union. A cutter given as one manifold is trimmed whole for every slab.
+
+    Args:
+        base: Manifold to subtract from
+        cutter: Manifold to subtract, or its operands (typically pores/channels)
+        num_slabs: Number of slabs to split the operation into
+
+    Returns:
+        base - cutter
+    """
+    operands = _as_operands(cutter)
+    if not operands:
+        return base
+    if num_slabs <= 1:
+        return base - (operands[0] if len(operands) == 1 else batch_union(operands))
+
+    axis, bounds = _slab_planes(base, num_slabs)
+    # Neighbouring base bands overlap slightly so the final union fuses them
+    # (exactly abutting faces may stay separate shells), and cutter bands
+    # overlap further so no cut face is coplanar with a slab plane
+    overlap = (bounds[-1] - bounds[0]) / num_slabs * 1e-3
+    pad = 2 * overlap
+
+    normal = [0.0, 0.0, 0.0]
+    normal[axis] = 1.0
+    neg_normal = [-n for n in normal]
+
+    budget = get_active_budget()
+    pieces = []
+    for i, selected in enumerate(_slab_operands(operands, axis, bounds, pad)):
+        start, end = bounds[i], bounds[i + 1]
+
+        base_band = base
+        if i > 0:
+            base_band = base_band.trim_by_plane(normal, start - overlap)
+        if i < num_slabs - 1:
+            base_band = base_band.trim_by_plane(neg_normal, -(end + overlap))
+        if base_band.is_empty():
+            continue
+
+        piece = base_band
+        if selected:
+            slab_cutter = batch_union([operands[k] for k in selected])
+            cutter_band = slab_cutter.trim_by_plane(normal, start - pad).trim_by_plane(neg_normal, -(end + pad))
+            if not cutter_band.is_empty():
+                piece = base_band - cutter_band
+        if not piece.is_empty():
+            pieces.append(piece)
+
+        if budget is not None:
+            budget.check("slab-wise difference")
+
+    if not pieces:
+        return m3d.Manifold()
+    if len(pieces) == 1:
+        return pieces[0]
+    return m3d.Manifold.batch_boolean(pieces, m3d.OpType.Add)
+
+
+def slab_peak_bytes(
+    base: Manifold,
+    cutter: Manifold | Sequence[Manifold],
+    num_slabs: int,
+) -> int:
+    """
+    Estimated peak memory of ``slab_difference`` with ``num_slabs`` slabs.
+
+    Every slab trims the whole base and the union of the cutter operands
+    reaching into it, so the largest slab is charged for both in full.
+
+    Args:
+        base: Manifold to subtract from
+        cutter: Manifold to subtract, or its operands
+        num_slabs: Number of slabs
+
+    Returns:
+        Estimated peak bytes of the most expensive slab
+    """
+    operands = _as_operands(cutter)
+    tris = [op.num_tri() for op in operands]
+    if num_slabs <= 1:
+        return estimate_boolean_peak_bytes([base.num_tri()] + tris)
+    axis, bounds = _slab_planes(base, num_slabs)
+    pad = (bounds[-1] - bounds[0]) / num_slabs * 2e-3
+    return max(
+        estimate_boolean_peak_bytes([base.num_tri()] + [tris[k] for k in selected])
+        for selected in _slab_operands(operands, axis, bounds, pad)
+    )
+
+
+def budgeted_difference(
+    base: Manifold,
+    cutter: Manifold | Sequence[Manifold],
+    max_slabs: int = 16,
+) -> Manifold:
+    """
+    Subtract cutter from base within the active per-request memory budget.
+
+    Without an active budget this is simply ``base - cutter``. With one, the
+    peak memory is estimated from the operand triangle counts; if it does not
+    fit the remaining headroom the subtraction falls back to
+    ``slab_difference`` with just enough slabs to fit, and fails cleanly with
+    MemoryBudgetExceeded if even ``max_slabs`` slabs would not. Passing the
+    cutter as its separate operands lets the slabs avoid the full cutter.
+
+    Args:
+        base: Manifold to subtract from
+        cutter: Manifold to subtract, or its operands
+        max_slabs: Upper bound on slab count for the fallback
+
+    Returns:
+        base - cutter
+
+    Raises:
+        MemoryBudgetExceeded: If the operation cannot fit in the budget
+    """
+    budget = get_active_budget()
+    if budget is None:
+        return slab_difference(base, cutter, 1)
+
+    budget.check("difference")
+    estimate = slab_peak_bytes(base, cutter, 1)
+    headroom = budget.headroom_bytes()
+    if estimate <= headroom:
+        budget.admit(estimate)
+        return slab_difference(base, cutter, 1)
+
+    # The recombined result must also fit, so leave half the headroom for it
+    for num_slabs in range(2, max_slabs + 1):
+        slab_estimate = slab_peak_bytes(base, cutter, num_slabs)
+        if slab_estimate <= headroom / 2:
+            budget.admit(slab_estimate)
+            return slab_difference(base, cutter, num_slabs)
+
+    raise MemoryBudgetExceeded(
+        f"difference needs an estimated {estimate / 2**20:.0f} MB, more than "
+        f"{max_slabs} slabs can fit in the remaining "
+        f"{max(headroom, 0) / 2**20:.0f} MB of the {budget.limit_mb:.0f} MB "
+        "per-request memory budget. Reduce resolution, feature count or scaffold size."
+    )
+
+
 def check_manifold_available() -> bool:
     """Check if manifold3d library is available."""
     return HAS_MANIFOLD
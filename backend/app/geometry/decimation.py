@@ -0,0 +1,341 @@
+"""
+Quadric-error mesh decimation for viewport meshes.
+
+TPMS surfaces and fine lattices reach millions of triangles, far more than a
+browser viewport needs to show them. Printing needs every one of them, so STL
+export is left alone; only the mesh sent to the viewer is decimated.
+
+The decimator follows Garland & Heckbert's quadric error metric. Every vertex
+accumulates the planes of its faces as a 4x4 quadric Q, so v^T Q v is the sum
+of squared distances from v to those planes. Collapsing edge (a, b) to point
+v costs v^T (Qa + Qb) v; the cheapest of a, b and their midpoint is used.
+Open boundaries (e.g. where a TPMS sheet is cut by the box) get extra planes
+perpendicular to the boundary so the outline is kept.
+
+Instead of one collapse at a time from a priority queue, each pass collapses
+a batch at once, all in numpy: every vertex nominates its cheapest eligible
+edge and the edges nominated by both endpoints form a matching (no two share
+a vertex). Collapses that would flip a neighbouring face are withdrawn and
+the next cheapest take their place. Passes repeat until the triangle budget
+or the error tolerance is reached.
+
+A pass costs time in proportion to the whole mesh, so huge meshes many times
+over budget are first brought near it by vertex clustering: vertices are merged
+per cell of a uniform grid sized from the surface area. That coarse pass is
+cruder (it may pinch thin features), but it is a single sort, and the
+quadric passes then only work on about twice the budget. An optional time
+limit ends the quadric passes early and clusters straight to the budget.
+
+Usage:
+    >>> verts, faces = decimate_mesh(verts, faces, target_triangles=200_000)
+    >>> mesh_dict = manifold_to_mesh_dict(manifold, max_triangles=200_000)
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Weight of the planes that pin open boundaries in place
+_BOUNDARY_WEIGHT = 100.0
+
+# Upper-triangle entries of a symmetric 4x4 quadric, stored as 10 columns
+_QUADRIC_ROWS, _QUADRIC_COLS = np.triu_indices(4)
+
+# Matching rounds per pass
+_MATCHING_ROUNDS = 3
+
+# Smallest batch of a pass, as a fraction (1/n) of the triangle count
+_MIN_BATCH_FRACTION = 100
+
+# Safety limit on decimation passes
+_MAX_PASSES = 200
+
+# Meshes over this multiple of the budget, and over _CLUSTER_MIN_TRIANGLES,
+# are clustered first, down to _CLUSTER_TARGET times the budget
+_CLUSTER_ABOVE = 4
+_CLUSTER_MIN_TRIANGLES = 1_000_000
+_CLUSTER_TARGET = 2
+
+# Attempts at finding a cluster grid that meets a triangle count
+_CLUSTER_ATTEMPTS = 6
+
+
+def _plane_quadrics(planes: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted quadrics (K, 10) of planes (K, 4) given as [n, d]."""
+    return planes[:, _QUADRIC_ROWS] * planes[:, _QUADRIC_COLS] * weights[:, None]
+
+
+def _quadric_error(quadrics: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """v^T Q v for quadrics (E, 10) and points (E, 3)."""
+    homogeneous = np.column_stack([points, np.ones(len(points))])
+    products = homogeneous[:, _QUADRIC_ROWS] * homogeneous[:, _QUADRIC_COLS]
+    # Off-diagonal entries appear twice in the full symmetric matrix
+    products[:, _QUADRIC_ROWS != _QUADRIC_COLS] *= 2
+    return np.maximum((quadrics * products).sum(axis=1), 0.0)
+
+
+def _face_normals(verts: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Unnormalized face normals (area-weighted)."""
+    v0 = verts[faces[:, 0]]
+    return np.cross(verts[faces[:, 1]] - v0, verts[faces[:, 2]] - v0)
+
+
+def _compact(verts: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Drop vertices no face refers to."""
+    used_mask = np.zeros(len(verts), dtype=bool)
+    used_mask[faces.ravel()] = True
+    used = np.flatnonzero(used_mask)
+    reindex = np.full(len(verts), -1, dtype=np.int64)
+    reindex[used] = np.arange(len(used))
+    return verts[used], reindex[faces]
+
+
+def _cluster_vertices(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    target_triangles: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge vertices per grid cell until at most ``target_triangles`` faces remain.
+
+    Merged vertices move to the mean of their cell; faces that collapse or
+    duplicate another face are dropped.
+    """
+    area = np.linalg.norm(_face_normals(verts, faces), axis=1).sum() / 2
+    origin = verts.min(axis=0)
+    # About two triangles per grid cell the surface crosses
+    cell = np.sqrt(2 * area / max(target_triangles, 1))
+    for _ in range(_CLUSTER_ATTEMPTS):
+        cells = np.floor((verts - origin) / cell).astype(np.int64)
+        shape = cells.max(axis=0) + 1
+        _, cluster = np.unique(np.ravel_multi_index(cells.T, shape), return_inverse=True)
+        cluster = cluster.ravel()
+        merged = cluster[faces]
+        merged = merged[(merged[:, 0] != merged[:, 1]) & (merged[:, 1] != merged[:, 2])
+                        & (merged[:, 2] != merged[:, 0])]
+        # Opposite windings of one triangle are distinct faces of a thin wall
+        keys = np.sort(merged, axis=1)
+        n = cluster.max() + 1
+        orientation = np.linalg.det(np.eye(3)[np.argsort(merged, axis=1)]) > 0
+        _, first = np.unique(((keys[:, 0] * n + keys[:, 1]) * n + keys[:, 2]) * 2 + orientation,
+                             return_index=True)
+        merged = merged[np.sort(first)]
+        if len(merged) <= target_triangles:
+            break
+        cell *= np.sqrt(len(merged) / target_triangles) * 1.05
+
+    counts = np.bincount(cluster)
+    positions = np.stack([np.bincount(cluster, verts[:, k]) for k in range(3)], axis=1) / counts[:, None]
+    return _compact(positions, merged)
+
+
+def _collapse_pass(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    needed: Optional[int],
+    max_cost: Optional[float],
+    blocked: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, int, np.ndarray]:
+    """
+    Collapse one independent batch of cheap edges.
+
+    Returns the new mesh, the collapse count and the keys (lo * n + hi) of
+    edges to skip in later passes because their collapse flipped a face.
+    """
+    n_verts = len(verts)
+    normals = _face_normals(verts, faces)
+    lengths = np.linalg.norm(normals, axis=1)
+    unit = normals / np.maximum(lengths, 1e-300)[:, None]
+    planes = np.column_stack([unit, -(unit * verts[faces[:, 0]]).sum(axis=1)])
+
+    # Edges with the faces they border
+    half_edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    owner = np.tile(np.arange(len(faces)), 3)
+    lo, hi = half_edges.min(axis=1), half_edges.max(axis=1)
+    edges, first, counts = np.unique(lo * n_verts + hi, return_index=True, return_counts=True)
+    a, b = edges // n_verts, edges % n_verts
+
+    # Vertex quadrics from the face planes, plus planes through open boundary
+    # edges perpendicular to their face, which pin the outline
+    plane_quadrics = [_plane_quadrics(planes, (lengths > 0).astype(np.float64))]
+    plane_vertices = [faces.T]
+    boundary = counts == 1
+    on_boundary = np.zeros(n_verts, dtype=bool)
+    if boundary.any():
+        ba, bb, bf = a[boundary], b[boundary], owner[first[boundary]]
+        side = np.cross(verts[bb] - verts[ba], unit[bf])
+        side /= np.maximum(np.linalg.norm(side, axis=1), 1e-300)[:, None]
+        side_planes = np.column_stack([side, -(side * verts[ba]).sum(axis=1)])
+        plane_quadrics.append(_plane_quadrics(side_planes, np.full(len(side), _BOUNDARY_WEIGHT)))
+        plane_vertices.append(np.stack([ba, bb]))
+        on_boundary[ba] = True
+        on_boundary[bb] = True
+    corners = np.concatenate([v.ravel() for v in plane_vertices])
+    per_corner = np.concatenate([np.tile(q, (len(v), 1)) for q, v in zip(plane_quadrics, plane_vertices)])
+    quadrics = np.column_stack([
+        np.bincount(corners, weights=per_corner[:, k], minlength=n_verts)
+        for k in range(per_corner.shape[1])
+    ])
+
+    # Edges are ranked by the cost of collapsing to their midpoint; the
+    # placement (either end or the midpoint) is refined for chosen edges only
+    edge_quadrics = quadrics[a] + quadrics[b]
+    cost = _quadric_error(edge_quadrics, (verts[a] + verts[b]) / 2)
+
+    # An interior edge joining two boundary vertices would pinch the outline;
+    # non-manifold edges are left alone
+    eligible = (counts <= 2) & ~(on_boundary[a] & on_boundary[b] & ~boundary)
+    if max_cost is not None:
+        eligible &= cost <= max_cost
+    if len(blocked):
+        eligible &= ~np.isin(edges, blocked)
+    # Only the cheaper part of the edges competes in one pass, so no edge is
+    # collapsed while many much cheaper ones wait
+    candidates = np.flatnonzero(eligible)
+    limit = len(candidates) // 2 if needed is None else max(len(candidates) // 2, needed)
+    if 0 < limit < len(candidates):
+        candidates = candidates[np.argpartition(cost[candidates], limit - 1)[:limit]]
+    if len(candidates) == 0:
+        return verts, faces, 0, blocked
+
+    # Matching: each vertex nominates its cheapest candidate edge; edges both
+    # ends nominate are taken, and the rest compete again without them
+    order = candidates[np.argsort(cost[candidates], kind="stable")]
+    taken = np.zeros(n_verts, dtype=bool)
+    matched = []
+    for _ in range(_MATCHING_ROUNDS):
+        order = order[~taken[a[order]] & ~taken[b[order]]]
+        if len(order) == 0:
+            break
+        rank = np.arange(len(order))
+        best = np.full(n_verts, len(order), dtype=np.int64)
+        np.minimum.at(best, a[order], rank)
+        np.minimum.at(best, b[order], rank)
+        picked = order[(best[a[order]] == rank) & (best[b[order]] == rank)]
+        taken[a[picked]] = True
+        taken[b[picked]] = True
+        matched.append(picked)
+    chosen = np.concatenate(matched)
+    # Twice the budget leaves room to replace collapses withdrawn below
+    chosen = chosen[np.argsort(cost[chosen], kind="stable")][:None if needed is None else 2 * needed]
+
+    options = np.stack([verts[a[chosen]], verts[b[chosen]], (verts[a[chosen]] + verts[b[chosen]]) / 2])
+    errors = np.stack([_quadric_error(edge_quadrics[chosen], option) for option in options])
+    placement = np.zeros((n_verts, 3))
+    placement[a[chosen]] = options[errors.argmin(axis=0), np.arange(len(chosen))]
+
+    # Withdraw collapses that would flip a surrounding face; the cheapest
+    # remaining ones within the budget replace them
+    owner_of = np.full(n_verts, -1, dtype=np.int64)
+    owner_of[a[chosen]] = np.arange(len(chosen))
+    owner_of[b[chosen]] = np.arange(len(chosen))
+    near = np.flatnonzero((owner_of[faces] >= 0).any(axis=1))
+    near_owners = owner_of[faces[near]]
+    vertex_ids = np.arange(n_verts)
+    flip_free = np.ones(len(chosen), dtype=bool)
+    while True:
+        alive_chosen = flip_free if needed is None else flip_free & (np.cumsum(flip_free) <= needed)
+        live = np.append(alive_chosen, False)[owner_of]
+        remap = np.where(live, a[chosen][np.maximum(owner_of, 0)], vertex_ids)
+        moved = np.where((live & (remap == vertex_ids))[:, None], placement, verts)
+        local = remap[faces[near]]
+        kept = (local[:, 0] != local[:, 1]) & (local[:, 1] != local[:, 2]) & (local[:, 2] != local[:, 0])
+        affected = live[faces[near]].any(axis=1)
+        flipped = kept & affected & ((_face_normals(moved, local) * normals[near]).sum(axis=1) <= 0)
+        if not flipped.any():
+            break
+        bad = near_owners[flipped].ravel()
+        bad = bad[bad >= 0]
+        flip_free[bad[alive_chosen[bad]]] = False
+
+    # Withdrawn edges stay blocked until a collapse changes one of their ends
+    withdrawn = edges[chosen[~flip_free]]
+    blocked = np.concatenate([blocked, withdrawn])
+    collapsed = int(alive_chosen.sum())
+    if collapsed == 0:
+        return verts, faces, 0, blocked
+    touched = np.zeros(n_verts, dtype=bool)
+    touched[a[chosen[alive_chosen]]] = True
+    touched[b[chosen[alive_chosen]]] = True
+    blocked = blocked[~touched[blocked // n_verts] & ~touched[blocked % n_verts]]
+    faces = remap[faces]
+    faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])]
+    return moved, faces, collapsed, blocked
+
+
+def decimate_mesh(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    target_triangles: Optional[int] = None,
+    max_error_mm: Optional[float] = None,
+    max_seconds: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a triangle mesh with quadric-error edge collapses.
+
+    Decimation stops at whichever limit is reached first: the triangle count
+    falls to ``target_triangles``, or no edge can be collapsed without moving
+    the surface by more than ``max_error_mm``. Meshes of over a million
+    triangles and more than four times over ``target_triangles`` are first
+    clustered to about twice the budget.
+
+    Args:
+        verts: Vertex positions (N, 3)
+        faces: Triangle vertex indices (M, 3)
+        target_triangles: Triangle budget (None: limited by error only)
+        max_error_mm: Largest allowed deviation from the original surface,
+            as the root of the quadric error (None: limited by count only)
+        max_seconds: Time after which no further quadric pass starts; a mesh
+            still over ``target_triangles`` is then clustered to it
+            (None: no limit)
+
+    Returns:
+        Tuple of (vertices, faces) of the decimated mesh, with at most
+        ``target_triangles`` faces (the last pass may undershoot by about 1%).
+        Meshes already within budget are returned unchanged.
+
+    Raises:
+        ValueError: If neither limit is given
+    """
+    if target_triangles is None and max_error_mm is None:
+        raise ValueError("decimate_mesh needs a target triangle count or an error tolerance")
+
+    verts = np.asarray(verts, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    if len(faces) == 0 or (target_triangles is not None and len(faces) <= target_triangles):
+        return verts, faces
+
+    deadline = None if max_seconds is None else time.monotonic() + max_seconds
+    if target_triangles is not None and len(faces) > max(_CLUSTER_ABOVE * target_triangles,
+                                                         _CLUSTER_MIN_TRIANGLES):
+        verts, faces = _cluster_vertices(verts, faces, _CLUSTER_TARGET * target_triangles)
+
+    max_cost = max_error_mm ** 2 if max_error_mm is not None else None
+    # Vertex indices stay stable until the final compaction, so edge keys
+    # blocked in one pass stay meaningful in later ones
+    blocked = np.empty(0, dtype=np.int64)
+    for _ in range(_MAX_PASSES):
+        needed = None
+        if target_triangles is not None:
+            # Each interior collapse removes two triangles. A pass costs the
+            # same however few edges it collapses, so the last ones may
+            # undershoot the budget slightly instead of crawling up to it
+            needed = (len(faces) - target_triangles + 1) // 2
+            if needed <= 0:
+                break
+            needed = max(needed, len(faces) // _MIN_BATCH_FRACTION)
+        n_blocked = len(blocked)
+        verts, faces, collapsed, blocked = _collapse_pass(verts, faces, needed, max_cost, blocked)
+        # A pass whose collapses were all withdrawn still blocks them, so the
+        # next one tries other edges; stop once nothing is left to try
+        if collapsed == 0 and len(blocked) == n_blocked:
+            break
+        if deadline is not None and time.monotonic() > deadline:
+            if target_triangles is not None and len(faces) > target_triangles:
+                return _cluster_vertices(*_compact(verts, faces), target_triangles)
+            break
+
+    return _compact(verts, faces)
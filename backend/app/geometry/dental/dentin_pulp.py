@@ -27,6 +27,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Literal
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -129,7 +130,7 @@ def _create_crown(params: DentinPulpParams, res: int) -> m3d.Manifold:
     crown_actual_height = params.crown_height
 
     # Create sphere and cut to get dome (upper hemisphere)
-    crown_sphere = m3d.Manifold.sphere(crown_radius, res)
+    crown_sphere = adaptive_sphere(crown_radius, res)
 
     # Cut plane to create dome (keep upper portion)
     cut_box = m3d.Manifold.cube(
@@ -173,7 +174,7 @@ def _create_single_root(
     root_top_radius = crown_radius * 0.6 if params.root_count > 1 else crown_radius
     root_bottom_radius = params.root_diameter / 2
 
-    root = m3d.Manifold.cylinder(
+    root = adaptive_cylinder(
         params.root_length,
         root_bottom_radius,
         root_top_radius,
@@ -251,7 +252,7 @@ def _create_roots(
 
         # Furcation connecting piece
         furcation_height = min(params.root_furcation_height, params.root_length * 0.75)
-        furcation_cyl = m3d.Manifold.cylinder(
+        furcation_cyl = adaptive_cylinder(
             params.root_length - furcation_height,
             crown_radius * 0.6,
             crown_radius * 0.8,
@@ -337,7 +338,7 @@ def _create_pulp_chamber(
 
     if params.root_count == 1:
         # Single canal
-        canal = m3d.Manifold.cylinder(
+        canal = adaptive_cylinder(
             params.root_length * 0.95,
             canal_bottom_radius,
             canal_top_radius,
@@ -350,7 +351,7 @@ def _create_pulp_chamber(
         # Two canals
         spread = crown_radius * 0.25
         for offset_x in [-spread, spread]:
-            canal = m3d.Manifold.cylinder(
+            canal = adaptive_cylinder(
                 params.root_length * 0.9,
                 canal_bottom_radius * 0.8,
                 canal_top_radius * 0.7,
@@ -367,7 +368,7 @@ def _create_pulp_chamber(
             (0, -crown_radius * 0.25)                     # Palatal
         ]
         for px, py in positions:
-            canal = m3d.Manifold.cylinder(
+            canal = adaptive_cylinder(
                 params.root_length * 0.85,
                 canal_bottom_radius * 0.7,
                 canal_top_radius * 0.6,
@@ -412,7 +413,7 @@ def _create_enamel_shell(
 
     # Create outer enamel surface as scaled sphere dome
     avg_enamel = (params.enamel_thickness_occlusal + params.enamel_thickness_cervical) / 2
-    outer_sphere = m3d.Manifold.sphere(crown_radius + avg_enamel, res)
+    outer_sphere = adaptive_sphere(crown_radius + avg_enamel, res)
 
     # Cut to hemisphere
     cut_box = m3d.Manifold.cube(
@@ -427,7 +428,7 @@ def _create_enamel_shell(
     outer_crown = outer_crown.scale([1, 1, scale_z])
 
     # Create inner surface (original crown shape) to subtract
-    inner_sphere = m3d.Manifold.sphere(crown_radius, res)
+    inner_sphere = adaptive_sphere(crown_radius, res)
     inner_cut_box = m3d.Manifold.cube(
         [params.crown_diameter * 2, params.crown_diameter * 2, crown_radius],
         center=True
@@ -467,7 +468,7 @@ def _create_cementum_layer(
     thickness = params.cementum_thickness
 
     # Outer cementum surface
-    outer = m3d.Manifold.cylinder(
+    outer = adaptive_cylinder(
         params.root_length,
         root_bottom_radius + thickness,
         root_top_radius + thickness,
@@ -475,7 +476,7 @@ def _create_cementum_layer(
     )
 
     # Inner surface (original root)
-    inner = m3d.Manifold.cylinder(
+    inner = adaptive_cylinder(
         params.root_length + 0.01,  # Slightly longer to ensure clean subtraction
         root_bottom_radius,
         root_top_radius,
@@ -549,7 +550,7 @@ def _add_dej_texture(
 
             # Create bump that's large enough to protrude from surface
             bump_radius = scallop_size * size_var * 2  # Make bumps larger
-            bump = m3d.Manifold.sphere(bump_radius, max(4, res // 4))
+            bump = adaptive_sphere(bump_radius, max(4, res // 4))
             bump = bump.translate([x, y, surface_z])
             scallops.append(bump)
 
@@ -624,7 +625,7 @@ def _create_tubule_channels(
 
         # Create tapered cylinder (wider near pulp)
         length = outer_r - inner_r
-        channel = m3d.Manifold.cylinder(
+        channel = adaptive_cylinder(
             length,
             diam_dej / 2,  # Smaller at DEJ end
             diam_pulp / 2,  # Larger at pulp end
@@ -658,7 +659,7 @@ def _create_tubule_channels(
         outer_r = root_r * 0.85
         length = max(0.1, outer_r - inner_r)
 
-        channel = m3d.Manifold.cylinder(
+        channel = adaptive_cylinder(
             length,
             diam_dej * 0.7 / 2,
             diam_pulp * 0.7 / 2,
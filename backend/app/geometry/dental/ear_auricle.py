@@ -24,6 +24,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Literal
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -213,7 +214,7 @@ def _create_antihelix(
     """
     if params.antihelix_depth <= 0:
         # Return empty manifold if no antihelix
-        return m3d.Manifold.sphere(0.01, 4).translate([1000, 1000, 1000])
+        return adaptive_sphere(0.01, 4).translate([1000, 1000, 1000])
 
     antihelix_parts = []
 
@@ -224,7 +225,7 @@ def _create_antihelix(
 
     # Main stem of antihelix (lower 2/3)
     stem_height = antihelix_height * 0.65
-    stem = m3d.Manifold.cylinder(
+    stem = adaptive_cylinder(
         stem_height,
         antihelix_radius * 1.2,
         antihelix_radius * 0.8,
@@ -244,7 +245,7 @@ def _create_antihelix(
         crura_angle_rad = np.radians(params.crura_angle)
 
         # Superior crus (upper branch)
-        superior_crus = m3d.Manifold.cylinder(
+        superior_crus = adaptive_cylinder(
             crura_length,
             crura_radius,
             crura_radius * 0.6,
@@ -259,7 +260,7 @@ def _create_antihelix(
         antihelix_parts.append(superior_crus)
 
         # Inferior crus (lower branch)
-        inferior_crus = m3d.Manifold.cylinder(
+        inferior_crus = adaptive_cylinder(
             crura_length * 0.8,
             crura_radius,
             crura_radius * 0.5,
@@ -385,10 +386,10 @@ def _create_antitragus(
 
     if antitragus_scaled < 1.0:
         # Return tiny sphere far away if antitragus is too small
-        return m3d.Manifold.sphere(0.01, 4).translate([1000, 1000, 1000])
+        return adaptive_sphere(0.01, 4).translate([1000, 1000, 1000])
 
     # Antitragus is a small rounded projection
-    antitragus = m3d.Manifold.sphere(antitragus_scaled / 2, max(6, res // 3))
+    antitragus = adaptive_sphere(antitragus_scaled / 2, max(6, res // 3))
 
     # Position below and posterior to tragus
     antitragus = antitragus.translate([
@@ -550,7 +551,7 @@ def _add_surface_texture(
                 size_var = 1.0 + (rng.random() - 0.5) * params.texture_roughness * 0.5
 
                 if params.pore_shape == 'hexagonal':
-                    bump = m3d.Manifold.cylinder(
+                    bump = adaptive_cylinder(
                         bump_radius * size_var * 2,
                         bump_radius * size_var,
                         bump_radius * size_var * 0.7,
@@ -559,7 +560,7 @@ def _add_surface_texture(
                     # Random rotation for variety
                     bump = bump.rotate([rng.random() * 90, rng.random() * 90, 0])
                 else:
-                    bump = m3d.Manifold.sphere(bump_radius * size_var, bump_res)
+                    bump = adaptive_sphere(bump_radius * size_var, bump_res)
 
                 bump = bump.translate([x, y, z])
                 texture_bumps.append(bump)
@@ -649,7 +650,7 @@ def _create_porous_structure(
         size_var = 1.0 + (rng.random() - 0.5) * params.randomness * 0.3
 
         if params.pore_shape == 'hexagonal':
-            pore = m3d.Manifold.cylinder(
+            pore = adaptive_cylinder(
                 pore_size_scaled * size_var,
                 pore_size_scaled * size_var / 2,
                 pore_size_scaled * size_var / 2,
@@ -658,7 +659,7 @@ def _create_porous_structure(
             # Random rotation for variety
             pore = pore.rotate([rng.random() * 90, rng.random() * 90, 0])
         else:
-            pore = m3d.Manifold.sphere(pore_size_scaled * size_var / 2, pore_res)
+            pore = adaptive_sphere(pore_size_scaled * size_var / 2, pore_res)
 
         pore = pore.translate([x, y, z])
         pores.append(pore)
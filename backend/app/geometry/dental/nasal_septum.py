@@ -27,6 +27,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -492,7 +493,7 @@ def _add_edge_rounding(
     # Vertical edges (along Z)
     for x_pos in [x_min, x_max]:
         for y_pos in [y_min, y_max]:
-            edge_cyl = m3d.Manifold.cylinder(
+            edge_cyl = adaptive_cylinder(
                 height + 2 * edge_radius,
                 edge_radius,
                 edge_radius,
@@ -504,7 +505,7 @@ def _add_edge_rounding(
     # Horizontal edges along X (at top and bottom Z)
     for z_pos in [z_min, z_max]:
         for y_pos in [y_min, y_max]:
-            edge_cyl = m3d.Manifold.cylinder(
+            edge_cyl = adaptive_cylinder(
                 length + 2 * edge_radius,
                 edge_radius,
                 edge_radius,
@@ -517,7 +518,7 @@ def _add_edge_rounding(
     # Horizontal edges along Y (thickness direction)
     for x_pos in [x_min, x_max]:
         for z_pos in [z_min, z_max]:
-            edge_cyl = m3d.Manifold.cylinder(
+            edge_cyl = adaptive_cylinder(
                 thickness + 2 * edge_radius,
                 edge_radius,
                 edge_radius,
@@ -531,7 +532,7 @@ def _add_edge_rounding(
     for x_pos in [x_min, x_max]:
         for y_pos in [y_min, y_max]:
             for z_pos in [z_min, z_max]:
-                corner = m3d.Manifold.sphere(edge_radius, cyl_res)
+                corner = adaptive_sphere(edge_radius, cyl_res)
                 corner = corner.translate([x_pos, y_pos, z_pos])
                 edge_pieces.append(corner)
 
@@ -690,7 +691,7 @@ def _add_porous_structure(
                 size_variation = 1 + params.randomness * rng.uniform(-0.2, 0.2)
                 current_radius = pore_radius * size_variation
 
-                pore = m3d.Manifold.sphere(current_radius, pore_res)
+                pore = adaptive_sphere(current_radius, pore_res)
                 pore = pore.translate([x, y, z])
                 pores.append(pore)
 
@@ -751,7 +752,7 @@ def _add_vascular_channels(
                 z += rng.uniform(-1, 1) * params.randomness * channel_spacing * 0.2
 
             # Create channel cylinder
-            channel = m3d.Manifold.cylinder(
+            channel = adaptive_cylinder(
                 length + 2,  # Extend beyond edges
                 channel_radius,
                 channel_radius,
@@ -886,7 +887,7 @@ def _add_cell_guidance_channels(
                 x += rng.uniform(-1, 1) * params.randomness * channel_spacing * 0.3
                 y += rng.uniform(-1, 1) * params.randomness * channel_spacing * 0.3
 
-            channel = m3d.Manifold.cylinder(
+            channel = adaptive_cylinder(
                 height + 2,
                 channel_radius,
                 channel_radius,
@@ -943,7 +944,7 @@ def _add_suture_holes(
         x = x_min + edge_inset + i * (length - 2 * edge_inset) / max(1, n_bottom - 1)
         z = z_min + edge_inset
 
-        hole = m3d.Manifold.cylinder(
+        hole = adaptive_cylinder(
             thickness + 2,
             hole_radius,
             hole_radius,
@@ -959,7 +960,7 @@ def _add_suture_holes(
         x = x_min + edge_inset + i * (length - 2 * edge_inset) / max(1, n_top - 1)
         z = z_max - edge_inset
 
-        hole = m3d.Manifold.cylinder(
+        hole = adaptive_cylinder(
             thickness + 2,
             hole_radius,
             hole_radius,
@@ -975,7 +976,7 @@ def _add_suture_holes(
         x = x_min + edge_inset
         z = z_min + edge_inset + i * (height - 2 * edge_inset) / max(1, n_left - 1)
 
-        hole = m3d.Manifold.cylinder(
+        hole = adaptive_cylinder(
             thickness + 2,
             hole_radius,
             hole_radius,
@@ -991,7 +992,7 @@ def _add_suture_holes(
         x = x_max - edge_inset
         z = z_min + edge_inset + i * (height - 2 * edge_inset) / max(1, n_right - 1)
 
-        hole = m3d.Manifold.cylinder(
+        hole = adaptive_cylinder(
             thickness + 2,
             hole_radius,
             hole_radius,
@@ -8,6 +8,7 @@ and recursive branching networks for vascular and airway structures.
 from __future__ import annotations
 from typing import List, Tuple, Optional
 import numpy as np
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 try:
     import manifold3d as m3d
@@ -63,7 +64,7 @@ def create_bifurcation(
         ...     branch_radius=0.35
         ... )
     """
-    m3d = _get_manifold()
+    _get_manifold()
     from .mesh_utils import tree_union
 
     n_branches = len(branch_ends)
@@ -81,7 +82,7 @@ def create_bifurcation(
     trunk_dir = trunk_vec / trunk_len
 
     # Create trunk cylinder
-    trunk_cyl = m3d.Manifold.cylinder(trunk_len, trunk_radius, trunk_radius, n_sides)
+    trunk_cyl = adaptive_cylinder(trunk_len, trunk_radius, trunk_radius, n_sides)
 
     # Rotate to align with direction
     z_axis = np.array([0, 0, 1])
@@ -111,7 +112,7 @@ def create_bifurcation(
     solids.append(trunk_cyl)
 
     # Junction sphere at split point
-    junction_sphere = m3d.Manifold.sphere(trunk_radius * 1.1, n_sides)
+    junction_sphere = adaptive_sphere(trunk_radius * 1.1, n_sides)
     junction_sphere = junction_sphere.translate(list(split_point))
     solids.append(junction_sphere)
 
@@ -125,7 +126,7 @@ def create_bifurcation(
         branch_dir = branch_vec / branch_len
 
         # Tapered cylinder: starts at trunk_radius * 0.8, ends at branch_radius
-        branch_cyl = m3d.Manifold.cylinder(
+        branch_cyl = adaptive_cylinder(
             branch_len,
             trunk_radius * 0.8,  # Larger at junction
             branch_radius,       # Smaller at end
@@ -245,7 +246,7 @@ def create_branching_network(
         ...     direction=(0, 0, 1)
         ... )
     """
-    m3d = _get_manifold()
+    _get_manifold()
     from .mesh_utils import tree_union
 
     if generations < 1:
@@ -271,7 +272,7 @@ def create_branching_network(
         end_pos = pos + direction * length
 
         # Create this segment
-        cyl = m3d.Manifold.cylinder(length, radius, radius, n_sides)
+        cyl = adaptive_cylinder(length, radius, radius, n_sides)
 
         # Rotate to align with direction
         z_axis = np.array([0, 0, 1])
@@ -301,7 +302,7 @@ def create_branching_network(
         solids.append(cyl)
 
         # Add junction sphere
-        sphere = m3d.Manifold.sphere(radius * 0.99, n_sides)
+        sphere = adaptive_sphere(radius * 0.99, n_sides)
         sphere = sphere.translate(list(end_pos))
         solids.append(sphere)
 
@@ -8,6 +8,7 @@ using manifold3d. All functions work without pyvista dependencies.
 from __future__ import annotations
 from typing import List, Tuple, Optional
 import numpy as np
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 try:
     import manifold3d as m3d
@@ -56,15 +57,15 @@ def create_hollow_vertical_tube(
     Raises:
         ImportError: If manifold3d is not available
     """
-    m3d = _get_manifold()
+    _get_manifold()
 
     inner_radius = radius - wall_thickness
     if inner_radius <= 0:
         # If wall is too thick, just return solid cylinder
-        return m3d.Manifold.cylinder(height, radius, radius, resolution).translate([x, y, 0])
+        return adaptive_cylinder(height, radius, radius, resolution).translate([x, y, 0])
 
     # Create outer cylinder
-    outer = m3d.Manifold.cylinder(height, radius, radius, resolution)
+    outer = adaptive_cylinder(height, radius, radius, resolution)
 
     # Inner cylinder - extend beyond ends to ensure clean subtraction
     inner_ext = 0.1  # Extension amount
@@ -77,7 +78,7 @@ def create_hollow_vertical_tube(
     if not cap_top:
         inner_height += inner_ext
 
-    inner = m3d.Manifold.cylinder(inner_height, inner_radius, inner_radius, resolution)
+    inner = adaptive_cylinder(inner_height, inner_radius, inner_radius, resolution)
     inner = inner.translate([0, 0, inner_z_offset])
 
     # Subtract inner from outer to create hollow tube
@@ -109,7 +110,7 @@ def create_hollow_sinusoid(
     Raises:
         ImportError: If manifold3d is not available
     """
-    m3d = _get_manifold()
+    _get_manifold()
 
     x1, y1, z1 = start_pos
     x2, y2, z2 = end_pos
@@ -123,7 +124,7 @@ def create_hollow_sinusoid(
     inner_radius = radius - wall_thickness
     if inner_radius <= 0:
         # Wall too thick, return solid cylinder
-        cyl = m3d.Manifold.cylinder(length, radius, radius, resolution)
+        cyl = adaptive_cylinder(length, radius, radius, resolution)
         # Rotate to align with direction
         h = np.sqrt(dx*dx + dy*dy)
         if h > 0.001 or abs(dz) > 0.001:
@@ -133,11 +134,11 @@ def create_hollow_sinusoid(
         return cyl.translate([x1, y1, z1])
 
     # Create outer cylinder
-    outer = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    outer = adaptive_cylinder(length, radius, radius, resolution)
 
     # Create inner cylinder - extend beyond both ends to ensure open ends
     inner_ext = 0.1
-    inner = m3d.Manifold.cylinder(length + 2 * inner_ext, inner_radius, inner_radius, resolution)
+    inner = adaptive_cylinder(length + 2 * inner_ext, inner_radius, inner_radius, resolution)
     inner = inner.translate([0, 0, -inner_ext])
 
     # Hollow tube
@@ -181,7 +182,7 @@ def create_solid_tube_manifold(
     if len(points) < 2:
         return None
 
-    m3d = _get_manifold()
+    _get_manifold()
     from .mesh_utils import tree_union
 
     pts = np.array(points)
@@ -201,7 +202,7 @@ def create_solid_tube_manifold(
             continue
 
         direction = direction / length
-        cyl = m3d.Manifold.cylinder(length, r1, r2, segments)
+        cyl = adaptive_cylinder(length, r1, r2, segments)
 
         z_axis = np.array([0, 0, 1])
         dot = np.dot(z_axis, direction)
@@ -229,7 +230,7 @@ def create_solid_tube_manifold(
 
         # Add junction sphere at intermediate points
         if i < n - 2:
-            sphere = m3d.Manifold.sphere(r2 * 0.99, segments)
+            sphere = adaptive_sphere(r2 * 0.99, segments)
             sphere = sphere.translate(list(p2))
             solids.append(sphere)
 
@@ -306,7 +307,7 @@ def create_hollow_vessel_network(
     if not tube_specs:
         return None
 
-    m3d = _get_manifold()
+    _get_manifold()
     from .mesh_utils import tree_union
 
     exterior_solids = []
@@ -350,13 +351,13 @@ def create_hollow_vessel_network(
     if junction_spheres:
         for pos, radius in junction_spheres:
             # Exterior sphere
-            sphere_out = m3d.Manifold.sphere(radius, segments)
+            sphere_out = adaptive_sphere(radius, segments)
             sphere_out = sphere_out.translate(list(pos))
             exterior_solids.append(sphere_out)
 
             # Interior sphere (hollow)
             inner_r = max(radius - wall_thickness, radius * 0.5)
-            sphere_in = m3d.Manifold.sphere(inner_r, segments)
+            sphere_in = adaptive_sphere(inner_r, segments)
             sphere_in = sphere_in.translate(list(pos))
             interior_solids.append(sphere_in)
 
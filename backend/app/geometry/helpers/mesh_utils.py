@@ -227,12 +227,15 @@ def subtract_all(
     Subtract multiple manifolds from a base manifold efficiently.
 
     Unions all subtractors first, then performs a single subtraction.
-    More efficient than sequential subtractions.
+    More efficient than sequential subtractions. The subtraction respects
+    the active per-request memory budget (see core.budgeted_difference),
+    which unions only the subtractors of each slab when the whole union
+    would not fit.
 
     Args:
         base: Base manifold to subtract from
         subtractors: List of manifolds to subtract
-        batch_size: Batch size for combining subtractors
+        batch_size: Unused, kept for compatibility
 
     Returns:
         Base manifold with all subtractors removed
@@ -245,8 +248,9 @@ def subtract_all(
     if not subtractors:
         return base
 
-    combined_subtractor = batch_union(subtractors, batch_size)
-    return base - combined_subtractor
+    from ..core import budgeted_difference
+
+    return budgeted_difference(base, subtractors)
 
 
 def intersect_all(manifolds: List[Manifold]) -> Optional[Manifold]:
@@ -10,6 +10,8 @@ Basic:
 Advanced TPMS (Triply Periodic Minimal Surfaces):
 - Gyroid: TPMS with excellent permeability and mechanical properties
 - Schwarz P: TPMS with cubic symmetry topology
+- Generic TPMS: any surface in the implicit-surface registry
+  (gyroid, schwarz_p, diamond, iwp, neovius)
 
 Strut-Based:
 - Octet Truss: High strength-to-weight ratio lattice
@@ -38,6 +40,19 @@ from .schwarz_p import (
     generate_schwarz_p,
     generate_schwarz_p_from_dict,
 )
+from .tpms import (
+    TPMSDefinition,
+    TPMSParams,
+    tpms_surface,
+    get_tpms_surface,
+    list_tpms_surfaces,
+    tpms_field,
+    extract_tpms_surface,
+    build_tpms_solid,
+    get_tpms_cell_cache,
+    generate_tpms,
+    generate_tpms_from_dict,
+)
 
 # Advanced strut-based
 from .octet_truss import (
@@ -72,6 +87,18 @@ __all__ = [
     "SchwarzPParams",
     "generate_schwarz_p",
     "generate_schwarz_p_from_dict",
+    # TPMS engine
+    "TPMSDefinition",
+    "TPMSParams",
+    "tpms_surface",
+    "get_tpms_surface",
+    "list_tpms_surfaces",
+    "tpms_field",
+    "extract_tpms_surface",
+    "build_tpms_solid",
+    "get_tpms_cell_cache",
+    "generate_tpms",
+    "generate_tpms_from_dict",
     # Octet Truss
     "OctetTrussParams",
     "generate_octet_truss",
@@ -0,0 +1,495 @@
+"""
+Adaptive, octree-culled marching cubes for implicit scaffolds.
+
+Uniform marching cubes samples every point of the bounding box at the finest
+spacing, although the surface only passes through a thin band of it, and
+spends as many triangles on nearly flat patches as on tightly curved necks.
+
+Here the sample grid is split into leaf blocks of ``block_cubes`` cubes:
+
+1. Octree culling. Blocks are grouped into an octree; a node whose center
+   value differs from the level by more than ``lipschitz * half_diagonal``
+   cannot contain the surface and is dropped with all its children. Only
+   one sample per node is evaluated.
+2. Level of detail. Each remaining block is sampled at twice the spacing
+   first. Where linear interpolation of those coarse samples would misplace
+   the surface by more than ``tolerance`` (a curvature measure: second
+   differences over gradient), the block is resampled at full resolution.
+3. Crack-free stitching. Samples a fine block shares with a coarse
+   neighbour are replaced by the coarse grid's multilinear interpolation,
+   so both sides cut every shared coarse edge at the same point. The few
+   fine vertices left inside a shared coarse face are projected onto the
+   coarse contour segment and the coarse triangle is split there, which
+   removes the T-junctions and leaves a conforming mesh.
+
+Blocks with equal levels share their boundary samples exactly and are joined
+by the same vertex-hash weld as the slab mesher.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .slab_marching import (
+    FieldFunction,
+    HAS_SKIMAGE,
+    concatenate_meshes,
+    marching_cubes,
+    weld_vertices,
+)
+
+# Cubes per leaf block edge (must be even)
+DEFAULT_BLOCK_CUBES = 16
+
+# Allowed surface misplacement of a coarse block, in fine sample spacings
+DEFAULT_TOLERANCE = 0.05
+
+# Interface vertices closer than this to a coarse vertex are merged into it
+# (in fine grid-index units)
+_MERGE_DISTANCE = 1e-3
+
+# Leaf block levels
+_CULLED, _COARSE, _FINE = 0, 1, 2
+
+
+@dataclass
+class AdaptiveExtractionStats:
+    """Work done by one adaptive extraction."""
+    samples: int = 0
+    dense_samples: int = 0
+    blocks_culled: int = 0
+    blocks_coarse: int = 0
+    blocks_fine: int = 0
+    t_junctions_resolved: int = 0
+
+
+def estimate_lipschitz(
+    field_fn: FieldFunction,
+    bounds: Tuple[float, float, float, float, float, float],
+    samples: int = 24,
+    safety: float = 1.5,
+) -> float:
+    """
+    Estimate an upper bound on |grad F| from a coarse lattice of samples.
+
+    Args:
+        field_fn: Implicit field
+        bounds: (min_x, min_y, min_z, max_x, max_y, max_z) region to sample
+        samples: Lattice points per axis
+        safety: Multiplier applied to the largest sampled gradient
+
+    Returns:
+        Estimated Lipschitz constant in field units per millimeter
+    """
+    axes = [np.linspace(bounds[i], bounds[i + 3], samples) for i in range(3)]
+    field = np.broadcast_to(
+        field_fn(axes[0][:, None, None], axes[1][None, :, None], axes[2][None, None, :]),
+        (samples, samples, samples),
+    )
+    spacing = [max(a[1] - a[0], 1e-12) for a in axes]
+    grads = np.gradient(field, *spacing)
+    magnitude = np.sqrt(sum(g * g for g in grads))
+    return float(magnitude.max() * safety)
+
+
+def _upsample(coarse: np.ndarray) -> np.ndarray:
+    """Multilinear interpolation of a coarse grid onto twice the resolution."""
+    out = coarse
+    for axis in range(3):
+        shape = list(out.shape)
+        shape[axis] = 2 * shape[axis] - 1
+        fine = np.empty(shape, dtype=out.dtype)
+        even = [slice(None)] * 3
+        odd = [slice(None)] * 3
+        even[axis] = slice(0, None, 2)
+        odd[axis] = slice(1, None, 2)
+        fine[tuple(even)] = out
+        lo = [slice(None)] * 3
+        hi = [slice(None)] * 3
+        lo[axis] = slice(0, -1)
+        hi[axis] = slice(1, None)
+        fine[tuple(odd)] = (out[tuple(lo)] + out[tuple(hi)]) / 2
+        out = fine
+    return out
+
+
+def _coarse_error(coarse: np.ndarray, level: float) -> float:
+    """
+    Surface misplacement of linear interpolation on a coarse block.
+
+    Interpolating a field with second difference D2 along an edge misplaces
+    the crossing by about |D2| / 8 / |gradient| (in coarse spacings). Only
+    samples within one coarse spacing of the surface are considered.
+    """
+    value = coarse - level
+    worst = 0.0
+    grads = np.gradient(coarse)
+    grad = np.sqrt(sum(g * g for g in grads))
+    for axis in range(3):
+        n = coarse.shape[axis]
+        if n < 3:
+            continue
+        mid = [slice(None)] * 3
+        lo = [slice(None)] * 3
+        hi = [slice(None)] * 3
+        mid[axis] = slice(1, -1)
+        lo[axis] = slice(0, -2)
+        hi[axis] = slice(2, None)
+        d2 = np.abs(coarse[tuple(hi)] - 2 * coarse[tuple(mid)] + coarse[tuple(lo)])
+        g = np.maximum(grad[tuple(mid)], 1e-9)
+        near = np.abs(value[tuple(mid)]) <= g
+        if near.any():
+            worst = max(worst, float((d2[near] / 8 / g[near]).max()))
+    return worst
+
+
+def adaptive_marching_cubes(
+    field_fn: FieldFunction,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    level: float = 0.0,
+    lipschitz: Optional[float] = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    block_cubes: int = DEFAULT_BLOCK_CUBES,
+    max_workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, AdaptiveExtractionStats]:
+    """
+    Extract an isosurface with octree culling and per-block level of detail.
+
+    Args:
+        field_fn: Implicit field evaluated on broadcast coordinate arrays
+        x, y, z: Uniformly spaced 1-D sample coordinates of the finest level,
+            each with an even number of cubes (odd counts are extended by
+            one sample)
+        level: Isosurface level
+        lipschitz: Upper bound on |grad F| (estimated if None)
+        tolerance: Allowed surface misplacement of coarse blocks, in fine
+            sample spacings; 0 forces every block to full resolution
+        block_cubes: Cubes per leaf block edge (even)
+        max_workers: Blocks meshed concurrently (default: CPU count)
+
+    Returns:
+        Tuple of (vertices (N, 3) in world coordinates, faces (M, 3), stats).
+        Vertices and faces are empty if the level is never crossed.
+
+    Raises:
+        ImportError: If scikit-image is not installed
+        ValueError: If block_cubes is not a positive even number
+    """
+    if not HAS_SKIMAGE:
+        raise ImportError(
+            "scikit-image is required for TPMS generation. "
+            "Install with: pip install scikit-image"
+        )
+    if block_cubes < 2 or block_cubes % 2:
+        raise ValueError(f"block_cubes must be a positive even number, got {block_cubes}")
+
+    spacing = np.array([x[1] - x[0], y[1] - y[0], z[1] - z[0]], dtype=np.float64)
+    origin = np.array([x[0], y[0], z[0]], dtype=np.float64)
+    cubes = np.array([len(x) - 1, len(y) - 1, len(z) - 1])
+    cubes += cubes % 2  # coarse blocks need an even number of cubes
+    B = block_cubes
+    n_blocks = -(-cubes // B)
+
+    stats = AdaptiveExtractionStats(dense_samples=int(np.prod(cubes + 1)))
+
+    def world(idx: np.ndarray, axis: int) -> np.ndarray:
+        return origin[axis] + idx * spacing[axis]
+
+    def settle(field: np.ndarray) -> np.ndarray:
+        # Samples (almost) at the level put several vertices on one point,
+        # which the weld would fuse into non-manifold edges; every block
+        # moves them off the level the same way
+        field[np.abs(field - level) < nudge] = level + nudge
+        return field
+
+    def sample(lo: np.ndarray, hi: np.ndarray, step: int, parity=(0, 0, 0)) -> np.ndarray:
+        ix, iy, iz = (np.arange(lo[a] + parity[a], hi[a] + 1, step) for a in range(3))
+        values = field_fn(
+            world(ix, 0)[:, None, None], world(iy, 1)[None, :, None], world(iz, 2)[None, None, :]
+        )
+        shape = (len(ix), len(iy), len(iz))
+        stats.samples += int(np.prod(shape))
+        return settle(np.broadcast_to(values, shape).astype(np.float32))
+
+    def sample_fine(lo: np.ndarray, hi: np.ndarray, coarse: np.ndarray) -> np.ndarray:
+        # The coarse samples are every other fine sample; evaluate the other 7/8
+        field = np.empty(tuple(hi - lo + 1), dtype=np.float32)
+        for parity in np.ndindex(2, 2, 2):
+            target = tuple(slice(p, None, 2) for p in parity)
+            field[target] = coarse if parity == (0, 0, 0) else sample(lo, hi, 2, parity)
+        return field
+
+    # 1. Octree culling over leaf blocks, one center sample per node
+    if lipschitz is None:
+        hi_world = origin + cubes * spacing
+        lipschitz = estimate_lipschitz(field_fn, (*origin, *hi_world))
+        stats.samples += 24 ** 3
+
+    active: List[Tuple[int, int, int]] = []
+    nodes = [(np.zeros(3, dtype=int), n_blocks.copy())]
+    while nodes:
+        lo_idx = np.array([lo * B for lo, _ in nodes])
+        hi_idx = np.array([np.minimum(hi * B, cubes) for _, hi in nodes])
+        center = (lo_idx + hi_idx) / 2
+        values = np.asarray(field_fn(world(center[:, 0], 0), world(center[:, 1], 1), world(center[:, 2], 2)))
+        values = np.broadcast_to(values, (len(nodes),))
+        stats.samples += len(nodes)
+        half_diag = np.linalg.norm((hi_idx - lo_idx) * spacing, axis=1) / 2
+        reachable = np.abs(values - level) <= lipschitz * half_diag + 1e-12
+
+        next_nodes = []
+        for (lo, hi), keep in zip(nodes, reachable):
+            count = hi - lo
+            if not keep:
+                stats.blocks_culled += int(np.prod(count))
+                continue
+            if np.all(count == 1):
+                active.append(tuple(int(v) for v in lo))
+                continue
+            mid = lo + np.maximum(count // 2, 1)
+            for corner in np.ndindex(2, 2, 2):
+                c_lo = np.where(np.array(corner) == 0, lo, mid)
+                c_hi = np.where(np.array(corner) == 0, np.where(count > 1, mid, hi), hi)
+                if np.all(c_hi > c_lo):
+                    next_nodes.append((c_lo, c_hi))
+        nodes = next_nodes
+
+    if not active:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), stats
+
+    nudge = np.float32(1e-4 * lipschitz * spacing.min())
+
+    # 2. Level of detail from the coarse samples of every active block. Every
+    # point of a block is within one fine cube diagonal of a coarse sample,
+    # which also culls blocks the octree test could not rule out.
+    levels = np.zeros(tuple(n_blocks + 2), dtype=np.int8)  # padded by one block
+    coarse_fields: Dict[Tuple[int, int, int], np.ndarray] = {}
+    reach = lipschitz * float(np.linalg.norm(spacing))
+    for block in list(active):
+        lo = np.array(block) * B
+        hi = np.minimum(lo + B, cubes)
+        coarse = sample(lo, hi, 2)
+        if coarse.min() - reach > level or coarse.max() + reach < level:
+            stats.blocks_culled += 1
+            active.remove(block)
+            continue
+        error = _coarse_error(coarse, level) * 2  # in fine spacings
+        fine = tolerance <= 0 or error > tolerance
+        levels[tuple(np.array(block) + 1)] = _FINE if fine else _COARSE
+        coarse_fields[block] = coarse
+
+    # 3. Mesh every block in fine grid-index coordinates
+    def mesh_block(block: Tuple[int, int, int]) -> Tuple[np.ndarray, np.ndarray, bool]:
+        b = np.array(block)
+        lo = b * B
+        hi = np.minimum(lo + B, cubes)
+        is_coarse = levels[tuple(b + 1)] == _COARSE
+
+        if is_coarse:
+            field = coarse_fields[block]
+            scale = 2
+        else:
+            field = sample_fine(lo, hi, coarse_fields[block])
+            # Samples shared with a coarse neighbour come from its coarse grid
+            neighbours = levels[b[0]:b[0] + 3, b[1]:b[1] + 3, b[2]:b[2] + 3]
+            if (neighbours == _COARSE).any():
+                interpolated = _upsample(field[::2, ::2, ::2])
+                mask = np.zeros(field.shape, dtype=bool)
+                for offset in zip(*np.nonzero(neighbours == _COARSE)):
+                    region = tuple(
+                        slice(0, 1) if d == 0 else slice(-1, None) if d == 2 else slice(None)
+                        for d in offset
+                    )
+                    mask[region] = True
+                field[mask] = interpolated[mask]
+            scale = 1
+
+        if not (field.min() <= level <= field.max()):
+            return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), is_coarse
+        verts, faces, _, _ = marching_cubes(field, level=level)
+        verts = verts.astype(np.float64) * scale + lo
+        return verts, faces.astype(np.int64), is_coarse
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(active)))
+    if workers == 1:
+        block_meshes = [mesh_block(block) for block in active]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            block_meshes = list(executor.map(mesh_block, active))
+
+    stats.blocks_coarse = int((levels == _COARSE).sum())
+    stats.blocks_fine = int((levels == _FINE).sum())
+
+    block_meshes = [m for m in block_meshes if len(m[1]) > 0]
+    if not block_meshes:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64), stats
+
+    verts, faces = concatenate_meshes([(v, f) for v, f, _ in block_meshes])
+    face_coarse = np.concatenate([np.full(len(f), c) for _, f, c in block_meshes])
+    verts, faces = weld_vertices(verts, faces, np.any(np.mod(verts, B) == 0, axis=1))
+
+    if stats.blocks_coarse and stats.blocks_fine:
+        verts, faces, stats.t_junctions_resolved = _resolve_t_junctions(
+            verts, faces, face_coarse, levels, B
+        )
+
+    return verts * spacing + origin, faces, stats
+
+
+def _touches_coarse(verts: np.ndarray, on_plane: np.ndarray, levels: np.ndarray, B: int) -> np.ndarray:
+    """Whether any leaf block sharing each block-plane vertex is coarse."""
+    n_blocks = np.array(levels.shape) - 2
+    # Vertices on the far faces of the box belong to the last block
+    block = np.minimum(np.floor(verts / B).astype(np.int64), n_blocks - 1)
+    touches = np.zeros(len(verts), dtype=bool)
+    for shift in np.ndindex(2, 2, 2):
+        # Step back across the vertex's own planes only (diagonals included)
+        neighbour = block - np.array(shift) * on_plane + 1
+        inside = np.all((neighbour >= 0) & (neighbour < levels.shape), axis=1)
+        idx = np.clip(neighbour, 0, np.array(levels.shape) - 1)
+        touches |= inside & (levels[idx[:, 0], idx[:, 1], idx[:, 2]] == _COARSE)
+    return touches
+
+
+def _resolve_t_junctions(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    face_coarse: np.ndarray,
+    levels: np.ndarray,
+    B: int,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Snap fine-side vertices onto coarse contour segments and split the coarse
+    triangles there, so fine/coarse block interfaces are conforming.
+    """
+    in_coarse = np.zeros(len(verts), dtype=bool)
+    in_coarse[faces[face_coarse].ravel()] = True
+
+    # Coarse triangle edges lying on a block face, bucketed by coarse face cell
+    coarse_faces = np.flatnonzero(face_coarse)
+    tris = faces[coarse_faces]
+    ends = np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]])
+    owner = np.tile(coarse_faces, 3)
+    vp, vq = verts[ends[:, 0]], verts[ends[:, 1]]
+    flat = (vp == vq) & (np.mod(vp, B) == 0)
+    segments: Dict[Tuple, List[Tuple[int, int]]] = defaultdict(list)
+    edge_face: Dict[Tuple[int, int], int] = {}
+    for e, axis in zip(*np.nonzero(flat)):
+        p, q = int(ends[e, 0]), int(ends[e, 1])
+        u, w = [a for a in range(3) if a != axis]
+        mid = (vp[e] + vq[e]) / 2
+        segments[(axis, vp[e, axis], int(mid[u] // 2), int(mid[w] // 2))].append((p, q))
+        edge_face[(min(p, q), max(p, q))] = int(owner[e])
+
+    # Fine-only vertices on a fine/coarse interface, projected onto the
+    # nearest segment; those at a segment end are merged into it (they were
+    # interpolated from the same samples but may differ by float rounding)
+    remap = np.arange(len(verts))
+    insertions: Dict[Tuple[int, int], List[Tuple[float, int]]] = defaultdict(list)
+    on_plane = np.mod(verts, B) == 0
+    candidates = on_plane.any(axis=1) & ~in_coarse
+    candidates[candidates] = _touches_coarse(verts[candidates], on_plane[candidates], levels, B)
+    for v in np.flatnonzero(candidates):
+        pos = verts[v]
+        axes = np.flatnonzero(on_plane[v])
+        best = None
+        for axis in axes:
+            u, w = [a for a in range(3) if a != axis]
+            # A vertex on a coarse cell edge borders two cells of the face
+            cells_u = {int((pos[u] - 1e-9) // 2), int((pos[u] + 1e-9) // 2)}
+            cells_w = {int((pos[w] - 1e-9) // 2), int((pos[w] + 1e-9) // 2)}
+            nearby = [
+                seg for cu in cells_u for cw in cells_w
+                for seg in segments.get((axis, pos[axis], cu, cw), ())
+            ]
+            for p, q in nearby:
+                d = verts[q] - verts[p]
+                length2 = float(d @ d)
+                if length2 == 0:
+                    continue
+                t = float(np.clip((pos - verts[p]) @ d / length2, 0.0, 1.0))
+                dist = float(np.linalg.norm(verts[p] + t * d - pos))
+                if best is None or dist < best[0]:
+                    best = (dist, p, q, t)
+        if best is None:
+            continue
+        _, p, q, t = best
+        length = float(np.linalg.norm(verts[q] - verts[p]))
+        if t * length < _MERGE_DISTANCE:
+            remap[v] = p
+        elif (1 - t) * length < _MERGE_DISTANCE:
+            remap[v] = q
+        else:
+            verts[v] = verts[p] + t * (verts[q] - verts[p])
+            edge = (min(p, q), max(p, q))
+            insertions[edge].append((t if p == edge[0] else 1 - t, v))
+
+    faces = remap[faces]
+    collapsed = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 2] == faces[:, 0])
+    if collapsed.any():
+        keep = ~collapsed
+        faces, face_coarse = faces[keep], face_coarse[keep]
+        # Coarse faces were never collapsed; re-index the split candidates
+        new_index = np.cumsum(keep) - 1
+        edge_face = {edge: int(new_index[f]) for edge, f in edge_face.items()}
+
+    if not insertions:
+        return (*_compact(verts, faces), int((remap != np.arange(len(verts))).sum()))
+
+    # Re-triangulate the split coarse triangles
+    split_faces: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for edge in insertions:
+        split_faces[edge_face[edge]].append(edge)
+
+    new_verts = [verts]
+    new_faces = []
+    next_index = len(verts)
+    for f, edges in split_faces.items():
+        tri = [int(i) for i in faces[f]]
+        ring = []
+        for r in range(3):
+            a, b = tri[r], tri[(r + 1) % 3]
+            ring.append(a)
+            edge = (min(a, b), max(a, b))
+            if edge in insertions:
+                points = sorted(insertions[edge])
+                ordered = [v for _, v in points]
+                ring.extend(ordered if a == edge[0] else ordered[::-1])
+        if len(edges) == 1:
+            # Fan from the corner opposite the split edge
+            start = next(r for r in range(3) if (min(tri[r], tri[(r + 1) % 3]), max(tri[r], tri[(r + 1) % 3])) == edges[0])
+            apex = tri[(start + 2) % 3]
+            k = ring.index(apex)
+            chain = ring[k + 1:] + ring[:k]
+            new_faces.extend([apex, chain[i], chain[i + 1]] for i in range(len(chain) - 1))
+        else:
+            # Several split edges: fan from a new vertex at the centroid
+            center = next_index
+            next_index += 1
+            new_verts.append(verts[tri].mean(axis=0)[None, :])
+            new_faces.extend([ring[i], ring[(i + 1) % len(ring)], center] for i in range(len(ring)))
+
+    keep = np.ones(len(faces), dtype=bool)
+    keep[list(split_faces.keys())] = False
+    faces = np.concatenate([faces[keep], np.asarray(new_faces, dtype=np.int64)])
+    verts = np.concatenate(new_verts)
+    merged = int((remap != np.arange(len(remap))).sum())
+    return (*_compact(verts, faces), merged + sum(len(v) for v in insertions.values()))
+
+
+def _compact(verts: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Drop vertices no face refers to."""
+    used_mask = np.zeros(len(verts), dtype=bool)
+    used_mask[faces.ravel()] = True
+    used = np.flatnonzero(used_mask)
+    reindex = np.full(len(verts), -1, dtype=np.int64)
+    reindex[used] = np.arange(len(used))
+    return verts[used], reindex[faces]
@@ -13,11 +13,24 @@ Provides parametric generation of lattice-based scaffolds with:
 """
 
 from __future__ import annotations
+import math
 import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from typing import Literal
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
+from .periodic_struts import cell_neighbourhood, tile_unit_cell, tiles_exactly, worth_tiling
+from .struts import build_struts, lattice_graph
+
+# Largest distance of a strut's surface from its axis, relative to the strut
+# radius, per cross-section profile (taper only narrows struts)
+PROFILE_REACH = {
+    'circular': 1.0,
+    'hexagonal': 1.0,  # radius is the circumradius
+    'square': math.sqrt(2),  # half-diagonal of a square of half-width radius
+    'elliptical': 1.5,  # major axis
+}
 
 
 # =============================================================================
@@ -78,7 +91,7 @@ def _create_tapered_strut(
         seg_height = seg_end - seg_start
 
         # Create cone frustum along Z axis
-        frustum = m3d.Manifold.cylinder(seg_height, r_start, r_end, resolution)
+        frustum = adaptive_cylinder(seg_height, r_start, r_end, resolution)
         frustum = frustum.translate([0, 0, seg_start])
         strut_parts.append(frustum)
 
@@ -216,7 +229,7 @@ def _create_hexagonal_strut(
         return m3d.Manifold()
 
     # Create hexagonal cylinder (6-sided polygon extruded)
-    strut = m3d.Manifold.cylinder(length, radius, radius, 6)
+    strut = adaptive_cylinder(length, radius, radius, 6)
 
     # Rotate to align with direction
     dx, dy, dz = direction
@@ -285,7 +298,7 @@ def _calculate_gradient_diameter(
     gradient_start: float,
     gradient_end: float,
     bbox: tuple[float, float, float]
-) -> float:
+) -> float | np.ndarray:
     """
     Calculate strut diameter based on position along gradient axis.
 
@@ -293,7 +306,7 @@ def _calculate_gradient_diameter(
     based on the normalized position along the specified axis.
 
     Args:
-        position: Midpoint position of the strut
+        position: Midpoint position of the strut (3,), or of many struts (N, 3)
         base_diameter: Base strut diameter (mm)
         gradient_axis: Axis for gradient ('x', 'y', or 'z')
         gradient_start: Density factor at start (0-1)
@@ -301,18 +314,18 @@ def _calculate_gradient_diameter(
         bbox: Bounding box dimensions (x, y, z)
 
     Returns:
-        Adjusted strut diameter based on gradient position
+        Adjusted strut diameter (one per position) based on gradient position
     """
     axis_map = {'x': 0, 'y': 1, 'z': 2}
     axis_idx = axis_map.get(gradient_axis.lower(), 2)
+    position = np.asarray(position, dtype=np.float64)
 
     # Get normalized position along axis (0 to 1)
     axis_extent = bbox[axis_idx]
     if axis_extent < 1e-6:
-        return base_diameter
+        return np.full(position.shape[:-1], base_diameter)
 
-    normalized_pos = position[axis_idx] / axis_extent
-    normalized_pos = max(0.0, min(1.0, normalized_pos))
+    normalized_pos = np.clip(position[..., axis_idx] / axis_extent, 0.0, 1.0)
 
     # Linear interpolation of density factor
     density_factor = gradient_start + (gradient_end - gradient_start) * normalized_pos
@@ -343,7 +356,7 @@ def _create_node_sphere(
     Returns:
         Manifold representing the node sphere
     """
-    sphere = m3d.Manifold.sphere(radius, resolution)
+    sphere = adaptive_sphere(radius, resolution)
     return sphere.translate([position[0], position[1], position[2]])
 
 
@@ -369,33 +382,6 @@ def _create_fillet_sphere(
     return _create_node_sphere(position, radius, resolution)
 
 
-def _collect_node_positions(
-    strut_endpoints: set,
-    cell_size: float
-) -> set[tuple[float, float, float]]:
-    """
-    Collect all unique node positions from strut endpoints.
-
-    Args:
-        strut_endpoints: Set of strut endpoint tuples
-        cell_size: Unit cell size for rounding tolerance
-
-    Returns:
-        Set of unique node position tuples
-    """
-    nodes = set()
-    tolerance = cell_size * 0.01  # 1% of cell size for grouping
-
-    for (p1_tuple, p2_tuple) in strut_endpoints:
-        # Round to tolerance for deduplication
-        p1_rounded = tuple(round(c / tolerance) * tolerance for c in p1_tuple)
-        p2_rounded = tuple(round(c / tolerance) * tolerance for c in p2_tuple)
-        nodes.add(p1_rounded)
-        nodes.add(p2_rounded)
-
-    return nodes
-
-
 @dataclass
 class LatticeParams:
     """
@@ -533,7 +519,7 @@ def make_strut(
         return m3d.Manifold()
 
     # Create cylinder along Z axis (from z=0 to z=length)
-    strut = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    strut = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation angles to align with direction vector (p1 -> p2)
     h = np.sqrt(dx*dx + dy*dy)  # horizontal distance
@@ -698,10 +684,79 @@ def get_fcc_struts(cell_origin: np.ndarray, cell_size: float) -> list[tuple[np.n
     return struts
 
 
+def _lattice_solid(
+    nodes: np.ndarray,
+    strut_nodes: np.ndarray,
+    radii: np.ndarray,
+    node_radii: np.ndarray | None,
+    resolution: int,
+    taper: float,
+    profile: str,
+    make_node,
+) -> m3d.Manifold:
+    """
+    Union of the struts and node features of a lattice graph.
+
+    Args:
+        nodes: Node positions (N, 3)
+        strut_nodes: Struts as node index pairs (E, 2)
+        radii: Strut radii (E,)
+        node_radii: Node feature radii (N,), or None for bare struts
+        resolution: Cylinder segments
+        taper: Strut taper ratio
+        profile: Cross-section profile
+        make_node: Node feature builder (node sphere or fillet)
+
+    Returns:
+        Unclipped lattice manifold
+
+    Raises:
+        ValueError: If no struts are generated
+    """
+    starts, ends = nodes[strut_nodes[:, 0]], nodes[strut_nodes[:, 1]]
+
+    # Circular struts are built in one batch; other profiles one by one
+    if profile == 'circular':
+        ring_profile = None
+        if taper > 0:
+            # Same rings as _create_tapered_strut: six frustums, thinnest at the middle
+            t = np.linspace(0.0, 1.0, 7)
+            ring_profile = 1.0 - min(taper, 0.9) * (1.0 - np.abs(2 * t - 1))
+        strut_manifolds = build_struts(starts, ends, radii, resolution, profile=ring_profile)
+    else:
+        strut_manifolds = [
+            make_strut(p1, p2, radius, resolution, taper=taper, profile=profile)
+            for p1, p2, radius in zip(starts, ends, radii.tolist())
+        ]
+        strut_manifolds = [strut for strut in strut_manifolds if strut.num_vert() > 0]
+
+    # Union all struts
+    if not strut_manifolds:
+        raise ValueError("No struts generated")
+
+    result = batch_union(strut_manifolds)
+
+    if node_radii is not None:
+        node_manifolds = [
+            make_node(pos, node_radius, resolution)
+            for pos, node_radius in zip(nodes, node_radii.tolist())
+        ]
+        node_manifolds = [node for node in node_manifolds if node.num_vert() > 0]
+
+        # Union node features with struts
+        if node_manifolds:
+            result = result + batch_union(node_manifolds)
+
+    return result
+
+
 def generate_lattice(params: LatticeParams) -> tuple[m3d.Manifold, dict]:
     """
     Generate a lattice scaffold with advanced features.
 
+    Large uniform lattices (no density gradient) whose box is a whole number
+    of cells are built from tiled unit cells (``periodic_struts``).
+
     Supports:
     - Multiple lattice types (cubic, BCC, FCC)
     - Strut tapering (biomimetic - thicker at nodes)
@@ -770,106 +825,89 @@ def generate_lattice(params: LatticeParams) -> tuple[m3d.Manifold, dict]:
     else:
         get_struts = get_cubic_struts
 
-    # Collect all unique struts (avoid duplicates at cell boundaries)
-    all_strut_endpoints = set()
-
-    for i in range(nx):
-        for j in range(ny):
-            for k in range(nz):
-                origin = np.array([i, j, k], dtype=float) * cell
-                struts = get_struts(origin, cell)
-                for p1, p2 in struts:
-                    # Normalize order for deduplication (smaller tuple first)
-                    key = tuple(sorted([tuple(p1.round(6)), tuple(p2.round(6))]))
-                    all_strut_endpoints.add(key)
-
-    # Create strut manifolds with advanced features
-    strut_manifolds = []
-    for (p1_tuple, p2_tuple) in all_strut_endpoints:
-        p1 = np.array(p1_tuple)
-        p2 = np.array(p2_tuple)
-
-        # Calculate strut midpoint for gradient
-        midpoint = (p1 + p2) / 2
-
-        # Apply gradient if enabled
+    # Unique nodes and struts of all cells (shared at cell boundaries)
+    node_coords, strut_nodes = lattice_graph(get_struts, (nx, ny, nz))
+    nodes = node_coords * (cell / 2)
+
+    # Node features (spheres and/or fillets)
+    enable_nodes = enable_node_spheres or enable_filleting
+    node_count = len(nodes) if enable_nodes else 0
+    if enable_node_spheres:
+        node_factor, make_node = node_sphere_factor, _create_node_sphere
+    else:
+        # Fillet is added only if node spheres are not enabled
+        # (since node spheres already provide smooth transitions)
+        node_factor, make_node = fillet_factor, _create_fillet_sphere
+
+    def solid(nodes: np.ndarray, strut_nodes: np.ndarray, radii: np.ndarray,
+              node_radii: np.ndarray | None) -> m3d.Manifold:
+        return _lattice_solid(
+            nodes, strut_nodes, radii, node_radii, params.resolution,
+            strut_taper, strut_profile, make_node
+        )
+
+    # Large uniform lattices filling the box with whole cells: tile trimmed unit cells
+    result = None
+    node_radius = base_radius * node_factor if enable_nodes else 0.0
+    reach = max(base_radius * PROFILE_REACH[strut_profile], node_radius)
+    periodic = (
+        not enable_gradient
+        # Cells with different outer faces must agree at the seams between them
+        and reach <= cell / 2
+        and tiles_exactly(bbox, cell, (nx, ny, nz))
+        and worth_tiling((nx, ny, nz))
+    )
+    if periodic:
+        def build_cell(outer):
+            cell_nodes, cell_struts = cell_neighbourhood(get_struts, cell, reach, outer)
+            cell_solid = solid(
+                cell_nodes, cell_struts,
+                np.full(len(cell_struts), base_radius),
+                np.full(len(cell_nodes), node_radius) if enable_nodes else None
+            )
+            return m3d.Manifold.batch_boolean(
+                [cell_solid, m3d.Manifold.cube([cell, cell, cell])], m3d.OpType.Intersect
+            )
+
+        result = tile_unit_cell(build_cell, cell, (nx, ny, nz))
+        periodic = result is not None
+
+    if result is None:
+        # Per-strut radius from the gradient at the strut midpoints
+        starts, ends = nodes[strut_nodes[:, 0]], nodes[strut_nodes[:, 1]]
         if enable_gradient:
-            adjusted_diameter = _calculate_gradient_diameter(
-                midpoint,
+            radii = _calculate_gradient_diameter(
+                (starts + ends) / 2,
                 params.strut_diameter_mm,
                 gradient_axis,
                 gradient_start,
                 gradient_end,
                 bbox
-            )
-            radius = adjusted_diameter / 2
+            ) / 2
         else:
-            radius = base_radius
-
-        # Create strut with taper and profile
-        strut = make_strut(
-            p1, p2,
-            radius,
-            params.resolution,
-            taper=strut_taper,
-            profile=strut_profile
-        )
-
-        if strut.num_vert() > 0:
-            strut_manifolds.append(strut)
-
-    # Union all struts
-    if not strut_manifolds:
-        raise ValueError("No struts generated")
+            radii = np.full(len(starts), base_radius)
 
-    result = batch_union(strut_manifolds)
-
-    # Add node features (spheres and/or fillets)
-    if enable_node_spheres or enable_filleting:
-        node_positions = _collect_node_positions(all_strut_endpoints, cell)
-        node_manifolds = []
-
-        for pos_tuple in node_positions:
-            pos = np.array(pos_tuple)
-
-            # Calculate local radius based on gradient if enabled
+        # Calculate local node radius based on gradient if enabled
+        node_radii = None
+        if enable_nodes:
             if enable_gradient:
-                local_diameter = _calculate_gradient_diameter(
-                    pos,
+                local_radii = _calculate_gradient_diameter(
+                    nodes,
                     params.strut_diameter_mm,
                     gradient_axis,
                     gradient_start,
                     gradient_end,
                     bbox
-                )
-                local_radius = local_diameter / 2
+                ) / 2
             else:
-                local_radius = base_radius
-
-            # Add node sphere
-            if enable_node_spheres:
-                sphere_radius = local_radius * node_sphere_factor
-                sphere = _create_node_sphere(pos, sphere_radius, params.resolution)
-                if sphere.num_vert() > 0:
-                    node_manifolds.append(sphere)
-
-            # Add fillet sphere (smaller than node sphere)
-            if enable_filleting and not enable_node_spheres:
-                # Fillet is added only if node spheres are not enabled
-                # (since node spheres already provide smooth transitions)
-                fillet_radius = local_radius * fillet_factor
-                fillet = _create_fillet_sphere(pos, fillet_radius, params.resolution)
-                if fillet.num_vert() > 0:
-                    node_manifolds.append(fillet)
+                local_radii = np.full(len(nodes), base_radius)
+            node_radii = local_radii * node_factor
 
-        # Union node features with struts
-        if node_manifolds:
-            node_union = batch_union(node_manifolds)
-            result = result + node_union
+        result = solid(nodes, strut_nodes, radii, node_radii)
 
-    # Clip to bounding box (intersection)
-    clip_box = m3d.Manifold.cube([bx, by, bz])
-    result = m3d.Manifold.batch_boolean([result, clip_box], m3d.OpType.Intersect)
+        # Clip to bounding box (intersection)
+        clip_box = m3d.Manifold.cube([bx, by, bz])
+        result = m3d.Manifold.batch_boolean([result, clip_box], m3d.OpType.Intersect)
 
     # Calculate statistics
     mesh = result.to_mesh()
@@ -881,9 +919,6 @@ def generate_lattice(params: LatticeParams) -> tuple[m3d.Manifold, dict]:
     # Estimate pore size based on geometry
     estimated_pore_size_um = (cell - params.strut_diameter_mm) * 1000 / 2
 
-    # Count node features
-    node_count = len(_collect_node_positions(all_strut_endpoints, cell)) if (enable_node_spheres or enable_filleting) else 0
-
     stats = {
         'triangle_count': len(mesh.tri_verts) // 3 if hasattr(mesh, 'tri_verts') else 0,
         'vertex_count': len(mesh.vert_properties) if hasattr(mesh, 'vert_properties') else 0,
@@ -895,7 +930,7 @@ def generate_lattice(params: LatticeParams) -> tuple[m3d.Manifold, dict]:
         'cells_x': nx,
         'cells_y': ny,
         'cells_z': nz,
-        'strut_count': len(all_strut_endpoints),
+        'strut_count': len(strut_nodes),
         'unit_cell_size_mm': cell,
         'strut_diameter_mm': params.strut_diameter_mm,
         'strut_taper': strut_taper,
@@ -915,6 +950,7 @@ def generate_lattice(params: LatticeParams) -> tuple[m3d.Manifold, dict]:
         'fillet_radius_factor': fillet_factor if enable_filleting else None,
         'node_count': node_count,
         # Generation
+        'periodic_cell_tiling': periodic,
         'seed': params.seed,
         'scaffold_type': 'lattice'
     }
@@ -16,12 +16,15 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Any
 
-try:
-    from skimage.measure import marching_cubes
-    HAS_SKIMAGE = True
-except ImportError:
-    marching_cubes = None
-    HAS_SKIMAGE = False
+from .slab_marching import HAS_SKIMAGE
+from .tpms import (
+    MarchingCubesMeshWrapper,
+    apply_surface_texture,
+    build_tpms_solid,
+    extract_tpms_surface,
+    gyroid_field,
+    linear_isovalue_field,
+)
 
 
 @dataclass
@@ -67,11 +70,19 @@ class GyroidParams:
         gradient_start_porosity: Porosity at gradient start
         gradient_end_porosity: Porosity at gradient end
 
+        # === Output ===
+        solid_mode: 'surface' (open zero-thickness sheet), 'sheet' (closed
+            wall of wall_thickness_um around the surface) or 'network' (solid
+            filling one side of the surface). Solids have a real volume and
+            can be inverted and tiled; surface texture applies to 'surface' only.
+
         # === Quality & Generation ===
         samples_per_cell: Grid resolution per unit cell (15-30)
         mesh_density: Output mesh density factor (1.0 = standard)
         seed: Random seed for reproducibility
         resolution: Overall resolution multiplier
+        adaptive_extraction: Mesh with the adaptive octree extractor (fewer
+            samples and triangles on large blocks; disables cell tiling)
     """
     # Basic Geometry
     bounding_box_x_mm: float = 10.0
@@ -101,11 +112,15 @@ class GyroidParams:
     gradient_start_porosity: float = 0.5
     gradient_end_porosity: float = 0.7
 
+    # Output
+    solid_mode: str = 'surface'
+
     # Quality & Generation
     samples_per_cell: int = 20
     mesh_density: float = 1.0
     seed: int | None = None
     resolution: int = 15
+    adaptive_extraction: bool = False
 
     # Legacy compatibility
     bounding_box_mm: tuple[float, float, float] | None = None
@@ -113,160 +128,6 @@ class GyroidParams:
     wall_thickness_mm: float | None = None
 
 
-def _apply_surface_texture(
-    vertices: np.ndarray,
-    faces: np.ndarray,
-    amplitude_um: float,
-    seed: int | None = None
-) -> np.ndarray:
-    """
-    Apply micro-texture to mesh surface using noise-based vertex displacement.
-
-    This creates surface roughness beneficial for cell attachment. The texture
-    is applied by displacing vertices along their estimated normals.
-
-    Args:
-        vertices: Vertex array (N, 3) from marching cubes
-        faces: Face array (M, 3) with vertex indices (used for normal estimation)
-        amplitude_um: Texture amplitude in micrometers (5-20 μm typical for osteoblasts)
-        seed: Random seed for reproducibility
-
-    Returns:
-        Modified vertex array with texture applied
-    """
-    if amplitude_um <= 0:
-        return vertices
-
-    # Convert amplitude from micrometers to millimeters
-    amplitude_mm = amplitude_um / 1000.0
-
-    # Set random seed for reproducibility
-    rng = np.random.default_rng(seed)
-
-    # Estimate vertex normals from adjacent faces
-    # Initialize normal accumulator
-    vertex_normals = np.zeros_like(vertices)
-
-    # Calculate face normals and accumulate to vertices
-    v0 = vertices[faces[:, 0]]
-    v1 = vertices[faces[:, 1]]
-    v2 = vertices[faces[:, 2]]
-
-    # Face normals via cross product
-    edge1 = v1 - v0
-    edge2 = v2 - v0
-    face_normals = np.cross(edge1, edge2)
-
-    # Normalize face normals
-    norms = np.linalg.norm(face_normals, axis=1, keepdims=True)
-    norms = np.where(norms > 1e-10, norms, 1.0)  # Avoid division by zero
-    face_normals = face_normals / norms
-
-    # Accumulate face normals to vertices
-    for i in range(3):
-        np.add.at(vertex_normals, faces[:, i], face_normals)
-
-    # Normalize vertex normals
-    vertex_norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
-    vertex_norms = np.where(vertex_norms > 1e-10, vertex_norms, 1.0)
-    vertex_normals = vertex_normals / vertex_norms
-
-    # Generate pseudo-random displacement based on vertex position
-    # Use simple noise: combine position-based randomness with smooth variation
-    n_verts = len(vertices)
-
-    # Create position-dependent noise (simulates Perlin-like behavior)
-    # Hash vertex positions to create consistent noise
-    pos_scale = 10.0  # Frequency of texture features
-    noise_x = np.sin(vertices[:, 0] * pos_scale + vertices[:, 1] * 0.7)
-    noise_y = np.sin(vertices[:, 1] * pos_scale + vertices[:, 2] * 0.7)
-    noise_z = np.sin(vertices[:, 2] * pos_scale + vertices[:, 0] * 0.7)
-    position_noise = (noise_x + noise_y + noise_z) / 3.0
-
-    # Add random component for micro-roughness
-    random_noise = rng.uniform(-1, 1, n_verts)
-
-    # Combine: 70% position-based (smooth), 30% random (rough)
-    displacement = (0.7 * position_noise + 0.3 * random_noise) * amplitude_mm
-
-    # Apply displacement along normals
-    textured_vertices = vertices + vertex_normals * displacement[:, np.newaxis]
-
-    return textured_vertices
-
-
-def _compute_gradient_field(
-    X: np.ndarray,
-    Y: np.ndarray,
-    Z: np.ndarray,
-    L: float,
-    gradient_axis: str,
-    start_porosity: float,
-    end_porosity: float,
-    base_isovalue: float,
-    bounding_box: tuple[float, float, float]
-) -> np.ndarray:
-    """
-    Compute gyroid field with spatially varying isovalue for porosity gradient.
-
-    The porosity gradient is achieved by varying the isovalue along the
-    specified axis. Higher isovalue magnitude = lower porosity (more solid).
-
-    Args:
-        X, Y, Z: 3D coordinate arrays
-        L: Unit cell period
-        gradient_axis: 'x', 'y', or 'z'
-        start_porosity: Porosity at axis start (0.0)
-        end_porosity: Porosity at axis end
-        base_isovalue: Base isovalue at neutral porosity
-        bounding_box: (bx, by, bz) dimensions
-
-    Returns:
-        3D array of field values with gradient applied
-    """
-    # Compute base gyroid field
-    k = 2 * np.pi / L
-    base_field = (
-        np.sin(k * X) * np.cos(k * Y) +
-        np.sin(k * Y) * np.cos(k * Z) +
-        np.sin(k * Z) * np.cos(k * X)
-    )
-
-    # Map porosity to isovalue offset
-    # Porosity ~0.5 at isovalue=0 for gyroid
-    # Lower porosity (more solid) = positive isovalue
-    # Higher porosity (more void) = negative isovalue
-    # Approximate relationship: porosity = 0.5 - isovalue * 0.15
-    # Therefore: isovalue = (0.5 - porosity) / 0.15
-
-    start_isovalue = (0.5 - start_porosity) / 0.15
-    end_isovalue = (0.5 - end_porosity) / 0.15
-
-    # Select coordinate array for gradient axis
-    bx, by, bz = bounding_box
-    if gradient_axis.lower() == 'x':
-        coord = X
-        max_coord = bx
-    elif gradient_axis.lower() == 'y':
-        coord = Y
-        max_coord = by
-    else:  # 'z' default
-        coord = Z
-        max_coord = bz
-
-    # Normalize position along axis [0, 1]
-    normalized_pos = coord / max_coord if max_coord > 0 else np.zeros_like(coord)
-    normalized_pos = np.clip(normalized_pos, 0, 1)
-
-    # Interpolate isovalue along gradient axis
-    spatially_varying_isovalue = start_isovalue + (end_isovalue - start_isovalue) * normalized_pos
-
-    # Subtract varying isovalue from field (shifts the zero-crossing)
-    gradient_field = base_field - spatially_varying_isovalue
-
-    return gradient_field
-
-
 def gyroid_function(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, L: float) -> np.ndarray:
     """
     Evaluate the gyroid implicit function.
@@ -275,72 +136,23 @@ def gyroid_function(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, L: float) -> np
     where k = 2*pi/L (wave number for period L)
 
     Args:
-        X, Y, Z: 3D coordinate arrays (meshgrid output)
+        X, Y, Z: Coordinate arrays (meshgrid output or broadcastable 1-D views)
         L: Unit cell period (cell size)
 
     Returns:
         3D array of function values
     """
-    k = 2 * np.pi / L
-    return (
-        np.sin(k * X) * np.cos(k * Y) +
-        np.sin(k * Y) * np.cos(k * Z) +
-        np.sin(k * Z) * np.cos(k * X)
-    )
-
-
-class _SimpleMesh:
-    """
-    Simple mesh wrapper that provides the interface expected by stl_export.
-
-    Mimics the manifold3d Mesh interface with:
-    - vert_properties: 2D array of vertex positions (N, 3)
-    - tri_verts: 2D array of triangle vertex indices (M, 3)
-    """
-
-    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
-        """
-        Initialize mesh from marching cubes output.
-
-        Args:
-            vertices: Vertex array (N, 3) from marching cubes
-            faces: Face array (M, 3) with vertex indices
-        """
-        # Store as 2D arrays - stl_export expects vert_properties[:, :3]
-        self.vert_properties = vertices.astype(np.float32)
-        # Store faces as 2D array - stl_export expects tri_verts as (M, 3)
-        self.tri_verts = faces.astype(np.uint32)
+    return gyroid_field(X, Y, Z, L)
 
 
-class _MarchingCubesMeshWrapper:
+def _porosity_to_isovalue(porosity: float) -> float:
     """
-    Wrapper class that provides a manifold3d-like interface for marching cubes output.
+    Map a target porosity to a gyroid isovalue.
 
-    This allows the API to use marching cubes meshes directly without requiring
-    manifold3d boolean operations, which fail on non-manifold TPMS surfaces.
+    Porosity is ~0.5 at isovalue 0; lower porosity (more solid) means a
+    positive isovalue. Approximate relationship: porosity = 0.5 - 0.15 * isovalue.
     """
-
-    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
-        """
-        Initialize wrapper from marching cubes output.
-
-        Args:
-            vertices: Vertex array (N, 3)
-            faces: Face array (M, 3) with vertex indices
-        """
-        self._vertices = vertices
-        self._faces = faces
-        self._mesh = _SimpleMesh(vertices, faces)
-
-    def to_mesh(self) -> _SimpleMesh:
-        """Return the mesh object."""
-        return self._mesh
-
-    def volume(self) -> float:
-        """
-        Return volume (0 for TPMS surfaces since they're not closed solids).
-        """
-        return 0.0
+    return (0.5 - porosity) / 0.15
 
 
 def generate_gyroid(params: GyroidParams) -> tuple[Any, dict]:
@@ -348,11 +160,15 @@ def generate_gyroid(params: GyroidParams) -> tuple[Any, dict]:
     Generate a gyroid TPMS scaffold using marching cubes.
 
     The algorithm:
-    1. Create a 3D grid covering the bounding box
-    2. Evaluate the gyroid implicit function at each grid point
-    3. Use marching cubes to extract the isosurface
+    1. Build the isovalue (uniform, or graded along an axis)
+    2. Extract the surface with the shared TPMS engine: uniform untextured
+       gyroids are tiled from one periodic cell, others meshed slab by slab
+    3. Apply surface texture if enabled
     4. Return the mesh directly (no manifold3d boolean operations)
 
+    With solid_mode 'sheet' or 'network' a closed manifold3d solid is built
+    instead (see ``build_tpms_solid``) and returned as a Manifold.
+
     Args:
         params: GyroidParams configuration object
 
@@ -362,7 +178,11 @@ def generate_gyroid(params: GyroidParams) -> tuple[Any, dict]:
         Statistics include:
             - triangle_count: Number of triangles in mesh
             - volume_mm3: Scaffold volume (0 for surfaces)
-            - porosity: Void fraction (approximate)
+            - porosity: Measured void fraction (from the mesh volume for
+              solids, from the sampled field for surfaces)
+            - surface_area_density_per_mm: Surface area per box volume
+            - field_metrics: Field measurements of surfaces, including
+              plate-model wall thickness and pore size (None for solids)
             - cell_count: Number of unit cells in each dimension
             - scaffold_type: 'gyroid'
 
@@ -392,73 +212,87 @@ def generate_gyroid(params: GyroidParams) -> tuple[Any, dict]:
     effective_samples = int(params.samples_per_cell * params.mesh_density * (params.resolution / 15.0))
     effective_samples = max(10, effective_samples)  # Minimum 10 samples per cell
 
-    # Calculate grid resolution with mesh_density applied
-    nx = max(10, int(bx / L * effective_samples))
-    ny = max(10, int(by / L * effective_samples))
-    nz = max(10, int(bz / L * effective_samples))
-
-    # Create coordinate arrays
-    x = np.linspace(0, bx, nx)
-    y = np.linspace(0, by, ny)
-    z = np.linspace(0, bz, nz)
-    X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
-
-    # Spacing for marching cubes
-    spacing = (x[1] - x[0], y[1] - y[0], z[1] - z[0])
-
-    # Evaluate gyroid function - with or without gradient
+    # Gradient: subtract a spatially varying isovalue and extract at level 0
+    isovalue_field = None
     if params.enable_gradient:
-        # Use gradient field with spatially varying isovalue
-        F = _compute_gradient_field(
-            X, Y, Z, L,
-            gradient_axis=params.gradient_axis,
-            start_porosity=params.gradient_start_porosity,
-            end_porosity=params.gradient_end_porosity,
-            base_isovalue=params.isovalue,
-            bounding_box=(bx, by, bz)
-        )
-        # For gradient field, extract at level=0 since isovalue is baked into field
-        extraction_level = 0.0
-    else:
-        # Standard uniform gyroid
-        F = gyroid_function(X, Y, Z, L)
-        extraction_level = params.isovalue
-
-    # Extract single isosurface using marching cubes
-    try:
-        verts, faces, _, _ = marching_cubes(F, level=extraction_level, spacing=spacing)
-    except ValueError as e:
-        raise ValueError(f"Failed to extract gyroid surface: {e}")
-
-    if len(verts) == 0 or len(faces) == 0:
-        raise ValueError("Marching cubes produced empty mesh for gyroid surface")
-
-    # Apply surface texture if enabled
-    if params.enable_surface_texture and params.texture_amplitude_um > 0:
-        verts = _apply_surface_texture(
-            verts, faces,
-            amplitude_um=params.texture_amplitude_um,
-            seed=params.seed
+        isovalue_field = linear_isovalue_field(
+            params.gradient_axis,
+            _porosity_to_isovalue(params.gradient_start_porosity),
+            _porosity_to_isovalue(params.gradient_end_porosity),
+            (bx, by, bz),
         )
 
-    # Create wrapper with manifold3d-like interface
-    result = _MarchingCubesMeshWrapper(verts, faces)
+    if params.solid_mode != 'surface':
+        # Closed solid: has a volume and supports inversion and tiling
+        wall_mm = (
+            params.wall_thickness_mm if params.wall_thickness_mm is not None
+            else params.wall_thickness_um / 1000.0
+        )
+        result = build_tpms_solid(
+            'gyroid', L, (bx, by, bz), effective_samples,
+            mode=params.solid_mode,
+            level=params.isovalue,
+            thickness_mm=wall_mm,
+            isovalue_field=isovalue_field,
+            adaptive=params.adaptive_extraction,
+        )
+        triangle_count, vertex_count = result.num_tri(), result.num_vert()
+        volume = result.volume()
+        extraction = {'periodic_cell_tiling': False, 'field_metrics': None}
+    else:
+        # Every unit cell of a uniform gyroid is identical, so the engine meshes
+        # one periodic cell and tiles it. The surface texture draws its noise in
+        # vertex order, so textured gyroids keep the slab-extracted layout.
+        try:
+            verts, faces, extraction = extract_tpms_surface(
+                'gyroid', L, (bx, by, bz), effective_samples,
+                level=params.isovalue,
+                isovalue_field=isovalue_field,
+                adaptive=params.adaptive_extraction,
+                allow_periodic=not params.enable_surface_texture,
+            )
+        except ValueError as e:
+            raise ValueError(f"Failed to extract gyroid surface: {e}")
+
+        if len(verts) == 0 or len(faces) == 0:
+            raise ValueError("Marching cubes produced empty mesh for gyroid surface")
+
+        # Apply surface texture if enabled
+        if params.enable_surface_texture and params.texture_amplitude_um > 0:
+            verts = apply_surface_texture(
+                verts, faces,
+                amplitude_um=params.texture_amplitude_um,
+                seed=params.seed
+            )
+
+        # Create wrapper with manifold3d-like interface
+        result = MarchingCubesMeshWrapper(verts, faces)
+        triangle_count, vertex_count = len(faces), len(verts)
+        volume = 0.0  # TPMS surfaces are not closed solids
 
     # Calculate statistics
     cell_count = (int(bx / L), int(by / L), int(bz / L))
     total_cells = cell_count[0] * cell_count[1] * cell_count[2]
 
-    # Estimate porosity based on isovalue
-    # Gyroid porosity is approximately 0.5 at isovalue=0, varies with isovalue
-    estimated_porosity = 0.5 - (params.isovalue * 0.15)
-    estimated_porosity = max(0.3, min(0.8, estimated_porosity))
+    field_metrics = extraction['field_metrics']
+    if field_metrics is None:
+        # Solids: measured from the mesh
+        porosity = 1.0 - volume / (bx * by * bz)
+        surface_area_density = result.surface_area() / (bx * by * bz)
+    else:
+        # Surfaces: measured from the sampled field (void side of the surface)
+        porosity = field_metrics['porosity']
+        surface_area_density = field_metrics['surface_area_density_per_mm']
 
     stats = {
-        'triangle_count': len(faces),
-        'vertex_count': len(verts),
-        'volume_mm3': 0.0,  # TPMS surfaces are not closed solids
-        'porosity': estimated_porosity,
+        'triangle_count': triangle_count,
+        'vertex_count': vertex_count,
+        'volume_mm3': volume,
+        'solid_mode': params.solid_mode,
+        'porosity': porosity,
         'target_porosity': params.porosity,
+        'surface_area_density_per_mm': surface_area_density,
+        'field_metrics': field_metrics,
         'cell_count': cell_count,
         'total_cells': total_cells,
         'unit_cell_size_mm': L,
@@ -482,6 +316,8 @@ def generate_gyroid(params: GyroidParams) -> tuple[Any, dict]:
         # Mesh generation parameters
         'mesh_density': params.mesh_density,
         'effective_samples_per_cell': effective_samples,
+        'periodic_cell_tiling': extraction['periodic_cell_tiling'],
+        'adaptive_extraction': extraction.get('adaptive_extraction'),
     }
 
     return result, stats
@@ -556,4 +392,8 @@ def generate_gyroid_from_dict(params: dict) -> tuple[Any, dict]:
         mesh_density=params.get('mesh_density', 1.0),
         seed=params.get('seed'),
         resolution=params.get('resolution', 15),
+        adaptive_extraction=params.get('adaptive_extraction', False),
+
+        # Output
+        solid_mode=params.get('solid_mode', 'surface'),
     ))
@@ -24,6 +24,7 @@ except ImportError:
     HAS_MANIFOLD = False
 
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder
 
 
 @dataclass
@@ -373,7 +374,7 @@ def create_wall_perforations(
 
             # Create cylinder oriented along wall normal
             # Cylinder is created along Z, then rotated to align with wall normal
-            cylinder = m3d.Manifold.cylinder(
+            cylinder = adaptive_cylinder(
                 height=wall_thickness * 1.5,  # Slightly longer to ensure complete cut
                 radius=radius,
                 circular_segments=resolution
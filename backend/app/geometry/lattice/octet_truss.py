@@ -25,6 +25,9 @@ except ImportError:
     HAS_MANIFOLD = False
 
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
+from .periodic_struts import cell_neighbourhood, tile_unit_cell, tiles_exactly, worth_tiling
+from .struts import build_struts, lattice_graph
 
 
 @dataclass
@@ -66,9 +69,11 @@ class OctetTrussParams:
         elastic_modulus_target_gpa: Target elastic modulus
 
         # === Node Features ===
-        node_fillet_radius_mm: Fillet radius at strut joints
+        node_fillet_radius_mm: Fillet radius at strut joints (full size at
+            nodes with all their struts, proportionally less at boundary nodes)
         enable_node_spheres: Add spherical nodes at joints
-        node_sphere_factor: Node sphere size relative to strut
+        node_sphere_factor: Node sphere size relative to strut at nodes with
+            all their struts (boundary nodes scale towards the strut radius)
 
         # === Gradient Features ===
         enable_gradient: Enable density gradient
@@ -143,7 +148,7 @@ def make_strut(p1: np.ndarray, p2: np.ndarray, radius: float, resolution: int) -
         return m3d.Manifold()
 
     # Create cylinder along Z axis
-    strut = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    strut = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -230,7 +235,7 @@ def make_tapered_strut(
             r_end *= (1.0 + rng.uniform(-roughness_mm, roughness_mm) / radius_max)
 
         # Create tapered cylinder segment
-        seg = m3d.Manifold.cylinder(segment_length, r_start, r_end, resolution)
+        seg = adaptive_cylinder(segment_length, r_start, r_end, resolution)
         seg = seg.translate([0, 0, i * segment_length])
         segments.append(seg)
 
@@ -265,7 +270,7 @@ def make_node_sphere(center: np.ndarray, radius: float, resolution: int) -> m3d.
     Returns:
         Manifold representing the sphere
     """
-    sphere = m3d.Manifold.sphere(radius, resolution * 2)
+    sphere = adaptive_sphere(radius, resolution * 2)
     return sphere.translate([center[0], center[1], center[2]])
 
 
@@ -280,14 +285,15 @@ def get_gradient_density_factor(
     Calculate density factor based on position along gradient axis.
 
     Args:
-        position: 3D position (typically strut midpoint)
+        position: 3D position (typically strut midpoint), or positions (N, 3)
         bbox: Bounding box dimensions (x, y, z)
         axis: Gradient axis ('x', 'y', or 'z')
         start_density: Density at axis start (0)
         end_density: Density at axis end (max)
 
     Returns:
-        Density factor (interpolated between start and end density)
+        Density factor (interpolated between start and end density), one
+        per position
     """
     axis_map = {'x': 0, 'y': 1, 'z': 2}
     axis_idx = axis_map.get(axis.lower(), 2)  # Default to z
@@ -297,7 +303,7 @@ def get_gradient_density_factor(
     if axis_max <= 0:
         return (start_density + end_density) / 2
 
-    t = np.clip(position[axis_idx] / axis_max, 0.0, 1.0)
+    t = np.clip(np.asarray(position)[..., axis_idx] / axis_max, 0.0, 1.0)
 
     # Linear interpolation between start and end density
     return start_density + t * (end_density - start_density)
@@ -433,6 +439,30 @@ def get_octet_truss_struts(cell_origin: np.ndarray, cell_size: float) -> list[tu
     return struts
 
 
+def octet_node_valence(half_coords: np.ndarray) -> np.ndarray:
+    """
+    Struts meeting at each node of an unbounded octet truss.
+
+    Cube corners join 18 struts and face centers 12. Each sublattice is
+    told apart by the parity of its half-cell coordinates; its valence is
+    counted at the center cell of a 3x3x3 block, whose nodes have all
+    their struts.
+
+    Args:
+        half_coords: Integer node coordinates (N, 3) in half-cell units
+
+    Returns:
+        Valence of each node (N,)
+    """
+    coords, struts = lattice_graph(get_octet_truss_struts, (3, 3, 3))
+    valence = np.bincount(struts.ravel(), minlength=len(coords))
+    center = np.all((coords >= 2) & (coords <= 4), axis=1)
+
+    by_parity = np.zeros((2, 2, 2), dtype=np.int64)
+    by_parity[tuple((coords[center] % 2).T)] = valence[center]
+    return by_parity[tuple((np.asarray(half_coords) % 2).T)]
+
+
 def generate_octet_truss(params: OctetTrussParams) -> tuple[m3d.Manifold, dict]:
     """
     Generate an octet truss lattice scaffold.
@@ -444,6 +474,9 @@ def generate_octet_truss(params: OctetTrussParams) -> tuple[m3d.Manifold, dict]:
     - Node spheres: Spherical reinforcement at lattice nodes
     - Density gradient: Varying strut thickness along an axis
 
+    Without gradient or roughness, a large box of whole cells is built from
+    tiled unit cells (``periodic_struts``).
+
     Args:
         params: OctetTrussParams configuration object
 
@@ -457,6 +490,7 @@ def generate_octet_truss(params: OctetTrussParams) -> tuple[m3d.Manifold, dict]:
             - cell_count: Number of unit cells
             - strut_count: Number of unique struts
             - node_count: Number of lattice nodes (if spheres enabled)
+            - periodic_cell_tiling: Whether the unit cell was tiled
             - scaffold_type: 'octet_truss'
 
     Raises:
@@ -490,133 +524,114 @@ def generate_octet_truss(params: OctetTrussParams) -> tuple[m3d.Manifold, dict]:
     ny = max(1, int(by / cell))
     nz = max(1, int(bz / cell))
 
-    # Collect unique struts and nodes across all cells
-    all_strut_endpoints = set()
-    all_nodes = set()
-
-    for i in range(nx):
-        for j in range(ny):
-            for k in range(nz):
-                origin = np.array([i, j, k], dtype=float) * cell
-                struts = get_octet_truss_struts(origin, cell)
-                for p1, p2 in struts:
-                    p1_key = tuple(p1.round(6))
-                    p2_key = tuple(p2.round(6))
-                    key = tuple(sorted([p1_key, p2_key]))
-                    all_strut_endpoints.add(key)
-                    # Track unique node positions
-                    all_nodes.add(p1_key)
-                    all_nodes.add(p2_key)
-
     # Determine if we need advanced strut features
     use_taper = params.strut_taper > 0.01
     use_roughness = params.strut_surface_roughness > 0.01
     use_gradient = params.enable_gradient
-
-    # Create strut manifolds
-    strut_manifolds = []
-    for (p1_tuple, p2_tuple) in all_strut_endpoints:
-        p1 = np.array(p1_tuple)
-        p2 = np.array(p2_tuple)
-
-        # Calculate effective radius based on gradient
-        effective_radius = base_radius
-        if use_gradient:
-            # Use strut midpoint for gradient calculation
-            midpoint = (p1 + p2) / 2
-            density_factor = get_gradient_density_factor(
-                midpoint, bbox,
-                params.gradient_axis,
-                params.gradient_start_density,
-                params.gradient_end_density
-            )
-            # Scale radius by density factor (higher density = thicker struts)
-            # density_factor is relative density, so radius scales as sqrt(density)
-            effective_radius = base_radius * np.sqrt(density_factor / 0.5)
-
-        # Create strut with appropriate method
-        if use_taper or use_roughness:
-            strut = make_tapered_strut(
-                p1, p2,
-                effective_radius,
-                params.strut_taper if use_taper else 0.0,
-                params.resolution,
-                params.strut_surface_roughness if use_roughness else 0.0,
-                rng if use_roughness else None
+    use_fillets = params.node_fillet_radius_mm > 0.01
+
+    # Ring radii along a tapered strut, as in make_tapered_strut
+    taper = max(0.0, min(0.95, params.strut_taper)) if use_taper else 0.0
+    t = np.linspace(0.0, 1.0, max(3, int(8 * taper) + 3) + 1)
+    ring_profile = 1.0 - taper * (1.0 - np.abs(2 * t - 1))
+
+    def local_scale(positions: np.ndarray) -> np.ndarray:
+        """Radius scale of the density gradient at positions (N, 3)."""
+        if not use_gradient:
+            return np.ones(len(positions))
+        density_factor = get_gradient_density_factor(
+            positions, bbox,
+            params.gradient_axis,
+            params.gradient_start_density,
+            params.gradient_end_density
+        )
+        # Scale radius by density factor (higher density = thicker struts)
+        # density_factor is relative density, so radius scales as sqrt(density)
+        return np.sqrt(np.broadcast_to(density_factor, (len(positions),)) / 0.5)
+
+    def build(nodes: np.ndarray, strut_nodes: np.ndarray) -> m3d.Manifold:
+        """Union of struts, node spheres and fillets of a lattice graph."""
+        starts, ends = nodes[strut_nodes[:, 0]], nodes[strut_nodes[:, 1]]
+        # Use strut midpoints for gradient calculation
+        radii = base_radius * local_scale((starts + ends) / 2)
+
+        profile = ring_profile if use_taper else None
+        if use_roughness:
+            # Convert roughness from μm to mm and apply as relative variation per ring
+            roughness_mm = params.strut_surface_roughness / 1000.0
+            noise = rng.uniform(-roughness_mm, roughness_mm, (len(radii), len(ring_profile)))
+            profile = ring_profile[None, :] * (1.0 + noise / radii[:, None])
+        strut_manifolds = build_struts(starts, ends, radii, params.resolution, profile=profile)
+
+        if not strut_manifolds:
+            raise ValueError("No struts generated for octet truss")
+
+        # Boundary nodes join fewer struts than the same node of an unbounded
+        # lattice and get proportionally smaller node features
+        valence = np.bincount(strut_nodes.ravel(), minlength=len(nodes))
+        half_coords = np.rint(nodes / (cell / 2)).astype(np.int64)
+        connected = valence / octet_node_valence(half_coords)
+        node_scale = local_scale(nodes)
+
+        # Add node spheres if enabled
+        node_radii = []
+        if params.enable_node_spheres:
+            node_radii.append(base_radius * (1.0 + (params.node_sphere_factor - 1.0) * connected) * node_scale)
+
+        # Add fillets at node junctions if enabled
+        if use_fillets:
+            # Fillets are approximated using spheres at each node, slightly
+            # larger than the strut for blending
+            node_radii.append((base_radius + params.node_fillet_radius_mm * 0.5 * connected) * node_scale)
+
+        node_manifolds = [
+            make_node_sphere(node_pos, radius, params.resolution)
+            for radii_at_nodes in node_radii
+            for node_pos, radius in zip(nodes[valence > 0], radii_at_nodes[valence > 0].tolist())
+        ]
+        node_manifolds = [node for node in node_manifolds if node.num_vert() > 0]
+
+        # Union all parts
+        return batch_union(strut_manifolds + node_manifolds)
+
+    # Without gradient or random roughness cells only differ at the outer
+    # faces: when the box is many whole cells, tile trimmed unit cells
+    result = None
+    # Struts are circular and taper only narrows them
+    reach = max(
+        base_radius,
+        base_radius * params.node_sphere_factor if params.enable_node_spheres else 0.0,
+        base_radius + params.node_fillet_radius_mm * 0.5 if use_fillets else 0.0,
+    )
+    periodic = (
+        not use_gradient
+        and not use_roughness
+        # Cells with different outer faces must agree at the seams between them
+        and reach <= cell / 2
+        and tiles_exactly(bbox, cell, (nx, ny, nz))
+        and worth_tiling((nx, ny, nz))
+    )
+    if periodic:
+        def build_cell(outer):
+            cell_nodes, cell_struts = cell_neighbourhood(get_octet_truss_struts, cell, reach, outer)
+            return m3d.Manifold.batch_boolean(
+                [build(cell_nodes, cell_struts), m3d.Manifold.cube([cell, cell, cell])],
+                m3d.OpType.Intersect
             )
-        else:
-            strut = make_strut(p1, p2, effective_radius, params.resolution)
-
-        if strut.num_vert() > 0:
-            strut_manifolds.append(strut)
-
-    if not strut_manifolds:
-        raise ValueError("No struts generated for octet truss")
-
-    # Add node spheres if enabled
-    node_manifolds = []
-    if params.enable_node_spheres:
-        sphere_radius = base_radius * params.node_sphere_factor
-        for node_tuple in all_nodes:
-            node_pos = np.array(node_tuple)
-            # Only add spheres within bounding box (with small tolerance)
-            if (0 - sphere_radius <= node_pos[0] <= bx + sphere_radius and
-                0 - sphere_radius <= node_pos[1] <= by + sphere_radius and
-                0 - sphere_radius <= node_pos[2] <= bz + sphere_radius):
-
-                # Apply gradient to sphere size if enabled
-                if use_gradient:
-                    density_factor = get_gradient_density_factor(
-                        node_pos, bbox,
-                        params.gradient_axis,
-                        params.gradient_start_density,
-                        params.gradient_end_density
-                    )
-                    local_sphere_radius = sphere_radius * np.sqrt(density_factor / 0.5)
-                else:
-                    local_sphere_radius = sphere_radius
-
-                sphere = make_node_sphere(node_pos, local_sphere_radius, params.resolution)
-                if sphere.num_vert() > 0:
-                    node_manifolds.append(sphere)
-
-    # Add fillets at node junctions if enabled
-    fillet_manifolds = []
-    if params.node_fillet_radius_mm > 0.01:
-        # Fillets are approximated using small spheres at each node
-        # This provides smooth stress distribution similar to true fillets
-        fillet_radius = params.node_fillet_radius_mm
-        for node_tuple in all_nodes:
-            node_pos = np.array(node_tuple)
-            # Only add fillets within bounding box
-            if (0 <= node_pos[0] <= bx and
-                0 <= node_pos[1] <= by and
-                0 <= node_pos[2] <= bz):
-
-                # Create fillet sphere (slightly larger than strut for blending)
-                fillet_sphere_radius = base_radius + fillet_radius * 0.5
-                if use_gradient:
-                    density_factor = get_gradient_density_factor(
-                        node_pos, bbox,
-                        params.gradient_axis,
-                        params.gradient_start_density,
-                        params.gradient_end_density
-                    )
-                    fillet_sphere_radius *= np.sqrt(density_factor / 0.5)
-
-                fillet = make_node_sphere(node_pos, fillet_sphere_radius, params.resolution)
-                if fillet.num_vert() > 0:
-                    fillet_manifolds.append(fillet)
-
-    # Combine all manifolds
-    all_manifolds = strut_manifolds + node_manifolds + fillet_manifolds
-
-    # Union all parts
-    result = batch_union(all_manifolds)
-
-    # Clip to bounding box (intersection)
-    clip_box = m3d.Manifold.cube([bx, by, bz])
-    result = m3d.Manifold.batch_boolean([result, clip_box], m3d.OpType.Intersect)
+
+        result = tile_unit_cell(build_cell, cell, (nx, ny, nz))
+        periodic = result is not None
+
+    # Unique nodes and struts of all cells, keyed by integer half-cell coordinates
+    node_coords, strut_nodes = lattice_graph(get_octet_truss_struts, (nx, ny, nz))
+    nodes = node_coords * (cell / 2)
+
+    if result is None:
+        result = build(nodes, strut_nodes)
+
+        # Clip to bounding box (intersection)
+        clip_box = m3d.Manifold.cube([bx, by, bz])
+        result = m3d.Manifold.batch_boolean([result, clip_box], m3d.OpType.Intersect)
 
     # Calculate statistics
     mesh = result.to_mesh()
@@ -637,8 +652,8 @@ def generate_octet_truss(params: OctetTrussParams) -> tuple[m3d.Manifold, dict]:
         'relative_density': relative_density,
         'target_relative_density': params.relative_density,
         'cell_count': nx * ny * nz,
-        'strut_count': len(all_strut_endpoints),
-        'node_count': len(all_nodes),
+        'strut_count': len(strut_nodes),
+        'node_count': len(nodes),
         'unit_cell_edge_mm': cell,
         'strut_diameter_mm': params.strut_diameter_mm,
         'strut_length_mm': strut_length_mm,
@@ -658,6 +673,7 @@ def generate_octet_truss(params: OctetTrussParams) -> tuple[m3d.Manifold, dict]:
         'gradient_start_density': params.gradient_start_density if params.enable_gradient else None,
         'gradient_end_density': params.gradient_end_density if params.enable_gradient else None,
         'seed': params.seed,
+        'periodic_cell_tiling': periodic,
         'scaffold_type': 'octet_truss'
     }
 
@@ -0,0 +1,167 @@
+"""
+Periodic unit-cell replication for uniform TPMS lattices.
+
+Without a gradient or surface texture every unit cell of a TPMS block is
+identical, so meshing the whole box repeats the same marching cubes work
+once per cell. Instead, one periodic cell is sampled and meshed, and the
+block is assembled from translated copies of it.
+
+The grid spacing is chosen so the period is an exact number of cubes, and
+the cell's boundary samples are copied from the opposite face (``np.pad``
+with ``mode='wrap'``). Both sides of every seam are therefore interpolated
+from bit-identical samples and the copies are joined with a vertex-hash weld.
+
+Box sizes that are not a whole number of periods are handled by copying only
+the triangles of the leading cubes of the cell into the last, partial copy.
+The box is snapped to the sample grid (within half a sample spacing).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .slab_marching import (
+    FieldFunction,
+    HAS_SKIMAGE,
+    concatenate_meshes,
+    marching_cubes,
+    weld_vertices,
+)
+
+
+def _axis_copies(cube_count: int, cubes_per_period: int) -> List[Tuple[int, int]]:
+    """(offset, cubes used) of each copy along one axis, in grid-index units."""
+    full, remainder = divmod(cube_count, cubes_per_period)
+    copies = [(i * cubes_per_period, cubes_per_period) for i in range(full)]
+    if remainder:
+        copies.append((full * cubes_per_period, remainder))
+    return copies
+
+
+def sample_periodic_cell(field_fn: FieldFunction, period: float, cubes_per_period: int) -> np.ndarray:
+    """
+    Sample one period of a field on a closed (n+1)^3 grid.
+
+    The last sample plane along each axis is a copy of the first, so
+    opposite faces of the cell are bit-identical.
+
+    Args:
+        field_fn: Field with period ``period`` along X, Y and Z
+        period: Unit cell size in millimeters
+        cubes_per_period: Marching cubes per period along each axis
+
+    Returns:
+        float32 array of shape (n+1, n+1, n+1)
+    """
+    n = max(2, int(cubes_per_period))
+    t = np.arange(n) * (period / n)
+    field = field_fn(t[:, None, None], t[None, :, None], t[None, None, :])
+    field = np.broadcast_to(field, (n, n, n)).astype(np.float32)
+    return np.pad(field, ((0, 1), (0, 1), (0, 1)), mode="wrap")
+
+
+def tile_periodic_cell(
+    cell_field: np.ndarray,
+    period: float,
+    extent: Tuple[float, float, float],
+    level: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mesh one sampled periodic cell and tile it over a box.
+
+    Args:
+        cell_field: Closed cell samples from ``sample_periodic_cell``
+        period: Unit cell size in millimeters
+        extent: Box size (x, y, z) in millimeters, starting at the origin
+        level: Isosurface level
+
+    Returns:
+        Tuple of (vertices (N, 3) in world coordinates, faces (M, 3)).
+        Both are empty if the level is never crossed.
+
+    Raises:
+        ImportError: If scikit-image is not installed
+    """
+    if not HAS_SKIMAGE:
+        raise ImportError(
+            "scikit-image is required for TPMS generation. "
+            "Install with: pip install scikit-image"
+        )
+
+    n = cell_field.shape[0] - 1
+    spacing = period / n
+
+    if not (cell_field.min() <= level <= cell_field.max()):
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    cell_verts, cell_faces, _, _ = marching_cubes(cell_field, level=level)
+    cell_verts = cell_verts.astype(np.float64)
+    cell_faces = cell_faces.astype(np.int64)
+
+    # Cube each triangle came from: its vertices lie on that cube's edges
+    face_cube = np.clip(np.floor(cell_verts[cell_faces].mean(axis=1)).astype(np.int64), 0, n - 1)
+
+    # Group copies by how much of the cell they use (full or partial per axis)
+    cube_counts = [max(1, int(round(size / spacing))) for size in extent]
+    groups: Dict[Tuple[int, int, int], List[Tuple[int, int, int]]] = {}
+    for ox, ux in _axis_copies(cube_counts[0], n):
+        for oy, uy in _axis_copies(cube_counts[1], n):
+            for oz, uz in _axis_copies(cube_counts[2], n):
+                groups.setdefault((ux, uy, uz), []).append((ox, oy, oz))
+
+    pieces = []
+    for used, offsets in groups.items():
+        mask = np.all(face_cube < np.array(used), axis=1)
+        if not mask.any():
+            continue
+        faces = cell_faces[mask]
+        used_verts = np.unique(faces)
+        reindex = np.full(len(cell_verts), -1, dtype=np.int64)
+        reindex[used_verts] = np.arange(len(used_verts))
+        verts, faces = cell_verts[used_verts], reindex[faces]
+
+        shifts = np.asarray(offsets, dtype=np.float64)
+        tiled_verts = (verts[None, :, :] + shifts[:, None, :]).reshape(-1, 3)
+        tiled_faces = (faces[None, :, :] + (np.arange(len(shifts)) * len(verts))[:, None, None]).reshape(-1, 3)
+        pieces.append((tiled_verts, tiled_faces))
+
+    if not pieces:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    verts, faces = concatenate_meshes(pieces)
+
+    # Seam vertices lie on planes at whole multiples of the period
+    on_seam = np.any(np.mod(verts, n) == 0, axis=1)
+    verts, faces = weld_vertices(verts, faces, on_seam)
+    return verts * spacing, faces
+
+
+def periodic_marching_cubes(
+    field_fn: FieldFunction,
+    period: float,
+    cubes_per_period: int,
+    extent: Tuple[float, float, float],
+    level: float = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mesh a periodic implicit field over a box by replicating one cell.
+
+    Args:
+        field_fn: Field with period ``period`` along X, Y and Z, evaluated on
+            broadcast coordinate arrays
+        period: Unit cell size in millimeters
+        cubes_per_period: Marching cubes per period along each axis
+        extent: Box size (x, y, z) in millimeters, starting at the origin
+        level: Isosurface level
+
+    Returns:
+        Tuple of (vertices (N, 3) in world coordinates, faces (M, 3)).
+        Both are empty if the level is never crossed.
+
+    Raises:
+        ImportError: If scikit-image is not installed
+    """
+    cell_field = sample_periodic_cell(field_fn, period, cubes_per_period)
+    return tile_periodic_cell(cell_field, period, extent, level)
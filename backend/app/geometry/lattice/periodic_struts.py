@@ -0,0 +1,197 @@
+"""
+Periodic unit-cell replication for uniform strut lattices.
+
+Without a gradient or random surface texture every unit cell of a cubic,
+BCC, FCC or octet block is identical, yet the block used to be built by
+unioning every strut and node sphere of the whole box. Instead, one unit
+cell is built: the struts of the cell and its neighbours that reach into
+it are unioned and trimmed to the cell cube. The block is assembled from
+translated copies of that trimmed cell. Cells on the outside of the block
+lack the struts and nodes beyond it, and node features may depend on the
+node valence, so one trimmed cell is built per combination of outer faces
+(at most 27, whatever the block size).
+
+The trimmed cell's triangles split into its lattice surface and the cut
+faces on the six cube faces. Copies keep the cut faces only where they lie
+on the outside of the block; elsewhere the open boundary loops of
+neighbouring copies coincide (they are cut from the same struts, one
+period apart) and are joined with a vertex-hash weld, as in
+``periodic_cell`` for TPMS lattices. The cost is one cell's boolean plus
+linear copying, instead of a boolean over the whole block; small blocks
+(see ``worth_tiling``) are cheaper to build directly.
+
+Usage:
+    >>> def build_cell(outer):
+    ...     nodes, struts = cell_neighbourhood(get_bcc_struts, cell_size, reach, outer)
+    ...     return build(nodes, struts) ^ m3d.Manifold.cube([cell_size] * 3)
+    >>> block = tile_unit_cell(build_cell, cell_size, (nx, ny, nz))
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import manifold3d as m3d
+    HAS_MANIFOLD = True
+except ImportError:
+    m3d = None
+    HAS_MANIFOLD = False
+
+from .slab_marching import concatenate_meshes, weld_vertices
+from .struts import lattice_graph
+
+# Per axis, whether a cell's (low, high) face is on the outside of the block
+Outer = Tuple[Tuple[bool, bool], Tuple[bool, bool], Tuple[bool, bool]]
+
+# Relative tolerance (in cell sizes) for boxes that are whole cells and for
+# vertices on the cell faces
+_CELL_TOLERANCE = 1e-9
+
+
+def tiles_exactly(extent: Tuple[float, float, float], cell_size: float, counts: Tuple[int, int, int]) -> bool:
+    """Whether a box is exactly ``counts`` whole cells along every axis."""
+    return all(
+        abs(size - n * cell_size) <= 1e-6 * cell_size
+        for size, n in zip(extent, counts)
+    )
+
+
+def worth_tiling(counts: Tuple[int, int, int]) -> bool:
+    """Whether a block has at least twice as many cells as trimmed cells to build."""
+    return int(np.prod(counts)) >= 2 * len(_copy_groups(counts))
+
+
+def cell_neighbourhood(
+    get_struts: Callable[[np.ndarray, float], List[Tuple[np.ndarray, np.ndarray]]],
+    cell_size: float,
+    reach: float,
+    outer: Optional[Outer] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nodes and struts of the lattice that reach into the unit cell at the origin.
+
+    Args:
+        get_struts: Unit-cell strut function taking (cell_origin, cell_size)
+        cell_size: Unit cell size in millimeters
+        reach: Largest distance strut or node geometry extends from its
+            axis or center
+        outer: Per axis, whether the cell's (low, high) face is on the outside
+            of the block; struts and nodes beyond those faces are left out.
+            Default: an interior cell
+
+    Returns:
+        Tuple of (node positions (N, 3) in millimeters, struts (E, 2) as node
+        index pairs), covering the cell and its 26 neighbours as far as they
+        reach into the cell
+    """
+    nodes, struts = lattice_graph(get_struts, (3, 3, 3))
+    # Centre the 3x3x3 block on the cell
+    nodes = (nodes - 2) * (cell_size / 2)
+
+    # Nodes on the block's side of its outer faces
+    inside = np.ones(len(nodes), dtype=bool)
+    if outer is not None:
+        lo = np.where([low for low, _ in outer], 0.0, -np.inf)
+        hi = np.where([high for _, high in outer], cell_size, np.inf)
+        inside = np.all((nodes >= lo) & (nodes <= hi), axis=1)
+        struts = struts[inside[struts].all(axis=1)]
+
+    lo = np.minimum(nodes[struts[:, 0]], nodes[struts[:, 1]]) - reach
+    hi = np.maximum(nodes[struts[:, 0]], nodes[struts[:, 1]]) + reach
+    struts = struts[np.all((hi >= 0) & (lo <= cell_size), axis=1)]
+
+    near = inside & np.all((nodes >= -reach) & (nodes <= cell_size + reach), axis=1)
+    used = np.union1d(np.flatnonzero(near), struts)
+    reindex = np.full(len(nodes), -1, dtype=np.int64)
+    reindex[used] = np.arange(len(used))
+    return nodes[used], reindex[struts]
+
+
+def _copy_groups(counts: Tuple[int, int, int]) -> Dict[Outer, List[np.ndarray]]:
+    """Cell indices grouped by which outer faces of the block each cell lies on."""
+    per_axis = []
+    for n in counts:
+        groups: Dict[Tuple[bool, bool], List[int]] = {}
+        for i in range(n):
+            key = (i == 0, i == n - 1)
+            groups.setdefault(key, []).append(i)
+        per_axis.append({key: np.array(ids) for key, ids in groups.items()})
+
+    copies = {}
+    for combo in itertools.product(*(axis.items() for axis in per_axis)):
+        key = tuple(flags for flags, _ in combo)
+        copies[key] = [ids for _, ids in combo]
+    return copies
+
+
+def _trimmed_mesh(cell: "m3d.Manifold", cell_size: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vertices (cell units), faces and cube side of each face (-1 if none) of a trimmed cell."""
+    mesh = cell.to_mesh64()
+    verts = np.asarray(mesh.vert_properties, dtype=np.float64)[:, :3] / cell_size
+    faces = np.asarray(mesh.tri_verts, dtype=np.int64).reshape(-1, 3)
+
+    # Side of the cube each cut face lies on: 2 * axis + (0 low, 1 high)
+    corners = verts[faces]
+    side = np.full(len(faces), -1, dtype=np.int64)
+    for axis in range(3):
+        side[np.all(corners[:, :, axis] <= _CELL_TOLERANCE, axis=1)] = 2 * axis
+        side[np.all(corners[:, :, axis] >= 1 - _CELL_TOLERANCE, axis=1)] = 2 * axis + 1
+    return verts, faces, side
+
+
+def tile_unit_cell(
+    build_cell: Callable[[Outer], "m3d.Manifold"],
+    cell_size: float,
+    counts: Tuple[int, int, int],
+) -> Optional["m3d.Manifold"]:
+    """
+    Replicate trimmed unit cells over a block of cells and weld the seams.
+
+    Args:
+        build_cell: Builds the lattice within the cube [0, cell_size]^3 for
+            a cell with the given outer faces (see cell_neighbourhood);
+            called once per combination present in the block
+        cell_size: Unit cell size in millimeters
+        counts: Number of cells (nx, ny, nz); the block starts at the origin
+
+    Returns:
+        The block as one Manifold, or None if the copies do not close up
+        into a valid manifold (the caller should then build the block
+        directly)
+    """
+    pieces = []
+    for outer, indices in _copy_groups(counts).items():
+        verts, faces, side = _trimmed_mesh(build_cell(outer), cell_size)
+        if len(faces) == 0:
+            return None
+
+        kept_sides = [2 * axis + end for axis, flags in enumerate(outer) for end in (0, 1) if flags[end]]
+        group_faces = faces[(side < 0) | np.isin(side, kept_sides)]
+        used = np.unique(group_faces)
+        reindex = np.full(len(verts), -1, dtype=np.int64)
+        reindex[used] = np.arange(len(used))
+        group_verts, group_faces = verts[used], reindex[group_faces]
+
+        shifts = np.stack(np.meshgrid(*indices, indexing='ij'), axis=-1).reshape(-1, 3).astype(np.float64)
+        tiled_verts = (group_verts[None, :, :] + shifts[:, None, :]).reshape(-1, 3)
+        tiled_faces = (group_faces[None, :, :]
+                       + (np.arange(len(shifts)) * len(group_verts))[:, None, None]).reshape(-1, 3)
+        pieces.append((tiled_verts, tiled_faces))
+
+    verts, faces = concatenate_meshes(pieces)
+
+    # Seam vertices lie on whole-cell planes (cell units)
+    on_seam = np.any(np.abs(verts - np.round(verts)) <= _CELL_TOLERANCE, axis=1)
+    verts, faces = weld_vertices(verts, faces, on_seam)
+
+    block = m3d.Manifold(m3d.Mesh64(
+        vert_properties=np.ascontiguousarray(verts * cell_size),
+        tri_verts=faces.astype(np.uint64),
+    ))
+    if block.status() != m3d.Error.NoError:
+        return None
+    return block
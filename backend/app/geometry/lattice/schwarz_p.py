@@ -18,12 +18,14 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Any
 
-try:
-    from skimage.measure import marching_cubes
-    HAS_SKIMAGE = True
-except ImportError:
-    marching_cubes = None
-    HAS_SKIMAGE = False
+from .slab_marching import HAS_SKIMAGE
+from .tpms import (
+    MarchingCubesMeshWrapper,
+    build_tpms_solid,
+    extract_tpms_surface,
+    linear_isovalue_field,
+    schwarz_p_field,
+)
 
 
 @dataclass
@@ -72,11 +74,19 @@ class SchwarzPParams:
         gradient_start_porosity: Porosity at gradient start
         gradient_end_porosity: Porosity at gradient end
 
+        # === Output ===
+        solid_mode: 'surface' (open zero-thickness sheet), 'sheet' (closed
+            wall of wall_thickness_um around the surface) or 'network' (solid
+            filling one side of the surface). Solids have a real volume and
+            can be inverted and tiled.
+
         # === Quality & Generation ===
         samples_per_cell: Grid resolution per unit cell (15-30)
         mesh_density: Output mesh density factor
         seed: Random seed (reserved for future stochastic features, currently unused)
         resolution: Overall resolution multiplier (affects mesh quality via sampling)
+        adaptive_extraction: Mesh with the adaptive octree extractor (fewer
+            samples and triangles on large blocks; disables cell tiling)
     """
     # Basic Geometry
     bounding_box_x_mm: float = 10.0
@@ -109,11 +119,15 @@ class SchwarzPParams:
     gradient_start_porosity: float = 0.6
     gradient_end_porosity: float = 0.85
 
+    # Output
+    solid_mode: str = 'surface'
+
     # Quality & Generation
     samples_per_cell: int = 20
     mesh_density: float = 1.0
     seed: int | None = None
     resolution: int = 15
+    adaptive_extraction: bool = False
 
     # Legacy compatibility
     bounding_box_mm: tuple[float, float, float] | None = None
@@ -146,7 +160,7 @@ def schwarz_p_function(
     With s_param, the range becomes -3*s to +3*s.
 
     Args:
-        X, Y, Z: 3D coordinate arrays (meshgrid output)
+        X, Y, Z: Coordinate arrays (meshgrid output or broadcastable 1-D views)
         L: Unit cell period (cell size)
         k_param: Wave number multiplier (default 1.0, higher = more oscillations)
         s_param: Surface stretching factor (default 1.0, scales output amplitude)
@@ -154,62 +168,7 @@ def schwarz_p_function(
     Returns:
         3D array of function values
     """
-    k = 2 * np.pi / L * k_param
-    return s_param * (np.cos(k * X) + np.cos(k * Y) + np.cos(k * Z))
-
-
-class _SimpleMesh:
-    """
-    Simple mesh wrapper that provides the interface expected by stl_export.
-
-    Mimics the manifold3d Mesh interface with:
-    - vert_properties: 2D array of vertex positions (N, 3)
-    - tri_verts: 2D array of triangle vertex indices (M, 3)
-    """
-
-    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
-        """
-        Initialize mesh from marching cubes output.
-
-        Args:
-            vertices: Vertex array (N, 3) from marching cubes
-            faces: Face array (M, 3) with vertex indices
-        """
-        # Store as 2D arrays - stl_export expects vert_properties[:, :3]
-        self.vert_properties = vertices.astype(np.float32)
-        # Store faces as 2D array - stl_export expects tri_verts as (M, 3)
-        self.tri_verts = faces.astype(np.uint32)
-
-
-class _MarchingCubesMeshWrapper:
-    """
-    Wrapper class that provides a manifold3d-like interface for marching cubes output.
-
-    This allows the API to use marching cubes meshes directly without requiring
-    manifold3d boolean operations, which fail on non-manifold TPMS surfaces.
-    """
-
-    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
-        """
-        Initialize wrapper from marching cubes output.
-
-        Args:
-            vertices: Vertex array (N, 3)
-            faces: Face array (M, 3) with vertex indices
-        """
-        self._vertices = vertices
-        self._faces = faces
-        self._mesh = _SimpleMesh(vertices, faces)
-
-    def to_mesh(self) -> _SimpleMesh:
-        """Return the mesh object."""
-        return self._mesh
-
-    def volume(self) -> float:
-        """
-        Return volume (0 for TPMS surfaces since they're not closed solids).
-        """
-        return 0.0
+    return schwarz_p_field(X, Y, Z, L, k_param=k_param, s_param=s_param)
 
 
 def _porosity_to_isovalue(porosity: float) -> float:
@@ -272,12 +231,13 @@ def generate_schwarz_p(params: SchwarzPParams) -> tuple[Any, dict]:
     Generate a Schwarz P TPMS scaffold using marching cubes.
 
     The algorithm:
-    1. Create a 3D grid covering the bounding box
-    2. Evaluate the Schwarz P implicit function at each grid point
-    3. Apply gradient porosity if enabled (spatially-varying isovalue)
-    4. Adjust for diffusion and mechanical targets
-    5. Use marching cubes to extract the isosurface
-    6. Return the mesh directly (no manifold3d boolean operations)
+    1. Adjust the isovalue for diffusion and mechanical targets
+    2. Build the isovalue (uniform, or graded along an axis if enabled)
+    3. Extract the surface with the shared TPMS engine: uniform surfaces with
+       an integer k_parameter are tiled from one periodic cell, others
+       meshed slab by slab; with solid_mode 'sheet' or 'network' a closed
+       manifold3d solid is built instead (see ``build_tpms_solid``)
+    4. Return the mesh directly (no manifold3d boolean operations)
 
     Args:
         params: SchwarzPParams configuration object
@@ -288,7 +248,11 @@ def generate_schwarz_p(params: SchwarzPParams) -> tuple[Any, dict]:
         Statistics include:
             - triangle_count: Number of triangles in mesh
             - volume_mm3: Scaffold volume (0 for surfaces)
-            - porosity: Void fraction (approximate)
+            - porosity: Measured void fraction (from the mesh volume for
+              solids, from the sampled field for surfaces)
+            - surface_area_density_per_mm: Surface area per box volume
+            - field_metrics: Field measurements of surfaces, including
+              plate-model wall thickness and pore size (None for solids)
             - cell_count: Number of unit cells in each dimension
             - scaffold_type: 'schwarz_p'
             - gradient_enabled: Whether gradient porosity was applied
@@ -327,22 +291,6 @@ def generate_schwarz_p(params: SchwarzPParams) -> tuple[Any, dict]:
     resolution_factor = params.resolution / 15.0  # Normalize around default of 15
     effective_samples = int(base_samples * mesh_density * resolution_factor)
     effective_samples = max(10, effective_samples)  # Ensure minimum viable resolution
-    nx = max(10, int(bx / L * effective_samples))
-    ny = max(10, int(by / L * effective_samples))
-    nz = max(10, int(bz / L * effective_samples))
-
-    # Create coordinate arrays
-    x = np.linspace(0, bx, nx)
-    y = np.linspace(0, by, ny)
-    z = np.linspace(0, bz, nz)
-    X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
-
-    # Spacing for marching cubes
-    spacing = (x[1] - x[0], y[1] - y[0], z[1] - z[0])
-
-    # Evaluate Schwarz P function with shape parameters
-    F = schwarz_p_function(X, Y, Z, L, k_param=params.k_parameter, s_param=params.s_parameter)
-
     # === diffusion_coefficient_ratio: Adjust connectivity ===
     # Higher diffusion ratio requires better pore connectivity
     # We can modulate the base isovalue slightly to improve connectivity
@@ -355,86 +303,87 @@ def generate_schwarz_p(params: SchwarzPParams) -> tuple[Any, dict]:
     # Calculate suggested porosity based on target modulus
     gibson_ashby_porosity = _gibson_ashby_porosity(params.elastic_modulus_target_gpa)
 
+    shape = {'k_param': params.k_parameter, 's_param': params.s_parameter}
+
     # === Determine effective isovalue ===
+    isovalue_field = None
+    effective_isovalue = params.isovalue + diffusion_isovalue_offset
     if params.enable_gradient:
         # === Gradient porosity: spatially-varying isovalue ===
         # Convert start/end porosity to isovalues
         start_porosity = max(0.2, min(0.9, params.gradient_start_porosity))
         end_porosity = max(0.2, min(0.9, params.gradient_end_porosity))
 
-        isovalue_start = _porosity_to_isovalue(start_porosity)
-        isovalue_end = _porosity_to_isovalue(end_porosity)
-
         # Apply diffusion offset to both ends
-        isovalue_start += diffusion_isovalue_offset
-        isovalue_end += diffusion_isovalue_offset
-
-        # Create position-dependent isovalue field based on gradient_axis
-        axis = params.gradient_axis.lower()
-        if axis == 'x':
-            # Gradient along X: normalize X position to [0, 1]
-            normalized_pos = X / bx
-            axis_length = bx
-        elif axis == 'y':
-            # Gradient along Y: normalize Y position to [0, 1]
-            normalized_pos = Y / by
-            axis_length = by
-        else:  # Default to 'z'
-            # Gradient along Z: normalize Z position to [0, 1]
-            normalized_pos = Z / bz
-            axis_length = bz
-
-        # Linear interpolation of isovalue along gradient axis
-        # isovalue(pos) = isovalue_start + (isovalue_end - isovalue_start) * normalized_pos
-        isovalue_field = isovalue_start + (isovalue_end - isovalue_start) * normalized_pos
-
-        # For gradient case, we need to threshold F against the spatially-varying isovalue
-        # Create a modified field: F_modified = F - isovalue_field
-        # Then extract isosurface at level=0
-        F_modified = F - isovalue_field
-
-        # Extract isosurface at level 0 (where F = isovalue_field)
-        try:
-            verts, faces, _, _ = marching_cubes(F_modified, level=0.0, spacing=spacing)
-        except ValueError as e:
-            raise ValueError(f"Failed to extract Schwarz P gradient surface: {e}")
+        isovalue_start = _porosity_to_isovalue(start_porosity) + diffusion_isovalue_offset
+        isovalue_end = _porosity_to_isovalue(end_porosity) + diffusion_isovalue_offset
 
-        # Calculate average porosity for stats
-        avg_isovalue = (isovalue_start + isovalue_end) / 2
-        estimated_porosity = 0.5 - (avg_isovalue * 0.15)
-        estimated_porosity = max(0.2, min(0.9, estimated_porosity))
+        # Surface lies where F equals the isovalue interpolated along gradient_axis
+        isovalue_field = linear_isovalue_field(
+            params.gradient_axis, isovalue_start, isovalue_end, (bx, by, bz)
+        )
 
-    else:
-        # === Uniform porosity: single isovalue ===
-        # Apply diffusion offset to base isovalue
-        effective_isovalue = params.isovalue + diffusion_isovalue_offset
+    if params.solid_mode != 'surface':
+        # Closed solid: has a volume and supports inversion and tiling
+        wall_mm = (
+            params.wall_thickness_mm if params.wall_thickness_mm is not None
+            else params.wall_thickness_um / 1000.0
+        )
+        result = build_tpms_solid(
+            'schwarz_p', L, (bx, by, bz), effective_samples,
+            mode=params.solid_mode,
+            level=effective_isovalue,
+            thickness_mm=wall_mm,
+            isovalue_field=isovalue_field,
+            adaptive=params.adaptive_extraction,
+            **shape,
+        )
+        triangle_count, vertex_count = result.num_tri(), result.num_vert()
+        volume = result.volume()
+        extraction = {'periodic_cell_tiling': False, 'grid_resolution': None, 'field_metrics': None}
 
-        # Extract single isosurface using marching cubes
+        # Measured from the mesh
+        porosity = 1.0 - volume / (bx * by * bz)
+        surface_area_density = result.surface_area() / (bx * by * bz)
+    else:
+        # With an integer k_parameter a uniform field repeats every unit cell
+        # and the engine tiles one periodic cell instead of meshing the whole box
         try:
-            verts, faces, _, _ = marching_cubes(F, level=effective_isovalue, spacing=spacing)
+            verts, faces, extraction = extract_tpms_surface(
+                'schwarz_p', L, (bx, by, bz), effective_samples,
+                level=effective_isovalue,
+                isovalue_field=isovalue_field,
+                adaptive=params.adaptive_extraction,
+                **shape,
+            )
         except ValueError as e:
             raise ValueError(f"Failed to extract Schwarz P surface: {e}")
 
-        # Estimate porosity based on effective isovalue
-        estimated_porosity = 0.5 - (effective_isovalue * 0.15)
-        estimated_porosity = max(0.2, min(0.9, estimated_porosity))
+        if len(verts) == 0 or len(faces) == 0:
+            raise ValueError("Marching cubes produced empty mesh for Schwarz P surface")
 
-    if len(verts) == 0 or len(faces) == 0:
-        raise ValueError("Marching cubes produced empty mesh for Schwarz P surface")
+        # Create wrapper with manifold3d-like interface
+        result = MarchingCubesMeshWrapper(verts, faces)
+        triangle_count, vertex_count = len(faces), len(verts)
+        volume = 0.0  # TPMS surfaces are not closed solids
 
-    # Create wrapper with manifold3d-like interface
-    result = _MarchingCubesMeshWrapper(verts, faces)
+        # Measured from the sampled field (void side of the surface)
+        porosity = extraction['field_metrics']['porosity']
+        surface_area_density = extraction['field_metrics']['surface_area_density_per_mm']
 
     # Calculate statistics
     cell_count = (int(bx / L), int(by / L), int(bz / L))
     total_cells = cell_count[0] * cell_count[1] * cell_count[2]
 
     stats = {
-        'triangle_count': len(faces),
-        'vertex_count': len(verts),
-        'volume_mm3': 0.0,  # TPMS surfaces are not closed solids
-        'porosity': estimated_porosity,
+        'triangle_count': triangle_count,
+        'vertex_count': vertex_count,
+        'volume_mm3': volume,
+        'solid_mode': params.solid_mode,
+        'porosity': porosity,
         'target_porosity': params.porosity,
+        'surface_area_density_per_mm': surface_area_density,
+        'field_metrics': extraction['field_metrics'],
         'cell_count': cell_count,
         'total_cells': total_cells,
         'unit_cell_size_mm': L,
@@ -458,7 +407,9 @@ def generate_schwarz_p(params: SchwarzPParams) -> tuple[Any, dict]:
         'mesh_density': mesh_density,
         'resolution': params.resolution,
         'effective_samples_per_cell': effective_samples,
-        'grid_resolution': (nx, ny, nz),
+        'grid_resolution': extraction['grid_resolution'],
+        'periodic_cell_tiling': extraction['periodic_cell_tiling'],
+        'adaptive_extraction': extraction.get('adaptive_extraction'),
         'seed': params.seed,  # Reserved for future stochastic features
     }
 
@@ -537,4 +488,8 @@ def generate_schwarz_p_from_dict(params: dict) -> tuple[Any, dict]:
         mesh_density=params.get('mesh_density', 1.0),
         seed=params.get('seed'),
         resolution=params.get('resolution', 15),
+        adaptive_extraction=params.get('adaptive_extraction', False),
+
+        # Output
+        solid_mode=params.get('solid_mode', 'surface'),
     ))
@@ -0,0 +1,157 @@
+"""
+Seed point distributions for Voronoi lattices.
+
+Uniform random seeds cluster and leave gaps, so Voronoi cell sizes vary a
+lot and neighbouring vertices end up very close together, producing tiny
+struts. Two ways to even the seeds out:
+
+- Poisson-disk sampling: seeds keep a minimum distance from each other.
+  Candidates are thrown in batches and checked against the accepted seeds
+  through a background grid with cells of r / sqrt(3), which hold at most
+  one seed each, so a candidate only looks at the 5x5x5 cells around it.
+- Lloyd relaxation: each iteration moves every seed to the centroid of its
+  Voronoi cell within the box, estimated from uniform samples assigned to
+  their nearest seed.
+
+Usage:
+    >>> seeds = poisson_disk_points((10, 10, 10), 200, rng)
+    >>> seeds = lloyd_relax(seeds, (10, 10, 10), iterations=3, rng=rng)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    cKDTree = None
+    HAS_SCIPY = False
+
+# Volume fraction covered by the seeds' r/2 balls when choosing r; random
+# sequential packing saturates near 0.38, so this target stays reachable
+_PACKING_FRACTION = 0.3
+
+# Neighbour cell offsets within two cells (cell size r / sqrt(3))
+_OFFSETS = np.stack(np.meshgrid(*[np.arange(-2, 3)] * 3, indexing='ij'), axis=-1).reshape(-1, 3)
+
+# Batches in a row that may fail to add a seed before sampling stops
+_MAX_IDLE_BATCHES = 8
+
+# Uniform samples per seed for one Lloyd centroid estimate
+_LLOYD_SAMPLES = 32
+
+
+def poisson_disk_radius(bbox: tuple[float, float, float], count: int) -> float:
+    """Minimum seed spacing for which ``count`` seeds fit comfortably in the box."""
+    volume = float(np.prod(bbox))
+    return (6 * _PACKING_FRACTION * volume / (np.pi * max(count, 1))) ** (1 / 3)
+
+
+def poisson_disk_points(
+    bbox: tuple[float, float, float],
+    count: int,
+    rng: np.random.Generator,
+    radius: float | None = None,
+) -> np.ndarray:
+    """
+    Poisson-disk seeds: random points no closer than ``radius`` to each other.
+
+    Args:
+        bbox: Bounding box dimensions (x, y, z)
+        count: Number of seeds wanted
+        rng: Numpy random generator
+        radius: Minimum spacing (default: poisson_disk_radius)
+
+    Returns:
+        Array of seed points (N, 3), N <= count; fewer only if the box
+        cannot take more seeds at this spacing
+    """
+    size = np.asarray(bbox, dtype=np.float64)
+    if radius is None:
+        radius = poisson_disk_radius(bbox, count)
+    cell = radius / np.sqrt(3)
+    shape = np.maximum(np.ceil(size / cell).astype(np.int64), 1)
+    grid = np.full(shape, -1, dtype=np.int64)
+    accepted = np.empty((count, 3))
+    n = 0
+    idle = 0
+
+    while n < count and idle < _MAX_IDLE_BATCHES:
+        candidates = rng.uniform(0.0, size, size=(max(64, 2 * (count - n)), 3))
+        cells = np.minimum((candidates / cell).astype(np.int64), shape - 1)
+
+        # Reject candidates near accepted seeds
+        near = cells[:, None, :] + _OFFSETS[None, :, :]
+        valid = np.all((near >= 0) & (near < shape), axis=2)
+        neighbours = np.where(valid, grid[tuple(np.clip(near, 0, shape - 1).transpose(2, 0, 1))], -1)
+        dist_sq = ((accepted[np.maximum(neighbours, 0)] - candidates[:, None, :]) ** 2).sum(axis=2)
+        free = ~np.any((neighbours >= 0) & (dist_sq < radius * radius), axis=1)
+        candidates, cells = candidates[free], cells[free]
+
+        # Among the rest, a candidate loses to any earlier one within reach
+        pairs = cKDTree(candidates).query_pairs(radius, output_type='ndarray')
+        keep = np.ones(len(candidates), dtype=bool)
+        keep[pairs.max(axis=1)] = False
+        candidates, cells = candidates[keep][:count - n], cells[keep][:count - n]
+
+        idle = idle + 1 if len(candidates) == 0 else 0
+        grid[tuple(cells.T)] = n + np.arange(len(candidates))
+        accepted[n:n + len(candidates)] = candidates
+        n += len(candidates)
+
+    return accepted[:n]
+
+
+def lloyd_relax(
+    points: np.ndarray,
+    bbox: tuple[float, float, float],
+    iterations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Move seeds towards the centroids of their Voronoi cells within the box.
+
+    Args:
+        points: Seed points (N, 3) inside the box
+        bbox: Bounding box dimensions (x, y, z)
+        iterations: Number of relaxation steps
+        rng: Numpy random generator for the centroid samples
+
+    Returns:
+        Relaxed seed points (N, 3)
+    """
+    points = np.array(points, dtype=np.float64)
+    size = np.asarray(bbox, dtype=np.float64)
+    for _ in range(iterations):
+        samples = rng.uniform(0.0, size, size=(_LLOYD_SAMPLES * len(points), 3))
+        _, owner = cKDTree(points).query(samples)
+        counts = np.bincount(owner, minlength=len(points))
+        sums = np.stack([np.bincount(owner, samples[:, k], len(points)) for k in range(3)], axis=1)
+        # Seeds without samples keep their position
+        hit = counts > 0
+        points[hit] = sums[hit] / counts[hit, None]
+    return points
+
+
+def mirror_points(points: np.ndarray, bbox: tuple[float, float, float], threshold: float) -> np.ndarray:
+    """
+    Reflections of points across each box face they are within ``threshold`` of.
+
+    Args:
+        points: Points (N, 3) inside the box
+        bbox: Bounding box dimensions (x, y, z)
+        threshold: Distance from a face below which a point is mirrored
+
+    Returns:
+        Mirror points (M, 3), faces in order -x, +x, -y, +y, -z, +z
+    """
+    mirrors = []
+    for axis, extent in enumerate(bbox):
+        for near, plane in ((points[:, axis] < threshold, 0.0),
+                            (points[:, axis] > extent - threshold, extent)):
+            reflected = points[near].copy()
+            reflected[:, axis] = 2 * plane - reflected[:, axis]
+            mirrors.append(reflected)
+    return np.concatenate(mirrors)
@@ -0,0 +1,205 @@
+"""
+Memory-bounded, slab-parallel marching cubes for TPMS generators.
+
+Evaluating a TPMS field on a full ``np.meshgrid`` allocates three float64
+coordinate arrays plus the field itself over the whole bounding box; at high
+mesh density on a 20 mm cube that is several gigabytes, followed by a single
+``marching_cubes`` call on one core.
+
+Here the grid is cut into Z-slabs that share their boundary sample plane.
+Each slab's field is computed from broadcast 1-D coordinate vectors (no
+meshgrid), meshed independently on a thread pool, and the slabs are stitched
+by welding the vertices that lie on the shared planes. Peak memory is bounded
+by the slab size times the worker count instead of the full grid.
+
+Seam welding is exact rather than tolerance-based: vertices on a shared plane
+are interpolated from the same two samples in both neighbouring slabs, and
+all slab meshes are extracted in grid-index space where the plane coordinate
+is an integer.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from skimage.measure import marching_cubes
+    HAS_SKIMAGE = True
+except ImportError:
+    marching_cubes = None
+    HAS_SKIMAGE = False
+
+
+# Field callback: takes broadcastable X (nx,1,1), Y (1,ny,1), Z (1,1,nz)
+# coordinate arrays and returns field values broadcastable to (nx, ny, nz).
+FieldFunction = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+# Slab callback: receives each slab's sampled float32 field and its
+# (start, stop) plane range, e.g. to measure the field while it is meshed.
+SlabObserver = Callable[[np.ndarray, int, int], None]
+
+# Default memory allowance for one slab's float32 field
+DEFAULT_SLAB_BYTES = 64 * 1024 * 1024
+
+# Decimal places kept when matching seam vertices (grid-index units)
+_SEAM_DECIMALS = 6
+
+
+def plan_slabs(nx: int, ny: int, nz: int, slab_bytes: int = DEFAULT_SLAB_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split ``nz`` sample planes into slabs that share their boundary plane.
+
+    Args:
+        nx, ny, nz: Grid sample counts
+        slab_bytes: Memory allowance for one slab's float32 field
+
+    Returns:
+        List of (start, stop) plane index ranges, inclusive of ``stop``
+    """
+    plane_bytes = nx * ny * np.dtype(np.float32).itemsize
+    cells_per_slab = max(1, int(slab_bytes // max(plane_bytes, 1)) - 1)
+    cells = nz - 1
+    return [
+        (start, min(start + cells_per_slab, cells))
+        for start in range(0, cells, cells_per_slab)
+    ]
+
+
+def _mesh_slab(
+    field_fn: FieldFunction,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    start: int,
+    stop: int,
+    level: float,
+    on_slab: Optional[SlabObserver] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mesh planes start..stop in grid-index coordinates (Z offset applied)."""
+    field = field_fn(x[:, None, None], y[None, :, None], z[None, None, start:stop + 1])
+    field = np.broadcast_to(field, (len(x), len(y), stop + 1 - start)).astype(np.float32)
+    if on_slab is not None:
+        on_slab(field, start, stop)
+
+    if not (field.min() <= level <= field.max()):
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    verts, faces, _, _ = marching_cubes(field, level=level)
+    verts = verts.astype(np.float64)
+    verts[:, 2] += start
+    return verts, faces.astype(np.int64)
+
+
+def weld_vertices(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    candidates: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge candidate vertices that share a position (vertex hash weld).
+
+    Positions are hashed after rounding in grid-index units, where seam
+    vertices from neighbouring pieces are computed from identical samples.
+
+    Args:
+        verts: Vertex array (N, 3) in grid-index coordinates
+        faces: Face array (M, 3)
+        candidates: Boolean mask (N,) of vertices that may be duplicated
+
+    Returns:
+        Tuple of (welded vertices, reindexed faces)
+    """
+    candidate_idx = np.flatnonzero(candidates)
+    if len(candidate_idx) == 0:
+        return verts, faces
+
+    # Integer keys + lexsort is much faster than np.unique(axis=0) on float rows
+    keys = np.round(verts[candidate_idx] * 10 ** _SEAM_DECIMALS).astype(np.int64)
+    order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0]))
+    sorted_keys = keys[order]
+    starts_group = np.empty(len(order), dtype=bool)
+    starts_group[0] = True
+    np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=starts_group[1:])
+    group_first = order[starts_group][np.cumsum(starts_group) - 1]
+
+    # Map every candidate to one representative of its position
+    remap = np.arange(len(verts))
+    remap[candidate_idx[order]] = candidate_idx[group_first]
+
+    # Drop the now-unreferenced duplicates and compact indices
+    keep = remap == np.arange(len(verts))
+    new_index = np.cumsum(keep) - 1
+    return verts[keep], new_index[remap][faces]
+
+
+def concatenate_meshes(meshes: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate (verts, faces) pieces into one indexed mesh."""
+    offsets = np.cumsum([0] + [len(v) for v, _ in meshes[:-1]])
+    verts = np.concatenate([v for v, _ in meshes])
+    faces = np.concatenate([f + off for (_, f), off in zip(meshes, offsets)])
+    return verts, faces
+
+
+def slab_marching_cubes(
+    field_fn: FieldFunction,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    level: float = 0.0,
+    slab_bytes: int = DEFAULT_SLAB_BYTES,
+    max_workers: Optional[int] = None,
+    on_slab: Optional[SlabObserver] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract an isosurface slab by slab along Z.
+
+    Args:
+        field_fn: Implicit field evaluated on broadcast coordinate arrays
+        x, y, z: Uniformly spaced 1-D sample coordinates (at least 2 each)
+        level: Isosurface level
+        slab_bytes: Memory allowance for one slab's float32 field
+        max_workers: Slabs meshed concurrently (default: CPU count)
+        on_slab: Called with every slab's sampled field and plane range,
+            possibly from worker threads
+
+    Returns:
+        Tuple of (vertices (N, 3) in world coordinates, faces (M, 3)).
+        Both are empty if the level is never crossed.
+
+    Raises:
+        ImportError: If scikit-image is not installed
+    """
+    if not HAS_SKIMAGE:
+        raise ImportError(
+            "scikit-image is required for TPMS generation. "
+            "Install with: pip install scikit-image"
+        )
+
+    slabs = plan_slabs(len(x), len(y), len(z), slab_bytes)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(slabs)))
+
+    def mesh(bounds: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        return _mesh_slab(field_fn, x, y, z, bounds[0], bounds[1], level, on_slab)
+
+    if workers == 1:
+        slab_meshes = [mesh(bounds) for bounds in slabs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            slab_meshes = list(executor.map(mesh, slabs))
+
+    slab_meshes = [(v, f) for v, f in slab_meshes if len(f) > 0]
+    if not slab_meshes:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    seam_planes = np.array([start for start, _ in slabs[1:]], dtype=np.float64)
+    verts, faces = concatenate_meshes(slab_meshes)
+    verts, faces = weld_vertices(verts, faces, np.isin(verts[:, 2], seam_planes))
+
+    # Grid-index space to world coordinates
+    spacing = np.array([x[1] - x[0], y[1] - y[0], z[1] - z[0]])
+    origin = np.array([x[0], y[0], z[0]])
+    return verts * spacing + origin, faces
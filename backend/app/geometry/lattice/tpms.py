@@ -0,0 +1,898 @@
+"""
+Implicit-surface engine for triply periodic minimal surface (TPMS) scaffolds.
+
+Every TPMS generator does the same work around a different formula: sample
+an implicit field over the bounding box, optionally shift the isovalue along
+an axis to grade porosity, extract the isosurface and wrap the mesh for the
+STL exporter. This module owns that shared machinery; a surface type is just
+a field function registered by name.
+
+Registered surfaces (k = 2*pi/L for unit cell size L):
+- gyroid:    sin(kx)cos(ky) + sin(ky)cos(kz) + sin(kz)cos(kx)
+- schwarz_p: s * (cos(k'x) + cos(k'y) + cos(k'z)), k' = k * k_param
+- diamond:   sin(kx)sin(ky)sin(kz) + sin(kx)cos(ky)cos(kz)
+             + cos(kx)sin(ky)cos(kz) + cos(kx)cos(ky)sin(kz)
+- iwp:       2(cos(kx)cos(ky) + cos(ky)cos(kz) + cos(kz)cos(kx))
+             - (cos(2kx) + cos(2ky) + cos(2kz))
+- neovius:   3(cos(kx) + cos(ky) + cos(kz)) + 4 cos(kx)cos(ky)cos(kz)
+
+Extraction has one backend with two paths. Uniform fields that repeat every
+unit cell are meshed from one periodic cell and tiled (``periodic_cell``);
+the sampled cell is cached by (surface, cell size, sampling, shape
+parameters), so editing only the isovalue or box size reuses it. Graded or
+otherwise non-periodic fields are meshed slab by slab over the whole box
+(``slab_marching``); those grids depend on the box and are not cached.
+
+Besides the open surface, the engine builds closed solids (``build_tpms_solid``)
+that behave like every other scaffold: they have a volume and can be inverted,
+combined and tiled. A sheet solid thickens the surface to a wall,
+t/2 - |F / |grad F||; a network solid fills one side of it. The field is
+clipped by the box's signed distance and sampled half a cube beyond the box,
+so the extracted isosurface is closed, and meshed with the same slab mesher
+(bounded memory) before being handed to manifold3d.
+
+Both can instead use the adaptive extractor (``adaptive_marching``), which
+skips blocks the surface cannot reach and meshes gently curved blocks at half
+resolution: fewer samples and triangles for large blocks at the same
+tolerance, at the cost of periodic-cell reuse.
+
+Surface extraction also measures porosity, surface area density and wall
+thickness from the sampled field (``field_metrics``), on the one periodic
+cell or on each slab as it is meshed.
+
+Usage:
+    >>> field = tpms_field("diamond", 2.0)
+    >>> verts, faces, info = extract_tpms_surface("diamond", 2.0, (6, 6, 6), 20)
+    >>> solid = build_tpms_solid("gyroid", 2.0, (6, 6, 6), 20, mode="sheet", thickness_mm=0.3)
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field as dataclass_field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import manifold3d as m3d
+import numpy as np
+
+from ..memory_budget import estimate_boolean_peak_bytes, get_active_budget
+from ..stage_cache import StageCache
+from .adaptive_marching import adaptive_marching_cubes, estimate_lipschitz
+from .field_metrics import FieldMetrics, measure_block, measure_field
+from .periodic_cell import sample_periodic_cell, tile_periodic_cell
+from .slab_marching import FieldFunction, HAS_SKIMAGE, slab_marching_cubes
+
+
+# =============================================================================
+# Surface registry
+# =============================================================================
+
+@dataclass(frozen=True)
+class TPMSDefinition:
+    """
+    A registered TPMS field function.
+
+    Attributes:
+        name: Registry name
+        func: Field ``func(X, Y, Z, L, **shape)`` on broadcastable arrays
+        description: One-line description of the surface
+        shape_defaults: Default values of the shape parameters ``func`` accepts
+        is_periodic: Returns True if the field repeats every unit cell for
+            the given shape parameters
+    """
+    name: str
+    func: Callable[..., np.ndarray]
+    description: str
+    shape_defaults: Dict[str, float] = dataclass_field(default_factory=dict)
+    is_periodic: Callable[..., bool] = lambda **shape: True
+
+
+_REGISTRY: Dict[str, TPMSDefinition] = {}
+
+
+def tpms_surface(
+    name: str,
+    description: str,
+    shape_defaults: Optional[Dict[str, float]] = None,
+    is_periodic: Optional[Callable[..., bool]] = None,
+) -> Callable:
+    """
+    Decorator registering a TPMS field function.
+
+    Args:
+        name: Registry name (e.g. 'gyroid')
+        description: One-line description of the surface
+        shape_defaults: Default values of extra shape parameters
+        is_periodic: Periodicity check for shape parameters (default: always)
+    """
+    def decorator(func: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+        kwargs = {}
+        if is_periodic is not None:
+            kwargs["is_periodic"] = is_periodic
+        _REGISTRY[name] = TPMSDefinition(
+            name=name,
+            func=func,
+            description=description,
+            shape_defaults=dict(shape_defaults or {}),
+            **kwargs,
+        )
+        return func
+    return decorator
+
+
+def get_tpms_surface(name: str) -> TPMSDefinition:
+    """
+    Look up a registered TPMS surface.
+
+    Raises:
+        KeyError: If the surface is not registered
+    """
+    if name not in _REGISTRY:
+        raise KeyError(
+            f"Unknown TPMS surface: {name}. "
+            f"Available: {', '.join(sorted(_REGISTRY.keys()))}"
+        )
+    return _REGISTRY[name]
+
+
+def list_tpms_surfaces() -> List[str]:
+    """Return the names of all registered TPMS surfaces."""
+    return sorted(_REGISTRY.keys())
+
+
+@tpms_surface("gyroid", "Gyroid: chiral, smoothly curved, highly permeable")
+def gyroid_field(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, L: float) -> np.ndarray:
+    k = 2 * np.pi / L
+    return (
+        np.sin(k * X) * np.cos(k * Y) +
+        np.sin(k * Y) * np.cos(k * Z) +
+        np.sin(k * Z) * np.cos(k * X)
+    )
+
+
+@tpms_surface(
+    "schwarz_p",
+    "Schwarz P: cubic symmetry with circular openings along each axis",
+    shape_defaults={"k_param": 1.0, "s_param": 1.0},
+    # Other wave number multipliers do not repeat within one unit cell
+    is_periodic=lambda k_param=1.0, **_: k_param > 0 and float(k_param).is_integer(),
+)
+def schwarz_p_field(
+    X: np.ndarray,
+    Y: np.ndarray,
+    Z: np.ndarray,
+    L: float,
+    k_param: float = 1.0,
+    s_param: float = 1.0,
+) -> np.ndarray:
+    k = 2 * np.pi / L * k_param
+    return s_param * (np.cos(k * X) + np.cos(k * Y) + np.cos(k * Z))
+
+
+@tpms_surface("diamond", "Schwarz D (diamond): tetrahedral network, stiff under compression")
+def diamond_field(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, L: float) -> np.ndarray:
+    k = 2 * np.pi / L
+    sx, sy, sz = np.sin(k * X), np.sin(k * Y), np.sin(k * Z)
+    cx, cy, cz = np.cos(k * X), np.cos(k * Y), np.cos(k * Z)
+    return sx * sy * sz + sx * cy * cz + cx * sy * cz + cx * cy * sz
+
+
+@tpms_surface("iwp", "Schoen I-WP: two interpenetrating channel systems of unequal size")
+def iwp_field(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, L: float) -> np.ndarray:
+    k = 2 * np.pi / L
+    cx, cy, cz = np.cos(k * X), np.cos(k * Y), np.cos(k * Z)
+    return (
+        2 * (cx * cy + cy * cz + cz * cx)
+        - (np.cos(2 * k * X) + np.cos(2 * k * Y) + np.cos(2 * k * Z))
+    )
+
+
+@tpms_surface("neovius", "Neovius: high-genus surface with small, well-connected pores")
+def neovius_field(X: np.ndarray, Y: np.ndarray, Z: np.ndarray, L: float) -> np.ndarray:
+    k = 2 * np.pi / L
+    cx, cy, cz = np.cos(k * X), np.cos(k * Y), np.cos(k * Z)
+    return 3 * (cx + cy + cz) + 4 * cx * cy * cz
+
+
+# =============================================================================
+# Field construction
+# =============================================================================
+
+def tpms_field(name: str, L: float, **shape: float) -> FieldFunction:
+    """
+    Bind a registered surface to a unit cell size and shape parameters.
+
+    Args:
+        name: Registered surface name
+        L: Unit cell size in millimeters
+        **shape: Shape parameters of the surface (e.g. k_param, s_param)
+
+    Returns:
+        Field function of (X, Y, Z)
+    """
+    func = get_tpms_surface(name).func
+
+    def field(X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> np.ndarray:
+        return func(X, Y, Z, L, **shape)
+    return field
+
+
+def linear_isovalue_field(
+    axis: str,
+    start: float,
+    end: float,
+    extent: Tuple[float, float, float],
+) -> FieldFunction:
+    """
+    Isovalue that varies linearly along one axis of the bounding box.
+
+    Subtracting it from a TPMS field and extracting at level 0 grades the
+    porosity from ``start`` to ``end`` across the box.
+
+    Args:
+        axis: 'x', 'y' or 'z' (anything else is treated as 'z')
+        start: Isovalue at the box origin
+        end: Isovalue at the far side of the box
+        extent: Box size (x, y, z) in millimeters
+
+    Returns:
+        Field function of (X, Y, Z)
+    """
+    index = {"x": 0, "y": 1}.get(axis.lower(), 2)
+    length = extent[index]
+
+    def isovalue(X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> np.ndarray:
+        coord = (X, Y, Z)[index]
+        t = np.clip(coord / length, 0, 1) if length > 0 else np.zeros_like(coord)
+        return start + (end - start) * t
+    return isovalue
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+_cell_cache = StageCache(max_entries=32)
+
+
+def get_tpms_cell_cache() -> StageCache:
+    """Return the cache of sampled periodic TPMS cells."""
+    return _cell_cache
+
+
+def _sampled_cell(name: str, L: float, cubes_per_period: int, shape: Dict[str, float]) -> Tuple[np.ndarray, bool]:
+    """Sampled periodic cell of a surface, and whether it came from the cache."""
+    key = (name, float(L), int(cubes_per_period), tuple(sorted(shape.items())))
+    cell = _cell_cache.get(key)
+    if cell is not None:
+        return cell, True
+    cell = sample_periodic_cell(tpms_field(name, L, **shape), L, cubes_per_period)
+    _cell_cache.put(key, cell)
+    return cell, False
+
+
+def extract_tpms_surface(
+    name: str,
+    L: float,
+    extent: Tuple[float, float, float],
+    cubes_per_period: int,
+    level: float = 0.0,
+    isovalue_field: Optional[FieldFunction] = None,
+    allow_periodic: bool = True,
+    adaptive: bool = False,
+    **shape: float,
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+    """
+    Extract a TPMS isosurface over a box starting at the origin.
+
+    Args:
+        name: Registered surface name
+        L: Unit cell size in millimeters
+        extent: Box size (x, y, z) in millimeters
+        cubes_per_period: Marching cubes per unit cell along each axis
+        level: Isosurface level (ignored when ``isovalue_field`` is given)
+        isovalue_field: Spatially varying isovalue; the surface is extracted
+            where the field equals it
+        allow_periodic: Permit periodic-cell tiling. Callers that post-process
+            vertices in mesh order can disable it to keep the slab layout.
+        adaptive: Use the adaptive octree extractor instead of uniform
+            marching cubes (never tiled)
+        **shape: Shape parameters of the surface
+
+    Returns:
+        Tuple of (vertices (N, 3), faces (M, 3), info). ``info`` holds
+        'periodic_cell_tiling', 'grid_resolution', 'cell_field_cached' and
+        'field_metrics' (porosity, surface area density and wall thickness
+        measured from the sampled field, see ``field_metrics``), plus
+        'adaptive_extraction' statistics when ``adaptive`` is set.
+        Vertices and faces are empty if the level is never crossed.
+
+    Raises:
+        ImportError: If scikit-image is not installed
+        KeyError: If the surface is not registered
+    """
+    if not HAS_SKIMAGE:
+        raise ImportError(
+            "scikit-image is required for TPMS generation. "
+            "Install with: pip install scikit-image"
+        )
+
+    definition = get_tpms_surface(name)
+    shape = {**definition.shape_defaults, **shape}
+    bx, by, bz = extent
+    nx = max(10, int(bx / L * cubes_per_period))
+    ny = max(10, int(by / L * cubes_per_period))
+    nz = max(10, int(bz / L * cubes_per_period))
+
+    info: Dict[str, Any] = {
+        'periodic_cell_tiling': False,
+        'grid_resolution': (nx, ny, nz),
+        'cell_field_cached': False,
+    }
+
+    if adaptive:
+        # Coarse blocks halve the resolution, so the cube counts must be even
+        nx, ny, nz = (n + 1 - n % 2 for n in (nx, ny, nz))
+        info['grid_resolution'] = (nx, ny, nz)
+
+    if (isovalue_field is None and allow_periodic and not adaptive
+            and definition.is_periodic(**shape)):
+        cell, cached = _sampled_cell(name, L, cubes_per_period, shape)
+        verts, faces = tile_periodic_cell(cell, L, extent, level=level)
+        info['periodic_cell_tiling'] = True
+        info['cell_field_cached'] = cached
+        # Every cell is the same, so one cell's measurements hold for the box
+        info['field_metrics'] = _measure_cell(cell, L, level).as_stats()
+        return verts, faces, info
+
+    surface = tpms_field(name, L, **shape)
+    if isovalue_field is not None:
+        def field(X, Y, Z):
+            return surface(X, Y, Z) - isovalue_field(X, Y, Z)
+        level = 0.0
+    else:
+        field = surface
+
+    # The field is evaluated slab by slab from these 1-D vectors, never on a
+    # full meshgrid
+    x = np.linspace(0, bx, nx)
+    y = np.linspace(0, by, ny)
+    z = np.linspace(0, bz, nz)
+    if adaptive:
+        periodic = isovalue_field is None and definition.is_periodic(**shape)
+        verts, faces, adaptive_stats = adaptive_marching_cubes(
+            field, x, y, z, level=level, lipschitz=_lipschitz(field, L, extent, periodic),
+        )
+        info['adaptive_extraction'] = asdict(adaptive_stats)
+        # The adaptive extractor samples no regular grid to measure
+        if periodic:
+            metrics = _measure_cell(_sampled_cell(name, L, cubes_per_period, shape)[0], L, level)
+        else:
+            metrics = measure_field(field, x, y, z, level=level)
+    else:
+        spacing = (x[1] - x[0], y[1] - y[0], z[1] - z[0])
+        slab_metrics: List[FieldMetrics] = []
+        verts, faces = slab_marching_cubes(
+            field, x, y, z, level=level,
+            on_slab=lambda values, start, stop: slab_metrics.append(measure_block(values, level, spacing)),
+        )
+        metrics = FieldMetrics()
+        for part in slab_metrics:
+            metrics.merge(part)
+    info['field_metrics'] = metrics.as_stats()
+    return verts, faces, info
+
+
+def _measure_cell(cell: np.ndarray, L: float, level: float) -> FieldMetrics:
+    """Measurements of one sampled periodic cell."""
+    step = L / (cell.shape[0] - 1)
+    return measure_block(cell, level, (step, step, step), periodic=True)
+
+
+def _lipschitz(field: FieldFunction, L: float, extent: Tuple[float, float, float], periodic: bool) -> float:
+    """Gradient bound of a field, from one unit cell when it is periodic."""
+    bounds = (0.0, 0.0, 0.0, L, L, L) if periodic else (0.0, 0.0, 0.0, *extent)
+    return estimate_lipschitz(field, bounds)
+
+
+SOLID_MODES = ('sheet', 'network')
+
+# Hard limits on a solid's sampling grid and estimated mesh, whatever the
+# memory budget: beyond them sampling alone takes minutes
+MAX_SOLID_SAMPLES = 50_000_000
+MAX_SOLID_TRIANGLES = 20_000_000
+
+# The level-set fallback evaluates the field point by point in Python
+MAX_LEVEL_SET_SAMPLES = 1_000_000
+
+# Triangles per isosurface, per unit cell volume over the squared cube size
+# (V / L / h^2), measured on the registered surfaces including the box clip
+_TRIANGLES_PER_SURFACE = 13.0
+
+
+def _normalized(field: FieldFunction, step: float) -> FieldFunction:
+    """First-order distance estimate F / |grad F| by central differences."""
+    def distance(X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> np.ndarray:
+        gx = field(X + step, Y, Z) - field(X - step, Y, Z)
+        gy = field(X, Y + step, Z) - field(X, Y - step, Z)
+        gz = field(X, Y, Z + step) - field(X, Y, Z - step)
+        grad = np.sqrt(gx * gx + gy * gy + gz * gz) / (2 * step)
+        return field(X, Y, Z) / np.maximum(grad, 1e-6)
+    return distance
+
+
+def estimate_solid_size(
+    L: float,
+    extent: Tuple[float, float, float],
+    counts: List[int],
+    mode: str,
+) -> Tuple[int, int]:
+    """
+    Sample and triangle counts of a TPMS solid before it is meshed.
+
+    Args:
+        L: Unit cell size in millimeters
+        extent: Box size (x, y, z) in millimeters
+        counts: Marching cubes along each axis
+        mode: 'sheet' (two surfaces) or 'network' (one)
+
+    Returns:
+        Tuple of (grid samples, estimated triangles)
+    """
+    samples = int(np.prod([n + 2 for n in counts], dtype=np.float64))
+    spacing = min(size / n for size, n in zip(extent, counts))
+    surfaces = 2 if mode == 'sheet' else 1
+    cells = float(np.prod(extent)) / L
+    triangles = int(_TRIANGLES_PER_SURFACE * surfaces * cells / spacing ** 2)
+    return samples, triangles
+
+
+def _check_solid_size(samples: int, triangles: int, max_samples: int, label: str) -> None:
+    """Reject a solid whose sampling or mesh is too large, before any sampling."""
+    if samples > max_samples or triangles > MAX_SOLID_TRIANGLES:
+        raise ValueError(
+            f"{label} needs {samples:,} field samples and about {triangles:,} triangles "
+            f"(limits {max_samples:,} and {MAX_SOLID_TRIANGLES:,}). "
+            "Increase the wall thickness or reduce resolution or scaffold size."
+        )
+    budget = get_active_budget()
+    if budget is not None:
+        budget.check_estimate(estimate_boolean_peak_bytes([triangles]), label)
+
+
+def build_tpms_solid(
+    name: str,
+    L: float,
+    extent: Tuple[float, float, float],
+    cubes_per_period: int,
+    mode: str = 'sheet',
+    level: float = 0.0,
+    thickness_mm: float = 0.3,
+    isovalue_field: Optional[FieldFunction] = None,
+    adaptive: bool = False,
+    **shape: float,
+) -> m3d.Manifold:
+    """
+    Build a watertight TPMS solid filling a box starting at the origin.
+
+    Args:
+        name: Registered surface name
+        L: Unit cell size in millimeters
+        extent: Box size (x, y, z) in millimeters
+        cubes_per_period: Marching cubes per unit cell along each axis; raised
+            for sheets so the wall is at least two cubes thick
+        mode: 'sheet' (wall of thickness_mm around the surface) or
+            'network' (the region where the field is below the isovalue)
+        level: Isovalue of the surface (ignored when ``isovalue_field`` is given)
+        thickness_mm: Sheet wall thickness in millimeters
+        isovalue_field: Spatially varying isovalue
+        adaptive: Use the adaptive octree extractor instead of uniform
+            marching cubes
+        **shape: Shape parameters of the surface
+
+    Returns:
+        Closed manifold3d solid
+
+    Raises:
+        ImportError: If scikit-image is not installed
+        KeyError: If the surface is not registered
+        ValueError: If the mode is unknown, the solid is empty, or its
+            sampling grid or mesh would exceed MAX_SOLID_SAMPLES or
+            MAX_SOLID_TRIANGLES
+        MemoryBudgetExceeded: If the estimated mesh exceeds the request's
+            memory budget
+    """
+    if mode not in SOLID_MODES:
+        raise ValueError(f"Unknown TPMS solid mode: {mode}. Available: {', '.join(SOLID_MODES)}")
+
+    definition = get_tpms_surface(name)
+    shape = {**definition.shape_defaults, **shape}
+    surface = tpms_field(name, L, **shape)
+    if isovalue_field is not None:
+        def offset(X, Y, Z):
+            return surface(X, Y, Z) - isovalue_field(X, Y, Z)
+    else:
+        def offset(X, Y, Z):
+            return surface(X, Y, Z) - level
+
+    # A sheet wall must span at least two cubes or it breaks up into holes
+    if mode == 'sheet':
+        cubes_per_period = max(cubes_per_period, int(np.ceil(2 * L / thickness_mm)))
+
+    bx, by, bz = extent
+    counts = [max(10, int(size / L * cubes_per_period)) for size in extent]
+    spacing = [size / n for size, n in zip(extent, counts)]
+    samples, triangles = estimate_solid_size(L, extent, counts, mode)
+    _check_solid_size(samples, triangles, MAX_SOLID_SAMPLES, f"TPMS {mode} solid")
+    distance = _normalized(offset, step=min(spacing) / 4)
+
+    # Positive inside the solid, clipped by the box's signed distance
+    def solid(X, Y, Z):
+        d = distance(X, Y, Z)
+        inside = thickness_mm / 2 - np.abs(d) if mode == 'sheet' else -d
+        box = np.minimum(
+            np.minimum(np.minimum(X, bx - X), np.minimum(Y, by - Y)),
+            np.minimum(Z, bz - Z),
+        )
+        return np.minimum(inside, box)
+
+    # Samples sit half a cube off the box faces so no sample lies exactly on
+    # the clip plane, and the outermost layer is outside the box (closed mesh)
+    x, y, z = [(np.arange(n + 2) - 0.5) * h for n, h in zip(counts, spacing)]
+    if adaptive:
+        # The wall is a distance field, so its gradient is close to one
+        # everywhere; the box clip has gradient one
+        periodic = isovalue_field is None and definition.is_periodic(**shape)
+        lipschitz = max(1.0, _lipschitz(distance, L, extent, periodic))
+        verts, faces, _ = adaptive_marching_cubes(solid, x, y, z, level=0.0, lipschitz=lipschitz)
+    else:
+        verts, faces = slab_marching_cubes(solid, x, y, z, level=0.0)
+    if len(faces) == 0:
+        raise ValueError(f"TPMS {mode} solid for {name} is empty; adjust isovalue or thickness")
+
+    # Marching cubes winds faces towards decreasing values; manifold3d wants
+    # outward normals, and "outside" is where the solid field is negative
+    mesh = m3d.Mesh(
+        vert_properties=verts.astype(np.float32),
+        tri_verts=faces[:, ::-1].astype(np.uint32),
+    )
+    result = m3d.Manifold(mesh)
+    if result.status() != m3d.Error.NoError:
+        # Ambiguous cubes can leave a few non-manifold edges; manifold3d's
+        # marching tetrahedra always produces a valid solid, but samples the
+        # field one point at a time
+        edge = min(spacing)
+        level_set_samples = int(np.prod([size / edge + 2 for size in extent]))
+        _check_solid_size(level_set_samples, triangles, MAX_LEVEL_SET_SAMPLES, f"TPMS {mode} solid repair")
+        result = m3d.Manifold.level_set(
+            lambda px, py, pz: float(solid(np.float64(px), np.float64(py), np.float64(pz))),
+            [0.0, 0.0, 0.0, bx, by, bz],
+            edge,
+        )
+    if result.is_empty():
+        raise ValueError(f"TPMS {mode} solid for {name} is empty; adjust isovalue or thickness")
+    return result
+
+
+# =============================================================================
+# Mesh output
+# =============================================================================
+
+def apply_surface_texture(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    amplitude_um: float,
+    seed: int | None = None
+) -> np.ndarray:
+    """
+    Apply micro-texture to mesh surface using noise-based vertex displacement.
+
+    This creates surface roughness beneficial for cell attachment. The texture
+    is applied by displacing vertices along their estimated normals.
+
+    Args:
+        vertices: Vertex array (N, 3) from marching cubes
+        faces: Face array (M, 3) with vertex indices (used for normal estimation)
+        amplitude_um: Texture amplitude in micrometers (5-20 μm typical for osteoblasts)
+        seed: Random seed for reproducibility
+
+    Returns:
+        Modified vertex array with texture applied
+    """
+    if amplitude_um <= 0:
+        return vertices
+
+    # Convert amplitude from micrometers to millimeters
+    amplitude_mm = amplitude_um / 1000.0
+
+    # Set random seed for reproducibility
+    rng = np.random.default_rng(seed)
+
+    # Estimate vertex normals from adjacent faces
+    vertex_normals = np.zeros_like(vertices)
+
+    v0 = vertices[faces[:, 0]]
+    v1 = vertices[faces[:, 1]]
+    v2 = vertices[faces[:, 2]]
+
+    # Face normals via cross product
+    face_normals = np.cross(v1 - v0, v2 - v0)
+    norms = np.linalg.norm(face_normals, axis=1, keepdims=True)
+    norms = np.where(norms > 1e-10, norms, 1.0)  # Avoid division by zero
+    face_normals = face_normals / norms
+
+    # Accumulate face normals to vertices
+    for i in range(3):
+        np.add.at(vertex_normals, faces[:, i], face_normals)
+
+    vertex_norms = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+    vertex_norms = np.where(vertex_norms > 1e-10, vertex_norms, 1.0)
+    vertex_normals = vertex_normals / vertex_norms
+
+    # Position-dependent noise (simulates Perlin-like behavior)
+    pos_scale = 10.0  # Frequency of texture features
+    noise_x = np.sin(vertices[:, 0] * pos_scale + vertices[:, 1] * 0.7)
+    noise_y = np.sin(vertices[:, 1] * pos_scale + vertices[:, 2] * 0.7)
+    noise_z = np.sin(vertices[:, 2] * pos_scale + vertices[:, 0] * 0.7)
+    position_noise = (noise_x + noise_y + noise_z) / 3.0
+
+    # Random component for micro-roughness
+    random_noise = rng.uniform(-1, 1, len(vertices))
+
+    # Combine: 70% position-based (smooth), 30% random (rough)
+    displacement = (0.7 * position_noise + 0.3 * random_noise) * amplitude_mm
+
+    # Apply displacement along normals
+    return vertices + vertex_normals * displacement[:, np.newaxis]
+
+
+class SimpleMesh:
+    """
+    Simple mesh wrapper that provides the interface expected by stl_export.
+
+    Mimics the manifold3d Mesh interface with:
+    - vert_properties: 2D array of vertex positions (N, 3)
+    - tri_verts: 2D array of triangle vertex indices (M, 3)
+    """
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
+        """
+        Initialize mesh from marching cubes output.
+
+        Args:
+            vertices: Vertex array (N, 3) from marching cubes
+            faces: Face array (M, 3) with vertex indices
+        """
+        # Store as 2D arrays - stl_export expects vert_properties[:, :3]
+        self.vert_properties = vertices.astype(np.float32)
+        # Store faces as 2D array - stl_export expects tri_verts as (M, 3)
+        self.tri_verts = faces.astype(np.uint32)
+
+
+class MarchingCubesMeshWrapper:
+    """
+    Wrapper class that provides a manifold3d-like interface for marching cubes output.
+
+    This allows the API to use marching cubes meshes directly without requiring
+    manifold3d boolean operations, which fail on non-manifold TPMS surfaces.
+    """
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray):
+        """
+        Initialize wrapper from marching cubes output.
+
+        Args:
+            vertices: Vertex array (N, 3)
+            faces: Face array (M, 3) with vertex indices
+        """
+        self._vertices = vertices
+        self._faces = faces
+        self._mesh = SimpleMesh(vertices, faces)
+
+    def to_mesh(self) -> SimpleMesh:
+        """Return the mesh object."""
+        return self._mesh
+
+    def volume(self) -> float:
+        """
+        Return volume (0 for TPMS surfaces since they're not closed solids).
+        """
+        return 0.0
+
+
+# =============================================================================
+# Generic generator
+# =============================================================================
+
+@dataclass
+class TPMSParams:
+    """
+    Parameters for a sheet TPMS scaffold of any registered surface type.
+
+    Surface-specific generators (gyroid, Schwarz P) map porosity targets onto
+    isovalues with their own calibrations; this generic form takes isovalues
+    directly.
+
+    Attributes:
+        surface_type: Registered surface name (see ``list_tpms_surfaces``)
+        bounding_box_x_mm: Scaffold X dimension in millimeters
+        bounding_box_y_mm: Scaffold Y dimension in millimeters
+        bounding_box_z_mm: Scaffold Z dimension in millimeters
+        unit_cell_size_mm: Unit cell period in millimeters
+        isovalue: Implicit surface level
+        shape_params: Extra shape parameters of the surface (e.g. k_param)
+        solid_mode: 'surface' (open sheet), 'sheet' or 'network' (closed solids)
+        wall_thickness_mm: Wall thickness of 'sheet' solids in millimeters
+        enable_gradient: Grade the isovalue linearly along gradient_axis
+        gradient_axis: 'x', 'y' or 'z'
+        gradient_start_isovalue: Isovalue at the start of the gradient axis
+        gradient_end_isovalue: Isovalue at the end of the gradient axis
+        enable_surface_texture: Add micro-roughness to the surface
+        texture_amplitude_um: Texture amplitude in micrometers
+        samples_per_cell: Marching cubes per unit cell at default resolution
+        mesh_density: Multiplier on samples_per_cell
+        resolution: Overall quality (15 = default)
+        adaptive_extraction: Mesh with the adaptive octree extractor
+        seed: Random seed for the surface texture
+    """
+    surface_type: str = 'gyroid'
+    bounding_box_x_mm: float = 10.0
+    bounding_box_y_mm: float = 10.0
+    bounding_box_z_mm: float = 10.0
+    unit_cell_size_mm: float = 2.0
+    isovalue: float = 0.0
+    shape_params: Dict[str, float] = dataclass_field(default_factory=dict)
+    solid_mode: str = 'surface'
+    wall_thickness_mm: float = 0.3
+
+    enable_gradient: bool = False
+    gradient_axis: str = 'z'
+    gradient_start_isovalue: float = 0.0
+    gradient_end_isovalue: float = 0.5
+
+    enable_surface_texture: bool = False
+    texture_amplitude_um: float = 10.0
+
+    samples_per_cell: int = 20
+    mesh_density: float = 1.0
+    resolution: int = 15
+    adaptive_extraction: bool = False
+    seed: int | None = None
+
+
+def generate_tpms(params: TPMSParams) -> tuple[Any, dict]:
+    """
+    Generate a sheet TPMS scaffold of any registered surface type.
+
+    Args:
+        params: TPMSParams configuration object
+
+    Returns:
+        Tuple of (mesh_wrapper, statistics_dict)
+
+    Raises:
+        ImportError: If scikit-image is not installed
+        ValueError: If the surface type is unknown or extraction is empty
+    """
+    if params.surface_type not in _REGISTRY:
+        raise ValueError(
+            f"Unknown TPMS surface: {params.surface_type}. "
+            f"Available: {', '.join(list_tpms_surfaces())}"
+        )
+
+    extent = (params.bounding_box_x_mm, params.bounding_box_y_mm, params.bounding_box_z_mm)
+    L = params.unit_cell_size_mm
+    effective_samples = int(params.samples_per_cell * params.mesh_density * (params.resolution / 15.0))
+    effective_samples = max(10, effective_samples)  # Minimum 10 samples per cell
+
+    isovalue_field = None
+    if params.enable_gradient:
+        isovalue_field = linear_isovalue_field(
+            params.gradient_axis,
+            params.gradient_start_isovalue,
+            params.gradient_end_isovalue,
+            extent,
+        )
+
+    if params.solid_mode != 'surface':
+        result = build_tpms_solid(
+            params.surface_type, L, extent, effective_samples,
+            mode=params.solid_mode,
+            level=params.isovalue,
+            thickness_mm=params.wall_thickness_mm,
+            isovalue_field=isovalue_field,
+            adaptive=params.adaptive_extraction,
+            **params.shape_params,
+        )
+        triangle_count, vertex_count = result.num_tri(), result.num_vert()
+        volume = result.volume()
+        info = {'periodic_cell_tiling': False, 'field_metrics': None}
+        box_volume = float(np.prod(extent))
+        porosity = 1.0 - volume / box_volume
+        surface_area_density = result.surface_area() / box_volume
+    else:
+        verts, faces, info = extract_tpms_surface(
+            params.surface_type, L, extent, effective_samples,
+            level=params.isovalue,
+            isovalue_field=isovalue_field,
+            allow_periodic=not params.enable_surface_texture,
+            adaptive=params.adaptive_extraction,
+            **params.shape_params,
+        )
+        if len(verts) == 0 or len(faces) == 0:
+            raise ValueError(f"Marching cubes produced empty mesh for {params.surface_type} surface")
+
+        if params.enable_surface_texture and params.texture_amplitude_um > 0:
+            verts = apply_surface_texture(verts, faces, params.texture_amplitude_um, seed=params.seed)
+
+        result = MarchingCubesMeshWrapper(verts, faces)
+        triangle_count, vertex_count = len(faces), len(verts)
+        volume = 0.0  # TPMS surfaces are not closed solids
+        porosity = info['field_metrics']['porosity']
+        surface_area_density = info['field_metrics']['surface_area_density_per_mm']
+
+    cell_count = tuple(int(size / L) for size in extent)
+    stats = {
+        'triangle_count': triangle_count,
+        'vertex_count': vertex_count,
+        'volume_mm3': volume,
+        'porosity': porosity,
+        'surface_area_density_per_mm': surface_area_density,
+        'surface_type': params.surface_type,
+        'solid_mode': params.solid_mode,
+        'isovalue': params.isovalue,
+        'shape_params': dict(params.shape_params),
+        'cell_count': cell_count,
+        'total_cells': cell_count[0] * cell_count[1] * cell_count[2],
+        'unit_cell_size_mm': L,
+        'gradient_enabled': params.enable_gradient,
+        'surface_texture_enabled': params.enable_surface_texture,
+        'effective_samples_per_cell': effective_samples,
+        'scaffold_type': params.surface_type,
+        **info,
+    }
+    return result, stats
+
+
+def generate_tpms_from_dict(params: dict) -> tuple[Any, dict]:
+    """
+    Generate a TPMS scaffold from dictionary parameters.
+
+    Args:
+        params: Dictionary with keys matching TPMSParams fields; the bounding
+            box may also be given as 'bounding_box_mm' (list or x/y/z dict)
+
+    Returns:
+        Tuple of (mesh_wrapper, statistics_dict)
+    """
+    bbox = params.get('bounding_box_mm', params.get('bounding_box'))
+    if isinstance(bbox, dict):
+        bx, by, bz = bbox.get('x', 10.0), bbox.get('y', 10.0), bbox.get('z', 10.0)
+    elif isinstance(bbox, (list, tuple)):
+        bx, by, bz = bbox[0], bbox[1], bbox[2]
+    else:
+        bx = params.get('bounding_box_x_mm', 10.0)
+        by = params.get('bounding_box_y_mm', 10.0)
+        bz = params.get('bounding_box_z_mm', 10.0)
+
+    return generate_tpms(TPMSParams(
+        surface_type=params.get('surface_type', 'gyroid'),
+        bounding_box_x_mm=bx,
+        bounding_box_y_mm=by,
+        bounding_box_z_mm=bz,
+        unit_cell_size_mm=params.get('unit_cell_size_mm', params.get('cell_size_mm', 2.0)),
+        isovalue=params.get('isovalue', 0.0),
+        shape_params=dict(params.get('shape_params', {})),
+        solid_mode=params.get('solid_mode', 'surface'),
+        wall_thickness_mm=params.get('wall_thickness_mm', 0.3),
+        enable_gradient=params.get('enable_gradient', False),
+        gradient_axis=params.get('gradient_axis', 'z'),
+        gradient_start_isovalue=params.get('gradient_start_isovalue', 0.0),
+        gradient_end_isovalue=params.get('gradient_end_isovalue', 0.5),
+        enable_surface_texture=params.get('enable_surface_texture', False),
+        texture_amplitude_um=params.get('texture_amplitude_um', 10.0),
+        samples_per_cell=params.get('samples_per_cell', 20),
+        mesh_density=params.get('mesh_density', 1.0),
+        resolution=params.get('resolution', 15),
+        adaptive_extraction=params.get('adaptive_extraction', False),
+        seed=params.get('seed'),
+    ))
@@ -14,6 +14,7 @@ Properties:
 from __future__ import annotations
 import numpy as np
 from dataclasses import dataclass
+from itertools import chain
 
 try:
     import manifold3d as m3d
@@ -23,6 +24,8 @@ except ImportError:
     HAS_MANIFOLD = False
 
 try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
     from scipy.spatial import Voronoi
     HAS_SCIPY = True
 except ImportError:
@@ -30,6 +33,15 @@ except ImportError:
     HAS_SCIPY = False
 
 from ..core import batch_union
+from .seeding import lloyd_relax, mirror_points, poisson_disk_points
+from .struts import build_struts
+
+# Edge length per unit volume of a Poisson-Voronoi diagram at unit seed density
+EDGE_LENGTH_DENSITY = 5.832
+
+# Share of the strut volume left after node overlaps and short edges,
+# measured on generated scaffolds
+STRUT_FILL = 0.65
 
 
 @dataclass
@@ -57,6 +69,9 @@ class VoronoiParams:
         target_pore_radius_mm: Target pore radius (0.3-0.9mm)
         target_porosity: Target void fraction (0.6-0.8)
         seed_count: Number of Voronoi seed points (auto-calculated if None)
+        all_ridge_edges: Build every edge of each Voronoi ridge polygon
+            instead of one edge per ridge; the auto-calculated seed count
+            then follows target_porosity and the strut diameter
 
         # === Strut Properties ===
         strut_diameter_mm: Strut diameter (0.2-0.5mm)
@@ -67,6 +82,9 @@ class VoronoiParams:
         random_coefficient: Overall randomness (0=regular, 1=fully random)
         irregularity: Shape irregularity factor (0-1)
         seed: Random seed for reproducibility
+        seed_distribution: 'uniform' random seeds or 'poisson' (minimum
+            seed spacing, more even cells and strut lengths)
+        lloyd_iterations: Lloyd relaxation steps applied to the seeds
 
         # === Gradient Features ===
         enable_gradient: Enable density gradient
@@ -77,7 +95,7 @@ class VoronoiParams:
         # === Quality & Generation ===
         resolution: Cylinder segments (6-12)
         margin_factor: Margin around bbox for seed points (0.1-0.5)
-        min_strut_length_mm: Minimum strut length filter
+        min_strut_length_mm: Struts shorter than this are merged into their nodes
     """
     # Basic Geometry
     bounding_box_x_mm: float = 10.0
@@ -88,6 +106,7 @@ class VoronoiParams:
     target_pore_radius_mm: float = 0.6  # 0.3-0.9mm range
     target_porosity: float = 0.70  # 60-80% for trabecular-like
     seed_count: int | None = None  # Auto-calculated if None
+    all_ridge_edges: bool = False
 
     # Strut Properties
     strut_diameter_mm: float = 0.3  # 0.2-0.5mm for bone scaffolds
@@ -99,6 +118,8 @@ class VoronoiParams:
     random_coefficient: float = 0.5  # Balance of regularity and randomness
     irregularity: float = 0.5  # Shape irregularity
     seed: int | None = None
+    seed_distribution: str = 'uniform'  # 'uniform' or 'poisson'
+    lloyd_iterations: int = 0
 
     # Gradient Features
     enable_gradient: bool = False
@@ -116,6 +137,43 @@ class VoronoiParams:
     cell_count: int | None = None  # Maps to seed_count
 
 
+def strut_profiles(
+    radii: np.ndarray,
+    taper: float = 0.0,
+    roughness_enabled: bool = False,
+    roughness_amplitude: float = 0.0,
+    rng: np.random.Generator | None = None
+) -> np.ndarray | None:
+    """
+    Ring radius factors along struts for taper and roughness.
+
+    Args:
+        radii: Strut radii at the nodes (N,)
+        taper: Taper ratio (0-1), see make_strut
+        roughness_enabled: Whether to add surface roughness
+        roughness_amplitude: Roughness amplitude in mm (Ra value)
+        rng: Random number generator for roughness
+
+    Returns:
+        None for plain cylinders, a shared profile (K,) for taper only, or
+        per-strut profiles (N, K) with roughness, relative to ``radii``
+    """
+    rough = roughness_enabled and roughness_amplitude > 0 and rng is not None
+    if taper <= 0.01 and not rough:
+        return None
+
+    # More rings for roughness
+    t = np.linspace(0.0, 1.0, 9 if rough else 6)
+    profile = 1.0 - taper * (1.0 - np.abs(2.0 * t - 1.0))
+    if not rough:
+        return profile
+
+    # Roughness as +-amplitude variation of each ring, keeping the radius positive
+    radii = np.asarray(radii, dtype=np.float64)
+    noise = rng.uniform(-roughness_amplitude, roughness_amplitude, size=(len(radii), len(t)))
+    return np.maximum(profile + noise / radii[:, None], 0.3)
+
+
 def make_strut(
     p1: np.ndarray,
     p2: np.ndarray,
@@ -145,143 +203,179 @@ def make_strut(
     Returns:
         Manifold representing the strut (cylinder or tapered/rough variant)
     """
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
-    dz = p2[2] - p1[2]
-    length = np.sqrt(dx*dx + dy*dy + dz*dz)
+    radii = np.array([radius], dtype=np.float64)
+    profile = strut_profiles(radii, taper, roughness_enabled, roughness_amplitude, rng)
+    struts = build_struts(p1, p2, radii, resolution, profile=profile)
+    return struts[0] if struts else m3d.Manifold()
 
-    if length < 1e-6:
-        return m3d.Manifold()
 
-    # Determine if we need segmented construction (taper or roughness)
-    needs_segments = (taper > 0.01) or (roughness_enabled and roughness_amplitude > 0)
+def seed_count_for_porosity(volume: float, porosity: float, strut_radius: float) -> int:
+    """
+    Number of uniform random seeds whose Voronoi edges, built as struts
+    along every ridge polygon edge, give ``porosity``.
 
-    if not needs_segments:
-        # Simple uniform cylinder
-        strut = m3d.Manifold.cylinder(length, radius, radius, resolution)
-    else:
-        # Build strut from multiple segments for taper/roughness
-        # Number of segments along length - more for roughness
-        n_segments = 8 if roughness_enabled else 5
-
-        segment_length = length / n_segments
-        segments = []
-
-        for i in range(n_segments):
-            # Parameter t along strut (0 to 1)
-            t_start = i / n_segments
-            t_end = (i + 1) / n_segments
-            t_mid = (t_start + t_end) / 2
-
-            # Calculate radius at start and end of this segment
-            # Taper formula: r(t) = r_node * (1 - taper * (1 - |2t - 1|))
-            # At t=0,1: factor = 1 - taper * 0 = 1 (full radius)
-            # At t=0.5: factor = 1 - taper * 1 = 1 - taper (minimum radius)
-            def taper_factor(t: float) -> float:
-                return 1.0 - taper * (1.0 - abs(2.0 * t - 1.0))
-
-            r_start = radius * taper_factor(t_start)
-            r_end = radius * taper_factor(t_end)
-
-            # Add roughness as random variation
-            if roughness_enabled and roughness_amplitude > 0 and rng is not None:
-                # Roughness as ±amplitude variation
-                r_start += rng.uniform(-roughness_amplitude, roughness_amplitude)
-                r_end += rng.uniform(-roughness_amplitude, roughness_amplitude)
-                # Ensure positive radius
-                r_start = max(r_start, radius * 0.3)
-                r_end = max(r_end, radius * 0.3)
-
-            # Create tapered cylinder segment (cone frustum)
-            z_start = t_start * length
-            seg = m3d.Manifold.cylinder(segment_length, r_start, r_end, resolution)
-            seg = seg.translate([0, 0, z_start])
-            segments.append(seg)
-
-        # Union all segments
-        if segments:
-            from ..core import batch_union
-            strut = batch_union(segments)
-        else:
-            strut = m3d.Manifold.cylinder(length, radius, radius, resolution)
-
-    # Rotate to align with direction vector
-    h = np.sqrt(dx*dx + dy*dy)
-    if h > 0.001 or abs(dz) > 0.001:
-        angle_y = np.arctan2(h, dz) * 180 / np.pi
-        angle_z = np.arctan2(dy, dx) * 180 / np.pi
-        strut = strut.rotate([0, angle_y, 0])
-        strut = strut.rotate([0, 0, angle_z])
-
-    return strut.translate([p1[0], p1[1], p1[2]])
+    A Poisson-Voronoi diagram with seed density L has a total edge length
+    of EDGE_LENGTH_DENSITY * L^(2/3) per unit volume. Struts of that length
+    fill a fraction 1 - exp(-STRUT_FILL * pi * r^2 * length), which is
+    solved for L.
+
+    Args:
+        volume: Scaffold volume in mm^3
+        porosity: Target void fraction (0-1)
+        strut_radius: Strut radius in mm
+
+    Returns:
+        Seed count, at least 10
+    """
+    porosity = min(max(porosity, 0.01), 0.99)
+    edge_length = -np.log(porosity) / (STRUT_FILL * np.pi * strut_radius ** 2)
+    seed_density = (edge_length / EDGE_LENGTH_DENSITY) ** 1.5
+    return max(10, int(round(volume * seed_density)))
 
 
 def generate_seed_points(
     bbox: tuple[float, float, float],
     count: int,
     margin: float,
-    rng: np.random.Generator
+    rng: np.random.Generator,
+    distribution: str = 'uniform',
+    lloyd_iterations: int = 0
 ) -> np.ndarray:
     """
-    Generate random seed points for Voronoi tessellation.
+    Generate seed points for Voronoi tessellation.
 
-    Points are generated within the bounding box plus a margin to ensure
-    good edge coverage. Mirror points are added outside to handle boundaries.
+    Interior points are generated within the bounding box. Mirror points are
+    added outside to handle boundaries.
 
     Args:
         bbox: Bounding box dimensions (x, y, z)
         count: Number of interior seed points
         margin: Margin around bbox for extended seed region
         rng: Numpy random generator
+        distribution: 'uniform' random seeds, or 'poisson' for seeds with a
+            minimum spacing (more even cell sizes)
+        lloyd_iterations: Lloyd relaxation steps applied to the interior seeds
 
     Returns:
         Array of seed points (N, 3)
+
+    Raises:
+        ValueError: If the distribution is unknown
     """
     bx, by, bz = bbox
 
     # Generate interior points
-    interior = rng.uniform(
-        low=[0, 0, 0],
-        high=[bx, by, bz],
-        size=(count, 3)
-    )
+    if distribution == 'uniform':
+        interior = rng.uniform(
+            low=[0, 0, 0],
+            high=[bx, by, bz],
+            size=(count, 3)
+        )
+    elif distribution == 'poisson':
+        interior = poisson_disk_points(bbox, count, rng)
+    else:
+        raise ValueError(f"Unknown seed distribution: {distribution!r} (expected 'uniform' or 'poisson')")
+
+    if lloyd_iterations > 0:
+        interior = lloyd_relax(interior, bbox, lloyd_iterations, rng)
 
     # Add mirror points outside each face for better boundary behavior
     # This prevents infinite Voronoi ridges at boundaries
-    mirror_points = []
-
-    for point in interior:
-        # Mirror across each face if point is close to that face
-        x, y, z = point
-        threshold = max(bx, by, bz) * 0.3
-
-        if x < threshold:
-            mirror_points.append([-x, y, z])
-        if x > bx - threshold:
-            mirror_points.append([2*bx - x, y, z])
-        if y < threshold:
-            mirror_points.append([x, -y, z])
-        if y > by - threshold:
-            mirror_points.append([x, 2*by - y, z])
-        if z < threshold:
-            mirror_points.append([x, y, -z])
-        if z > bz - threshold:
-            mirror_points.append([x, y, 2*bz - z])
-
-    if mirror_points:
-        all_points = np.vstack([interior, np.array(mirror_points)])
+    threshold = max(bx, by, bz) * 0.3
+    return np.vstack([interior, mirror_points(interior, bbox, threshold)])
+
+
+def voronoi_edge_indices(vor: Voronoi, all_edges: bool = False) -> np.ndarray:
+    """
+    Unique finite edges of the Voronoi ridges.
+
+    By default each ridge contributes the edge between its first two
+    vertices, and ridges reaching the vertex at infinity (index -1) are
+    skipped. With ``all_edges`` every edge of each ridge polygon is taken;
+    each edge of the diagram borders several ridges, so edges are
+    deduplicated by their vertex indices, and edges to the vertex at
+    infinity are dropped.
+
+    Args:
+        vor: Scipy Voronoi object
+        all_edges: Take every polygon edge instead of one edge per ridge
+
+    Returns:
+        Integer array (E, 2) of vertex index pairs, smaller index first
+    """
+    sizes = np.fromiter(map(len, vor.ridge_vertices), dtype=np.int64, count=len(vor.ridge_vertices))
+    if sizes.sum() == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    flat = np.fromiter(chain.from_iterable(vor.ridge_vertices), dtype=np.int64, count=int(sizes.sum()))
+    first = np.cumsum(sizes) - sizes
+
+    if all_edges:
+        # Each polygon vertex pairs with the next one, the last closing the loop
+        following = np.arange(len(flat)) + 1
+        following[first + sizes - 1] = first
+        pairs = np.stack([flat, flat[following]], axis=1)
+        pairs = pairs[(pairs >= 0).all(axis=1)]
     else:
-        all_points = interior
+        # First two vertices of each ridge with none at infinity
+        infinite = np.zeros(len(sizes), dtype=bool)
+        infinite[np.repeat(np.arange(len(sizes)), sizes)[flat < 0]] = True
+        first = first[(sizes >= 2) & ~infinite]
+        pairs = np.stack([flat[first], flat[first + 1]], axis=1)
+
+    pairs = np.sort(pairs, axis=1)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+
+    # Dedup on a single integer key per pair
+    n = np.int64(len(vor.vertices))
+    keys = np.unique(pairs[:, 0] * n + pairs[:, 1])
+    return np.stack([keys // n, keys % n], axis=1)
+
+
+def collapse_short_edges(
+    vertices: np.ndarray,
+    edges: np.ndarray,
+    min_length: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Contract edges shorter than ``min_length`` into single nodes.
 
-    return all_points
+    Vertices joined by short edges are merged at their centroid, so the
+    struts around a tiny edge still meet instead of leaving a gap where it
+    was dropped.
+
+    Args:
+        vertices: Vertex positions (N, 3)
+        edges: Vertex index pairs (E, 2), smaller index first
+        min_length: Edges shorter than this are contracted
+
+    Returns:
+        Tuple of (vertex positions, remaining unique edges)
+    """
+    lengths = np.linalg.norm(vertices[edges[:, 1]] - vertices[edges[:, 0]], axis=1)
+    short = edges[lengths < min_length]
+    if len(short) == 0:
+        return vertices, edges
+
+    n = len(vertices)
+    links = coo_matrix((np.ones(len(short)), (short[:, 0], short[:, 1])), shape=(n, n))
+    n_nodes, labels = connected_components(links, directed=False)
+    counts = np.bincount(labels, minlength=n_nodes)
+    merged = np.stack([np.bincount(labels, vertices[:, k], n_nodes) for k in range(3)], axis=1)
+    merged /= counts[:, None]
+
+    edges = np.sort(labels[edges], axis=1)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    keys = np.unique(edges[:, 0] * np.int64(n_nodes) + edges[:, 1])
+    return merged, np.stack([keys // n_nodes, keys % n_nodes], axis=1)
 
 
 def get_voronoi_edges(
     vor: Voronoi,
     bbox: tuple[float, float, float],
     margin: float = 0.1,
-    min_strut_length: float = 0.1
-) -> list[tuple[np.ndarray, np.ndarray]]:
+    min_strut_length: float = 0.1,
+    all_edges: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Extract Voronoi edges that lie within or near the bounding box.
 
@@ -289,50 +383,28 @@ def get_voronoi_edges(
         vor: Scipy Voronoi object
         bbox: Bounding box dimensions (x, y, z)
         margin: Margin for including edges near boundaries
-        min_strut_length: Minimum strut length to include (filters short struts)
+        min_strut_length: Edges shorter than this (after clipping) are
+            contracted into their neighbours' nodes
+        all_edges: Take every ridge polygon edge, see voronoi_edge_indices
 
     Returns:
-        List of (p1, p2) tuples defining edge endpoints
+        Tuple of (start points, end points) arrays (E, 3), clipped to the box
     """
-    bx, by, bz = bbox
-    edges = []
-
-    for ridge_vertices in vor.ridge_vertices:
-        if -1 in ridge_vertices:
-            # Ridge goes to infinity - skip
-            continue
-
-        v1 = vor.vertices[ridge_vertices[0]]
-        v2 = vor.vertices[ridge_vertices[1]]
-
-        # Check if edge is within bounds (with margin)
-        margin_x = bx * margin
-        margin_y = by * margin
-        margin_z = bz * margin
-
-        # Check if both points are reasonably within bounds
-        in_bounds_1 = (
-            -margin_x <= v1[0] <= bx + margin_x and
-            -margin_y <= v1[1] <= by + margin_y and
-            -margin_z <= v1[2] <= bz + margin_z
-        )
-        in_bounds_2 = (
-            -margin_x <= v2[0] <= bx + margin_x and
-            -margin_y <= v2[1] <= by + margin_y and
-            -margin_z <= v2[2] <= bz + margin_z
-        )
+    size = np.array(bbox, dtype=np.float64)
+    edges = voronoi_edge_indices(vor, all_edges)
+    vertices = np.asarray(vor.vertices, dtype=np.float64)
 
-        if in_bounds_1 and in_bounds_2:
-            # Clip points to bounding box
-            p1 = np.clip(v1, [0, 0, 0], [bx, by, bz])
-            p2 = np.clip(v2, [0, 0, 0], [bx, by, bz])
+    # Keep edges with both vertices within the box grown by the margin
+    inside = np.all((vertices >= -size * margin) & (vertices <= size * (1 + margin)), axis=1)
+    edges = edges[inside[edges].all(axis=1)]
 
-            # Filter by minimum strut length
-            strut_length = np.linalg.norm(p2 - p1)
-            if strut_length >= min_strut_length:
-                edges.append((p1, p2))
+    # Clip to the box, then remove micro-struts
+    vertices, edges = collapse_short_edges(np.clip(vertices, 0.0, size), edges, min_strut_length)
+    p1, p2 = vertices[edges[:, 0]], vertices[edges[:, 1]]
 
-    return edges
+    # Merging can leave a few edges just under the limit; drop those
+    keep = np.linalg.norm(p2 - p1, axis=1) >= min_strut_length
+    return p1[keep], p2[keep]
 
 
 def calculate_gradient_factor(
@@ -342,54 +414,45 @@ def calculate_gradient_factor(
     direction: str,
     density_start: float,
     density_end: float
-) -> float:
+) -> float | np.ndarray:
     """
-    Calculate the density gradient factor for a strut based on its position.
+    Calculate the density gradient factor for struts based on their position.
 
     The gradient affects strut diameter: higher density = thicker struts, smaller pores.
     Lower density = thinner struts, larger pores.
 
     Args:
-        p1: Start point of strut
-        p2: End point of strut
+        p1: Start point of strut (3,), or start points of many struts (N, 3)
+        p2: End point of strut, shaped like p1
         bbox: Bounding box dimensions (x, y, z)
         direction: Gradient direction ('x', 'y', 'z', or 'radial')
         density_start: Density factor at start of gradient (0-1)
         density_end: Density factor at end of gradient (0-1)
 
     Returns:
-        Density factor (0-1) at strut midpoint position
+        Density factor (0-1) at each strut midpoint position
     """
     bx, by, bz = bbox
     # Use strut midpoint for gradient calculation
-    midpoint = (p1 + p2) / 2
-
-    if direction == 'x':
-        # Gradient along X axis
-        t = midpoint[0] / bx if bx > 0 else 0.5
-    elif direction == 'y':
-        # Gradient along Y axis
-        t = midpoint[1] / by if by > 0 else 0.5
-    elif direction == 'z':
-        # Gradient along Z axis (most common for layered scaffolds)
-        t = midpoint[2] / bz if bz > 0 else 0.5
-    elif direction == 'radial':
+    midpoint = (np.asarray(p1, dtype=np.float64) + np.asarray(p2, dtype=np.float64)) / 2
+
+    if direction == 'radial':
         # Radial gradient from center
         center = np.array([bx / 2, by / 2, bz / 2])
-        max_dist = np.sqrt((bx/2)**2 + (by/2)**2 + (bz/2)**2)
-        dist = np.linalg.norm(midpoint - center)
-        t = dist / max_dist if max_dist > 0 else 0.5
+        max_dist = np.linalg.norm(center)
+        dist = np.linalg.norm(midpoint - center, axis=-1)
+        t = dist / max_dist if max_dist > 0 else np.full_like(dist, 0.5)
     else:
-        # Default to Z gradient
-        t = midpoint[2] / bz if bz > 0 else 0.5
+        # Gradient along one axis; default to Z (most common for layered scaffolds)
+        axis = {'x': 0, 'y': 1}.get(direction, 2)
+        extent = bbox[axis]
+        t = midpoint[..., axis] / extent if extent > 0 else np.full_like(midpoint[..., axis], 0.5)
 
     # Clamp t to [0, 1]
     t = np.clip(t, 0.0, 1.0)
 
     # Linear interpolation between start and end density
-    density = density_start + t * (density_end - density_start)
-
-    return density
+    return density_start + t * (density_end - density_start)
 
 
 def generate_voronoi(params: VoronoiParams) -> tuple[m3d.Manifold, dict]:
@@ -450,6 +513,12 @@ def generate_voronoi(params: VoronoiParams) -> tuple[m3d.Manifold, dict]:
         actual_seed_count = params.seed_count
     elif params.cell_count is not None:
         actual_seed_count = params.cell_count
+    elif params.all_ridge_edges:
+        # Every ridge edge makes a denser network; size the cells so the
+        # struts fill 1 - target_porosity
+        actual_seed_count = seed_count_for_porosity(
+            bx * by * bz, params.target_porosity, radius
+        )
     else:
         # Auto-calculate based on target pore size and volume
         volume = bx * by * bz
@@ -461,59 +530,48 @@ def generate_voronoi(params: VoronoiParams) -> tuple[m3d.Manifold, dict]:
         bbox,
         actual_seed_count,
         params.margin_factor,
-        rng
+        rng,
+        distribution=params.seed_distribution,
+        lloyd_iterations=params.lloyd_iterations
     )
 
     # Compute Voronoi tessellation
     vor = Voronoi(points)
 
     # Extract edges within bounding box, applying min_strut_length filter
-    edges = get_voronoi_edges(
+    starts, ends = get_voronoi_edges(
         vor,
         bbox,
         margin=0.05,
-        min_strut_length=params.min_strut_length_mm
+        min_strut_length=params.min_strut_length_mm,
+        all_edges=params.all_ridge_edges
     )
 
-    if not edges:
+    if len(starts) == 0:
         raise ValueError("No Voronoi edges generated within bounding box")
 
-    # Create strut manifolds with taper, gradient, and roughness
-    strut_manifolds = []
-    struts_filtered_count = 0
-
-    for p1, p2 in edges:
-        # Calculate effective radius for this strut
-        effective_radius = radius
-
-        # Apply density gradient if enabled
-        if params.enable_gradient:
-            density_factor = calculate_gradient_factor(
-                p1, p2, bbox,
-                params.gradient_direction,
-                params.density_gradient_start,
-                params.density_gradient_end
-            )
-            # Scale radius by density factor
-            # Higher density = thicker struts (larger radius)
-            # density_factor typically 0.3-0.9, so scale to reasonable range
-            effective_radius = radius * (0.5 + density_factor)
-
-        # Create strut with taper and optional roughness
-        strut = make_strut(
-            p1, p2,
-            effective_radius,
-            params.resolution,
-            taper=params.strut_taper,
-            roughness_enabled=params.enable_strut_roughness,
-            roughness_amplitude=params.strut_roughness_amplitude,
-            rng=rng
+    # Per-strut radius, scaled by the density gradient if enabled
+    radii = np.full(len(starts), radius)
+    if params.enable_gradient:
+        density_factor = calculate_gradient_factor(
+            starts, ends, bbox,
+            params.gradient_direction,
+            params.density_gradient_start,
+            params.density_gradient_end
         )
-
-        if strut.num_vert() > 0:
-            strut_manifolds.append(strut)
-        else:
-            struts_filtered_count += 1
+        # Higher density = thicker struts (larger radius)
+        # density_factor typically 0.3-0.9, so scale to reasonable range
+        radii = radius * (0.5 + density_factor)
+
+    # Create all struts with taper and optional roughness in one batch
+    profile = strut_profiles(
+        radii,
+        taper=params.strut_taper,
+        roughness_enabled=params.enable_strut_roughness,
+        roughness_amplitude=params.strut_roughness_amplitude,
+        rng=rng
+    )
+    strut_manifolds = build_struts(starts, ends, radii, params.resolution, profile=profile)
 
     if not strut_manifolds:
         raise ValueError("No valid struts created for Voronoi lattice")
@@ -533,8 +591,7 @@ def generate_voronoi(params: VoronoiParams) -> tuple[m3d.Manifold, dict]:
     porosity = 1.0 - relative_density
 
     # Calculate average strut length
-    total_length = sum(np.linalg.norm(np.array(p2) - np.array(p1)) for p1, p2 in edges)
-    avg_strut_length = total_length / len(edges) if edges else 0
+    avg_strut_length = float(np.linalg.norm(ends - starts, axis=1).mean())
 
     stats = {
         'triangle_count': len(mesh.tri_verts) // 3 if hasattr(mesh, 'tri_verts') else 0,
@@ -544,7 +601,8 @@ def generate_voronoi(params: VoronoiParams) -> tuple[m3d.Manifold, dict]:
         'porosity': porosity,
         'target_porosity': params.target_porosity,
         'seed_count': actual_seed_count,
-        'strut_count': len(edges),
+        'strut_count': len(starts),
+        'all_ridge_edges': params.all_ridge_edges,
         'avg_strut_length_mm': avg_strut_length,
         'strut_diameter_mm': params.strut_diameter_mm,
         'target_pore_radius_mm': params.target_pore_radius_mm,
@@ -564,6 +622,8 @@ def generate_voronoi(params: VoronoiParams) -> tuple[m3d.Manifold, dict]:
         # Filter info
         'min_strut_length_mm': params.min_strut_length_mm,
         'seed': params.seed,
+        'seed_distribution': params.seed_distribution,
+        'lloyd_iterations': params.lloyd_iterations,
         'scaffold_type': 'voronoi'
     }
 
@@ -609,6 +669,7 @@ def generate_voronoi_from_dict(params: dict) -> tuple[m3d.Manifold, dict]:
         target_pore_radius_mm=params.get('target_pore_radius_mm', 0.6),
         target_porosity=params.get('target_porosity', 0.70),
         seed_count=seed_count,
+        all_ridge_edges=params.get('all_ridge_edges', False),
 
         # Strut Properties
         strut_diameter_mm=params.get('strut_diameter_mm', 0.3),
@@ -620,6 +681,8 @@ def generate_voronoi_from_dict(params: dict) -> tuple[m3d.Manifold, dict]:
         random_coefficient=params.get('random_coefficient', 0.5),
         irregularity=params.get('irregularity', 0.5),
         seed=params.get('seed'),
+        seed_distribution=params.get('seed_distribution', 'uniform'),
+        lloyd_iterations=params.get('lloyd_iterations', 0),
 
         # Gradient Features
         enable_gradient=params.get('enable_gradient', False),
@@ -0,0 +1,309 @@
+"""
+Per-request memory budget for boolean operations.
+
+Large booleans (e.g. subtracting a union of thousands of pores from a disc)
+can allocate several gigabytes inside manifold3d. When that happens inside
+the API process the kernel OOM-killer takes down the whole server, not just
+the offending request. This module lets the boolean engine in ``core.py``
+estimate the peak memory of an operation from its operand triangle counts
+and compare it against a per-request budget before running it.
+
+Requests share one process, so the budget does not charge process RSS to
+any single request: RSS is checked against an absolute ceiling for the
+whole process, by default a share of the container (cgroup) memory limit
+or of the machine's memory.
+
+The budget is carried in a ``ContextVar`` so it follows the request through
+``asyncio.to_thread`` without threading it through every generator signature.
+Code running outside a budget (scripts, tests) is never limited.
+
+Usage:
+    with memory_budget(limit_mb=2048, process_limit_mb=12288) as budget:
+        manifold, stats = generate_porous_disc(params)
+    stats["peak_boolean_estimate_mb"] = budget.peak_mb
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAS_PSUTIL = False
+
+
+# Resident cost of one triangle in a manifold3d Manifold: three half-edges,
+# tangents, face normal and the amortised vertex position/normal.
+BYTES_PER_TRIANGLE = 160
+
+# Scratch memory during a boolean relative to its operands: collider,
+# edge/face intersection tables and the result mesh itself.
+BOOLEAN_PEAK_FACTOR = 3.0
+
+# Share of the container or machine memory the process may use by default
+DEFAULT_PROCESS_MEMORY_FRACTION = 0.9
+
+_MB = 1024 * 1024
+
+# cgroup v2 and v1 memory limit files
+_CGROUP_LIMIT_FILES = (
+    "/sys/fs/cgroup/memory.max",
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+)
+
+
+class MemoryBudgetExceeded(ValueError):
+    """
+    Raised when an operation would exceed the active per-request memory budget.
+
+    Subclasses ValueError because, like the tiling triangle limit, it signals
+    parameters that are too large to generate rather than an internal fault.
+    """
+
+
+def current_rss_bytes() -> int:
+    """
+    Return the resident set size of this process in bytes.
+
+    Uses psutil when installed, then /proc/self/statm (Linux), then falls
+    back to the peak RSS reported by getrusage as an upper bound.
+    """
+    if HAS_PSUTIL:
+        return psutil.Process().memory_info().rss
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+        import sys
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+def total_memory_bytes() -> int:
+    """Physical memory of the machine in bytes (0 if unknown)."""
+    if HAS_PSUTIL:
+        return psutil.virtual_memory().total
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def container_memory_limit_bytes() -> int:
+    """
+    Memory limit of the container (cgroup v2 or v1) in bytes.
+
+    Returns:
+        The limit, or 0 when there is none or it is not below the
+        machine's memory
+    """
+    total = total_memory_bytes()
+    for path in _CGROUP_LIMIT_FILES:
+        try:
+            with open(path, "r") as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if not value.isdigit():
+            # "max": no limit at this level
+            return 0
+        limit = int(value)
+        # cgroup v1 reports "no limit" as a huge page-aligned number
+        return limit if total == 0 or limit < total else 0
+    return 0
+
+
+def default_process_limit_bytes() -> int:
+    """
+    Default RSS ceiling of the process.
+
+    DEFAULT_PROCESS_MEMORY_FRACTION of the container memory limit, or of the
+    machine's memory outside a limited container; 0 (no ceiling) if neither
+    is known.
+    """
+    available = container_memory_limit_bytes() or total_memory_bytes()
+    return int(available * DEFAULT_PROCESS_MEMORY_FRACTION)
+
+
+@dataclass
+class MemoryBudget:
+    """
+    Memory allowance for a single generation request.
+
+    Requests run in worker threads of one process, so the process RSS cannot
+    be attributed to any one of them. Per-request decisions are therefore
+    based on the estimated peak of each operation (see
+    ``check_boolean_budget``), and RSS is only compared against an absolute
+    ceiling for the whole process, shared by all requests.
+
+    Attributes:
+        limit_bytes: Largest estimated peak any one operation of the request may have
+        process_limit_bytes: Process RSS ceiling (0 = no ceiling)
+        peak_estimate_bytes: Largest estimate admitted so far
+    """
+    limit_bytes: int
+    process_limit_bytes: int = 0
+    peak_estimate_bytes: int = 0
+
+    def headroom_bytes(self) -> int:
+        """Memory the next operation may use (may be negative near the process ceiling)."""
+        headroom = self.limit_bytes
+        if self.process_limit_bytes > 0:
+            headroom = min(headroom, self.process_limit_bytes - current_rss_bytes())
+        return headroom
+
+    def admit(self, estimate_bytes: int) -> None:
+        """Record the estimated peak of an operation about to run."""
+        self.peak_estimate_bytes = max(self.peak_estimate_bytes, int(estimate_bytes))
+
+    @property
+    def peak_mb(self) -> float:
+        """Largest estimated operation peak of the request in megabytes."""
+        return self.peak_estimate_bytes / _MB
+
+    @property
+    def limit_mb(self) -> float:
+        """Budget limit in megabytes."""
+        return self.limit_bytes / _MB
+
+    def check(self, label: str = "generation") -> None:
+        """
+        Raise MemoryBudgetExceeded if the process is over its memory ceiling.
+
+        Args:
+            label: Name of the stage being checked, used in the error message
+        """
+        if self.process_limit_bytes <= 0:
+            return
+        rss = current_rss_bytes()
+        if rss > self.process_limit_bytes:
+            raise MemoryBudgetExceeded(
+                f"{label} stopped: the server is using {rss / _MB:.0f} MB, over its "
+                f"{self.process_limit_bytes / _MB:.0f} MB memory ceiling. "
+                "Retry later, or reduce resolution, feature count or scaffold size."
+            )
+
+    def check_estimate(self, estimate_bytes: int, label: str = "generation") -> None:
+        """
+        Admit an operation with the given estimated peak, or raise.
+
+        Args:
+            estimate_bytes: Estimated peak memory of the operation
+            label: Operation name used in the error message
+
+        Raises:
+            MemoryBudgetExceeded: If the process is over its ceiling or the
+                estimate exceeds the remaining headroom
+        """
+        self.check(label)
+        headroom = self.headroom_bytes()
+        if estimate_bytes > headroom:
+            raise MemoryBudgetExceeded(
+                f"{label} needs an estimated {estimate_bytes / _MB:.0f} MB but only "
+                f"{max(headroom, 0) / _MB:.0f} MB of the {self.limit_mb:.0f} MB "
+                "per-request memory budget is available. "
+                "Reduce resolution, feature count or scaffold size."
+            )
+        self.admit(estimate_bytes)
+
+
+_active_budget: ContextVar[Optional[MemoryBudget]] = ContextVar(
+    "morphostruct_memory_budget", default=None
+)
+
+
+@contextmanager
+def memory_budget(
+    limit_mb: Optional[float],
+    process_limit_mb: Optional[float] = None,
+) -> Iterator[Optional[MemoryBudget]]:
+    """
+    Activate a per-request memory budget for the enclosed block.
+
+    Args:
+        limit_mb: Budget in megabytes. None or <= 0 disables the guard.
+        process_limit_mb: RSS ceiling of the whole process in megabytes,
+            checked alongside the budget. None or 0: the default ceiling
+            (see default_process_limit_bytes); < 0: no ceiling.
+
+    Yields:
+        The active MemoryBudget, or None when disabled
+    """
+    if not limit_mb or limit_mb <= 0:
+        yield None
+        return
+
+    if not process_limit_mb:
+        process_limit_bytes = default_process_limit_bytes()
+    else:
+        process_limit_bytes = max(int(process_limit_mb * _MB), 0)
+    budget = MemoryBudget(
+        limit_bytes=int(limit_mb * _MB),
+        process_limit_bytes=process_limit_bytes,
+    )
+    token = _active_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _active_budget.reset(token)
+
+
+def get_active_budget() -> Optional[MemoryBudget]:
+    """Return the budget active in the current context, if any."""
+    return _active_budget.get()
+
+
+def estimate_boolean_peak_bytes(triangle_counts: Sequence[int]) -> int:
+    """
+    Estimate peak memory of a boolean operation from operand triangle counts.
+
+    Args:
+        triangle_counts: Triangle count of every operand
+
+    Returns:
+        Estimated peak bytes allocated while the operation runs
+    """
+    total_tris = sum(int(t) for t in triangle_counts)
+    return int(total_tris * BYTES_PER_TRIANGLE * BOOLEAN_PEAK_FACTOR)
+
+
+def check_boolean_budget(manifolds: Sequence, label: str = "boolean") -> int:
+    """
+    Check that a boolean over ``manifolds`` fits in the active budget.
+
+    Does nothing (and returns 0) when no budget is active.
+
+    Args:
+        manifolds: Operands of the boolean operation
+        label: Operation name used in the error message
+
+    Returns:
+        Estimated peak bytes for the operation
+
+    Raises:
+        MemoryBudgetExceeded: If the process is over its memory ceiling or
+            the estimate exceeds the available headroom
+    """
+    budget = get_active_budget()
+    if budget is None:
+        return 0
+
+    estimate = estimate_boolean_peak_bytes([m.num_tri() for m in manifolds])
+    budget.check_estimate(estimate, f"{label} over {len(manifolds)} operands")
+    return estimate
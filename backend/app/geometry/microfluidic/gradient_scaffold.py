@@ -18,6 +18,7 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import Literal, Optional, List
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -269,10 +270,10 @@ def create_cylinder_between_points(
 
     if length < 1e-9:
         # Points too close, return tiny sphere instead
-        return m3d.Manifold.sphere(radius, resolution).translate(p1.tolist())
+        return adaptive_sphere(radius, resolution).translate(p1.tolist())
 
     # Create cylinder along z-axis, then rotate and translate
-    cylinder = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    cylinder = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align z-axis with direction
     direction_normalized = direction / length
@@ -536,12 +537,12 @@ def generate_gradient_scaffold(params: GradientScaffoldParams) -> tuple[m3d.Mani
 
                 # Create pore based on shape
                 if params.pore_shape == 'spherical':
-                    pore = m3d.Manifold.sphere(pore_size / 2, params.resolution)
+                    pore = adaptive_sphere(pore_size / 2, params.resolution)
                 elif params.pore_shape == 'ellipsoidal':
                     pore = m3d.Manifold.sphere(pore_size / 2, params.resolution)
                     pore = pore.scale([1, 1, params.pore_aspect_ratio])
                 else:  # cylindrical
-                    pore = m3d.Manifold.cylinder(pore_size, pore_size / 2, pore_size / 2, params.resolution)
+                    pore = adaptive_cylinder(pore_size, pore_size / 2, pore_size / 2, params.resolution)
 
                 pore = pore.translate([x, y, z])
                 pores.append(pore)
@@ -577,7 +578,7 @@ def generate_gradient_scaffold(params: GradientScaffoldParams) -> tuple[m3d.Mani
 
     # Create bounding volume based on shape
     if params.scaffold_shape == 'cylindrical':
-        bbox = m3d.Manifold.cylinder(dz, params.scaffold_diameter_mm/2, params.scaffold_diameter_mm/2, params.resolution)
+        bbox = adaptive_cylinder(dz, params.scaffold_diameter_mm/2, params.scaffold_diameter_mm/2, params.resolution)
         bbox = bbox.translate([0, 0, -dz/2])
         solid_volume = np.pi * (params.scaffold_diameter_mm/2)**2 * dz
     else:
@@ -17,6 +17,7 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import Literal, Optional
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder
 
 
 @dataclass
@@ -174,7 +175,7 @@ def make_port(
     Returns:
         Manifold representing the port volume
     """
-    port = m3d.Manifold.cylinder(depth, diameter/2, diameter/2, resolution)
+    port = adaptive_cylinder(depth, diameter/2, diameter/2, resolution)
     # Cylinder is along Z axis, translate so top is at position
     return port.translate([position[0], position[1], position[2] - depth/2])
 
@@ -252,7 +253,7 @@ def make_membrane_with_pores(
             # Ensure pore is within bounds
             if abs(x) < usable_length / 2 and abs(y) < usable_width / 2:
                 # Create cylindrical pore through membrane
-                pore = m3d.Manifold.cylinder(
+                pore = adaptive_cylinder(
                     thickness * 1.2,  # Slightly longer to ensure clean boolean
                     pore_radius,
                     pore_radius,
@@ -343,7 +344,7 @@ def make_cell_trap_array(
             # Position trap at bottom of chamber
             z = chamber_center[2] - chamber_height / 2 - trap_depth / 2
 
-            trap = m3d.Manifold.cylinder(
+            trap = adaptive_cylinder(
                 trap_depth,
                 trap_radius,
                 trap_radius,
@@ -414,7 +415,7 @@ def make_interlayer_vias(
         ]
 
         for cx, cy in corners:
-            via = m3d.Manifold.cylinder(
+            via = adaptive_cylinder(
                 total_via_height,
                 via_radius,
                 via_radius,
@@ -24,8 +24,9 @@ from __future__ import annotations
 import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass, field
-from typing import Literal, Optional, List, Tuple, Dict, NamedTuple
-from ..core import batch_union
+from typing import Callable, Literal, Optional, List, Tuple, Dict, NamedTuple
+from ..core import batch_union, union_groups
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 class VesselEndpoint(NamedTuple):
@@ -47,6 +48,8 @@ class VesselStats:
     vein_count: int = 0
     anastomosis_count: int = 0
     total_length_mm: float = 0.0
+    branch_segment_count: int = 0
+    subtree_count: int = 0
 
 
 @dataclass
@@ -178,7 +181,7 @@ def make_vessel_segment(
         return m3d.Manifold()
 
     # Create cylinder along Z axis
-    vessel = m3d.Manifold.cylinder(length, r1, r2, resolution)
+    vessel = adaptive_cylinder(length, r1, r2, resolution)
 
     # Create hollow vessel if requested
     if enable_hollow and wall_thickness_ratio > 0:
@@ -191,7 +194,7 @@ def make_vessel_segment(
 
         # Only hollow if inner radius is positive and meaningful
         if inner_r1 > 0.001 and inner_r2 > 0.001:
-            inner = m3d.Manifold.cylinder(length + 0.01, inner_r1, inner_r2, resolution)
+            inner = adaptive_cylinder(length + 0.01, inner_r1, inner_r2, resolution)
             vessel = vessel - inner
 
     # Calculate rotation to align with direction vector
@@ -267,201 +270,321 @@ def apply_position_noise(
     return position + noise
 
 
-def create_branch_recursive(
-    position: np.ndarray,
-    direction: np.ndarray,
-    radius: float,
-    generation: int,
+# Level width at which branches are split into separate subtrees, whose
+# geometry is built in parallel
+_MIN_SUBTREES = 16
+
+
+@dataclass
+class VesselSkeleton:
+    """
+    Vessel segments of one or more branching trees, one row per segment.
+
+    Attributes:
+        start: Segment start points (N, 3)
+        end: Segment end points (N, 3)
+        start_radius: Radius at the start (N,)
+        end_radius: Radius at the end (N,)
+        subtree: Subtree each segment is built with (N,)
+    """
+    start: np.ndarray
+    end: np.ndarray
+    start_radius: np.ndarray
+    end_radius: np.ndarray
+    subtree: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.start_radius)
+
+
+def _terminal_endpoints(
+    radii: np.ndarray,
+    generations: np.ndarray,
+    positions: np.ndarray,
+    directions: np.ndarray,
+    params: PerfusableNetworkParams,
+    is_venous: bool
+) -> List[VesselEndpoint]:
+    """Terminal endpoints for a batch of vessel ends."""
+    arteriole_radius = params.arteriole_diameter_um / 1000.0 / 2.0
+    capillary_radius = params.capillary_diameter_um / 1000.0 / 2.0
+    venule_radius = params.venule_diameter_um / 1000.0 / 2.0
+    return [
+        VesselEndpoint(
+            position=positions[i].copy(),
+            direction=directions[i].copy(),
+            radius=float(radii[i]),
+            vessel_type=classify_vessel_type(
+                radii[i], arteriole_radius, capillary_radius, venule_radius, is_venous
+            ),
+            generation=int(generations[i])
+        )
+        for i in range(len(radii))
+    ]
+
+
+def build_vessel_skeleton(
+    positions: np.ndarray,
+    directions: np.ndarray,
+    radii: np.ndarray,
+    generations: np.ndarray,
     max_generations: int,
     params: PerfusableNetworkParams,
     bounding_box: tuple[float, float, float],
-    segments: List[m3d.Manifold],
     endpoints: List[VesselEndpoint],
     stats: VesselStats,
     rng: np.random.Generator,
     is_venous: bool = False
-) -> None:
+) -> VesselSkeleton:
     """
-    Recursively generate branching vascular tree.
+    Grow branching vascular trees from their roots, one level at a time.
+
+    All branches of a level are advanced with array operations: segment
+    length, organic variation, Murray's law child radii and the rotated
+    child directions are computed for the whole level, and the children of
+    every branch form the next level. Random draws are made per level.
 
     Args:
-        position: Current branch start position
-        direction: Current branch direction (normalized)
-        radius: Current branch radius
-        generation: Current generation level
+        positions: Root start positions (R, 3)
+        directions: Root directions, normalized (R, 3)
+        radii: Root radii (R,)
+        generations: Generation level of each root (R,)
         max_generations: Maximum generation depth
         params: Network parameters
         bounding_box: Bounding box dimensions
-        segments: List to append vessel segments to
         endpoints: List to collect terminal endpoints for capillary bed
         stats: Vessel statistics tracker
         rng: Random number generator
-        is_venous: True if generating venous return tree
+        is_venous: True if generating venous return trees
+
+    Returns:
+        VesselSkeleton with every vessel segment of the trees
     """
-    # Convert diameters to radii in mm
-    arteriole_radius = params.arteriole_diameter_um / 1000.0 / 2.0
     capillary_radius = params.capillary_diameter_um / 1000.0 / 2.0
+    arteriole_radius = params.arteriole_diameter_um / 1000.0 / 2.0
     venule_radius = params.venule_diameter_um / 1000.0 / 2.0
-    min_wall_mm = params.min_wall_thickness_um / 1000.0
-
-    # Classify current vessel type
-    vessel_type = classify_vessel_type(
-        radius, arteriole_radius, capillary_radius, venule_radius, is_venous
-    )
-
-    # Termination conditions
-    if generation >= max_generations or radius < capillary_radius:
-        # Record endpoint for capillary bed connection
-        endpoints.append(VesselEndpoint(
-            position=position.copy(),
-            direction=direction.copy(),
-            radius=radius,
-            vessel_type=vessel_type,
-            generation=generation
-        ))
-        return
-
-    # Calculate segment length based on generation
-    base_length = bounding_box[2] / (max_generations * 1.2)
-    segment_length = base_length * (1.5 - generation / max_generations * 0.8)
-
-    # Add organic variation
-    if params.enable_organic_variation and generation > 0:
-        segment_length *= rng.uniform(0.7, 1.3)
-
-    # Calculate end position
-    end_position = position + direction * segment_length
+    organic = params.enable_organic_variation
+    bbox_x, bbox_y, bbox_z = bounding_box
+    half_box = np.array([bbox_x/2, bbox_y/2, bbox_z/2])
+    base_length = bbox_z / (max_generations * 1.2)
+    branching_angle = params.bifurcation_angle_deg * np.pi / 180
+
+    position = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    direction = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+    radius = np.asarray(radii, dtype=np.float64).reshape(-1)
+    generation = np.asarray(generations, dtype=np.int64).reshape(-1)
+    subtree = np.arange(len(radius))
+    n_subtrees = len(radius)
+
+    rows: List[Tuple[np.ndarray, ...]] = []
+    while len(radius):
+        # Termination conditions: record endpoints for capillary bed connection
+        done = (generation >= max_generations) | (radius < capillary_radius)
+        if done.any():
+            endpoints.extend(_terminal_endpoints(
+                radius[done], generation[done], position[done], direction[done],
+                params, is_venous
+            ))
+            keep = ~done
+            position, direction, radius, generation, subtree = (
+                a[keep] for a in (position, direction, radius, generation, subtree)
+            )
+        n = len(radius)
+        if n == 0:
+            break
+
+        # Once a level is wide enough, each of its branches starts its own
+        # subtree for parallel building
+        if n_subtrees < _MIN_SUBTREES <= n:
+            subtree = n_subtrees + np.arange(n)
+            n_subtrees += n
+
+        # Segment length based on generation, with organic variation
+        segment_length = base_length * (1.5 - generation / max_generations * 0.8)
+        varied = generation > 0
+        if organic:
+            segment_length[varied] *= rng.uniform(0.7, 1.3, int(varied.sum()))
+
+        end_position = position + direction * segment_length[:, None]
+        if organic and params.position_noise > 0:
+            noise = rng.uniform(-1, 1, (int(varied.sum()), 3))
+            end_position[varied] += (
+                noise * params.position_noise * segment_length[varied, None] * 0.3
+            )
+        end_position = np.clip(end_position, -half_box, half_box)
+
+        # Vessel statistics
+        stats.total_length_mm += float(np.linalg.norm(end_position - position, axis=1).sum())
+        for vessel_type in (
+            classify_vessel_type(r, arteriole_radius, capillary_radius, venule_radius, is_venous)
+            for r in radius
+        ):
+            setattr(stats, f"{vessel_type}_count", getattr(stats, f"{vessel_type}_count") + 1)
+
+        # Number of children
+        if params.enable_trifurcation:
+            num_children = np.where(rng.random(n) < 0.2, 3, 2)
+        else:
+            num_children = np.full(n, 2)
 
-    # Apply position noise if enabled
-    if params.enable_organic_variation and params.position_noise > 0 and generation > 0:
-        end_position = apply_position_noise(
-            end_position, params.position_noise, segment_length, rng
+        # Child radius using Murray's law (child 0), with diameter variance
+        base_radius = radius / params.murrays_law_ratio
+        asymmetric = (params.bifurcation_asymmetry > 0) & (num_children == 2)
+        child_radius = np.where(
+            asymmetric, base_radius * (1 + params.bifurcation_asymmetry * 0.3), base_radius
         )
-
-    # Clamp to bounding box
-    bbox_x, bbox_y, bbox_z = bounding_box
-    end_position = np.clip(end_position, [-bbox_x/2, -bbox_y/2, -bbox_z/2],
-                          [bbox_x/2, bbox_y/2, bbox_z/2])
-
-    # Update vessel statistics
-    segment_actual_length = np.linalg.norm(end_position - position)
-    stats.total_length_mm += segment_actual_length
-
-    if vessel_type == 'artery':
-        stats.artery_count += 1
-    elif vessel_type == 'arteriole':
-        stats.arteriole_count += 1
-    elif vessel_type == 'capillary':
-        stats.capillary_count += 1
-    elif vessel_type == 'venule':
-        stats.venule_count += 1
-    elif vessel_type == 'vein':
-        stats.vein_count += 1
-
-    # Determine number of children
-    num_children = 3 if params.enable_trifurcation and rng.random() < 0.2 else 2
-
-    # Calculate child radius using Murray's law
-    child_radius = calculate_child_radius(
-        radius, num_children, params.murrays_law_ratio,
-        params.bifurcation_asymmetry, 0
+        if organic:
+            child_radius *= 1 + rng.uniform(-params.diameter_variance, params.diameter_variance, n)
+
+        rows.append((position, end_position, radius, child_radius, subtree))
+
+        # At the last generation, record terminal endpoints for capillary bed
+        last = generation >= max_generations - 1
+        if last.any():
+            endpoints.extend(_terminal_endpoints(
+                child_radius[last], generation[last], end_position[last], direction[last],
+                params, is_venous
+            ))
+        split = ~last
+        if not split.any():
+            break
+
+        # Children of every splitting branch
+        counts = num_children[split]
+        parent = np.repeat(np.flatnonzero(split), counts)
+        child = np.arange(len(parent)) - np.repeat(np.cumsum(counts) - counts, counts)
+        siblings = num_children[parent]
+
+        angle_offset = np.where(
+            siblings == 2,
+            np.where(child == 0, branching_angle, -branching_angle),
+            (child - 1) * branching_angle
+        )
+        if organic:
+            angle_offset += rng.uniform(-params.angle_noise, params.angle_noise, len(parent)) * np.pi / 4
+
+        # Random rotation axis, rotated with the Rodrigues formula
+        k = rng.uniform(-1, 1, (len(parent), 3)) * np.array([1.0, 1.0, 0.2])
+        k /= np.linalg.norm(k, axis=1, keepdims=True) + 1e-6
+        d = direction[parent]
+        cos_theta = np.cos(angle_offset)[:, None]
+        sin_theta = np.sin(angle_offset)[:, None]
+        child_direction = (
+            d * cos_theta
+            + np.cross(k, d) * sin_theta
+            + k * np.sum(k * d, axis=1, keepdims=True) * (1 - cos_theta)
+        )
+        child_direction /= np.linalg.norm(child_direction, axis=1, keepdims=True) + 1e-6
+
+        # Asymmetric child radius per child index
+        base = radius[parent] / params.murrays_law_ratio
+        if params.bifurcation_asymmetry > 0:
+            skew = np.where(child == 0, 1.0, -1.0) * params.bifurcation_asymmetry * 0.3
+            base = np.where(siblings == 2, base * (1 + skew), base)
+
+        position = end_position[parent]
+        direction = child_direction
+        radius = base
+        generation = generation[parent] + 1
+        subtree = subtree[parent]
+
+    if not rows:
+        empty = np.empty((0, 3))
+        return VesselSkeleton(empty, empty, np.empty(0), np.empty(0), np.empty(0, dtype=int))
+    start, end, start_radius, end_radius, subtree = (
+        np.concatenate(column) for column in zip(*rows)
     )
+    return VesselSkeleton(start, end, start_radius, end_radius, subtree)
 
-    # Add diameter variance
-    if params.enable_organic_variation:
-        child_radius *= (1 + rng.uniform(-params.diameter_variance, params.diameter_variance))
-
-    # Create vessel segment
-    segment = make_vessel_segment(
-        position,
-        end_position,
-        radius,
-        child_radius,
-        params.resolution,
-        params.vessel_wall_thickness_ratio,
-        params.enable_hollow_vessels,
-        min_wall_mm
-    )
 
-    if segment.num_vert() > 0:
-        segments.append(segment)
-
-        # Add junction sphere for smooth connection
-        junction = m3d.Manifold.sphere(radius * 1.05, params.resolution)
-        junction = junction.translate([end_position[0], end_position[1], end_position[2]])
-        segments.append(junction)
-
-    # Generate child branches if not at last generation
-    if generation < max_generations - 1:
-        branching_angle = params.bifurcation_angle_deg * np.pi / 180
-
-        for i in range(num_children):
-            # Calculate angle offset for each child
-            if num_children == 2:
-                angle_offset = branching_angle if i == 0 else -branching_angle
-            else:  # Trifurcation
-                angle_offset = (i - 1) * branching_angle
-
-            # Add angle noise
-            if params.enable_organic_variation:
-                angle_offset += rng.uniform(-params.angle_noise, params.angle_noise) * np.pi / 4
-
-            # Random rotation axis perpendicular to current direction
-            perp_axis = np.array([
-                rng.uniform(-1, 1),
-                rng.uniform(-1, 1),
-                0.2 * rng.uniform(-1, 1)
-            ])
-            perp_axis = perp_axis / (np.linalg.norm(perp_axis) + 1e-6)
+def build_vessel_geometry(
+    skeleton: VesselSkeleton,
+    params: PerfusableNetworkParams
+) -> List[m3d.Manifold]:
+    """
+    Build vessel segments and junction spheres, unioned per subtree.
 
-            # Rodrigues rotation formula
-            k = perp_axis
-            cos_theta = np.cos(angle_offset)
-            sin_theta = np.sin(angle_offset)
+    Subtrees are built and unioned in parallel.
 
-            child_direction = (
-                direction * cos_theta +
-                np.cross(k, direction) * sin_theta +
-                k * np.dot(k, direction) * (1 - cos_theta)
-            )
+    Returns:
+        One manifold per non-empty subtree
+    """
+    min_wall_mm = params.min_wall_thickness_um / 1000.0
 
-            # Normalize
-            child_direction = child_direction / (np.linalg.norm(child_direction) + 1e-6)
+    def subtree_parts(rows: np.ndarray) -> Callable[[], List[m3d.Manifold]]:
+        def build() -> List[m3d.Manifold]:
+            parts: List[m3d.Manifold] = []
+            for i in rows:
+                end = skeleton.end[i]
+                segment = make_vessel_segment(
+                    skeleton.start[i],
+                    end,
+                    skeleton.start_radius[i],
+                    skeleton.end_radius[i],
+                    params.resolution,
+                    params.vessel_wall_thickness_ratio,
+                    params.enable_hollow_vessels,
+                    min_wall_mm
+                )
+                if segment.num_vert() > 0:
+                    parts.append(segment)
+                    # Junction sphere for smooth connection
+                    junction = adaptive_sphere(skeleton.start_radius[i] * 1.05, params.resolution)
+                    parts.append(junction.translate([end[0], end[1], end[2]]))
+            return parts
+        return build
+
+    groups = [
+        subtree_parts(np.flatnonzero(skeleton.subtree == s))
+        for s in np.unique(skeleton.subtree)
+    ]
+    return union_groups(groups)
+
+
+def create_branch_trees(
+    positions: np.ndarray,
+    directions: np.ndarray,
+    radii: np.ndarray,
+    generations: np.ndarray,
+    max_generations: int,
+    params: PerfusableNetworkParams,
+    bounding_box: tuple[float, float, float],
+    segments: List[m3d.Manifold],
+    endpoints: List[VesselEndpoint],
+    stats: VesselStats,
+    rng: np.random.Generator,
+    is_venous: bool = False
+) -> None:
+    """
+    Generate branching vascular trees from a batch of roots.
 
-            # Calculate asymmetric child radius
-            asymm_child_radius = calculate_child_radius(
-                radius, num_children, params.murrays_law_ratio,
-                params.bifurcation_asymmetry, i
-            )
+    The skeleton of all trees is computed level by level first
+    (build_vessel_skeleton), then the geometry of each subtree is built and
+    unioned in parallel (build_vessel_geometry).
 
-            # Recurse for child branch
-            create_branch_recursive(
-                end_position,
-                child_direction,
-                asymm_child_radius,
-                generation + 1,
-                max_generations,
-                params,
-                bounding_box,
-                segments,
-                endpoints,
-                stats,
-                rng,
-                is_venous
-            )
-    else:
-        # At last generation - record terminal endpoint for capillary bed
-        # Classify the terminal vessel type based on child radius
-        terminal_type = classify_vessel_type(
-            child_radius, arteriole_radius, capillary_radius, venule_radius, is_venous
-        )
-        endpoints.append(VesselEndpoint(
-            position=end_position.copy(),
-            direction=direction.copy(),
-            radius=child_radius,
-            vessel_type=terminal_type,
-            generation=generation
-        ))
+    Args:
+        positions: Root start positions (R, 3)
+        directions: Root directions, normalized (R, 3)
+        radii: Root radii (R,)
+        generations: Generation level of each root (R,)
+        max_generations: Maximum generation depth
+        params: Network parameters
+        bounding_box: Bounding box dimensions
+        segments: List to append the subtree manifolds to
+        endpoints: List to collect terminal endpoints for capillary bed
+        stats: Vessel statistics tracker
+        rng: Random number generator
+        is_venous: True if generating venous return trees
+    """
+    skeleton = build_vessel_skeleton(
+        positions, directions, radii, generations, max_generations,
+        params, bounding_box, endpoints, stats, rng, is_venous
+    )
+    if len(skeleton):
+        subtrees = build_vessel_geometry(skeleton, params)
+        segments.extend(subtrees)
+        stats.branch_segment_count += len(skeleton)
+        stats.subtree_count += len(subtrees)
 
 
 def create_capillary_bed(
@@ -675,6 +798,7 @@ def generate_parallel_network(
     """
     segments: List[m3d.Manifold] = []
     endpoints: List[VesselEndpoint] = []
+    roots: List[Tuple[np.ndarray, np.ndarray, float, int]] = []
 
     bbox_x, bbox_y, bbox_z = params.bounding_box_mm
     inlet_radius = params.large_vessel_diameter_mm / 2
@@ -729,20 +853,7 @@ def generate_parallel_network(
 
             branch_radius = inlet_radius * 0.3 * (1 - b / num_branches * 0.5)
 
-            create_branch_recursive(
-                branch_pos,
-                branch_dir,
-                branch_radius,
-                generation=2,
-                max_generations=params.num_branching_generations,
-                params=params,
-                bounding_box=params.bounding_box_mm,
-                segments=segments,
-                endpoints=endpoints,
-                stats=stats,
-                rng=rng,
-                is_venous=False
-            )
+            roots.append((branch_pos, branch_dir, branch_radius, 2))
 
         # Record endpoint
         endpoints.append(VesselEndpoint(
@@ -753,6 +864,24 @@ def generate_parallel_network(
             generation=1
         ))
 
+    # Branching trees of all roots, grown together
+    if roots:
+        positions, directions, radii, generations = zip(*roots)
+        create_branch_trees(
+            np.array(positions),
+            np.array(directions),
+            np.array(radii),
+            generations=np.array(generations),
+            max_generations=params.num_branching_generations,
+            params=params,
+            bounding_box=params.bounding_box_mm,
+            segments=segments,
+            endpoints=endpoints,
+            stats=stats,
+            rng=rng,
+            is_venous=False
+        )
+
     return segments, endpoints
 
 
@@ -776,6 +905,7 @@ def generate_loop_network(
     """
     segments: List[m3d.Manifold] = []
     endpoints: List[VesselEndpoint] = []
+    roots: List[Tuple[np.ndarray, np.ndarray, float, int]] = []
 
     bbox_x, bbox_y, bbox_z = params.bounding_box_mm
     inlet_radius = params.large_vessel_diameter_mm / 2
@@ -821,23 +951,28 @@ def generate_loop_network(
                 branch_dir = -np.array([np.cos(angle), np.sin(angle), rng.uniform(-0.2, 0.2)])
                 branch_dir = branch_dir / (np.linalg.norm(branch_dir) + 1e-6)
 
-                create_branch_recursive(
-                    point,
-                    branch_dir,
-                    vessel_radius * 0.5,
-                    generation=loop_idx + 2,
-                    max_generations=params.num_branching_generations,
-                    params=params,
-                    bounding_box=params.bounding_box_mm,
-                    segments=segments,
-                    endpoints=endpoints,
-                    stats=stats,
-                    rng=rng,
-                    is_venous=False
-                )
+                roots.append((point, branch_dir, vessel_radius * 0.5, loop_idx + 2))
 
             prev_point = point
 
+    # Branching trees of all roots, grown together
+    if roots:
+        positions, directions, radii, generations = zip(*roots)
+        create_branch_trees(
+            np.array(positions),
+            np.array(directions),
+            np.array(radii),
+            generations=np.array(generations),
+            max_generations=params.num_branching_generations,
+            params=params,
+            bounding_box=params.bounding_box_mm,
+            segments=segments,
+            endpoints=endpoints,
+            stats=stats,
+            rng=rng,
+            is_venous=False
+        )
+
     # Create vertical connections between loops
     if num_loops > 1:
         for angle_idx in range(4):
@@ -984,18 +1119,18 @@ def generate_perfusable_network(params: PerfusableNetworkParams) -> tuple[m3d.Ma
         start_direction = np.array([1.0, 0.0, 0.0])
 
     # Create inlet sphere
-    inlet_sphere = m3d.Manifold.sphere(inlet_radius, params.resolution)
+    inlet_sphere = adaptive_sphere(inlet_radius, params.resolution)
     inlet_sphere = inlet_sphere.translate([start_position[0], start_position[1], start_position[2]])
     segments.append(inlet_sphere)
 
     # Generate network based on topology
     if params.network_topology == 'hierarchical':
         # Standard tree-based branching
-        create_branch_recursive(
-            start_position,
-            start_direction,
-            inlet_radius,
-            generation=0,
+        create_branch_trees(
+            start_position[None],
+            start_direction[None],
+            np.array([inlet_radius]),
+            generations=np.array([0]),
             max_generations=params.num_branching_generations,
             params=params,
             bounding_box=params.bounding_box_mm,
@@ -1008,11 +1143,11 @@ def generate_perfusable_network(params: PerfusableNetworkParams) -> tuple[m3d.Ma
 
     elif params.network_topology == 'anastomosing':
         # Tree with cross-connections
-        create_branch_recursive(
-            start_position,
-            start_direction,
-            inlet_radius,
-            generation=0,
+        create_branch_trees(
+            start_position[None],
+            start_direction[None],
+            np.array([inlet_radius]),
+            generations=np.array([0]),
             max_generations=params.num_branching_generations,
             params=params,
             bounding_box=params.bounding_box_mm,
@@ -1074,16 +1209,16 @@ def generate_perfusable_network(params: PerfusableNetworkParams) -> tuple[m3d.Ma
         venous_radius = params.venule_diameter_um / 1000.0 * 2  # Larger collecting veins
 
         # Create venous inlet sphere
-        venous_sphere = m3d.Manifold.sphere(venous_radius, params.resolution)
+        venous_sphere = adaptive_sphere(venous_radius, params.resolution)
         venous_sphere = venous_sphere.translate([venous_start[0], venous_start[1], venous_start[2]])
         segments.append(venous_sphere)
 
         # Generate venous tree (fewer generations, converging)
-        create_branch_recursive(
-            venous_start,
-            venous_dir,
-            venous_radius,
-            generation=0,
+        create_branch_trees(
+            venous_start[None],
+            venous_dir[None],
+            np.array([venous_radius]),
+            generations=np.array([0]),
             max_generations=max(3, params.num_branching_generations - 2),
             params=params,
             bounding_box=params.bounding_box_mm,
@@ -1142,7 +1277,10 @@ def generate_perfusable_network(params: PerfusableNetworkParams) -> tuple[m3d.Ma
     stats_dict = {
         'triangle_count': len(mesh.tri_verts) // 3 if hasattr(mesh, 'tri_verts') else 0,
         'volume_mm3': volume,
-        'segment_count': len(segments),
+        # Branch trees reach segments as subtree unions; count their
+        # skeleton segments instead
+        'segment_count': len(segments) - stats.subtree_count + stats.branch_segment_count,
+        'subtree_union_count': stats.subtree_count,
         'generation_count': params.num_branching_generations,
 
         # Network configuration
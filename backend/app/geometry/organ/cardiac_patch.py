@@ -16,6 +16,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Optional
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 class SpatialGrid:
@@ -158,7 +159,7 @@ def make_fiber(start: np.ndarray, end: np.ndarray, radius: float, resolution: in
     if length < 1e-6:
         return m3d.Manifold()
 
-    fiber = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    fiber = adaptive_cylinder(length, radius, radius, resolution)
 
     h = np.sqrt(dx*dx + dy*dy)
     if h > 0.001 or abs(dz) > 0.001:
@@ -543,7 +544,7 @@ def generate_cardiac_patch(params: CardiacPatchParams) -> tuple[m3d.Manifold, di
         z_coords = np.random.uniform(pore_radius_mm, pz - pore_radius_mm, pore_count)
 
         # Pre-create sphere template once and reuse
-        sphere_template = m3d.Manifold.sphere(pore_radius_mm, max(4, params.resolution - 2))
+        sphere_template = adaptive_sphere(pore_radius_mm, max(4, params.resolution - 2))
 
         pore_positions = np.column_stack([x_coords, y_coords, z_coords])
 
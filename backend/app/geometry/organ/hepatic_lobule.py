@@ -13,6 +13,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -483,9 +484,9 @@ def create_irregular_hexagon_prism(corners: list, height: float, wall_thickness:
 def create_hexagon_prism(radius: float, height: float, wall_thickness: float,
                          resolution: int = 32) -> m3d.Manifold:
     """Create a hexagonal prism (hollow) using manifold3d."""
-    outer = m3d.Manifold.cylinder(height, radius, radius, 6)
+    outer = adaptive_cylinder(height, radius, radius, 6)
     inner_radius = radius - wall_thickness
-    inner = m3d.Manifold.cylinder(height + 0.02, inner_radius, inner_radius, 6)
+    inner = adaptive_cylinder(height + 0.02, inner_radius, inner_radius, 6)
     inner = inner.translate([0, 0, -0.01])
     return outer - inner
 
@@ -493,7 +494,7 @@ def create_hexagon_prism(radius: float, height: float, wall_thickness: float,
 def create_vertical_tube(x: float, y: float, height: float, radius: float,
                          resolution: int = 16) -> m3d.Manifold:
     """Create a vertical cylindrical tube at position (x, y)."""
-    tube = m3d.Manifold.cylinder(height, radius, radius, resolution)
+    tube = adaptive_cylinder(height, radius, radius, resolution)
     return tube.translate([x, y, 0])
 
 
@@ -518,10 +519,10 @@ def create_hollow_vertical_tube(x: float, y: float, height: float, radius: float
     inner_radius = radius - wall_thickness
     if inner_radius <= 0:
         # If wall is too thick, just return solid cylinder
-        return m3d.Manifold.cylinder(height, radius, radius, resolution).translate([x, y, 0])
+        return adaptive_cylinder(height, radius, radius, resolution).translate([x, y, 0])
 
     # Create outer and inner cylinders
-    outer = m3d.Manifold.cylinder(height, radius, radius, resolution)
+    outer = adaptive_cylinder(height, radius, radius, resolution)
 
     # Inner cylinder - extend beyond ends to ensure clean subtraction
     inner_ext = 0.1  # Extension amount
@@ -534,7 +535,7 @@ def create_hollow_vertical_tube(x: float, y: float, height: float, radius: float
     if not cap_top:
         inner_height += inner_ext
 
-    inner = m3d.Manifold.cylinder(inner_height, inner_radius, inner_radius, resolution)
+    inner = adaptive_cylinder(inner_height, inner_radius, inner_radius, resolution)
     inner = inner.translate([0, 0, inner_z_offset])
 
     # Subtract inner from outer to create hollow tube
@@ -562,7 +563,7 @@ def create_sinusoid(start_pos: tuple[float, float, float], end_pos: tuple[float,
     if length < 0.01:
         return None
 
-    cyl = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    cyl = adaptive_cylinder(length, radius, radius, resolution)
 
     h = np.sqrt(dx*dx + dy*dy)
     if h > 0.001 or abs(dz) > 0.001:
@@ -605,11 +606,11 @@ def create_hollow_sinusoid(start_pos: tuple[float, float, float],
         return create_sinusoid(start_pos, end_pos, radius, resolution)
 
     # Create outer cylinder
-    outer = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    outer = adaptive_cylinder(length, radius, radius, resolution)
 
     # Create inner cylinder - extend beyond both ends to ensure open ends
     inner_ext = 0.1
-    inner = m3d.Manifold.cylinder(length + 2 * inner_ext, inner_radius, inner_radius, resolution)
+    inner = adaptive_cylinder(length + 2 * inner_ext, inner_radius, inner_radius, resolution)
     inner = inner.translate([0, 0, -inner_ext])
 
     # Hollow tube
@@ -668,7 +669,7 @@ def create_solid_tube_manifold(points: list, radius_start: float, radius_end: fl
             continue
 
         direction = direction / length
-        cyl = m3d.Manifold.cylinder(length, r1, r2, segments)
+        cyl = adaptive_cylinder(length, r1, r2, segments)
 
         z_axis = np.array([0, 0, 1])
         dot = np.dot(z_axis, direction)
@@ -695,7 +696,7 @@ def create_solid_tube_manifold(points: list, radius_start: float, radius_end: fl
         solids.append(cyl)
 
         if i < n - 2:
-            sphere = m3d.Manifold.sphere(r2 * 0.99, segments)
+            sphere = adaptive_sphere(r2 * 0.99, segments)
             sphere = sphere.translate(list(p2))
             solids.append(sphere)
 
@@ -766,13 +767,13 @@ def create_hollow_vessel_network(tube_specs: list, wall_thickness: float = 0.02,
     if junction_spheres:
         for pos, radius in junction_spheres:
             # Exterior sphere
-            sphere_out = m3d.Manifold.sphere(radius, segments)
+            sphere_out = adaptive_sphere(radius, segments)
             sphere_out = sphere_out.translate(list(pos))
             exterior_solids.append(sphere_out)
 
             # Interior sphere (hollow)
             inner_r = max(radius - wall_thickness, radius * 0.5)
-            sphere_in = m3d.Manifold.sphere(inner_r, segments)
+            sphere_in = adaptive_sphere(inner_r, segments)
             sphere_in = sphere_in.translate(list(pos))
             interior_solids.append(sphere_in)
 
@@ -930,9 +931,9 @@ def generate_hepatic_lobule(params: HepaticLobuleParams) -> tuple[m3d.Manifold,
             if scaffold is None:
                 # Fallback to regular hexagon (edge_curve not supported in fallback)
                 lob_radius = radius * size_mult if size_variance > 0 else radius
-                outer = m3d.Manifold.cylinder(height, lob_radius, lob_radius, 6).rotate([0, 0, 30])
+                outer = adaptive_cylinder(height, lob_radius, lob_radius, 6).rotate([0, 0, 30])
                 inner_radius = lob_radius - wall_thickness
-                inner = m3d.Manifold.cylinder(height + 0.02, inner_radius, inner_radius, 6).rotate([0, 0, 30])
+                inner = adaptive_cylinder(height + 0.02, inner_radius, inner_radius, 6).rotate([0, 0, 30])
                 inner = inner.translate([0, 0, -0.01])
                 scaffold = (outer - inner).translate([lob_x, lob_y, 0])
             else:
@@ -940,9 +941,9 @@ def generate_hepatic_lobule(params: HepaticLobuleParams) -> tuple[m3d.Manifold,
                 pass
         else:
             # No randomness and no edge_curve - all lobules same size, perfect tiling
-            outer = m3d.Manifold.cylinder(height, radius, radius, 6).rotate([0, 0, 30])
+            outer = adaptive_cylinder(height, radius, radius, 6).rotate([0, 0, 30])
             inner_radius = radius - wall_thickness
-            inner = m3d.Manifold.cylinder(height + 0.02, inner_radius, inner_radius, 6).rotate([0, 0, 30])
+            inner = adaptive_cylinder(height + 0.02, inner_radius, inner_radius, 6).rotate([0, 0, 30])
             inner = inner.translate([0, 0, -0.01])
             scaffold = (outer - inner).translate([lob_x, lob_y, 0])
 
@@ -15,6 +15,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -144,8 +145,8 @@ def create_hollow_tube_segment(p1: np.ndarray, p2: np.ndarray, outer_radius: flo
         return m3d.Manifold()
 
     # Create outer and inner cylinders
-    outer = m3d.Manifold.cylinder(length, outer_radius, outer_radius, resolution)
-    inner = m3d.Manifold.cylinder(length + 0.02, inner_radius, inner_radius, resolution)
+    outer = adaptive_cylinder(length, outer_radius, outer_radius, resolution)
+    inner = adaptive_cylinder(length + 0.02, inner_radius, inner_radius, resolution)
     inner = inner.translate([0, 0, -0.01])
 
     hollow = outer - inner
@@ -254,7 +255,7 @@ def create_brush_border_texture(path: np.ndarray, inner_radius: float,
             base_pos = p1 + radial_dir * inner_radius
 
             # Create small cone/cylinder for microvillus (pointing inward toward lumen center)
-            mv = m3d.Manifold.cylinder(
+            mv = adaptive_cylinder(
                 microvilli_height,
                 microvilli_radius,
                 microvilli_radius * 0.5,  # Slight taper
@@ -367,7 +368,7 @@ def create_peritubular_capillaries(path: np.ndarray, outer_radius: float,
                 seg_length = np.sqrt(dx*dx + dy*dy + dz*dz)
 
                 if seg_length > capillary_radius * 0.5:
-                    cap_seg = m3d.Manifold.cylinder(
+                    cap_seg = adaptive_cylinder(
                         seg_length, capillary_radius, capillary_radius,
                         max(6, resolution // 2)
                     )
@@ -447,10 +448,10 @@ def create_tubule_branches(end_point: np.ndarray, end_direction: np.ndarray,
         branch_dir = branch_dir / np.linalg.norm(branch_dir)
 
         # Create hollow cylinder for branch
-        outer = m3d.Manifold.cylinder(
+        outer = adaptive_cylinder(
             branch_length, child_outer_radius, child_outer_radius, resolution
         )
-        inner = m3d.Manifold.cylinder(
+        inner = adaptive_cylinder(
             branch_length + 0.02, child_inner_radius, child_inner_radius, resolution
         )
         inner = inner.translate([0, 0, -0.01])
@@ -546,7 +547,7 @@ def create_cell_attachment_sites(path: np.ndarray, outer_radius: float,
             site_pos = center + radial_dir * (outer_radius - depth * 0.3)
 
             # Create sphere for indentation
-            site = m3d.Manifold.sphere(site_radius, max(6, resolution // 2))
+            site = adaptive_sphere(site_radius, max(6, resolution // 2))
             site = site.translate([site_pos[0], site_pos[1], site_pos[2]])
             sites.append(site)
 
@@ -629,7 +630,7 @@ def create_wall_pores(path: np.ndarray, outer_radius: float, inner_radius: float
         pore_pos = center + radial_dir * radial_pos
 
         # Create sphere for pore
-        pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 3))
+        pore = adaptive_sphere(pore_radius, max(4, resolution // 3))
         pore = pore.translate([pore_pos[0], pore_pos[1], pore_pos[2]])
         pores.append(pore)
 
@@ -816,7 +817,7 @@ def create_scaffold_support_matrix(path: np.ndarray, outer_radius: float,
             pore_pos = center + radial_dir * radial_pos
 
             # Create sphere for pore
-            pore = m3d.Manifold.sphere(pore_radius, max(6, resolution // 2))
+            pore = adaptive_sphere(pore_radius, max(6, resolution // 2))
             pore = pore.translate([pore_pos[0], pore_pos[1], pore_pos[2]])
             pores.append(pore)
 
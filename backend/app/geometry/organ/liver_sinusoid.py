@@ -16,6 +16,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 logger = logging.getLogger(__name__)
 
@@ -108,8 +109,8 @@ def create_hollow_tube(length: float, outer_radius: float, inner_radius: float,
     Returns:
         Hollow tube manifold
     """
-    outer = m3d.Manifold.cylinder(length, outer_radius, outer_radius, resolution)
-    inner = m3d.Manifold.cylinder(length + 0.02, inner_radius, inner_radius, resolution)
+    outer = adaptive_cylinder(length, outer_radius, outer_radius, resolution)
+    inner = adaptive_cylinder(length + 0.02, inner_radius, inner_radius, resolution)
     inner = inner.translate([0, 0, -0.01])
     return outer - inner
 
@@ -157,7 +158,7 @@ def create_fenestrations_clustered(length: float, radius: float, fenestration_ra
             x = radius * np.cos(angle)
             y = radius * np.sin(angle)
 
-            pore = m3d.Manifold.sphere(fenestration_radius, 6)
+            pore = adaptive_sphere(fenestration_radius, 6)
             pore = pore.translate([x, y, z])
             fenestrations.append(pore)
 
@@ -206,7 +207,7 @@ def create_fenestrations_random(length: float, radius: float, fenestration_radiu
             y = radius * np.sin(angle)
 
             # Create small sphere for fenestration
-            pore = m3d.Manifold.sphere(fenestration_radius, 6)
+            pore = adaptive_sphere(fenestration_radius, 6)
             pore = pore.translate([x, y, z])
             fenestrations.append(pore)
 
@@ -246,7 +247,7 @@ def create_space_of_disse_layer(length: float, inner_radius: float, thickness: f
             x = outer_radius * np.cos(angle)
             y = outer_radius * np.sin(angle)
 
-            pore = m3d.Manifold.sphere(pore_radius, 6)
+            pore = adaptive_sphere(pore_radius, 6)
             pore = pore.translate([x, y, z])
             pores.append(pore)
 
@@ -288,7 +289,7 @@ def create_hepatocyte_markers(length: float, sinusoid_radius: float,
             x = placement_radius * np.cos(angle)
             y = placement_radius * np.sin(angle)
 
-            marker = m3d.Manifold.sphere(hepatocyte_radius, resolution)
+            marker = adaptive_sphere(hepatocyte_radius, resolution)
             marker = marker.translate([x, y, z])
             markers.append(marker)
 
@@ -336,7 +337,7 @@ def create_kupffer_cell_zones(length: float, inner_radius: float,
         x = inner_radius * np.cos(angle)
         y = inner_radius * np.sin(angle)
 
-        cell = m3d.Manifold.sphere(kupffer_radius, resolution)
+        cell = adaptive_sphere(kupffer_radius, resolution)
         cell = cell.translate([x, y, z])
         cells.append(cell)
 
@@ -394,7 +395,7 @@ def create_stellate_cell_zones(length: float, sinusoid_outer_radius: float,
             x = placement_radius * np.cos(angle)
             y = placement_radius * np.sin(angle)
 
-            cell = m3d.Manifold.sphere(stellate_radius, resolution)
+            cell = adaptive_sphere(stellate_radius, resolution)
             cell = cell.translate([x, y, z])
             cells.append(cell)
 
@@ -435,8 +436,8 @@ def create_central_vein(sinusoid_length: float, vein_diameter: float,
     vein_wall_thickness = vein_radius * 0.1  # 10% wall thickness
     vein_inner_radius = vein_radius - vein_wall_thickness
 
-    outer_vein = m3d.Manifold.cylinder(vein_length, vein_radius, vein_radius, resolution)
-    inner_vein = m3d.Manifold.cylinder(vein_length + 0.002, vein_inner_radius, vein_inner_radius, resolution)
+    outer_vein = adaptive_cylinder(vein_length, vein_radius, vein_radius, resolution)
+    inner_vein = adaptive_cylinder(vein_length + 0.002, vein_inner_radius, vein_inner_radius, resolution)
     inner_vein = inner_vein.translate([0, 0, -0.001])
     central_vein = outer_vein - inner_vein
 
@@ -455,7 +456,7 @@ def create_central_vein(sinusoid_length: float, vein_diameter: float,
         if dist > 0.001:  # Only create connection if sinusoid is not at center
             # Create angled tube connecting sinusoid to vein
             connection_radius = sinusoid_outer_radius * 0.8
-            connection = m3d.Manifold.cylinder(dist + vein_radius, connection_radius, connection_radius, 8)
+            connection = adaptive_cylinder(dist + vein_radius, connection_radius, connection_radius, 8)
 
             # Rotate to point toward center
             angle = np.arctan2(dy, dx)
@@ -511,8 +512,8 @@ def create_scaffold_shell(sinusoid_positions: list, scaffold_length_mm: float,
     outer_radius = inner_radius + shell_thickness_mm
 
     # Create cylindrical shell using scaffold_length for Z-dimension
-    outer_shell = m3d.Manifold.cylinder(scaffold_length_mm, outer_radius, outer_radius, resolution)
-    inner_shell = m3d.Manifold.cylinder(scaffold_length_mm + 0.002, inner_radius, inner_radius, resolution)
+    outer_shell = adaptive_cylinder(scaffold_length_mm, outer_radius, outer_radius, resolution)
+    inner_shell = adaptive_cylinder(scaffold_length_mm + 0.002, inner_radius, inner_radius, resolution)
     inner_shell = inner_shell.translate([0, 0, -0.001])
     shell = outer_shell - inner_shell
 
@@ -536,7 +537,7 @@ def create_scaffold_shell(sinusoid_positions: list, scaffold_length_mm: float,
             x = center_x + outer_radius * np.cos(angle)
             y = center_y + outer_radius * np.sin(angle)
 
-            pore = m3d.Manifold.sphere(pore_radius, 6)
+            pore = adaptive_sphere(pore_radius, 6)
             pore = pore.translate([x, y, z])
             pores.append(pore)
 
@@ -595,7 +596,7 @@ def create_bile_canaliculi(length: float, sinusoid_outer_radius: float,
             y = canaliculus_placement_radius * np.sin(angle)
 
             # Create short tube running parallel to sinusoid axis
-            canaliculus = m3d.Manifold.cylinder(spacing_mm * 0.8, canaliculus_radius, canaliculus_radius, 6)
+            canaliculus = adaptive_cylinder(spacing_mm * 0.8, canaliculus_radius, canaliculus_radius, 6)
             canaliculus = canaliculus.translate([x, y, z - spacing_mm * 0.4])
             canaliculi.append(canaliculus)
 
@@ -652,7 +653,7 @@ def create_ecm_fibers(length: float, sinusoid_outer_radius: float,
         y = r * np.sin(angle)
 
         # Create fiber running along sinusoid length
-        fiber = m3d.Manifold.cylinder(length, fiber_radius, fiber_radius, 6)
+        fiber = adaptive_cylinder(length, fiber_radius, fiber_radius, 6)
         fiber = fiber.translate([x, y, 0])
         fibers.append(fiber)
 
@@ -791,7 +792,7 @@ def generate_liver_sinusoid(params: LiverSinusoidParams) -> tuple[m3d.Manifold,
                     # Create new fenestration with varied size
                     size_factor = 1 + np.random.uniform(-1, 1) * params.fenestration_variance * 0.3
                     varied_radius = fenestration_radius_base * size_factor
-                    varied_fen = m3d.Manifold.sphere(varied_radius, 6)
+                    varied_fen = adaptive_sphere(varied_radius, 6)
                     varied_fen = varied_fen.translate(center)
                     fenestrations.append(varied_fen)
             else:
@@ -813,7 +814,7 @@ def generate_liver_sinusoid(params: LiverSinusoidParams) -> tuple[m3d.Manifold,
                     center = [(bbox.min[i] + bbox.max[i]) / 2 for i in range(3)]
                     size_factor = 1 + np.random.uniform(-1, 1) * params.fenestration_variance * 0.3
                     varied_radius = fenestration_radius_base * size_factor
-                    varied_fen = m3d.Manifold.sphere(varied_radius, 6)
+                    varied_fen = adaptive_sphere(varied_radius, 6)
                     varied_fen = varied_fen.translate(center)
                     varied_fenestrations.append(varied_fen)
                 fenestrations = varied_fenestrations
@@ -15,6 +15,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -118,7 +119,7 @@ def create_airway_segment(start: np.ndarray, end: np.ndarray, radius: float, res
     if length < 1e-6:
         return m3d.Manifold()
 
-    cyl = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    cyl = adaptive_cylinder(length, radius, radius, resolution)
 
     h = np.sqrt(dx*dx + dy*dy)
     if h > 0.001 or abs(dz) > 0.001:
@@ -157,7 +158,7 @@ def create_alveolus(position: np.ndarray, radius: float, wall_thickness: float,
         outer = m3d.Manifold.sphere(radius, resolution)
         outer = outer.scale([1.0, 1.0, depth_ratio])
     else:
-        outer = m3d.Manifold.sphere(radius, resolution)
+        outer = adaptive_sphere(radius, resolution)
 
     if enable_hollow and wall_thickness > 0:
         inner_radius = radius - wall_thickness
@@ -213,7 +214,7 @@ def create_pore_of_kohn(pos1: np.ndarray, pos2: np.ndarray,
     pore_radius = pore_diameter / 2.0
 
     # Create cylinder along z-axis, then orient
-    cyl = m3d.Manifold.cylinder(distance, pore_radius, pore_radius, resolution)
+    cyl = adaptive_cylinder(distance, pore_radius, pore_radius, resolution)
 
     # Calculate rotation to align with direction
     dx, dy, dz = direction
@@ -373,7 +374,7 @@ def create_wall_porosity_pores(position: np.ndarray, alveolar_radius: float,
 
         # Create cylindrical pore through the wall
         pore_length = wall_thickness * 1.2  # Slightly longer than wall
-        cyl = m3d.Manifold.cylinder(pore_length, pore_radius, pore_radius, max(4, resolution // 2))
+        cyl = adaptive_cylinder(pore_length, pore_radius, pore_radius, max(4, resolution // 2))
 
         # Orient pore to point toward center
         dx, dy, dz = direction
@@ -461,7 +462,7 @@ def create_interconnectivity_channels(alveoli_positions: list[np.ndarray],
             continue
 
         # Create channel cylinder
-        cyl = m3d.Manifold.cylinder(channel_length, channel_radius, channel_radius, max(4, resolution // 2))
+        cyl = adaptive_cylinder(channel_length, channel_radius, channel_radius, max(4, resolution // 2))
 
         # Orient cylinder
         dx, dy, dz = direction_norm
@@ -516,8 +517,8 @@ def create_blood_air_barrier(position: np.ndarray, alveolar_radius: float,
     if barrier_radius <= 0 or inner_radius <= 0:
         return m3d.Manifold(), []
 
-    outer_shell = m3d.Manifold.sphere(inner_radius, resolution)
-    inner_shell = m3d.Manifold.sphere(barrier_radius, resolution)
+    outer_shell = adaptive_sphere(inner_radius, resolution)
+    inner_shell = adaptive_sphere(barrier_radius, resolution)
     barrier = outer_shell - inner_shell
 
     # Create Type II cell bumps (cuboidal cells appearing as small protrusions)
@@ -552,7 +553,7 @@ def create_blood_air_barrier(position: np.ndarray, alveolar_radius: float,
 
         # Create small bump for Type II cell
         bump_radius = type_2_cell_size
-        bump = m3d.Manifold.sphere(bump_radius, max(4, resolution // 2))
+        bump = adaptive_sphere(bump_radius, max(4, resolution // 2))
 
         bump_pos = position + np.array([x, y, z])
         bump = bump.translate([bump_pos[0], bump_pos[1], bump_pos[2]])
@@ -622,7 +623,7 @@ def create_capillary_segment(start: np.ndarray, end: np.ndarray,
     if length < 1e-6:
         return m3d.Manifold()
 
-    cyl = m3d.Manifold.cylinder(length, capillary_radius, capillary_radius, max(4, resolution // 2))
+    cyl = adaptive_cylinder(length, capillary_radius, capillary_radius, max(4, resolution // 2))
 
     dx, dy, dz = direction
     h = np.sqrt(dx*dx + dy*dy)
@@ -808,7 +809,7 @@ def create_alveolar_duct(position: np.ndarray, direction: np.ndarray,
     direction = direction / (np.linalg.norm(direction) + 1e-10)
 
     # Create the duct cylinder
-    duct = m3d.Manifold.cylinder(duct_length, duct_radius, duct_radius, resolution)
+    duct = adaptive_cylinder(duct_length, duct_radius, duct_radius, resolution)
 
     # Orient the duct along the direction
     dx, dy, dz = direction
@@ -14,6 +14,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -177,7 +178,7 @@ def create_cell_distribution_markers(center: np.ndarray, islet_radius: float,
     if beta_core_count > 0:
         positions = fibonacci_sphere_points(beta_core_count, 0, core_boundary)
         for pos in positions:
-            marker = m3d.Manifold.sphere(marker_size, max(4, resolution // 2))
+            marker = adaptive_sphere(marker_size, max(4, resolution // 2))
             marker = marker.translate([
                 center[0] + pos[0],
                 center[1] + pos[1],
@@ -190,7 +191,7 @@ def create_cell_distribution_markers(center: np.ndarray, islet_radius: float,
     if beta_mantle_count > 0:
         positions = fibonacci_sphere_points(beta_mantle_count, core_boundary, islet_radius * 0.9)
         for pos in positions:
-            marker = m3d.Manifold.sphere(marker_size, max(4, resolution // 2))
+            marker = adaptive_sphere(marker_size, max(4, resolution // 2))
             marker = marker.translate([
                 center[0] + pos[0],
                 center[1] + pos[1],
@@ -203,7 +204,7 @@ def create_cell_distribution_markers(center: np.ndarray, islet_radius: float,
     if alpha_count > 0:
         positions = fibonacci_sphere_points(alpha_count, core_boundary * 1.1, islet_radius * 0.95)
         for pos in positions:
-            marker = m3d.Manifold.sphere(marker_size * 0.9, max(4, resolution // 2))
+            marker = adaptive_sphere(marker_size * 0.9, max(4, resolution // 2))
             marker = marker.translate([
                 center[0] + pos[0],
                 center[1] + pos[1],
@@ -216,7 +217,7 @@ def create_cell_distribution_markers(center: np.ndarray, islet_radius: float,
     if delta_count > 0:
         positions = fibonacci_sphere_points(delta_count, core_boundary * 0.5, islet_radius * 0.9)
         for pos in positions:
-            marker = m3d.Manifold.sphere(marker_size * 0.8, max(4, resolution // 2))
+            marker = adaptive_sphere(marker_size * 0.8, max(4, resolution // 2))
             marker = marker.translate([
                 center[0] + pos[0],
                 center[1] + pos[1],
@@ -229,7 +230,7 @@ def create_cell_distribution_markers(center: np.ndarray, islet_radius: float,
     if pp_count > 0:
         positions = fibonacci_sphere_points(pp_count, core_boundary, islet_radius * 0.95)
         for pos in positions:
-            marker = m3d.Manifold.sphere(marker_size * 0.7, max(4, resolution // 2))
+            marker = adaptive_sphere(marker_size * 0.7, max(4, resolution // 2))
             marker = marker.translate([
                 center[0] + pos[0],
                 center[1] + pos[1],
@@ -276,8 +277,8 @@ def create_ecm_coating(center: np.ndarray, islet_radius: float, ecm_thickness: f
         pore_count_factor = 0.12
 
     # Create ECM shell
-    outer_sphere = m3d.Manifold.sphere(outer_radius, resolution)
-    inner_sphere = m3d.Manifold.sphere(inner_radius, resolution)
+    outer_sphere = adaptive_sphere(outer_radius, resolution)
+    inner_sphere = adaptive_sphere(inner_radius, resolution)
     ecm_shell = outer_sphere - inner_sphere
 
     # Add pores for diffusion
@@ -299,7 +300,7 @@ def create_ecm_coating(center: np.ndarray, islet_radius: float, ecm_thickness: f
         y = outer_radius * np.sin(inclination) * np.sin(azimuth)
         z = outer_radius * np.cos(inclination)
 
-        pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 3))
+        pore = adaptive_sphere(pore_radius, max(4, resolution // 3))
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -334,7 +335,7 @@ def create_inter_islet_connection(pos1: np.ndarray, pos2: np.ndarray,
         return m3d.Manifold()
 
     radius = connection_diameter / 2.0
-    cyl = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    cyl = adaptive_cylinder(length, radius, radius, resolution)
 
     # Rotate to align with connection vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -398,8 +399,8 @@ def create_porous_sphere_dual_porosity(center: np.ndarray, outer_radius: float,
         Porous sphere manifold with dual porosity
     """
     # Create outer and inner spheres
-    outer = m3d.Manifold.sphere(outer_radius, resolution)
-    inner = m3d.Manifold.sphere(inner_radius, resolution)
+    outer = adaptive_sphere(outer_radius, resolution)
+    inner = adaptive_sphere(inner_radius, resolution)
     shell = outer - inner
 
     # Define core-shell boundary
@@ -439,7 +440,7 @@ def create_porous_sphere_dual_porosity(center: np.ndarray, outer_radius: float,
         z = core_mid_radius * np.cos(inclination)
 
         # Slightly larger pores in core for better nutrient flow
-        pore = m3d.Manifold.sphere(pore_radius * 1.2, 8)
+        pore = adaptive_sphere(pore_radius * 1.2, 8)
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -453,7 +454,7 @@ def create_porous_sphere_dual_porosity(center: np.ndarray, outer_radius: float,
         y = outer_radius * np.sin(inclination) * np.sin(azimuth)
         z = outer_radius * np.cos(inclination)
 
-        pore = m3d.Manifold.sphere(pore_radius, 8)
+        pore = adaptive_sphere(pore_radius, 8)
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -488,7 +489,7 @@ def create_viability_channel(center: np.ndarray, islet_radius: float,
     channel_length = islet_radius * 2.2  # slightly longer than diameter
     channel_radius = channel_diameter / 2.0
 
-    cyl = m3d.Manifold.cylinder(channel_length, channel_radius, channel_radius, resolution)
+    cyl = adaptive_cylinder(channel_length, channel_radius, channel_radius, resolution)
     # Center the channel vertically
     cyl = cyl.translate([center[0], center[1], center[2] - channel_length / 2])
 
@@ -584,8 +585,8 @@ def create_porous_sphere(center: np.ndarray, outer_radius: float, inner_radius:
         Porous sphere manifold
     """
     # Create outer and inner spheres for shell
-    outer = m3d.Manifold.sphere(outer_radius, resolution)
-    inner = m3d.Manifold.sphere(inner_radius, resolution)
+    outer = adaptive_sphere(outer_radius, resolution)
+    inner = adaptive_sphere(inner_radius, resolution)
 
     shell = outer - inner
 
@@ -613,7 +614,7 @@ def create_porous_sphere(center: np.ndarray, outer_radius: float, inner_radius:
         z = outer_radius * np.cos(inclination)
 
         # Create pore as small sphere cutting through shell
-        pore = m3d.Manifold.sphere(pore_radius, 8)
+        pore = adaptive_sphere(pore_radius, 8)
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -638,7 +639,7 @@ def create_solid_sphere(center: np.ndarray, radius: float, resolution: int) -> m
     Returns:
         Sphere manifold
     """
-    sphere = m3d.Manifold.sphere(radius, resolution)
+    sphere = adaptive_sphere(radius, resolution)
     return sphere.translate([center[0], center[1], center[2]])
 
 
@@ -770,7 +771,7 @@ def create_vascular_channels(center: np.ndarray, islet_radius: float,
             ])
 
             length = np.linalg.norm(end - start)
-            cyl = m3d.Manifold.cylinder(length, channel_radius, channel_radius, resolution)
+            cyl = adaptive_cylinder(length, channel_radius, channel_radius, resolution)
 
             # Rotate to align
             direction = (end - start) / length
@@ -792,7 +793,7 @@ def create_vascular_channels(center: np.ndarray, islet_radius: float,
             end = center + np.array([x_offset, 0, islet_radius])
 
             length = np.linalg.norm(end - start)
-            cyl = m3d.Manifold.cylinder(length, channel_radius, channel_radius, resolution)
+            cyl = adaptive_cylinder(length, channel_radius, channel_radius, resolution)
             cyl = cyl.translate([start[0], start[1], start[2]])
             channels.append(cyl)
 
@@ -17,7 +17,8 @@ except ImportError:
     m3d = None
     HAS_MANIFOLD = False
 
-from .core import batch_union
+from .core import budgeted_difference
+from .tessellation import adaptive_cylinder
 
 
 @dataclass
@@ -166,7 +167,7 @@ def generate_porous_disc(params: PorousDiscParams) -> tuple[m3d.Manifold, dict]:
         spacing_mm = params.pore_spacing_um / 1000  # um to mm
 
     # Create base disc
-    base = m3d.Manifold.cylinder(
+    base = adaptive_cylinder(
         params.height_mm,
         radius_mm,
         radius_mm,
@@ -182,7 +183,7 @@ def generate_porous_disc(params: PorousDiscParams) -> tuple[m3d.Manifold, dict]:
     # Create pore cylinders
     pores = []
     for x, y in positions:
-        pore = m3d.Manifold.cylinder(
+        pore = adaptive_cylinder(
             params.height_mm + 0.1,  # Slightly taller to ensure clean cut
             pore_radius_mm,
             pore_radius_mm,
@@ -190,10 +191,10 @@ def generate_porous_disc(params: PorousDiscParams) -> tuple[m3d.Manifold, dict]:
         ).translate([x, y, -0.05])
         pores.append(pore)
 
-    # Union all pores and subtract from base
+    # Subtract the pores from the base; the pores are unioned inside
+    # budgeted_difference, slab by slab if the full union would not fit
     if pores:
-        all_pores = batch_union(pores)
-        result = base - all_pores
+        result = budgeted_difference(base, pores)
     else:
         result = base
 
@@ -55,12 +55,14 @@ from .transforms import (
 )
 
 # Import and re-export CSG tree evaluation
-from .csg import evaluate_csg_tree
+from .csg import evaluate_csg_tree, get_subtree_cache, subtree_hash
+from .csg_optimizer import optimize_csg_tree, format_csg_tree
 
 # Backwards compatibility functions
 import manifold3d as m3d
 from dataclasses import dataclass, field
 from typing import Literal, Optional
+from ..tessellation import adaptive_cylinder
 
 @dataclass
 class PrimitiveParams:
@@ -86,15 +88,15 @@ def apply_hole(manifold: m3d.Manifold, params: dict, resolution: int) -> m3d.Man
 
     if axis == 'z':
         depth = (max_bounds[2] - min_bounds[2]) + 0.2
-        hole = m3d.Manifold.cylinder(depth, radius, radius, resolution)
+        hole = adaptive_cylinder(depth, radius, radius, resolution)
         hole = hole.translate([center[0], center[1], min_bounds[2] - 0.1])
     elif axis == 'y':
         depth = (max_bounds[1] - min_bounds[1]) + 0.2
-        hole = m3d.Manifold.cylinder(depth, radius, radius, resolution)
+        hole = adaptive_cylinder(depth, radius, radius, resolution)
         hole = hole.rotate([90, 0, 0]).translate([center[0], min_bounds[1] - 0.1, center[2]])
     else:  # x
         depth = (max_bounds[0] - min_bounds[0]) + 0.2
-        hole = m3d.Manifold.cylinder(depth, radius, radius, resolution)
+        hole = adaptive_cylinder(depth, radius, radius, resolution)
         hole = hole.rotate([0, 90, 0]).translate([min_bounds[0] - 0.1, center[1], center[2]])
 
     return manifold - hole
@@ -206,6 +208,10 @@ __all__ = [
     'apply_transforms',
     # CSG
     'evaluate_csg_tree',
+    'get_subtree_cache',
+    'subtree_hash',
+    'optimize_csg_tree',
+    'format_csg_tree',
     # Legacy compatibility
     'PrimitiveParams',
     'generate_primitive',
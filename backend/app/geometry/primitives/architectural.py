@@ -19,6 +19,7 @@ Example Usage:
 import manifold3d as m3d
 import numpy as np
 from .registry import primitive
+from ..tessellation import adaptive_cylinder
 
 
 # ============================================================================
@@ -218,10 +219,10 @@ def create_counterbore(dims: dict, resolution: int) -> m3d.Manifold:
     bore_radius = bore_dia / 2
 
     # Create through hole (full depth)
-    hole = m3d.Manifold.cylinder(total_depth, hole_radius, hole_radius, resolution)
+    hole = adaptive_cylinder(total_depth, hole_radius, hole_radius, resolution)
 
     # Create counterbore (only bore_depth)
-    bore = m3d.Manifold.cylinder(bore_depth, bore_radius, bore_radius, resolution)
+    bore = adaptive_cylinder(bore_depth, bore_radius, bore_radius, resolution)
 
     # Position bore at top of hole
     bore = bore.translate([0, 0, total_depth - bore_depth])
@@ -276,10 +277,10 @@ def create_countersink(dims: dict, resolution: int) -> m3d.Manifold:
     sink_depth = radius_diff / np.tan(half_angle_rad)
 
     # Create through hole (full depth)
-    hole = m3d.Manifold.cylinder(total_depth, hole_radius, hole_radius, resolution)
+    hole = adaptive_cylinder(total_depth, hole_radius, hole_radius, resolution)
 
     # Create cone for countersink
-    cone = m3d.Manifold.cylinder(sink_depth, sink_radius, hole_radius, resolution)
+    cone = adaptive_cylinder(sink_depth, sink_radius, hole_radius, resolution)
 
     # Position cone at top
     cone = cone.translate([0, 0, total_depth - sink_depth])
@@ -324,7 +325,7 @@ def create_boss(dims: dict, resolution: int) -> m3d.Manifold:
     radius = diameter / 2
 
     # Create main cylinder
-    boss = m3d.Manifold.cylinder(height, radius, radius, resolution)
+    boss = adaptive_cylinder(height, radius, radius, resolution)
 
     # Add fillet at base if requested
     if fillet_radius > 0 and fillet_radius < radius:
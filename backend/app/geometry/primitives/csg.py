@@ -41,9 +41,18 @@ Example Usage:
     >>> result = evaluate_csg_tree(complex_tree)
 """
 
+import contextvars
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, TypedDict, Union, Optional
 import manifold3d as m3d
 
+from ..core import budgeted_difference
+from ..memory_budget import check_boolean_budget
+from ..stage_cache import StageCache
+from ..tessellation import get_active_policy
 from .registry import get_primitive
 from .transforms import apply_transforms
 
@@ -96,16 +105,86 @@ class OperationNode(TypedDict, total=False):
 CSGNode = Union[PrimitiveNode, OperationNode]
 
 
-def evaluate_csg_tree(tree: CSGNode, resolution: int = 32) -> m3d.Manifold:
+SUPPORTED_OPERATIONS = ("union", "difference", "intersection")
+
+# Evaluated subtrees shared across calls. LLM-generated trees repeat the same
+# sub-assemblies (a bolt hole, a rib) both within one tree and across edits.
+_subtree_cache = StageCache(max_entries=256)
+
+# Children are evaluated on a thread pool only near the root; deeper levels
+# run inline so nested pools cannot multiply the thread count.
+PARALLEL_DEPTH = 2
+
+
+def get_subtree_cache() -> StageCache:
+    """Return the cache of evaluated CSG subtrees shared across calls."""
+    return _subtree_cache
+
+
+def subtree_hash(node: CSGNode) -> str:
+    """Content hash of a CSG subtree, independent of dict key order.
+
+    Args:
+        node: CSG tree node (either primitive or operation)
+
+    Returns:
+        Hex digest identifying structurally identical subtrees
+    """
+    canonical = json.dumps(node, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def validate_operation_node(node: OperationNode) -> None:
+    """Check that an operation node has a supported op and at least 2 children.
+
+    Raises:
+        ValueError: If the node is malformed
+    """
+    operation = node["op"]
+    children = node.get("children", [])
+
+    if not children:
+        raise ValueError(f"Operation node '{operation}' has no children")
+
+    if len(children) < 2:
+        raise ValueError(f"Operation '{operation}' requires at least 2 children, got {len(children)}")
+
+    if operation not in SUPPORTED_OPERATIONS:
+        raise ValueError(
+            f"Unsupported CSG operation: '{operation}'. "
+            f"Supported operations: 'union', 'difference', 'intersection'"
+        )
+
+
+def evaluate_csg_tree(
+    tree: CSGNode,
+    resolution: int = 32,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    optimize: bool = True,
+) -> m3d.Manifold:
     """Evaluate a CSG tree to produce a Manifold3D mesh.
 
     Recursively processes a CSG tree structure, creating primitives at leaf nodes
     and applying boolean operations at internal nodes. Supports transforms at any
     level of the tree hierarchy.
 
+    Identical subtrees are evaluated once: results are memoized by a content
+    hash of the subtree (plus resolution and tessellation policy), both within
+    the tree and across calls. Independent operation children near the root are
+    evaluated in parallel, and each operation node runs a single n-ary boolean.
+
+    Unless ``optimize`` is False the tree is first simplified by
+    ``optimize_csg_tree`` (flattening, transform folding, bounding-box
+    pruning and operand reordering); the rewritten tree is logged at DEBUG.
+
     Args:
         tree: CSG tree node (either primitive or operation)
         resolution: Resolution parameter for circular primitives (default: 32)
+        max_workers: Threads used for parallel children (default: CPU count,
+            1 disables parallel evaluation)
+        use_cache: Reuse subtrees evaluated by earlier calls (default: True)
+        optimize: Run the CSG optimizer pass first (default: True)
 
     Returns:
         Manifold3D mesh representing the evaluated CSG tree
@@ -132,59 +211,131 @@ def evaluate_csg_tree(tree: CSGNode, resolution: int = 32) -> m3d.Manifold:
         ... }
         >>> mesh = evaluate_csg_tree(union_tree)
     """
-    # Handle primitive (leaf) nodes
-    if "primitive" in tree:
-        primitive_name = tree["primitive"]
-        dims = tree.get("dims", {})
+    evaluator = _CSGEvaluator(
+        resolution=resolution,
+        max_workers=max_workers if max_workers is not None else (os.cpu_count() or 1),
+        cache=_subtree_cache if use_cache else None,
+    )
+    if optimize:
+        from .csg_optimizer import optimize_csg_tree
+
+        tree = optimize_csg_tree(tree, evaluator.leaf_bounds)
+    return evaluator.evaluate(tree)
+
+
+class _CSGEvaluator:
+    """State for one evaluate_csg_tree call: settings and the per-call memo."""
+
+    def __init__(self, resolution: int, max_workers: int, cache: Optional[StageCache]):
+        self.resolution = resolution
+        self.max_workers = max(1, int(max_workers))
+        self.cache = cache
+        self.policy = get_active_policy()
+        self.memo: Dict[str, m3d.Manifold] = {}
+
+    def evaluate(self, node: CSGNode, depth: int = 0) -> m3d.Manifold:
+        """Evaluate ``node``, reusing any identical subtree already built."""
+        digest = subtree_hash(node)
+        mesh = self.memo.get(digest)
+        if mesh is not None:
+            return mesh
+
+        key = (digest, self.resolution, self.policy)
+        if self.cache is not None:
+            mesh = self.cache.get(key)
+
+        if mesh is None:
+            mesh = self._build(node, depth)
+            if self.cache is not None:
+                self.cache.put(key, mesh)
+
+        self.memo[digest] = mesh
+        return mesh
 
-        # Get primitive definition from registry
-        primitive_def = get_primitive(primitive_name)
+    def leaf_bounds(self, leaf: PrimitiveNode) -> Optional[tuple]:
+        """Bounding box of an evaluated leaf, or None if it is empty."""
+        mesh = self.evaluate(leaf)
+        if mesh.is_empty():
+            return None
+        return tuple(mesh.bounding_box())
 
-        # Merge defaults with provided dims (provided dims take precedence)
-        merged_dims = {**primitive_def.defaults, **dims}
+    def _build(self, node: CSGNode, depth: int) -> m3d.Manifold:
+        # Subtree the optimizer proved to be empty
+        if node.get("empty"):
+            return m3d.Manifold()
 
-        # Create primitive mesh
-        mesh = primitive_def.func(merged_dims, resolution)
+        # Handle primitive (leaf) nodes
+        elif "primitive" in node:
+            primitive_name = node["primitive"]
+            dims = node.get("dims", {})
 
-        # Apply transforms if specified
-        if "transforms" in tree:
-            mesh = apply_transforms(mesh, tree["transforms"])
+            # Get primitive definition from registry
+            primitive_def = get_primitive(primitive_name)
 
-        return mesh
+            # Merge defaults with provided dims (provided dims take precedence)
+            merged_dims = {**primitive_def.defaults, **dims}
 
-    # Handle operation (internal) nodes
-    elif "op" in tree:
-        operation = tree["op"]
-        children = tree.get("children", [])
+            # Create primitive mesh
+            mesh = primitive_def.func(merged_dims, self.resolution)
 
-        if not children:
-            raise ValueError(f"Operation node '{operation}' has no children")
+            # Apply transforms if specified
+            if "transforms" in node:
+                mesh = apply_transforms(mesh, node["transforms"])
 
-        if len(children) < 2:
-            raise ValueError(f"Operation '{operation}' requires at least 2 children, got {len(children)}")
+            return mesh
 
-        # Recursively evaluate all children
-        child_meshes = [evaluate_csg_tree(child, resolution) for child in children]
+        # Handle operation (internal) nodes
+        elif "op" in node:
+            operation = node["op"]
+            children = node.get("children", [])
 
-        # Apply boolean operation
-        result = _apply_operation(operation, child_meshes)
+            validate_operation_node(node)
 
-        # Apply transforms if specified
-        if "transforms" in tree:
-            result = apply_transforms(result, tree["transforms"])
+            child_meshes = self._evaluate_children(children, depth)
 
-        return result
+            # Apply boolean operation
+            result = _apply_operation(operation, child_meshes)
 
-    else:
-        raise ValueError(
-            "Invalid CSG tree node: must contain either 'primitive' or 'op' key. "
-            f"Got keys: {list(tree.keys())}"
-        )
+            # Apply transforms if specified
+            if "transforms" in node:
+                result = apply_transforms(result, node["transforms"])
+
+            return result
+
+        else:
+            raise ValueError(
+                "Invalid CSG tree node: must contain either 'primitive' or 'op' key. "
+                f"Got keys: {list(node.keys())}"
+            )
+
+    def _evaluate_children(self, children: List[CSGNode], depth: int) -> List[m3d.Manifold]:
+        """Evaluate children, in parallel when several are operation subtrees."""
+        op_children = sum(1 for child in children if "op" in child)
+        if self.max_workers < 2 or depth >= PARALLEL_DEPTH or op_children < 2:
+            return [self.evaluate(child, depth + 1) for child in children]
+
+        def evaluate_materialized(child: CSGNode) -> m3d.Manifold:
+            mesh = self.evaluate(child, depth + 1)
+            # Booleans are lazy; force evaluation so the work happens on this thread
+            mesh.num_tri()
+            return mesh
+
+        workers = min(self.max_workers, len(children))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Copy the context so workers see the request's budget and policy
+            futures = [
+                executor.submit(contextvars.copy_context().run, evaluate_materialized, child)
+                for child in children
+            ]
+            return [future.result() for future in futures]
 
 
 def _apply_operation(operation: str, meshes: List[m3d.Manifold]) -> m3d.Manifold:
     """Apply a boolean operation to a list of meshes.
 
+    Runs one n-ary boolean per node instead of folding pairwise; difference
+    subtracts the union of all cutters in a single step.
+
     Args:
         operation: CSG operation ('union', 'difference', 'intersection')
         meshes: List of Manifold3D meshes (must contain at least 2)
@@ -194,24 +345,18 @@ def _apply_operation(operation: str, meshes: List[m3d.Manifold]) -> m3d.Manifold
 
     Raises:
         ValueError: If operation is not supported
+        MemoryBudgetExceeded: If the boolean would exceed the active memory budget
     """
     if operation == "union":
-        result = meshes[0]
-        for mesh in meshes[1:]:
-            result = result + mesh
-        return result
+        check_boolean_budget(meshes, "CSG union")
+        return m3d.Manifold.batch_boolean(meshes, m3d.OpType.Add)
 
     elif operation == "difference":
-        result = meshes[0]
-        for mesh in meshes[1:]:
-            result = result - mesh
-        return result
+        return budgeted_difference(meshes[0], meshes[1:])
 
     elif operation == "intersection":
-        result = meshes[0]
-        for mesh in meshes[1:]:
-            result = m3d.Manifold.batch_boolean([result, mesh], m3d.OpType.Intersect)
-        return result
+        check_boolean_budget(meshes, "CSG intersection")
+        return m3d.Manifold.batch_boolean(meshes, m3d.OpType.Intersect)
 
     else:
         raise ValueError(
@@ -0,0 +1,307 @@
+"""Rewrite pass that simplifies CSG trees before evaluation.
+
+LLM-generated trees are often badly shaped: unions nested inside unions,
+intersections of boxes that never meet, holes subtracted from empty space.
+Every redundant node costs a boolean, so the tree is normalized first:
+
+1. Fold transforms into leaves. Booleans commute with affine transforms, so
+   an operation's transforms are pushed down onto its children; afterwards
+   only primitive leaves carry transforms.
+2. Flatten associative operations: union(union(a, b), c) becomes
+   union(a, b, c), likewise for intersection, and
+   difference(difference(a, b), union(c, d)) becomes difference(a, b, c, d).
+3. Prune with bounding boxes: intersections whose operand boxes do not all
+   overlap are empty, and cutters whose box misses the base box are dropped
+   from a difference. Empty subtrees are then removed from their parents.
+4. Reorder operands for locality: union operands and difference cutters are
+   sorted along a Z-order curve of their box centers, intersection operands
+   by ascending box volume so the result shrinks as early as possible.
+
+Bounds are supplied by the caller (the evaluator builds leaves at the final
+resolution), so pruning decisions use the exact geometry that will be
+evaluated. Box tests are conservative: touching boxes count as overlapping.
+
+Example:
+    >>> optimized = optimize_csg_tree(tree, leaf_bounds)
+    >>> print(format_csg_tree(optimized))
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional, Tuple
+
+from .csg import CSGNode, validate_operation_node
+
+logger = logging.getLogger(__name__)
+
+# (min_x, min_y, min_z, max_x, max_y, max_z), as returned by Manifold.bounding_box()
+BBox = Tuple[float, float, float, float, float, float]
+
+# Placeholder for a subtree proven to produce no geometry
+EMPTY_NODE: CSGNode = {"empty": True}
+
+# Bits per axis of the Z-order key used to sort operands
+_MORTON_BITS = 10
+
+
+@dataclass
+class CSGOptimizationStats:
+    """Counts of the rewrites applied by one optimizer run."""
+    transforms_folded: int = 0
+    nodes_flattened: int = 0
+    intersections_pruned: int = 0
+    cutters_pruned: int = 0
+    empty_children_removed: int = 0
+    nodes_reordered: int = 0
+
+
+def is_empty_node(node: CSGNode) -> bool:
+    """Return True if ``node`` is the empty-geometry placeholder."""
+    return bool(node.get("empty"))
+
+
+def optimize_csg_tree(
+    tree: CSGNode,
+    leaf_bounds: Callable[[CSGNode], Optional[BBox]],
+    debug: bool = False,
+) -> CSGNode:
+    """Return a simplified CSG tree that evaluates to the same geometry.
+
+    The input tree is not modified.
+
+    Args:
+        tree: CSG tree node (either primitive or operation)
+        leaf_bounds: Returns the bounding box of a primitive leaf (with its
+            transforms applied), or None if the leaf is empty
+        debug: Log the rewritten tree at INFO instead of DEBUG level
+
+    Returns:
+        Optimized tree. May be EMPTY_NODE if the whole tree is provably empty.
+
+    Raises:
+        ValueError: If tree structure is invalid or unsupported operation specified
+    """
+    stats = CSGOptimizationStats()
+    folded = _fold_transforms(tree, [], stats)
+    flattened = _flatten(folded, stats)
+    optimized, _ = _prune_and_reorder(flattened, leaf_bounds, stats)
+
+    level = logging.INFO if debug else logging.DEBUG
+    if logger.isEnabledFor(level):
+        logger.log(
+            level,
+            "Optimized CSG tree %s:\n%s",
+            json.dumps(asdict(stats)),
+            format_csg_tree(optimized),
+        )
+    return optimized
+
+
+def format_csg_tree(node: CSGNode, indent: int = 0) -> str:
+    """Render a CSG tree as indented text for debugging.
+
+    Args:
+        node: CSG tree node
+        indent: Indentation level of ``node``
+
+    Returns:
+        One line per node, children indented under their operation
+    """
+    pad = "  " * indent
+    if is_empty_node(node):
+        line = f"{pad}<empty>"
+    elif "primitive" in node:
+        line = f"{pad}{node['primitive']} {json.dumps(node.get('dims', {}), sort_keys=True)}"
+    else:
+        line = f"{pad}{node.get('op')}"
+
+    transforms = node.get("transforms")
+    if transforms:
+        line += " @ " + json.dumps(transforms, sort_keys=True)
+
+    lines = [line]
+    for child in node.get("children", []):
+        lines.append(format_csg_tree(child, indent + 1))
+    return "\n".join(lines)
+
+
+def _fold_transforms(node: CSGNode, inherited: List[dict], stats: CSGOptimizationStats) -> CSGNode:
+    """Push operation transforms down so only leaves carry transforms."""
+    own = list(node.get("transforms", []))
+
+    if "primitive" in node:
+        leaf = {key: value for key, value in node.items() if key != "transforms"}
+        transforms = own + inherited
+        if transforms:
+            leaf["transforms"] = transforms
+        return leaf
+
+    if "op" not in node:
+        raise ValueError(
+            "Invalid CSG tree node: must contain either 'primitive' or 'op' key. "
+            f"Got keys: {list(node.keys())}"
+        )
+
+    validate_operation_node(node)
+    if own:
+        stats.transforms_folded += 1
+
+    # The node's transforms apply after its children's own transforms
+    child_transforms = own + inherited
+    return {
+        "op": node["op"],
+        "children": [_fold_transforms(child, child_transforms, stats) for child in node["children"]],
+    }
+
+
+def _flatten(node: CSGNode, stats: CSGOptimizationStats) -> CSGNode:
+    """Merge nested associative operations into their parent."""
+    if "op" not in node:
+        return node
+
+    operation = node["op"]
+    children = [_flatten(child, stats) for child in node["children"]]
+
+    if operation in ("union", "intersection"):
+        merged = []
+        for child in children:
+            if child.get("op") == operation:
+                merged.extend(child["children"])
+                stats.nodes_flattened += 1
+            else:
+                merged.append(child)
+        return {"op": operation, "children": merged}
+
+    # difference: a nested difference as the base contributes its own cutters,
+    # and a union of cutters is the same as subtracting each of them
+    base, cutters = children[0], []
+    if base.get("op") == "difference":
+        base, cutters = base["children"][0], list(base["children"][1:])
+        stats.nodes_flattened += 1
+    for cutter in children[1:]:
+        if cutter.get("op") == "union":
+            cutters.extend(cutter["children"])
+            stats.nodes_flattened += 1
+        else:
+            cutters.append(cutter)
+    return {"op": "difference", "children": [base] + cutters}
+
+
+def _prune_and_reorder(
+    node: CSGNode,
+    leaf_bounds: Callable[[CSGNode], Optional[BBox]],
+    stats: CSGOptimizationStats,
+) -> Tuple[CSGNode, Optional[BBox]]:
+    """Drop provably empty or non-contributing subtrees and sort operands.
+
+    Returns:
+        Tuple of (node, conservative bounding box or None if empty)
+    """
+    if "primitive" in node:
+        bbox = leaf_bounds(node)
+        if bbox is None:
+            return EMPTY_NODE, None
+        return node, tuple(bbox)
+
+    operation = node["op"]
+    results = [_prune_and_reorder(child, leaf_bounds, stats) for child in node["children"]]
+
+    if operation == "union":
+        kept = [(child, bbox) for child, bbox in results if bbox is not None]
+        stats.empty_children_removed += len(results) - len(kept)
+        if not kept:
+            return EMPTY_NODE, None
+        bbox = _bbox_union([b for _, b in kept])
+        kept = _sort_by_locality(kept, bbox, stats)
+        return _collapse("union", [c for c, _ in kept]), bbox
+
+    if operation == "intersection":
+        if any(bbox is None for _, bbox in results):
+            stats.intersections_pruned += 1
+            return EMPTY_NODE, None
+        bbox = _bbox_intersection([b for _, b in results])
+        if bbox is None:
+            stats.intersections_pruned += 1
+            return EMPTY_NODE, None
+        ordered = sorted(results, key=lambda item: _bbox_volume(item[1]))
+        if [c for c, _ in ordered] != [c for c, _ in results]:
+            stats.nodes_reordered += 1
+        return _collapse("intersection", [c for c, _ in ordered]), bbox
+
+    # difference
+    base, base_bbox = results[0]
+    if base_bbox is None:
+        return EMPTY_NODE, None
+    cutters = []
+    for cutter, bbox in results[1:]:
+        if bbox is None:
+            stats.empty_children_removed += 1
+        elif not _bboxes_overlap(base_bbox, bbox):
+            stats.cutters_pruned += 1
+        else:
+            cutters.append((cutter, bbox))
+    if not cutters:
+        return base, base_bbox
+    cutters = _sort_by_locality(cutters, base_bbox, stats)
+    return {"op": "difference", "children": [base] + [c for c, _ in cutters]}, base_bbox
+
+
+def _collapse(operation: str, children: List[CSGNode]) -> CSGNode:
+    """Build an operation node, or return the lone child if only one is left."""
+    if len(children) == 1:
+        return children[0]
+    return {"op": operation, "children": children}
+
+
+def _bboxes_overlap(a: BBox, b: BBox) -> bool:
+    """True unless the boxes are separated along some axis (touching overlaps)."""
+    return all(a[i] <= b[i + 3] and b[i] <= a[i + 3] for i in range(3))
+
+
+def _bbox_union(boxes: List[BBox]) -> BBox:
+    return (
+        min(b[0] for b in boxes), min(b[1] for b in boxes), min(b[2] for b in boxes),
+        max(b[3] for b in boxes), max(b[4] for b in boxes), max(b[5] for b in boxes),
+    )
+
+
+def _bbox_intersection(boxes: List[BBox]) -> Optional[BBox]:
+    lo = [max(b[i] for b in boxes) for i in range(3)]
+    hi = [min(b[i + 3] for b in boxes) for i in range(3)]
+    if any(lo[i] > hi[i] for i in range(3)):
+        return None
+    return (lo[0], lo[1], lo[2], hi[0], hi[1], hi[2])
+
+
+def _bbox_volume(bbox: BBox) -> float:
+    return max(0.0, bbox[3] - bbox[0]) * max(0.0, bbox[4] - bbox[1]) * max(0.0, bbox[5] - bbox[2])
+
+
+def _morton_key(bbox: BBox, extent: BBox) -> int:
+    """Z-order key of the box center within ``extent``."""
+    cells = (1 << _MORTON_BITS) - 1
+    key = 0
+    coords = []
+    for axis in range(3):
+        span = extent[axis + 3] - extent[axis]
+        center = (bbox[axis] + bbox[axis + 3]) / 2.0
+        t = (center - extent[axis]) / span if span > 0 else 0.0
+        coords.append(min(cells, max(0, int(t * cells))))
+    for bit in range(_MORTON_BITS - 1, -1, -1):
+        for axis in range(3):
+            key = (key << 1) | ((coords[axis] >> bit) & 1)
+    return key
+
+
+def _sort_by_locality(
+    items: List[Tuple[CSGNode, BBox]],
+    extent: BBox,
+    stats: CSGOptimizationStats,
+) -> List[Tuple[CSGNode, BBox]]:
+    """Sort (node, bbox) pairs along a Z-order curve of their box centers."""
+    ordered = sorted(items, key=lambda item: _morton_key(item[1], extent))
+    if [c for c, _ in ordered] != [c for c, _ in items]:
+        stats.nodes_reordered += 1
+    return ordered
+
@@ -8,6 +8,7 @@ with the primitive decorator for automatic schema validation and discovery.
 import manifold3d as m3d
 import numpy as np
 from .registry import primitive
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 # ============================================================================
@@ -38,7 +39,7 @@ def create_cylinder(dims: dict, resolution: int) -> m3d.Manifold:
     radius = dims["radius_mm"]
     height = dims["height_mm"]
 
-    return m3d.Manifold.cylinder(
+    return adaptive_cylinder(
         height=height,
         radius_low=radius,
         radius_high=radius,
@@ -70,7 +71,7 @@ def create_sphere(dims: dict, resolution: int) -> m3d.Manifold:
         Manifold sphere
     """
     radius = dims["radius_mm"]
-    return m3d.Manifold.sphere(radius=radius, circular_segments=resolution)
+    return adaptive_sphere(radius=radius, circular_segments=resolution)
 
 
 # ============================================================================
@@ -138,7 +139,7 @@ def create_cone(dims: dict, resolution: int) -> m3d.Manifold:
     top_radius = dims["top_radius_mm"]
     height = dims["height_mm"]
 
-    return m3d.Manifold.cylinder(
+    return adaptive_cylinder(
         height=height,
         radius_low=bottom_radius,
         radius_high=top_radius,
@@ -223,7 +224,7 @@ def create_capsule(dims: dict, resolution: int) -> m3d.Manifold:
     length = dims["length_mm"]
 
     # Create cylinder in middle
-    cylinder = m3d.Manifold.cylinder(
+    cylinder = adaptive_cylinder(
         height=length,
         radius_low=radius,
         radius_high=radius,
@@ -231,7 +232,7 @@ def create_capsule(dims: dict, resolution: int) -> m3d.Manifold:
     ).translate([0, 0, -length / 2])
 
     # Create sphere and split in half for hemispheres
-    sphere = m3d.Manifold.sphere(radius=radius, circular_segments=resolution)
+    sphere = adaptive_sphere(radius=radius, circular_segments=resolution)
 
     # Large box for intersection (to create hemispheres)
     large = radius * 10
@@ -434,14 +435,14 @@ def create_tube(dims: dict, resolution: int) -> m3d.Manifold:
     if inner_r >= outer_r:
         inner_r = outer_r * 0.7
 
-    outer_cyl = m3d.Manifold.cylinder(
+    outer_cyl = adaptive_cylinder(
         height=length,
         radius_low=outer_r,
         radius_high=outer_r,
         circular_segments=resolution
     ).translate([0, 0, -length / 2])
 
-    inner_cyl = m3d.Manifold.cylinder(
+    inner_cyl = adaptive_cylinder(
         height=length + 1,  # Slightly longer to ensure clean boolean
         radius_low=inner_r,
         radius_high=inner_r,
@@ -513,7 +514,7 @@ def create_hemisphere(dims: dict, resolution: int) -> m3d.Manifold:
     radius = dims["radius_mm"]
 
     # Create sphere
-    sphere = m3d.Manifold.sphere(radius=radius, circular_segments=resolution)
+    sphere = adaptive_sphere(radius=radius, circular_segments=resolution)
 
     # Create large box in positive z half-space
     large = radius * 10
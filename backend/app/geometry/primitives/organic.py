@@ -8,6 +8,7 @@ found in biological tissue engineering and biomedical applications.
 import manifold3d as m3d
 import numpy as np
 from .registry import primitive
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 # Branch primitive - tapered cylinder for organic branching structures
@@ -38,7 +39,7 @@ def create_branch(dims: dict, resolution: int) -> m3d.Manifold:
     end_radius = dims["end_radius_mm"]
     length = dims["length_mm"]
 
-    return m3d.Manifold.cylinder(
+    return adaptive_cylinder(
         height=length,
         radius_low=start_radius,
         radius_high=end_radius,
@@ -78,7 +79,7 @@ def create_bifurcation(dims: dict, resolution: int) -> m3d.Manifold:
     length = dims["length_mm"]
 
     # Parent cylinder (along Z-axis)
-    parent = m3d.Manifold.cylinder(
+    parent = adaptive_cylinder(
         height=length,
         radius_low=parent_radius,
         radius_high=parent_radius,
@@ -86,7 +87,7 @@ def create_bifurcation(dims: dict, resolution: int) -> m3d.Manifold:
     )
 
     # Junction sphere at split point for smooth connection
-    junction = m3d.Manifold.sphere(
+    junction = adaptive_sphere(
         radius=parent_radius * 1.1,
         circular_segments=resolution
     ).translate([0, 0, length])
@@ -95,7 +96,7 @@ def create_bifurcation(dims: dict, resolution: int) -> m3d.Manifold:
     half_angle = np.radians(angle / 2)
 
     # Create two child branches
-    child_base = m3d.Manifold.cylinder(
+    child_base = adaptive_cylinder(
         height=length,
         radius_low=child_radius,
         radius_high=child_radius,
@@ -140,7 +141,7 @@ def create_pore(dims: dict, resolution: int) -> m3d.Manifold:
     depth = dims["depth_mm"]
     radius = diameter / 2.0
 
-    return m3d.Manifold.cylinder(
+    return adaptive_cylinder(
         height=depth,
         radius_low=radius,
         radius_high=radius,
@@ -174,7 +175,7 @@ def create_channel(dims: dict, resolution: int) -> m3d.Manifold:
     length = dims["length_mm"]
     radius = diameter / 2.0
 
-    return m3d.Manifold.cylinder(
+    return adaptive_cylinder(
         height=length,
         radius_low=radius,
         radius_high=radius,
@@ -219,7 +220,7 @@ def create_fiber(dims: dict, resolution: int) -> m3d.Manifold:
 
     # Straight fiber case
     if amplitude == 0:
-        return m3d.Manifold.cylinder(
+        return adaptive_cylinder(
             height=length,
             radius_low=radius,
             radius_high=radius,
@@ -234,7 +235,7 @@ def create_fiber(dims: dict, resolution: int) -> m3d.Manifold:
     spheres = []
     for z in z_positions:
         x = amplitude * np.sin(2 * np.pi * z / wavelength)
-        sphere = m3d.Manifold.sphere(radius=radius, circular_segments=resolution)
+        sphere = adaptive_sphere(radius=radius, circular_segments=resolution)
         sphere = sphere.translate([x, 0, z])
         spheres.append(sphere)
 
@@ -289,7 +290,7 @@ def create_membrane(dims: dict, resolution: int) -> m3d.Manifold:
 
     # Flat membrane case
     if curvature == 0:
-        return m3d.Manifold.cylinder(
+        return adaptive_cylinder(
             height=thickness,
             radius_low=radius,
             radius_high=radius,
@@ -301,11 +302,11 @@ def create_membrane(dims: dict, resolution: int) -> m3d.Manifold:
     sphere_radius = radius / curvature
 
     # Create outer and inner spheres
-    outer_sphere = m3d.Manifold.sphere(
+    outer_sphere = adaptive_sphere(
         radius=sphere_radius,
         circular_segments=resolution
     )
-    inner_sphere = m3d.Manifold.sphere(
+    inner_sphere = adaptive_sphere(
         radius=sphere_radius - thickness,
         circular_segments=resolution
     )
@@ -354,7 +355,7 @@ def create_lattice_cell(dims: dict, resolution: int) -> m3d.Manifold:
     radius = strut_diameter / 2.0
 
     # Create a base strut (cylinder)
-    strut = m3d.Manifold.cylinder(
+    strut = adaptive_cylinder(
         height=cell_size,
         radius_low=radius,
         radius_high=radius,
@@ -431,7 +432,7 @@ def create_pore_array(dims: dict, resolution: int) -> m3d.Manifold:
     radius = pore_size / 2.0
 
     # Create base pore cylinder
-    pore = m3d.Manifold.cylinder(
+    pore = adaptive_cylinder(
         height=depth,
         radius_low=radius,
         radius_high=radius,
@@ -22,7 +22,9 @@ import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder
 
 
 @dataclass
@@ -233,7 +235,7 @@ def generate_articular_cartilage(params: ArticularCartilageParams) -> tuple[m3d.
     tidemark_thickness = params.tidemark_thickness if params.enable_tidemark_layer else 0
 
     # Create base cylinder
-    base = m3d.Manifold.cylinder(total_height, radius, radius, params.resolution)
+    base = adaptive_cylinder(total_height, radius, radius, params.resolution)
 
     # Collect all pore geometries
     all_pores = []
@@ -369,11 +371,13 @@ def generate_articular_cartilage(params: ArticularCartilageParams) -> tuple[m3d.
         return ('superficial', pores, zone_pores)
 
     # Execute zone processing in parallel
+    # Each worker runs in a copy of this context so the active tessellation
+    # policy and memory budget apply to its geometry too
     with ThreadPoolExecutor(max_workers=3) as executor:
         futures = [
-            executor.submit(process_deep_zone),
-            executor.submit(process_middle_zone),
-            executor.submit(process_superficial_zone)
+            executor.submit(contextvars.copy_context().run, process_deep_zone),
+            executor.submit(contextvars.copy_context().run, process_middle_zone),
+            executor.submit(contextvars.copy_context().run, process_superficial_zone)
         ]
 
         for future in as_completed(futures):
@@ -741,12 +745,12 @@ def create_fiber_bundles(
 
     # Pre-create cylinder templates for each orientation (major optimization)
     if fiber_angle_deg > 75:
-        cylinder_template = m3d.Manifold.cylinder(vertical_fiber_length, fiber_radius, fiber_radius, resolution)
+        cylinder_template = adaptive_cylinder(vertical_fiber_length, fiber_radius, fiber_radius, resolution)
     elif fiber_angle_deg < 15:
-        cylinder_template = m3d.Manifold.cylinder(horizontal_fiber_length, fiber_radius, fiber_radius, resolution)
+        cylinder_template = adaptive_cylinder(horizontal_fiber_length, fiber_radius, fiber_radius, resolution)
         cylinder_template = cylinder_template.rotate([0, 90, 0])  # Pre-rotate to horizontal
     else:
-        cylinder_template = m3d.Manifold.cylinder(oblique_fiber_length, fiber_radius, fiber_radius, resolution)
+        cylinder_template = adaptive_cylinder(oblique_fiber_length, fiber_radius, fiber_radius, resolution)
         cylinder_template = cylinder_template.rotate([0, 90 - fiber_angle_deg, 0])  # Pre-tilt
 
     for i in range(n_fibers_radial):
@@ -831,7 +835,7 @@ def create_vertical_channels(
             y = r * np.sin(angle)
 
             # Vertical cylinder through the zone
-            channel = m3d.Manifold.cylinder(height * 1.1, channel_radius, channel_radius, resolution)
+            channel = adaptive_cylinder(height * 1.1, channel_radius, channel_radius, resolution)
             channel = channel.translate([x, y, z_start - height * 0.05])
             channels.append(channel)
 
@@ -878,7 +882,7 @@ def create_horizontal_channels(
 
             # Channel from near center to edge
             length = radius * 0.75
-            cylinder = m3d.Manifold.cylinder(length, pore_radius, pore_radius, resolution)
+            cylinder = adaptive_cylinder(length, pore_radius, pore_radius, resolution)
 
             # Rotate to horizontal and point outward
             cylinder = cylinder.rotate([0, 90, 0])  # Make horizontal
@@ -20,6 +20,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Literal
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -161,8 +162,8 @@ def _create_cylindrical_shell(
     Returns:
         Manifold representing the cylindrical shell
     """
-    outer_cyl = m3d.Manifold.cylinder(height, outer_radius, outer_radius, resolution)
-    inner_cyl = m3d.Manifold.cylinder(height, inner_radius, inner_radius, resolution)
+    outer_cyl = adaptive_cylinder(height, outer_radius, outer_radius, resolution)
+    inner_cyl = adaptive_cylinder(height, inner_radius, inner_radius, resolution)
     return outer_cyl - inner_cyl
 
 
@@ -298,7 +299,7 @@ def _apply_surface_roughness(
             z = rng.uniform(size, bz - size)
 
         # Create small sphere for perturbation
-        sphere = m3d.Manifold.sphere(size, max(4, resolution // 2))
+        sphere = adaptive_sphere(size, max(4, resolution // 2))
         sphere = sphere.translate([x, y, z])
 
         # Randomly add or subtract (60% subtract for porous appearance)
@@ -387,7 +388,7 @@ def _create_volkmann_canals(
                 length = dist
 
                 # Create horizontal cylinder
-                canal = m3d.Manifold.cylinder(
+                canal = adaptive_cylinder(
                     length, volkmann_radius, volkmann_radius, params.resolution
                 )
 
@@ -553,7 +554,7 @@ def _create_canaliculi_from_lacuna(
         phi = rng.uniform(0, np.pi)
 
         # Create thin cylinder
-        canal = m3d.Manifold.cylinder(
+        canal = adaptive_cylinder(
             canaliculus_length, canaliculus_radius, canaliculus_radius,
             max(4, resolution // 2)
         )
@@ -667,7 +668,7 @@ def _create_interstitial_lamellae(
             size = rng.uniform(spacing * 0.3, spacing * 0.6)
             height_frac = rng.uniform(0.5, 1.0)
 
-            fragment = m3d.Manifold.cylinder(
+            fragment = adaptive_cylinder(
                 bz * height_frac, size, size * 0.8, resolution
             )
             z_offset = rng.uniform(0, bz * (1 - height_frac))
@@ -785,12 +786,12 @@ def _create_resorption_spaces(
         # Randomly choose between Howship's lacuna (sphere) and cutting cone (cylinder)
         if rng.random() > 0.5:
             # Spherical Howship's lacuna
-            space = m3d.Manifold.sphere(resorption_diameter / 2, resolution)
+            space = adaptive_sphere(resorption_diameter / 2, resolution)
             space = space.translate([x, y, z])
         else:
             # Cylindrical cutting cone
             length = rng.uniform(resorption_diameter, resorption_diameter * 3)
-            space = m3d.Manifold.cylinder(
+            space = adaptive_cylinder(
                 length, resorption_diameter / 2, resorption_diameter / 2, resolution
             )
             # Random orientation
@@ -906,7 +907,7 @@ def generate_haversian_bone(params: HaversianBoneParams) -> tuple[m3d.Manifold,
     for x, y in canal_positions:
         # Apply diameter variance and BMD modifier
         actual_radius = canal_radius * canal_bmd_modifier * (1 + rng.uniform(-params.diameter_variance, params.diameter_variance))
-        canal = m3d.Manifold.cylinder(bz, actual_radius, actual_radius, params.resolution)
+        canal = adaptive_cylinder(bz, actual_radius, actual_radius, params.resolution)
         canal = canal.translate([x, y, 0])
         haversian_canals.append(canal)
 
@@ -15,6 +15,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -375,7 +376,7 @@ def create_nucleus_pulposus(
         Porous nucleus pulposus manifold
     """
     # Create base cylinder
-    base = m3d.Manifold.cylinder(height, radius, radius, resolution)
+    base = adaptive_cylinder(height, radius, radius, resolution)
 
     # Modulate porosity based on water content (higher water = more open structure)
     # Water content 0.80 = baseline, range 0.70-0.95
@@ -420,7 +421,7 @@ def create_nucleus_pulposus(
                 z += rng.uniform(-noise_scale, noise_scale)
                 z = max(pore_radius, min(height - pore_radius, z))
 
-                pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 2))
+                pore = adaptive_sphere(pore_radius, max(4, resolution // 2))
                 pore = pore.translate([x, y, z])
                 pores.append(pore)
 
@@ -476,7 +477,7 @@ def create_notochordal_region(
                 # Vary void size within biological range
                 this_void_radius = void_radius * rng.uniform(0.8, 1.5)
 
-                void = m3d.Manifold.sphere(this_void_radius, max(4, resolution // 2))
+                void = adaptive_sphere(this_void_radius, max(4, resolution // 2))
                 void = void.translate([x, y, z])
                 voids.append(void)
 
@@ -484,7 +485,7 @@ def create_notochordal_region(
         return m3d.Manifold()
 
     # Create a shell structure with notochordal voids
-    base = m3d.Manifold.cylinder(height, radius * 0.3, radius * 0.3, resolution)
+    base = adaptive_cylinder(height, radius * 0.3, radius * 0.3, resolution)
     for void in voids:
         base = base - void
 
@@ -520,8 +521,8 @@ def create_transition_zone(
     outer_radius = np_radius + zone_width
 
     # Create base annular cylinder
-    outer = m3d.Manifold.cylinder(height, outer_radius, outer_radius, resolution)
-    inner = m3d.Manifold.cylinder(height + 0.1, np_radius, np_radius, resolution)
+    outer = adaptive_cylinder(height, outer_radius, outer_radius, resolution)
+    inner = adaptive_cylinder(height + 0.1, np_radius, np_radius, resolution)
     inner = inner.translate([0, 0, -0.05])
     base = outer - inner
 
@@ -560,7 +561,7 @@ def create_transition_zone(
                 y = r * np.sin(angle)
                 z = (k + 0.5) * height / n_vertical
 
-                pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 2))
+                pore = adaptive_sphere(pore_radius, max(4, resolution // 2))
                 pore = pore.translate([x, y, z])
                 pores.append(pore)
 
@@ -846,7 +847,7 @@ def create_endplate(
         Endplate manifold with pores and channels
     """
     # Create base disc
-    base = m3d.Manifold.cylinder(thickness, radius, radius, resolution)
+    base = adaptive_cylinder(thickness, radius, radius, resolution)
 
     # Add distributed pores for nutrient diffusion pathways (if enabled)
     if enable_endplate_pores:
@@ -867,7 +868,7 @@ def create_endplate(
                 y = r * np.sin(angle)
                 z = thickness / 2
 
-                pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 2))
+                pore = adaptive_sphere(pore_radius, max(4, resolution // 2))
                 pore = pore.translate([x, y, z])
                 base = base - pore
 
@@ -888,7 +889,7 @@ def create_endplate(
                 y = r * np.sin(angle)
 
                 # Vertical micropore through entire endplate
-                micropore = m3d.Manifold.cylinder(
+                micropore = adaptive_cylinder(
                     thickness + 0.1,
                     micropore_radius,
                     micropore_radius,
@@ -914,7 +915,7 @@ def create_endplate(
             y = r * np.sin(angle)
 
             # Vertical channel through endplate
-            channel = m3d.Manifold.cylinder(
+            channel = adaptive_cylinder(
                 thickness + 0.2,  # Extend slightly
                 channel_radius,
                 channel_radius,
@@ -975,7 +976,7 @@ def create_vascular_supply(
             y = r * np.sin(angle)
 
             # Small vessel segment (horizontal/radial orientation)
-            vessel = m3d.Manifold.sphere(channel_radius * 1.5, max(4, resolution // 2))
+            vessel = adaptive_sphere(channel_radius * 1.5, max(4, resolution // 2))
             vessel = vessel.translate([x, y, z])
             channels.append(vessel)
 
@@ -1027,7 +1028,7 @@ def create_fissures(
             fissure_height = height * 0.2 * (0.5 + degeneration_level)
 
             # Create elongated shape
-            fissure = m3d.Manifold.cylinder(length, fissure_width, fissure_width, 4)
+            fissure = adaptive_cylinder(length, fissure_width, fissure_width, 4)
             fissure = fissure.rotate([0, 90, 0])  # Rotate to radial
             fissure = fissure.rotate([0, 0, angle * 180 / np.pi])
 
@@ -1046,7 +1047,7 @@ def create_fissures(
                 x = r * np.cos(seg_angle)
                 y = r * np.sin(seg_angle)
 
-                seg = m3d.Manifold.sphere(fissure_thickness, 4)
+                seg = adaptive_sphere(fissure_thickness, 4)
                 seg = seg.translate([x, y, z_pos])
                 fissures.append(seg)
             continue
@@ -1220,7 +1221,7 @@ def make_fiber_segment(p1: np.ndarray, p2: np.ndarray, radius: float, resolution
         return m3d.Manifold()
 
     # Create cylinder along Z axis
-    segment = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    segment = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -17,6 +17,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -381,10 +382,10 @@ def create_wedge_base(
         Wedge-shaped manifold
     """
     # Create outer cylinder
-    outer_cyl = m3d.Manifold.cylinder(height, outer_radius, outer_radius, resolution)
+    outer_cyl = adaptive_cylinder(height, outer_radius, outer_radius, resolution)
 
     # Create inner cylinder to subtract
-    inner_cyl = m3d.Manifold.cylinder(height * 2, inner_radius, inner_radius, resolution)
+    inner_cyl = adaptive_cylinder(height * 2, inner_radius, inner_radius, resolution)
     inner_cyl = inner_cyl.translate([0, 0, -height * 0.5])
 
     # Create annular section
@@ -414,7 +415,7 @@ def create_wedge_base(
     if enable_femoral_surface and femoral_curvature_radius > 0:
         # Create a sphere positioned above to create concave top surface
         sphere_offset = femoral_curvature_radius - height * 0.3
-        femoral_sphere = m3d.Manifold.sphere(femoral_curvature_radius, resolution)
+        femoral_sphere = adaptive_sphere(femoral_curvature_radius, resolution)
         femoral_sphere = femoral_sphere.translate([0, 0, height + sphere_offset])
 
         # Subtract sphere to create concave surface
@@ -425,7 +426,7 @@ def create_wedge_base(
         # Add very slight concavity to tibial (bottom) surface
         # Use much larger radius for gentler curve (tibial plateau is relatively flat)
         tibial_curvature_radius = femoral_curvature_radius * 3.0  # 90mm for gentle curve
-        tibial_sphere = m3d.Manifold.sphere(tibial_curvature_radius, resolution)
+        tibial_sphere = adaptive_sphere(tibial_curvature_radius, resolution)
         tibial_sphere = tibial_sphere.translate([0, 0, -tibial_curvature_radius + height * 0.1])
         annulus = annulus - tibial_sphere
 
@@ -784,7 +785,7 @@ def create_vascular_channels(
             y = r * np.sin(angle)
 
             # Create vertical channel through the vascular zone
-            channel = m3d.Manifold.cylinder(
+            channel = adaptive_cylinder(
                 local_height * 1.1,  # Slightly taller to ensure clean subtraction
                 channel_radius,
                 channel_radius,
@@ -883,7 +884,7 @@ def create_zone_pores(
                 # Vary pore size slightly
                 actual_pore_radius = pore_radius * np.random.uniform(0.8, 1.2)
 
-                pore = m3d.Manifold.sphere(actual_pore_radius, max(6, resolution // 4))
+                pore = adaptive_sphere(actual_pore_radius, max(6, resolution // 4))
                 pore = pore.translate([x, y, z])
                 pores.append(pore)
 
@@ -958,7 +959,7 @@ def create_cell_lacunae(
         x = r * np.cos(angle)
         y = r * np.sin(angle)
 
-        lacuna = m3d.Manifold.sphere(lacuna_radius, max(4, resolution // 6))
+        lacuna = adaptive_sphere(lacuna_radius, max(4, resolution // 6))
         lacuna = lacuna.translate([x, y, z])
         lacunae.append(lacuna)
 
@@ -974,7 +975,7 @@ def create_cell_lacunae(
         x = r * np.cos(angle)
         y = r * np.sin(angle)
 
-        lacuna = m3d.Manifold.sphere(lacuna_radius, max(4, resolution // 6))
+        lacuna = adaptive_sphere(lacuna_radius, max(4, resolution // 6))
         lacuna = lacuna.translate([x, y, z])
         lacunae.append(lacuna)
 
@@ -1045,7 +1046,7 @@ def create_surface_roughness(
                 y = r * np.sin(angle)
 
                 # Create small spherical bump
-                bump = m3d.Manifold.sphere(bump_radius, max(4, resolution // 6))
+                bump = adaptive_sphere(bump_radius, max(4, resolution // 6))
                 bump = bump.translate([x, y, z])
                 bumps.append(bump)
 
@@ -1160,7 +1161,7 @@ def make_fiber(p1: np.ndarray, p2: np.ndarray, radius: float, resolution: int) -
         return m3d.Manifold()
 
     # Create cylinder along Z axis
-    fiber = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    fiber = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
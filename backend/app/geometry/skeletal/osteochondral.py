@@ -10,6 +10,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from typing import Literal
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -187,7 +188,7 @@ def generate_osteochondral(params: OsteochondralParams) -> tuple[m3d.Manifold, d
     radius = params.diameter / 2
 
     # Create base cylinder
-    base = m3d.Manifold.cylinder(total_height, radius, radius, params.resolution)
+    base = adaptive_cylinder(total_height, radius, radius, params.resolution)
 
     # Track z-position as we build up from bottom
     z_current = 0.0
@@ -754,7 +755,7 @@ def create_vascular_channels(
             y = r_final * np.sin(angle_final)
 
             # Create vertical cylinder for channel
-            channel = m3d.Manifold.cylinder(channel_height, channel_radius, channel_radius, resolution)
+            channel = adaptive_cylinder(channel_height, channel_radius, channel_radius, resolution)
             channel = channel.translate([x, y, z_start])
             channels.append(channel)
 
@@ -813,7 +814,7 @@ def create_interdigitated_layer(
 
             # Create small spherical pore
             pore_radius = layer_thickness * 0.3
-            pore = m3d.Manifold.sphere(pore_radius, max(8, resolution // 2))
+            pore = adaptive_sphere(pore_radius, max(8, resolution // 2))
             pore = pore.translate([x, y, z])
             pores.append(pore)
 
@@ -874,7 +875,7 @@ def create_thin_porous_layer(
             y = r * np.sin(angle)
             z = z_start + layer_thickness / 2
 
-            pore = m3d.Manifold.sphere(pore_radius, max(6, resolution // 2))
+            pore = adaptive_sphere(pore_radius, max(6, resolution // 2))
             pore = pore.translate([x, y, z])
             pores.append(pore)
 
@@ -990,7 +991,7 @@ def create_stiffness_indicators(
     bone_ring_radius = 0.05 / (bone_modulus / 10)  # Inversely scaled by modulus
     for i in range(n_markers):
         z = bone_z_start + (i + 0.5) * (bone_z_end - bone_z_start) / n_markers
-        ring = m3d.Manifold.cylinder(bone_ring_radius, radius * 0.95, radius * 0.95, resolution)
+        ring = adaptive_cylinder(bone_ring_radius, radius * 0.95, radius * 0.95, resolution)
         ring = ring.translate([0, 0, z - bone_ring_radius / 2])
         indicators.append(ring)
 
@@ -998,7 +999,7 @@ def create_stiffness_indicators(
     cartilage_ring_radius = 0.05 / (cartilage_modulus / 10 + 0.1)  # Inversely scaled
     for i in range(n_markers):
         z = cartilage_z_start + (i + 0.5) * (cartilage_z_end - cartilage_z_start) / n_markers
-        ring = m3d.Manifold.cylinder(cartilage_ring_radius, radius * 0.95, radius * 0.95, resolution)
+        ring = adaptive_cylinder(cartilage_ring_radius, radius * 0.95, radius * 0.95, resolution)
         ring = ring.translate([0, 0, z - cartilage_ring_radius / 2])
         indicators.append(ring)
 
@@ -10,6 +10,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -560,9 +561,9 @@ def _create_fascicle_boundary(
     inner_radius = diameter / 2
 
     # Create outer cylinder
-    outer = m3d.Manifold.cylinder(length, outer_radius, outer_radius, resolution)
+    outer = adaptive_cylinder(length, outer_radius, outer_radius, resolution)
     # Create inner cylinder to subtract
-    inner = m3d.Manifold.cylinder(length, inner_radius, inner_radius, resolution)
+    inner = adaptive_cylinder(length, inner_radius, inner_radius, resolution)
 
     # Create shell by subtraction
     shell = outer - inner
@@ -590,7 +591,7 @@ def _create_fascicle_boundary(
             y = mid_radius * np.cos(angle)
             z = mid_radius * np.sin(angle)
 
-            pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 2))
+            pore = adaptive_sphere(pore_radius, max(4, resolution // 2))
             pore = pore.translate([x, y, z])
             pores.append(pore)
 
@@ -774,7 +775,7 @@ def _make_segment(p1: np.ndarray, p2: np.ndarray, radius: float, resolution: int
         return None
 
     # Create cylinder along Z axis
-    segment = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    segment = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -869,7 +870,7 @@ def _create_vascular_channels(
 
             if pattern == 'longitudinal':
                 # Straight channel along length
-                channel = m3d.Manifold.cylinder(length, channel_radius, channel_radius, resolution)
+                channel = adaptive_cylinder(length, channel_radius, channel_radius, resolution)
                 channel = channel.rotate([0, 90, 0])
                 channel = channel.translate([0, y_pos, z_pos])
             elif pattern == 'spiral':
@@ -884,7 +885,7 @@ def _create_vascular_channels(
                 )
             else:
                 # Default to longitudinal
-                channel = m3d.Manifold.cylinder(length, channel_radius, channel_radius, resolution)
+                channel = adaptive_cylinder(length, channel_radius, channel_radius, resolution)
                 channel = channel.rotate([0, 90, 0])
                 channel = channel.translate([0, y_pos, z_pos])
 
@@ -1029,8 +1030,8 @@ def _create_tissue_layers(
         avg_outer_r = (outer_ry + outer_rz) / 2
         avg_inner_r = (inner_ry + inner_rz) / 2
 
-        outer = m3d.Manifold.cylinder(length, avg_outer_r, avg_outer_r, resolution)
-        inner = m3d.Manifold.cylinder(length, avg_inner_r, avg_inner_r, resolution)
+        outer = adaptive_cylinder(length, avg_outer_r, avg_outer_r, resolution)
+        inner = adaptive_cylinder(length, avg_inner_r, avg_inner_r, resolution)
 
         epitenon = outer - inner
 
@@ -1056,7 +1057,7 @@ def _create_tissue_layers(
                 y = mid_radius * np.cos(angle)
                 z = mid_radius * np.sin(angle)
 
-                pore = m3d.Manifold.sphere(pore_radius, max(4, resolution // 2))
+                pore = adaptive_sphere(pore_radius, max(4, resolution // 2))
                 pore = pore.translate([x, y, z])
                 pores.append(pore)
 
@@ -1081,8 +1082,8 @@ def _create_tissue_layers(
         avg_outer_r = (outer_ry + outer_rz) / 2
         avg_inner_r = (inner_ry + inner_rz) / 2
 
-        outer = m3d.Manifold.cylinder(length, avg_outer_r, avg_outer_r, resolution)
-        inner = m3d.Manifold.cylinder(length, avg_inner_r, avg_inner_r, resolution)
+        outer = adaptive_cylinder(length, avg_outer_r, avg_outer_r, resolution)
+        inner = adaptive_cylinder(length, avg_inner_r, avg_inner_r, resolution)
 
         paratenon = outer - inner
         paratenon = paratenon.rotate([0, 90, 0])
@@ -1126,7 +1127,7 @@ def _create_pores(
         z = rng.uniform(-thickness/2 + pore_radius, thickness/2 - pore_radius)
 
         # Create pore (sphere)
-        pore = m3d.Manifold.sphere(pore_radius, resolution)
+        pore = adaptive_sphere(pore_radius, resolution)
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -1190,7 +1191,7 @@ def _apply_surface_texture(
                 jitter_y = rng.uniform(-spacing * 0.3, spacing * 0.3)
                 jitter_z = rng.uniform(-spacing * 0.3, spacing * 0.3)
 
-                bump = m3d.Manifold.sphere(feature_radius, max(4, resolution // 4))
+                bump = adaptive_sphere(feature_radius, max(4, resolution // 4))
                 bump = bump.translate([x + jitter_x, y + jitter_y, z + jitter_z])
                 bumps.append(bump)
                 feature_count += 1
@@ -1387,7 +1388,7 @@ def make_segment(p1: np.ndarray, p2: np.ndarray, radius: float, resolution: int)
         return m3d.Manifold()
 
     # Create cylinder along Z axis
-    segment = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    segment = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from ..core import batch_union
 from ..helpers.mesh_utils import subtract_all
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -151,7 +152,7 @@ def _create_rod_strut(p1: np.ndarray, p2: np.ndarray, radius: float,
         radius = radius * radius_variation
 
     # Create cylinder along Z axis
-    strut = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    strut = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -242,7 +243,7 @@ def _create_resorption_pit(center: np.ndarray, normal: np.ndarray,
     """
     radius = diameter / 2
     # Create sphere (we'll subtract to create the pit)
-    pit = m3d.Manifold.sphere(radius, resolution)
+    pit = adaptive_sphere(radius, resolution)
 
     # Position the sphere so its center creates appropriate depth
     # Normal should point outward from surface
@@ -20,6 +20,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -119,7 +120,7 @@ def make_hexagonal_prism(
     # For a hexagon inscribed in a circle of radius R:
     # side_length = R
     radius = side_length
-    hexagon = m3d.Manifold.cylinder(height, radius, radius, 6)
+    hexagon = adaptive_cylinder(height, radius, radius, 6)
 
     return hexagon.translate([center_x, center_y, height / 2])
 
@@ -189,7 +190,7 @@ def make_vascular_channel(
         Manifold representing the channel
     """
     channel_radius = channel_diameter / 2
-    channel = m3d.Manifold.cylinder(
+    channel = adaptive_cylinder(
         height * 1.1,
         channel_radius,
         channel_radius,
@@ -454,7 +455,7 @@ def create_vascular_hierarchy(
 
         # Main vessel along septum (vertical channel)
         mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-        main_vessel = m3d.Manifold.cylinder(
+        main_vessel = adaptive_cylinder(
             height_mm * 1.1,
             vessel_r,
             vessel_r,
@@ -532,7 +533,7 @@ def make_branching_vessel(
         return None
 
     # Create cylinder along z-axis
-    cyl = m3d.Manifold.cylinder(length, radius, radius, max(4, resolution))
+    cyl = adaptive_cylinder(length, radius, radius, max(4, resolution))
 
     # Calculate rotation angles
     h = np.sqrt(dx*dx + dy*dy)
@@ -593,7 +594,7 @@ def create_svf_channels(
 
             # Add junction sphere at midpoint
             mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-            junction = m3d.Manifold.sphere(channel_r_mm * 1.2, max(4, resolution // 2))
+            junction = adaptive_sphere(channel_r_mm * 1.2, max(4, resolution // 2))
             junction = junction.translate([mx, my, z])
             channels.append(junction)
 
@@ -717,8 +718,8 @@ def create_basement_membrane(
         # Create spherical shell at center of scaffold height
         z_center = height_mm / 2
 
-        outer = m3d.Manifold.sphere(outer_r, resolution)
-        inner = m3d.Manifold.sphere(inner_r, resolution)
+        outer = adaptive_sphere(outer_r, resolution)
+        inner = adaptive_sphere(inner_r, resolution)
         shell = outer - inner
 
         shell = shell.translate([cx, cy, z_center])
@@ -781,7 +782,7 @@ def apply_surface_texture(
         for i in range(n_bumps):
             z = (i + 0.5) * height_mm / n_bumps
 
-            bump = m3d.Manifold.sphere(bump_size, max(4, resolution // 2))
+            bump = adaptive_sphere(bump_size, max(4, resolution // 2))
             # Move bump slightly outside surface
             bump = bump.translate([sx + nx * bump_height, sy + ny * bump_height, z])
             bumps.append(bump)
@@ -876,7 +877,7 @@ def create_additional_pores(
         y = r * np.sin(theta)
         z = rng.uniform(pore_r_mm, height_mm - pore_r_mm)
 
-        pore = m3d.Manifold.sphere(pore_r_mm, max(4, resolution // 2))
+        pore = adaptive_sphere(pore_r_mm, max(4, resolution // 2))
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -914,7 +915,7 @@ def generate_adipose_tissue(params: AdiposeTissueParams) -> tuple[m3d.Manifold,
 
     # Create outer cylinder
     outer_radius = params.diameter_mm / 2
-    outer_cylinder = m3d.Manifold.cylinder(
+    outer_cylinder = adaptive_cylinder(
         params.height_mm,
         outer_radius,
         outer_radius,
@@ -17,6 +17,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -232,17 +233,17 @@ def make_aspherical_shell(
 
     # Use manifold cylinder + sphere approach for more robust geometry
     # Create outer sphere for outer surface
-    outer_sphere = m3d.Manifold.sphere(outer_radius, resolution)
+    outer_sphere = adaptive_sphere(outer_radius, resolution)
     outer_sphere = outer_sphere.translate([0, 0, -outer_radius + max_sag_outer])
 
     # Create inner sphere
-    inner_sphere = m3d.Manifold.sphere(inner_radius, resolution)
+    inner_sphere = adaptive_sphere(inner_radius, resolution)
     inner_height = conic_sag(radius - thickness, inner_radius, asphericity_q)
     inner_sphere = inner_sphere.translate([0, 0, -inner_radius + inner_height])
 
     # Clipping cylinder
     cap_height = max_sag_outer * 1.5
-    clip_cylinder = m3d.Manifold.cylinder(
+    clip_cylinder = adaptive_cylinder(
         cap_height,
         radius,
         radius,
@@ -253,7 +254,7 @@ def make_aspherical_shell(
     # Clip to cap shapes (intersection)
     outer_cap = m3d.Manifold.batch_boolean([outer_sphere, clip_cylinder], m3d.OpType.Intersect)
 
-    inner_clip = m3d.Manifold.cylinder(
+    inner_clip = adaptive_cylinder(
         cap_height,
         radius - thickness,
         radius - thickness,
@@ -313,19 +314,19 @@ def make_layer_shell(
     max_sag_inner = conic_sag(r_inner, R_inner, asphericity_q)
 
     # Create spheres offset appropriately
-    outer_sphere = m3d.Manifold.sphere(R_outer, resolution)
+    outer_sphere = adaptive_sphere(R_outer, resolution)
     outer_sphere = outer_sphere.translate([0, 0, -R_outer + max_sag_outer])
 
-    inner_sphere = m3d.Manifold.sphere(R_inner, resolution)
+    inner_sphere = adaptive_sphere(R_inner, resolution)
     inner_sphere = inner_sphere.translate([0, 0, -R_inner + max_sag_inner])
 
     # Clip cylinders
     cap_height = max(max_sag_outer, max_sag_inner) * 2 + 1
 
-    outer_clip = m3d.Manifold.cylinder(cap_height, r_outer, r_outer, resolution)
+    outer_clip = adaptive_cylinder(cap_height, r_outer, r_outer, resolution)
     outer_clip = outer_clip.translate([0, 0, -0.1])
 
-    inner_clip = m3d.Manifold.cylinder(cap_height, r_inner, r_inner, resolution)
+    inner_clip = adaptive_cylinder(cap_height, r_inner, r_inner, resolution)
     inner_clip = inner_clip.translate([0, 0, -0.1])
 
     outer_cap = m3d.Manifold.batch_boolean([outer_sphere, outer_clip], m3d.OpType.Intersect)
@@ -474,7 +475,7 @@ def make_limbal_zone(
     limbal_epi_thickness = epithelium_thickness * limbal_epithelium_factor
 
     # Outer cylinder for limbal ring
-    outer_ring = m3d.Manifold.cylinder(
+    outer_ring = adaptive_cylinder(
         limbal_epi_thickness,
         radius,
         radius,
@@ -482,7 +483,7 @@ def make_limbal_zone(
     )
 
     # Inner cylinder to hollow out
-    inner_ring = m3d.Manifold.cylinder(
+    inner_ring = adaptive_cylinder(
         limbal_epi_thickness * 1.1,
         inner_radius,
         inner_radius,
@@ -509,7 +510,7 @@ def make_limbal_zone(
         angle = 2 * np.pi * i / n_palisades
 
         # Create radial ridge
-        ridge = m3d.Manifold.cylinder(
+        ridge = adaptive_cylinder(
             palisade_length,
             palisade_width / 2,
             palisade_width / 2,
@@ -606,7 +607,7 @@ def make_nerve_plexus(
         length = np.sqrt(dx**2 + dy**2 + dz**2)
 
         if length > 0.1:  # Only create if significant length
-            channel = m3d.Manifold.cylinder(
+            channel = adaptive_cylinder(
                 length,
                 channel_diameter_mm / 2,
                 channel_diameter_mm / 2,
@@ -657,7 +658,7 @@ def make_nerve_plexus(
                 if seg_length > 0.01:
                     sag = conic_sag(np.sqrt(x**2 + y**2), radius_of_curvature, asphericity_q)
 
-                    segment = m3d.Manifold.cylinder(
+                    segment = adaptive_cylinder(
                         seg_length,
                         channel_diameter_mm / 3,  # Thinner subbasal nerves
                         channel_diameter_mm / 3,
@@ -750,7 +751,7 @@ def make_keratocyte_markers(
         sag = conic_sag(r, radius_of_curvature, asphericity_q)
         z = sag - z_in_stroma
 
-        marker = m3d.Manifold.sphere(marker_radius, max(resolution // 4, 6))
+        marker = adaptive_sphere(marker_radius, max(resolution // 4, 6))
         marker = marker.translate([x, y, z])
         markers.append(marker)
 
@@ -823,21 +824,21 @@ def make_stromal_lamellae(
         sag = conic_sag(r_at_depth, R_at_depth, asphericity_q)
 
         # Create sphere and clip
-        sphere = m3d.Manifold.sphere(R_at_depth, resolution)
+        sphere = adaptive_sphere(R_at_depth, resolution)
         sphere = sphere.translate([0, 0, -R_at_depth + sag])
 
         # Clip cylinder
-        clip = m3d.Manifold.cylinder(sag * 2 + 0.1, r_at_depth, r_at_depth, resolution)
+        clip = adaptive_cylinder(sag * 2 + 0.1, r_at_depth, r_at_depth, resolution)
         clip = clip.translate([0, 0, -0.05])
 
         lamella_surface = m3d.Manifold.batch_boolean([sphere, clip], m3d.OpType.Intersect)
 
         # Make it a thin shell
-        inner_sphere = m3d.Manifold.sphere(R_at_depth - lamella_thickness, resolution)
+        inner_sphere = adaptive_sphere(R_at_depth - lamella_thickness, resolution)
         inner_sag = conic_sag(r_at_depth - lamella_thickness, R_at_depth - lamella_thickness, asphericity_q)
         inner_sphere = inner_sphere.translate([0, 0, -(R_at_depth - lamella_thickness) + inner_sag])
 
-        inner_clip = m3d.Manifold.cylinder(sag * 2 + 0.1, r_at_depth - lamella_thickness, r_at_depth - lamella_thickness, resolution)
+        inner_clip = adaptive_cylinder(sag * 2 + 0.1, r_at_depth - lamella_thickness, r_at_depth - lamella_thickness, resolution)
         inner_clip = inner_clip.translate([0, 0, -0.05])
 
         inner_surface = m3d.Manifold.batch_boolean([inner_sphere, inner_clip], m3d.OpType.Intersect)
@@ -14,6 +14,8 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from ..core import batch_union
+from ..stage_cache import StagedBuild
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 def apply_position_noise(
@@ -177,7 +179,7 @@ def make_rete_ridge_layer(
     # Adjust thickness slightly to account for ridge effect
     effective_thickness = base_thickness + ridge_height * 0.5
 
-    result = m3d.Manifold.cylinder(effective_thickness, radius, radius, resolution)
+    result = adaptive_cylinder(effective_thickness, radius, radius, resolution)
     result = result.translate([0, 0, z_offset])
 
     # Add porosity if needed
@@ -199,7 +201,7 @@ def make_rete_ridge_layer(
 
                 if np.sqrt(x * x + y * y) < radius - pore_radius:
                     pore_height = base_thickness + ridge_height * 2
-                    pore = m3d.Manifold.cylinder(
+                    pore = adaptive_cylinder(
                         pore_height * 1.2,
                         pore_radius,
                         pore_radius,
@@ -229,7 +231,7 @@ def make_rete_ridge_layer(
 
                             if length > 0.001:
                                 # Create horizontal channel
-                                channel = m3d.Manifold.cylinder(
+                                channel = adaptive_cylinder(
                                     length,
                                     channel_radius,
                                     channel_radius,
@@ -284,7 +286,7 @@ def make_porous_layer(
     """
     # Create base disc
     radius = diameter / 2
-    base = m3d.Manifold.cylinder(thickness, radius, radius, resolution)
+    base = adaptive_cylinder(thickness, radius, radius, resolution)
     base = base.translate([0, 0, z_offset])
 
     if porosity <= 0.01:
@@ -311,7 +313,7 @@ def make_porous_layer(
 
             # Check if pore is within circular boundary
             if np.sqrt(x*x + y*y) < radius - pore_radius:
-                pore = m3d.Manifold.cylinder(
+                pore = adaptive_cylinder(
                     thickness * 1.1,  # Slightly taller to ensure clean subtraction
                     pore_radius,
                     pore_radius,
@@ -340,7 +342,7 @@ def make_porous_layer(
 
                         if length > 0.001:
                             # Create horizontal channel
-                            channel = m3d.Manifold.cylinder(
+                            channel = adaptive_cylinder(
                                 length,
                                 channel_radius,
                                 channel_radius,
@@ -395,7 +397,7 @@ def make_vascular_channel(
     if np.sqrt(x_pos*x_pos + y_pos*y_pos) > radius - channel_radius:
         return m3d.Manifold()
 
-    channel = m3d.Manifold.cylinder(
+    channel = adaptive_cylinder(
         total_thickness * 1.1,
         channel_radius,
         channel_radius,
@@ -459,7 +461,7 @@ def make_hair_follicles(
         # Use slightly longer cylinder to ensure clean subtraction
         follicle_length = follicle_depth / np.cos(tilt_angle) * 1.1
 
-        follicle = m3d.Manifold.cylinder(
+        follicle = adaptive_cylinder(
             follicle_length,
             follicle_radius,
             follicle_radius,
@@ -480,7 +482,7 @@ def make_hair_follicles(
         follicle = follicle.translate([0, 0, top_z + 0.05])
 
         # Simpler approach: create cylinder pointing down
-        follicle = m3d.Manifold.cylinder(
+        follicle = adaptive_cylinder(
             follicle_length,
             follicle_radius,
             follicle_radius,
@@ -497,7 +499,7 @@ def make_hair_follicles(
         follicle = follicle.translate([x, y, top_z - follicle_depth])
 
         # For proper tilted cylinder, we need to rotate appropriately
-        follicle = m3d.Manifold.cylinder(
+        follicle = adaptive_cylinder(
             follicle_length,
             follicle_radius,
             follicle_radius * 0.9,  # Slight taper
@@ -596,7 +598,7 @@ def make_sebaceous_glands(
                 offset_x = lobule_radius * 0.4 * np.cos(angle)
                 offset_y = lobule_radius * 0.4 * np.sin(angle)
 
-            lobule = m3d.Manifold.sphere(
+            lobule = adaptive_sphere(
                 lobule_radius,
                 max(6, resolution // 2)
             )
@@ -607,7 +609,7 @@ def make_sebaceous_glands(
         duct_length = dermis_thickness * 0.2  # Duct extends 20% toward surface
         duct_radius = lobule_radius * 0.3  # Narrow duct
 
-        duct = m3d.Manifold.cylinder(
+        duct = adaptive_cylinder(
             duct_length,
             duct_radius,
             duct_radius,
@@ -682,7 +684,7 @@ def make_dermal_papillae(
         cylinder_height = height * 0.7  # 70% cylinder
         dome_height = height * 0.3      # 30% dome
 
-        cylinder = m3d.Manifold.cylinder(
+        cylinder = adaptive_cylinder(
             cylinder_height,
             papillae_radius,
             papillae_radius * 0.6,  # Taper to 60% at top
@@ -766,7 +768,7 @@ def make_sweat_glands(
         # Create straight duct from surface to coil
         duct_length = gland_depth - coil_height
         if duct_length > 0:
-            duct = m3d.Manifold.cylinder(
+            duct = adaptive_cylinder(
                 duct_length,
                 tube_radius,
                 tube_radius,
@@ -789,7 +791,7 @@ def make_sweat_glands(
             cy = y + coil_radius * np.sin(angle)
 
             # Create small sphere at each point
-            sphere = m3d.Manifold.sphere(tube_radius * 1.2, max(6, resolution // 2))
+            sphere = adaptive_sphere(tube_radius * 1.2, max(6, resolution // 2))
             sphere = sphere.translate([cx, cy, z])
             gland_parts.append(sphere)
 
@@ -809,7 +811,7 @@ def make_sweat_glands(
                 seg_length = np.sqrt(dx * dx + dy * dy + dz * dz)
 
                 if seg_length > 0.001:
-                    seg = m3d.Manifold.cylinder(
+                    seg = adaptive_cylinder(
                         seg_length,
                         tube_radius,
                         tube_radius,
@@ -905,7 +907,7 @@ def make_collagen_fibers(
             elevation = rng.uniform(-10, 10) * np.pi / 180
 
         # Create fiber as cylinder
-        fiber = m3d.Manifold.cylinder(
+        fiber = adaptive_cylinder(
             fiber_length,
             fiber_radius,
             fiber_radius,
@@ -984,7 +986,7 @@ def apply_surface_texture(
             bump_height = furrow_depth * rng.uniform(0.5, 1.0)
             bump_radius = furrow_spacing * 0.3
 
-            bump = m3d.Manifold.cylinder(
+            bump = adaptive_cylinder(
                 bump_height,
                 bump_radius,
                 bump_radius * 0.5,  # Tapered top
@@ -1004,6 +1006,10 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
     """
     Generate a multilayer skin scaffold with biologically realistic parameters.
 
+    Layers and appendages are built as memoized stages (see stage_cache), so
+    regenerating after a parameter edit only rebuilds the stages that read
+    the edited parameter before the final combine.
+
     Args:
         params: MultilayerSkinParams specifying geometry and structure
 
@@ -1011,14 +1017,14 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
         Tuple of (manifold, stats_dict)
         - manifold: The 3D geometry
         - stats_dict: Dictionary with triangle_count, volume_mm3, layer_thicknesses,
-                     porosity_gradient, scaffold_type
+                     porosity_gradient, stages (rebuilt/reused), scaffold_type
 
     Raises:
         ValueError: If parameters are invalid
     """
     # Set random seed for reproducibility
     np.random.seed(params.seed)
-    rng = np.random.default_rng(params.seed)
+    build = StagedBuild("multilayer_skin", params.seed)
 
     # Convert epidermis thickness from um to mm
     epidermis_thickness_mm = params.epidermis_thickness_um / 1000.0
@@ -1045,45 +1051,69 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
     dermis_pore_size = pore_size_mm           # Standard pores for dermis
     hypodermis_pore_size = pore_size_mm * 1.5 # Larger pores for hypodermis
 
-    # Create layers from bottom to top
+    # Parameters read by every porous layer
+    layer_inputs = {
+        'diameter_mm': params.diameter_mm,
+        'resolution': params.resolution,
+        'position_noise': params.position_noise,
+        'pore_interconnectivity': params.pore_interconnectivity,
+    }
+    ridge_inputs = {
+        'enable_rete_ridges': params.enable_rete_ridges,
+        'rete_ridge_height_mm': rete_ridge_height_mm,
+        'rete_ridge_spacing_mm': rete_ridge_spacing_mm,
+        'rete_ridge_width_mm': rete_ridge_width_mm,
+        'rete_ridge_depth_variance': params.rete_ridge_depth_variance,
+    } if params.enable_rete_ridges else {'enable_rete_ridges': False}
+
+    # Create layers from bottom to top. Each layer is a memoized stage keyed
+    # by the parameters it reads, so edits elsewhere reuse it.
     layers = []
 
     # Hypodermis (bottom layer) - always flat, no rete ridges
     z_hypo = 0
-    hypo = make_porous_layer(
-        params.diameter_mm,
-        params.hypodermis_thickness_mm,
-        z_hypo,
-        params.pore_gradient[2],
-        hypodermis_pore_size,
-        params.resolution,
-        params.position_noise,
-        rng,
-        params.pore_interconnectivity
+    hypo = build.run(
+        'hypodermis',
+        {**layer_inputs,
+         'thickness_mm': params.hypodermis_thickness_mm,
+         'porosity': params.pore_gradient[2],
+         'pore_size_mm': hypodermis_pore_size},
+        lambda rng: make_porous_layer(
+            params.diameter_mm,
+            params.hypodermis_thickness_mm,
+            z_hypo,
+            params.pore_gradient[2],
+            hypodermis_pore_size,
+            params.resolution,
+            params.position_noise,
+            rng,
+            params.pore_interconnectivity
+        )
     )
     layers.append(hypo)
 
     # Dermis (middle layer) - ridged top if rete ridges enabled
     z_dermis = z_hypo + params.hypodermis_thickness_mm
-    if params.enable_rete_ridges:
-        dermis = make_rete_ridge_layer(
-            params.diameter_mm,
-            params.dermis_thickness_mm,
-            z_dermis,
-            rete_ridge_height_mm,
-            rete_ridge_spacing_mm,
-            rete_ridge_width_mm,
-            params.rete_ridge_depth_variance,
-            params.pore_gradient[1],
-            dermis_pore_size,
-            params.resolution,
-            rng,
-            is_dermis=True,
-            position_noise=params.position_noise,
-            pore_interconnectivity=params.pore_interconnectivity
-        )
-    else:
-        dermis = make_porous_layer(
+
+    def build_dermis(rng):
+        if params.enable_rete_ridges:
+            return make_rete_ridge_layer(
+                params.diameter_mm,
+                params.dermis_thickness_mm,
+                z_dermis,
+                rete_ridge_height_mm,
+                rete_ridge_spacing_mm,
+                rete_ridge_width_mm,
+                params.rete_ridge_depth_variance,
+                params.pore_gradient[1],
+                dermis_pore_size,
+                params.resolution,
+                rng,
+                is_dermis=True,
+                position_noise=params.position_noise,
+                pore_interconnectivity=params.pore_interconnectivity
+            )
+        return make_porous_layer(
             params.diameter_mm,
             params.dermis_thickness_mm,
             z_dermis,
@@ -1094,29 +1124,40 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
             rng,
             params.pore_interconnectivity
         )
+
+    dermis = build.run(
+        'dermis',
+        {**layer_inputs, **ridge_inputs,
+         'z_mm': z_dermis,
+         'thickness_mm': params.dermis_thickness_mm,
+         'porosity': params.pore_gradient[1],
+         'pore_size_mm': dermis_pore_size},
+        build_dermis
+    )
     layers.append(dermis)
 
     # Epidermis (top layer) - ridged bottom if rete ridges enabled
     z_epi = z_dermis + params.dermis_thickness_mm
-    if params.enable_rete_ridges:
-        epi = make_rete_ridge_layer(
-            params.diameter_mm,
-            epidermis_thickness_mm,
-            z_epi,
-            rete_ridge_height_mm,
-            rete_ridge_spacing_mm,
-            rete_ridge_width_mm,
-            params.rete_ridge_depth_variance,
-            params.pore_gradient[0],
-            epidermis_pore_size,
-            params.resolution,
-            rng,
-            is_dermis=False,
-            position_noise=params.position_noise,
-            pore_interconnectivity=params.pore_interconnectivity
-        )
-    else:
-        epi = make_porous_layer(
+
+    def build_epidermis(rng):
+        if params.enable_rete_ridges:
+            return make_rete_ridge_layer(
+                params.diameter_mm,
+                epidermis_thickness_mm,
+                z_epi,
+                rete_ridge_height_mm,
+                rete_ridge_spacing_mm,
+                rete_ridge_width_mm,
+                params.rete_ridge_depth_variance,
+                params.pore_gradient[0],
+                epidermis_pore_size,
+                params.resolution,
+                rng,
+                is_dermis=False,
+                position_noise=params.position_noise,
+                pore_interconnectivity=params.pore_interconnectivity
+            )
+        return make_porous_layer(
             params.diameter_mm,
             epidermis_thickness_mm,
             z_epi,
@@ -1127,102 +1168,157 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
             rng,
             params.pore_interconnectivity
         )
+
+    epi = build.run(
+        'epidermis',
+        {**layer_inputs, **ridge_inputs,
+         'z_mm': z_epi,
+         'thickness_mm': epidermis_thickness_mm,
+         'porosity': params.pore_gradient[0],
+         'pore_size_mm': epidermis_pore_size},
+        build_epidermis
+    )
     layers.append(epi)
 
     # Union all layers
     result = batch_union(layers)
 
-    # Track elements for Boolean subtraction
+    # Track elements for Boolean subtraction (one union per stage)
     elements_to_subtract = []
 
     # Create vascular channels if enabled
     if params.enable_vascular_channels and params.vascular_channel_count > 0 and params.vascular_channel_diameter_mm > 0:
-        # Grid-based layout using vascular_channel_spacing_mm
-        spacing = params.vascular_channel_spacing_mm
-        radius = params.diameter_mm / 2
-
-        # Calculate grid bounds
-        grid_min = -radius
-        grid_max = radius
-
-        # Generate grid positions
-        channel_count = 0
-        i = 0
-        while grid_min + i * spacing <= grid_max:
-            j = 0
-            while grid_min + j * spacing <= grid_max:
-                x = grid_min + i * spacing
-                y = grid_min + j * spacing
-
-                # Add randomness if enabled
-                if params.randomness > 0:
-                    x += rng.uniform(-spacing * 0.2, spacing * 0.2) * params.randomness
-                    y += rng.uniform(-spacing * 0.2, spacing * 0.2) * params.randomness
-
-                # Only include channels within scaffold radius
-                if np.sqrt(x**2 + y**2) <= radius * 0.9:  # 90% of radius for safety margin
-                    channel = make_vascular_channel(
-                        params.diameter_mm,
-                        total_thickness,
-                        params.vascular_channel_diameter_mm,
-                        x, y,
-                        params.resolution
-                    )
-                    if channel.num_vert() > 0:
-                        elements_to_subtract.append(channel)
-                        channel_count += 1
-
-                        # Stop if we've reached the max count
-                        if channel_count >= params.vascular_channel_count:
-                            break
-
-                j += 1
-
-            if channel_count >= params.vascular_channel_count:
-                break
-            i += 1
+        def build_vascular_channels(rng):
+            # Grid-based layout using vascular_channel_spacing_mm
+            spacing = params.vascular_channel_spacing_mm
+            radius = params.diameter_mm / 2
+
+            # Calculate grid bounds
+            grid_min = -radius
+            grid_max = radius
+
+            # Generate grid positions
+            channels = []
+            i = 0
+            while grid_min + i * spacing <= grid_max:
+                j = 0
+                while grid_min + j * spacing <= grid_max:
+                    x = grid_min + i * spacing
+                    y = grid_min + j * spacing
+
+                    # Add randomness if enabled
+                    if params.randomness > 0:
+                        x += rng.uniform(-spacing * 0.2, spacing * 0.2) * params.randomness
+                        y += rng.uniform(-spacing * 0.2, spacing * 0.2) * params.randomness
+
+                    # Only include channels within scaffold radius
+                    if np.sqrt(x**2 + y**2) <= radius * 0.9:  # 90% of radius for safety margin
+                        channel = make_vascular_channel(
+                            params.diameter_mm,
+                            total_thickness,
+                            params.vascular_channel_diameter_mm,
+                            x, y,
+                            params.resolution
+                        )
+                        if channel.num_vert() > 0:
+                            channels.append(channel)
+
+                            # Stop if we've reached the max count
+                            if len(channels) >= params.vascular_channel_count:
+                                break
+
+                    j += 1
+
+                if len(channels) >= params.vascular_channel_count:
+                    break
+                i += 1
+            return batch_union(channels)
+
+        channels = build.run(
+            'vascular_channels',
+            {'diameter_mm': params.diameter_mm,
+             'total_thickness_mm': total_thickness,
+             'count': params.vascular_channel_count,
+             'channel_diameter_mm': params.vascular_channel_diameter_mm,
+             'spacing_mm': params.vascular_channel_spacing_mm,
+             'randomness': params.randomness,
+             'resolution': params.resolution},
+            build_vascular_channels
+        )
+        if channels is not None:
+            elements_to_subtract.append(channels)
 
     # Create hair follicles if enabled
     top_z = z_epi + epidermis_thickness_mm
     if params.enable_hair_follicles and params.hair_follicle_density_per_cm2 > 0:
         follicle_diameter_mm = params.hair_follicle_diameter_um / 1000.0
-        follicles = make_hair_follicles(
-            params.diameter_mm,
-            follicle_diameter_mm,
-            params.hair_follicle_depth_mm,
-            params.hair_follicle_density_per_cm2,
-            top_z,
-            params.resolution,
-            rng
+        follicles = build.run(
+            'hair_follicles',
+            {'diameter_mm': params.diameter_mm,
+             'follicle_diameter_mm': follicle_diameter_mm,
+             'depth_mm': params.hair_follicle_depth_mm,
+             'density_per_cm2': params.hair_follicle_density_per_cm2,
+             'top_z_mm': top_z,
+             'resolution': params.resolution},
+            lambda rng: batch_union(make_hair_follicles(
+                params.diameter_mm,
+                follicle_diameter_mm,
+                params.hair_follicle_depth_mm,
+                params.hair_follicle_density_per_cm2,
+                top_z,
+                params.resolution,
+                rng
+            ))
         )
-        elements_to_subtract.extend(follicles)
+        if follicles is not None:
+            elements_to_subtract.append(follicles)
 
     # Create sweat glands if enabled
     if params.enable_sweat_glands and params.sweat_gland_density_per_cm2 > 0:
         gland_diameter_mm = params.sweat_gland_diameter_um / 1000.0
-        sweat_glands = make_sweat_glands(
-            params.diameter_mm,
-            gland_diameter_mm,
-            params.sweat_gland_depth_mm,
-            params.sweat_gland_density_per_cm2,
-            top_z,
-            params.resolution,
-            rng
+        sweat_glands = build.run(
+            'sweat_glands',
+            {'diameter_mm': params.diameter_mm,
+             'gland_diameter_mm': gland_diameter_mm,
+             'depth_mm': params.sweat_gland_depth_mm,
+             'density_per_cm2': params.sweat_gland_density_per_cm2,
+             'top_z_mm': top_z,
+             'resolution': params.resolution},
+            lambda rng: batch_union(make_sweat_glands(
+                params.diameter_mm,
+                gland_diameter_mm,
+                params.sweat_gland_depth_mm,
+                params.sweat_gland_density_per_cm2,
+                top_z,
+                params.resolution,
+                rng
+            ))
         )
-        elements_to_subtract.extend(sweat_glands)
+        if sweat_glands is not None:
+            elements_to_subtract.append(sweat_glands)
 
     # Create sebaceous glands if enabled
     if params.enable_sebaceous_glands and params.sebaceous_gland_density_per_cm2 > 0:
-        sebaceous_glands = make_sebaceous_glands(
-            params.diameter_mm,
-            params.sebaceous_gland_density_per_cm2,
-            z_dermis,
-            params.dermis_thickness_mm,
-            params.sebaceous_gland_diameter_um,
-            params.resolution,
-            rng
+        sebaceous_glands = build.run(
+            'sebaceous_glands',
+            {'diameter_mm': params.diameter_mm,
+             'density_per_cm2': params.sebaceous_gland_density_per_cm2,
+             'z_dermis_mm': z_dermis,
+             'dermis_thickness_mm': params.dermis_thickness_mm,
+             'gland_diameter_um': params.sebaceous_gland_diameter_um,
+             'resolution': params.resolution},
+            lambda rng: batch_union(make_sebaceous_glands(
+                params.diameter_mm,
+                params.sebaceous_gland_density_per_cm2,
+                z_dermis,
+                params.dermis_thickness_mm,
+                params.sebaceous_gland_diameter_um,
+                params.resolution,
+                rng
+            ))
         )
-        elements_to_subtract.extend(sebaceous_glands)
+        if sebaceous_glands is not None:
+            elements_to_subtract.append(sebaceous_glands)
 
     # Subtract all channels/follicles/glands from result
     if elements_to_subtract:
@@ -1236,16 +1332,26 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
     if params.enable_dermal_papillae and params.papillae_density_per_mm2 > 0:
         # Dermis top is at z_dermis + dermis_thickness_mm
         dermis_top_z = z_dermis + params.dermis_thickness_mm
-        papillae = make_dermal_papillae(
-            params.diameter_mm,
-            params.papillae_density_per_mm2,
-            dermis_top_z,
-            params.papillae_height_um,
-            params.papillae_diameter_um,
-            params.resolution,
-            rng
+        papillae = build.run(
+            'dermal_papillae',
+            {'diameter_mm': params.diameter_mm,
+             'density_per_mm2': params.papillae_density_per_mm2,
+             'dermis_top_z_mm': dermis_top_z,
+             'height_um': params.papillae_height_um,
+             'papillae_diameter_um': params.papillae_diameter_um,
+             'resolution': params.resolution},
+            lambda rng: batch_union(make_dermal_papillae(
+                params.diameter_mm,
+                params.papillae_density_per_mm2,
+                dermis_top_z,
+                params.papillae_height_um,
+                params.papillae_diameter_um,
+                params.resolution,
+                rng
+            ))
         )
-        elements_to_add.extend(papillae)
+        if papillae is not None:
+            elements_to_add.append(papillae)
 
     # Add collagen fibers if enabled
     if params.enable_collagen_orientation:
@@ -1254,41 +1360,60 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
         papillary_z_end = z_dermis + params.dermis_thickness_mm
         papillary_fiber_diameter_mm = params.papillary_collagen_diameter_um / 1000.0
 
-        papillary_fibers = make_collagen_fibers(
-            params.diameter_mm,
-            papillary_z_start,
-            papillary_z_end,
-            papillary_fiber_diameter_mm,
-            0.0,  # Random orientation for papillary
-            is_papillary=True,
-            resolution=params.resolution,
-            rng=rng
+        papillary_fibers = build.run(
+            'papillary_collagen',
+            {'diameter_mm': params.diameter_mm,
+             'z_start_mm': papillary_z_start,
+             'z_end_mm': papillary_z_end,
+             'fiber_diameter_mm': papillary_fiber_diameter_mm,
+             'resolution': params.resolution},
+            lambda rng: batch_union(make_collagen_fibers(
+                params.diameter_mm,
+                papillary_z_start,
+                papillary_z_end,
+                papillary_fiber_diameter_mm,
+                0.0,  # Random orientation for papillary
+                is_papillary=True,
+                resolution=params.resolution,
+                rng=rng
+            ))
         )
-        elements_to_add.extend(papillary_fibers)
+        if papillary_fibers is not None:
+            elements_to_add.append(papillary_fibers)
 
         # Reticular dermis collagen (coarse, aligned)
         reticular_z_start = z_dermis
         reticular_z_end = papillary_z_start
         reticular_fiber_diameter_mm = params.reticular_collagen_diameter_um / 1000.0
 
-        reticular_fibers = make_collagen_fibers(
-            params.diameter_mm,
-            reticular_z_start,
-            reticular_z_end,
-            reticular_fiber_diameter_mm,
-            params.collagen_alignment,
-            is_papillary=False,
-            resolution=params.resolution,
-            rng=rng
+        reticular_fibers = build.run(
+            'reticular_collagen',
+            {'diameter_mm': params.diameter_mm,
+             'z_start_mm': reticular_z_start,
+             'z_end_mm': reticular_z_end,
+             'fiber_diameter_mm': reticular_fiber_diameter_mm,
+             'alignment': params.collagen_alignment,
+             'resolution': params.resolution},
+            lambda rng: batch_union(make_collagen_fibers(
+                params.diameter_mm,
+                reticular_z_start,
+                reticular_z_end,
+                reticular_fiber_diameter_mm,
+                params.collagen_alignment,
+                is_papillary=False,
+                resolution=params.resolution,
+                rng=rng
+            ))
         )
-        elements_to_add.extend(reticular_fibers)
+        if reticular_fibers is not None:
+            elements_to_add.append(reticular_fibers)
 
     # Union all additive elements (papillae, collagen) with result
     if elements_to_add:
         add_union = batch_union(elements_to_add)
         result = result + add_union
 
-    # Apply surface texture if enabled
+    # Apply surface texture if enabled (part of the final combine, never cached)
     if params.enable_surface_texture and params.surface_roughness > 0:
         result = apply_surface_texture(
             result,
@@ -1296,7 +1421,7 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
             top_z,
             params.surface_roughness,
             params.resolution,
-            rng
+            build.rng('surface_texture')
         )
 
     # Calculate statistics
@@ -1354,6 +1479,7 @@ def generate_multilayer_skin(params: MultilayerSkinParams) -> tuple[m3d.Manifold
             'roughness': params.surface_roughness
         },
         'vascular_channels': params.vascular_channel_count if params.enable_vascular_channels else 0,
+        'stages': build.summary(),
         'scaffold_type': 'multilayer_skin'
     }
 
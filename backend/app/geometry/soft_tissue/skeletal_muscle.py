@@ -18,6 +18,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Literal, List, Tuple, Optional
 from ..core import batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -125,7 +126,7 @@ def make_fiber_channel(
         return m3d.Manifold()
 
     # Create cylinder along Z axis
-    fiber = m3d.Manifold.cylinder(length, radius, radius, resolution)
+    fiber = adaptive_cylinder(length, radius, radius, resolution)
 
     # Calculate rotation to align with direction vector
     h = np.sqrt(dx*dx + dy*dy)
@@ -218,7 +219,7 @@ def make_curved_fiber_channel(
             segments.append(seg)
         # Add junction spheres for smooth connections
         if i > 0:
-            sphere = m3d.Manifold.sphere(radius * 0.99, resolution)
+            sphere = adaptive_sphere(radius * 0.99, resolution)
             sphere = sphere.translate([points[i][0], points[i][1], points[i][2]])
             segments.append(sphere)
 
@@ -559,10 +560,10 @@ def create_perimysium_shell(
     inner_radius = fascicle_diameter / 2
 
     # Create outer cylinder
-    outer = m3d.Manifold.cylinder(muscle_length, outer_radius, outer_radius, resolution * 2)
+    outer = adaptive_cylinder(muscle_length, outer_radius, outer_radius, resolution * 2)
 
     # Create inner cylinder (slightly longer for clean subtraction)
-    inner = m3d.Manifold.cylinder(muscle_length + 0.2, inner_radius, inner_radius, resolution * 2)
+    inner = adaptive_cylinder(muscle_length + 0.2, inner_radius, inner_radius, resolution * 2)
     inner = inner.translate([0, 0, -0.1])
 
     # Create shell
@@ -594,7 +595,7 @@ def create_perimysium_shell(
             y_offset = (fascicle_diameter / 2 + thickness_mm / 2) * np.sin(angle)
 
             # Create pore as small cylinder perpendicular to surface (radial direction)
-            pore = m3d.Manifold.cylinder(
+            pore = adaptive_cylinder(
                 thickness_mm * 1.5,  # Slightly longer to ensure clean subtraction
                 pore_radius,
                 pore_radius,
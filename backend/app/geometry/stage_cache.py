@@ -0,0 +1,189 @@
+"""
+Memoized generator stages for incremental regeneration.
+
+Editing one slider (say ``vascular_channel_count`` on a multilayer skin)
+used to rebuild every sub-component of the scaffold: porous layers, rete
+ridges, follicles, glands and fibers. Most of that work is identical to the
+previous request.
+
+Generators can instead be split into named stages. Each stage declares the
+subset of parameters it reads and builds its geometry from those alone;
+the result is memoized under that subset, so a parameter edit only
+rebuilds the stages that actually read it, followed by the final combine.
+
+Every stage draws from its own random stream derived from the seed and the
+stage name. With a single shared generator, changing how many numbers one
+stage consumes would shift every stage after it and defeat the cache.
+
+The active tessellation policy is part of every key, since it changes the
+geometry a stage produces for the same parameters.
+
+Usage:
+    build = StagedBuild("multilayer_skin", seed=params.seed)
+    hypo = build.run(
+        "hypodermis",
+        {"diameter_mm": params.diameter_mm, ...},
+        lambda rng: make_porous_layer(..., rng, ...),
+    )
+    stats["stages"] = build.summary()
+"""
+
+from __future__ import annotations
+
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from .tessellation import get_active_policy
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a parameter value into a hashable cache-key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class StageCache:
+    """
+    Bounded LRU store of stage outputs shared across requests.
+
+    Stage outputs are manifold3d objects, which are immutable, so a cached
+    value can safely be handed to several requests at once.
+
+    Attributes:
+        max_entries: Maximum number of stage outputs kept
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that required a rebuild
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if absent."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached stage outputs and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache = StageCache()
+
+
+def get_stage_cache() -> StageCache:
+    """Return the process-wide stage cache."""
+    return _default_cache
+
+
+def stage_rng(seed: int, stage: str) -> np.random.Generator:
+    """
+    Independent random stream for one stage of a seeded generator.
+
+    Args:
+        seed: Generator seed
+        stage: Stage name
+
+    Returns:
+        Generator seeded from (seed, crc32(stage))
+    """
+    return np.random.default_rng([int(seed), zlib.crc32(stage.encode("utf-8"))])
+
+
+class StagedBuild:
+    """
+    One generator invocation split into memoized stages.
+
+    Args:
+        generator: Generator name, namespacing the cache keys
+        seed: Random seed of the invocation
+        cache: Stage cache to use (defaults to the process-wide cache)
+    """
+
+    def __init__(self, generator: str, seed: int, cache: Optional[StageCache] = None):
+        self.generator = generator
+        self.seed = int(seed)
+        self.cache = cache if cache is not None else _default_cache
+        self.rebuilt: List[str] = []
+        self.reused: List[str] = []
+        self._policy = get_active_policy()
+
+    def rng(self, stage: str) -> np.random.Generator:
+        """Random stream for ``stage``, for work that is not memoized."""
+        return stage_rng(self.seed, stage)
+
+    def key(self, stage: str, inputs: Dict[str, Any]) -> Tuple:
+        """Cache key of ``stage`` for the given parameter subset."""
+        return (self.generator, stage, self.seed, self._policy, _freeze(inputs))
+
+    def run(
+        self,
+        stage: str,
+        inputs: Dict[str, Any],
+        builder: Callable[[np.random.Generator], T],
+    ) -> T:
+        """
+        Return the output of ``stage``, building it only if its inputs changed.
+
+        Args:
+            stage: Stage name, unique within the generator
+            inputs: Every parameter value the builder reads
+            builder: Builds the stage output from the stage's random stream
+
+        Returns:
+            The (possibly cached) stage output
+        """
+        key = self.key(stage, inputs)
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self.reused.append(stage)
+            return value
+
+        value = builder(self.rng(stage))
+        self.cache.put(key, value)
+        self.rebuilt.append(stage)
+        return value
+
+    def summary(self) -> Dict[str, List[str]]:
+        """Names of the stages rebuilt and reused by this invocation."""
+        return {"rebuilt": list(self.rebuilt), "reused": list(self.reused)}
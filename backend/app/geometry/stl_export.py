@@ -3,6 +3,10 @@ STL export utilities for manifold3d objects.
 
 Provides conversion from manifold meshes to STL binary/ASCII formats
 and helper functions for mesh data extraction.
+
+STL export always writes the full-resolution mesh. The viewer mesh from
+manifold_to_mesh_dict can be decimated to a triangle budget or an error
+tolerance to bound the response size.
 """
 
 import struct
@@ -10,6 +14,12 @@ import base64
 import numpy as np
 from typing import Any, Dict, Tuple, Optional
 
+from .decimation import decimate_mesh
+
+# Time after which viewer mesh decimation stops refining and clusters
+# straight to the triangle budget
+VIEWER_DECIMATION_SECONDS = 10.0
+
 
 def manifold_to_stl_binary(manifold: Any) -> bytes:
     """
@@ -117,7 +127,12 @@ def manifold_to_stl_ascii(manifold: Any) -> str:
     return "\n".join(lines)
 
 
-def manifold_to_mesh_dict(manifold: Any) -> Dict[str, Any]:
+def manifold_to_mesh_dict(
+    manifold: Any,
+    max_triangles: Optional[int] = None,
+    max_error_mm: Optional[float] = None,
+    max_seconds: Optional[float] = VIEWER_DECIMATION_SECONDS,
+) -> Dict[str, Any]:
     """
     Convert manifold to dict suitable for JSON response.
 
@@ -126,17 +141,26 @@ def manifold_to_mesh_dict(manifold: Any) -> Dict[str, Any]:
     - normals: [nx0, ny0, nz0, nx1, ny1, nz1, ...]
     - indices: [i0, i1, i2, i3, i4, i5, ...] (triangle indices)
 
+    Meshes over max_triangles, or any mesh when only max_error_mm is given,
+    are decimated first (see decimate_mesh); the manifold is not modified.
+
     Args:
         manifold: manifold3d Manifold object
+        max_triangles: Triangle budget for the returned mesh (None or 0: no limit)
+        max_error_mm: Largest deviation decimation may introduce (None: bounded
+            by max_triangles only)
+        max_seconds: Time limit of decimation (see decimate_mesh; None: no limit)
 
     Returns:
-        Dictionary with vertices, indices, normals, vertex_count, triangle_count
+        Dictionary with vertices, indices, normals, vertex_count, triangle_count,
+        source_triangle_count (before decimation) and decimated
     """
     mesh = manifold.to_mesh()
 
     # tri_verts contains indices into vert_properties, not actual coordinates
     verts = np.array(mesh.vert_properties)[:, :3]  # Get vertex positions (first 3 columns)
     tri_indices = np.array(mesh.tri_verts)  # Triangle vertex indices (Nx3)
+    source_triangle_count = len(tri_indices)
 
     if len(tri_indices) == 0:
         return {
@@ -144,9 +168,19 @@ def manifold_to_mesh_dict(manifold: Any) -> Dict[str, Any]:
             'normals': [],
             'indices': [],
             'vertex_count': 0,
-            'triangle_count': 0
+            'triangle_count': 0,
+            'source_triangle_count': 0,
+            'decimated': False,
         }
 
+    over_budget = bool(max_triangles) and source_triangle_count > max_triangles
+    if over_budget or (not max_triangles and max_error_mm is not None):
+        verts, tri_indices = decimate_mesh(
+            verts, tri_indices, target_triangles=max_triangles or None, max_error_mm=max_error_mm,
+            max_seconds=max_seconds,
+        )
+    decimated = len(tri_indices) < source_triangle_count
+
     # Index into vertices to get triangle coords (Nx3x3)
     tri_verts = verts[tri_indices]
     num_triangles = len(tri_verts)
@@ -178,7 +212,9 @@ def manifold_to_mesh_dict(manifold: Any) -> Dict[str, Any]:
         'normals': normals,
         'indices': indices,
         'vertex_count': num_triangles * 3,
-        'triangle_count': num_triangles
+        'triangle_count': num_triangles,
+        'source_triangle_count': source_triangle_count,
+        'decimated': decimated,
     }
 
 
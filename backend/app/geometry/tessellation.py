@@ -0,0 +1,186 @@
+"""
+Adaptive per-feature tessellation.
+
+Generators historically passed one global ``resolution`` as the segment
+count of every cylinder and sphere, so a 15 um lacuna got as many segments
+as a 40 mm disc body. Those surplus triangles are invisible once printed
+but make every downstream boolean slower.
+
+A TessellationPolicy picks the circle segment count from the feature radius
+and a chordal tolerance derived from the target printer's resolution: a
+circle of radius r approximated by n segments deviates from the true circle
+by at most r * (1 - cos(pi / n)), so n only needs to be large enough to keep
+that sagitta below the tolerance. The requested ``resolution`` becomes a
+ceiling rather than the count itself, so enabling a policy never adds
+triangles.
+
+The policy is carried in a ContextVar (like the memory budget) so the API
+can activate it per request without changing generator signatures.
+Generators build circular geometry through ``adaptive_cylinder`` and
+``adaptive_sphere``, which take the same arguments as
+``Manifold.cylinder``/``Manifold.sphere`` and pass through unchanged when no
+policy is active.
+
+Usage:
+    policy = TessellationPolicy(printer_resolution_um=100.0)
+    with tessellation_policy(policy):
+        manifold, stats = generate_haversian_bone(params)
+"""
+
+from __future__ import annotations
+
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+try:
+    import manifold3d as m3d
+    HAS_MANIFOLD = True
+except ImportError:
+    m3d = None
+    HAS_MANIFOLD = False
+
+
+@dataclass(frozen=True)
+class TessellationPolicy:
+    """
+    Maps feature radius to circle segment count for a target printer.
+
+    Attributes:
+        printer_resolution_um: Smallest feature the target printer resolves
+            (XY resolution / nozzle-limited line width) in micrometers
+        tolerance_fraction: Chordal tolerance as a fraction of the printer
+            resolution (0.5 = facets deviate at most half a printer pixel)
+        min_segments: Floor on segments for any circle, however small
+        max_segments: Ceiling on segments for any circle, however large
+    """
+    printer_resolution_um: float = 100.0
+    tolerance_fraction: float = 0.5
+    min_segments: int = 6
+    max_segments: int = 128
+
+    @property
+    def chordal_tolerance_mm(self) -> float:
+        """Maximum allowed deviation between a facet and the true circle (mm)."""
+        return self.printer_resolution_um * self.tolerance_fraction / 1000.0
+
+    def segments_for_radius(self, radius_mm: float, requested: Optional[int] = None) -> int:
+        """
+        Segment count for a circle of the given radius.
+
+        Args:
+            radius_mm: Feature radius in millimeters
+            requested: Segment count the generator asked for. Treated as an
+                additional ceiling so the policy never increases triangle count.
+
+        Returns:
+            Segment count clamped to [floor, ceiling]
+        """
+        ceiling = self.max_segments
+        if requested is not None and requested > 0:
+            ceiling = min(ceiling, int(requested))
+        floor = min(self.min_segments, ceiling)
+
+        tol = self.chordal_tolerance_mm
+        if radius_mm <= 0 or tol <= 0:
+            return ceiling
+        if tol >= radius_mm:
+            return floor
+
+        # Sagitta of one segment: r * (1 - cos(theta / 2)) <= tol
+        half_angle = math.acos(1.0 - tol / radius_mm)
+        needed = math.ceil(math.pi / half_angle)
+        return max(floor, min(ceiling, needed))
+
+
+_active_policy: ContextVar[Optional[TessellationPolicy]] = ContextVar(
+    "morphostruct_tessellation_policy", default=None
+)
+
+
+@contextmanager
+def tessellation_policy(policy: Optional[TessellationPolicy]) -> Iterator[Optional[TessellationPolicy]]:
+    """
+    Activate a tessellation policy for the enclosed block.
+
+    Args:
+        policy: Policy to activate, or None to leave segment counts untouched
+
+    Yields:
+        The active policy (or None)
+    """
+    token = _active_policy.set(policy)
+    try:
+        yield policy
+    finally:
+        _active_policy.reset(token)
+
+
+def get_active_policy() -> Optional[TessellationPolicy]:
+    """Return the tessellation policy active in the current context, if any."""
+    return _active_policy.get()
+
+
+def segments_for(radius_mm: float, requested: int) -> int:
+    """
+    Segment count for a circle under the active policy.
+
+    Returns ``requested`` unchanged when no policy is active. A non-positive
+    request (manifold3d's "use the global default") is resolved to the
+    default count first so the policy still only ever lowers it.
+
+    Args:
+        radius_mm: Feature radius in millimeters
+        requested: Segment count the generator asked for
+
+    Returns:
+        Segment count to pass to manifold3d
+    """
+    policy = _active_policy.get()
+    if policy is None:
+        return requested
+    if requested <= 0:
+        requested = m3d.get_circular_segments(radius_mm)
+    return policy.segments_for_radius(radius_mm, requested)
+
+
+def adaptive_cylinder(
+    height: float,
+    radius_low: float,
+    radius_high: float = -1.0,
+    circular_segments: int = 0,
+    center: bool = False,
+) -> "m3d.Manifold":
+    """
+    Drop-in replacement for ``Manifold.cylinder`` using the active policy.
+
+    Args:
+        height: Cylinder height
+        radius_low: Radius at the bottom
+        radius_high: Radius at the top (-1 = same as radius_low)
+        circular_segments: Segment count the generator asked for
+        center: Center the cylinder on the origin along Z
+
+    Returns:
+        Cylinder manifold
+    """
+    radius = max(radius_low, radius_high)
+    segments = segments_for(radius, int(circular_segments))
+    return m3d.Manifold.cylinder(height, radius_low, radius_high, segments, center)
+
+
+def adaptive_sphere(radius: float, circular_segments: int = 0) -> "m3d.Manifold":
+    """
+    Drop-in replacement for ``Manifold.sphere`` using the active policy.
+
+    Args:
+        radius: Sphere radius
+        circular_segments: Segment count the generator asked for
+
+    Returns:
+        Sphere manifold
+    """
+    segments = segments_for(radius, int(circular_segments))
+    return m3d.Manifold.sphere(radius, segments)
@@ -20,12 +20,16 @@ from .core import (
     tile_scaffold_onto_surface,
     TilingParams,
     TilingMode,
+    RefinementMode,
     TargetShape,
+    get_flat_sheet_cache,
 )
 
 __all__ = [
     "tile_scaffold_onto_surface",
     "TilingParams",
     "TilingMode",
+    "RefinementMode",
     "TargetShape",
+    "get_flat_sheet_cache",
 ]
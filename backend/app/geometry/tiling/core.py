@@ -5,22 +5,33 @@ Takes any scaffold manifold and tiles it onto curved 3D surfaces.
 Supports surface tiling (shell) and volume filling modes.
 
 Algorithm:
-    1. Tile scaffold in flat XY plane (num_u x num_v copies)
+    1. Tile scaffold in flat XY plane (num_u x num_v copies), welding the
+       faces where neighbouring tiles abut instead of a boolean union
     2. Refine mesh for smooth warping (refine_to_length)
+       Steps 1-2 don't depend on the target surface; their result is cached
+       per source scaffold, so changing surface dimensions only re-warps.
     3. Normalise flat grid to parametric UV space of target surface
+       (adaptive refinement runs here instead, where the warp is known)
     4. Apply vectorised warp_batch to map onto curved surface
-    5. For volume mode: create multiple radial layers and union them
+    5. For volume mode: warp radial layers concurrently and combine them,
+       by plain concatenation when the layers provably can't overlap
 """
 
 from __future__ import annotations
 
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
 
 from ..core import batch_union
+from ..stage_cache import StageCache
+from .refinement import max_chord_error, refine_for_warp
 from .surfaces import (
     SphereParams,
     EllipsoidParams,
@@ -55,6 +66,12 @@ class TilingMode(str, Enum):
     VOLUME = "volume"    # fill entire volume with layers
 
 
+class RefinementMode(str, Enum):
+    """How the flat sheet is refined before warping."""
+    UNIFORM = "uniform"    # refine_to_length everywhere
+    ADAPTIVE = "adaptive"  # split only edges the warp bends out of tolerance
+
+
 @dataclass
 class TilingParams:
     """
@@ -80,8 +97,16 @@ class TilingParams:
             layer_spacing_mm: Distance between layers
 
         Mesh refinement:
+            refinement: Uniform or warp-adaptive refinement
             refine_edge_length_mm: Max edge length before warping.
                 Smaller = smoother but more triangles. Set to 0 to skip.
+                In adaptive mode, warped edges shorter than this are never
+                split.
+            refine_tolerance_mm: Adaptive mode only: max distance between a
+                warped edge and the curve it approximates
+            weld_seams: Join the flat tiles by dropping the faces where
+                neighbours abut and welding their outlines. Falls back to a
+                boolean union when the scaffold's opposite faces don't match.
     """
     # Target surface
     target_shape: TargetShape = TargetShape.SPHERE
@@ -107,7 +132,26 @@ class TilingParams:
     layer_spacing_mm: float = 1.0
 
     # Mesh quality
+    refinement: RefinementMode = RefinementMode.UNIFORM
     refine_edge_length_mm: float = 0.5
+    refine_tolerance_mm: float = 0.02
+    weld_seams: bool = True
+
+
+# Tolerance for vertices on a bounding-box face, relative to the tile size
+_SEAM_TOLERANCE = 1e-6
+
+# Safety limit on the refined flat sheet
+MAX_VERTICES = 5_000_000
+
+# Refined flat sheets by (scaffold_id, tile grid, refine length, seam welding).
+# Sheets can run to millions of triangles, so only a few are kept.
+_sheet_cache = StageCache(max_entries=4)
+
+
+def get_flat_sheet_cache() -> StageCache:
+    """Return the cache of refined flat tile sheets."""
+    return _sheet_cache
 
 
 def _get_scaffold_dims(scaffold: m3d.Manifold) -> Tuple[float, float, float]:
@@ -136,17 +180,162 @@ def _estimate_avg_edge_length(manifold: m3d.Manifold) -> float:
     return max(np.sqrt(2 * avg_tri_area), 0.01)
 
 
+def _seam_outline(faces: np.ndarray) -> np.ndarray:
+    """Sorted, unique boundary edges (E, 2) of a set of faces."""
+    edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+    edges, counts = np.unique(edges, axis=0, return_counts=True)
+    return edges[counts == 1]
+
+
+def _match_seam(
+    verts: np.ndarray,
+    lo_faces: np.ndarray,
+    hi_faces: np.ndarray,
+    axis: int,
+    tol: float,
+) -> Optional[np.ndarray]:
+    """
+    Pair up the outlines of a tile's faces on its low and high bounding planes.
+
+    When the tile is repeated along ``axis`` these faces coincide with the
+    neighbour's opposite faces. Their triangulations may differ (a box's
+    sides are split along mirrored diagonals), but if the outlines agree
+    edge for edge, both face sets can be dropped and the outlines welded.
+
+    Returns:
+        (K, 2) array of (high-plane vertex, matching low-plane vertex), or
+        None if the outlines don't coincide
+    """
+    lo_edges, hi_edges = _seam_outline(lo_faces), _seam_outline(hi_faces)
+    if len(lo_edges) != len(hi_edges):
+        return None
+    if len(lo_edges) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    lo_verts, hi_verts = np.unique(lo_edges), np.unique(hi_edges)
+    if len(lo_verts) != len(hi_verts):
+        return None
+
+    # Match outline vertices by their in-plane position
+    plane = np.delete(verts, axis, axis=1)
+    lo_keys = np.round(plane[lo_verts] / tol).astype(np.int64)
+    hi_keys = np.round(plane[hi_verts] / tol).astype(np.int64)
+    lo_order = np.lexsort(lo_keys.T[::-1])
+    hi_order = np.lexsort(hi_keys.T[::-1])
+    lo_keys, hi_keys = lo_keys[lo_order], hi_keys[hi_order]
+    if not np.array_equal(lo_keys, hi_keys) or np.any(np.all(lo_keys[1:] == lo_keys[:-1], axis=1)):
+        return None
+    pairs = np.stack([hi_verts[hi_order], lo_verts[lo_order]], axis=1)
+
+    partner = np.full(len(verts), -1, dtype=np.int64)
+    partner[pairs[:, 0]] = pairs[:, 1]
+    mapped = np.unique(np.sort(partner[hi_edges], axis=1), axis=0)
+    if not np.array_equal(mapped, lo_edges):
+        return None
+    return pairs
+
+
+def _tile_flat_welded(
+    scaffold: m3d.Manifold,
+    num_u: int,
+    num_v: int,
+) -> Optional[m3d.Manifold]:
+    """
+    Tile scaffold in the flat XY plane by concatenating translated copies.
+
+    Neighbouring tiles only meet on their bounding-box faces, so no boolean
+    is needed: the faces where two tiles abut are dropped from both, and
+    each outline vertex on a tile's high face is replaced by the matching
+    vertex of its neighbour. Tiles that only touch along edges or at points
+    are left as separate shells, as a union would leave them.
+
+    Returns:
+        The tiled manifold, or None if the scaffold's opposite faces don't
+        match or the welded mesh is not a valid manifold
+    """
+    mesh = scaffold.to_mesh()
+    verts = np.asarray(mesh.vert_properties, dtype=np.float64)[:, :3]
+    faces = np.asarray(mesh.tri_verts, dtype=np.int64)
+    if len(faces) == 0:
+        return None
+
+    bb = np.array(scaffold.bounding_box())
+    lo, hi = bb[:3], bb[3:]
+    dims = hi - lo
+    tol = _SEAM_TOLERANCE * float(dims.max())
+
+    n_tiles = num_u * num_v
+    n_verts = len(verts)
+    tile_u, tile_v = np.divmod(np.arange(n_tiles), num_v)
+
+    # Same placement as the union path: the tile grid centred at the origin
+    offsets = np.zeros((n_tiles, 3))
+    offsets[:, 0] = (tile_u - num_u / 2.0 + 0.5) * dims[0] - lo[0] - dims[0] / 2
+    offsets[:, 1] = (tile_v - num_v / 2.0 + 0.5) * dims[1] - lo[1] - dims[1] / 2
+    offsets[:, 2] = -lo[2]
+
+    keep = np.ones((n_tiles, len(faces)), dtype=bool)
+    remap = np.arange(n_tiles * n_verts)
+    face_coords = verts[faces]
+
+    # (axis, tile count, tile index, tile-number step to the next tile)
+    for axis, count, index, step in ((0, num_u, tile_u, num_v), (1, num_v, tile_v, 1)):
+        if count == 1:
+            continue
+        on_lo = np.all(np.abs(face_coords[:, :, axis] - lo[axis]) <= tol, axis=1)
+        on_hi = np.all(np.abs(face_coords[:, :, axis] - hi[axis]) <= tol, axis=1)
+        pairs = _match_seam(verts, faces[on_lo], faces[on_hi], axis, tol)
+        if pairs is None:
+            return None
+
+        has_next = index < count - 1
+        keep[np.ix_(has_next, on_hi)] = False
+        keep[np.ix_(index > 0, on_lo)] = False
+        tiles = np.flatnonzero(has_next)
+        remap[(tiles[:, None] * n_verts + pairs[:, 0]).ravel()] = (
+            (tiles[:, None] + step) * n_verts + pairs[:, 1]
+        ).ravel()
+
+    # Vertices on both seams (tile corners) are forwarded more than once
+    while True:
+        forwarded = remap[remap]
+        if np.array_equal(forwarded, remap):
+            break
+        remap = forwarded
+
+    all_faces = (faces[None, :, :] + (np.arange(n_tiles) * n_verts)[:, None, None])[keep]
+    all_faces = remap[all_faces]
+    used, all_faces = np.unique(all_faces, return_inverse=True)
+    all_verts = (verts[None, :, :] + offsets[:, None, :]).reshape(-1, 3)[used]
+
+    result = m3d.Manifold(m3d.Mesh(
+        vert_properties=all_verts.astype(np.float32),
+        tri_verts=all_faces.reshape(-1, 3).astype(np.uint32),
+    ))
+    if result.status() != m3d.Error.NoError or result.is_empty():
+        return None
+    return result
+
+
 def _tile_flat(
     scaffold: m3d.Manifold,
     num_u: int,
     num_v: int,
+    weld_seams: bool = True,
 ) -> m3d.Manifold:
     """
     Tile scaffold in flat XY plane, num_u x num_v copies.
 
     Tiles are placed edge-to-edge using the scaffold's bounding box
-    dimensions. Boolean union ensures shared edges are seamless.
+    dimensions. Where tiles abut on matching faces, the seams are welded
+    directly (see _tile_flat_welded); otherwise a boolean union makes the
+    shared edges seamless.
     """
+    if weld_seams and num_u * num_v > 1:
+        welded = _tile_flat_welded(scaffold, num_u, num_v)
+        if welded is not None:
+            return welded
+
     width, depth, _height = _get_scaffold_dims(scaffold)
     ox, oy, oz = _get_scaffold_origin(scaffold)
 
@@ -272,9 +461,133 @@ def _get_parametric_bounds(
         raise ValueError(f"Unsupported target shape: {shape}")
 
 
+def _offset_reach(params: TilingParams) -> Tuple[float, float]:
+    """
+    How far (inward, outward) normal offsets of the target surface stay apart.
+
+    Within these distances the surface's normal lines don't cross, so sheets
+    at different offsets can't intersect. Inward, the limit is the smallest
+    principal radius of curvature; outward, only the torus's inner side
+    folds back (its normals meet on the axis).
+    """
+    shape = params.target_shape
+    if shape in (TargetShape.SPHERE, TargetShape.CYLINDER):
+        return params.radius, math.inf
+    if shape == TargetShape.TORUS:
+        return params.minor_radius, params.major_radius - params.minor_radius
+
+    radii = (params.radius_x, params.radius_y, params.radius_z)
+    if shape == TargetShape.ELLIPSOID or (params.exponent_n == 1.0 and params.exponent_e == 1.0):
+        return min(radii) ** 2 / max(radii), math.inf
+    # Boxy or pinched superellipsoids have creases with no such margin
+    return 0.0, 0.0
+
+
+def _layers_disjoint(
+    uv_normalised: m3d.Manifold,
+    offsets: List[float],
+    warps: List[Callable[[np.ndarray], np.ndarray]],
+    params: TilingParams,
+) -> bool:
+    """
+    Whether the warped layers are guaranteed not to overlap.
+
+    Layers occupy disjoint thickness ranges when the spacing exceeds the
+    sheet thickness, and offsets within the surface's reach keep them apart
+    after warping. Flat triangles stray from the curved offset surfaces by up
+    to their chord error, so both margins must also exceed that.
+    """
+    bb = uv_normalised.bounding_box()
+    z_min, z_max = bb[2], bb[5]
+    mesh = uv_normalised.to_mesh()
+    margin = 2 * max_chord_error(
+        np.asarray(mesh.vert_properties, dtype=np.float64)[:, :3],
+        np.asarray(mesh.tri_verts, dtype=np.int64),
+        warps,
+    )
+
+    gap = min(b - a for a, b in zip(offsets, offsets[1:])) - (z_max - z_min)
+    inward, outward = _offset_reach(params)
+    return (
+        gap > margin
+        and z_min + offsets[0] > -inward + margin
+        and z_max + offsets[-1] < outward - margin
+    )
+
+
+def _warp_layers(
+    uv_normalised: m3d.Manifold,
+    warps: List[Callable[[np.ndarray], np.ndarray]],
+) -> List[m3d.Manifold]:
+    """Warp the shared sheet once per layer, concurrently."""
+    workers = max(1, min(os.cpu_count() or 1, len(warps)))
+    if workers == 1:
+        return [uv_normalised.warp_batch(warp) for warp in warps]
+
+    # Apply the pending normalisation transform once, not in every worker
+    uv_normalised.num_tri()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(uv_normalised.warp_batch, warps))
+
+
+def _build_flat_sheet(scaffold: m3d.Manifold, params: TilingParams) -> m3d.Manifold:
+    """
+    Tile the scaffold flat and refine it for warping (uniform mode only).
+
+    Raises:
+        ValueError: If refinement would exceed the triangle limit
+    """
+    flat_tiled = _tile_flat(
+        scaffold, params.num_tiles_u, params.num_tiles_v, weld_seams=params.weld_seams
+    )
+    if params.refinement == RefinementMode.ADAPTIVE or params.refine_edge_length_mm <= 0:
+        return flat_tiled
+
+    # Safety: estimate vertex count to avoid memory exhaustion
+    pre_refine_tris = flat_tiled.num_tri()
+    avg_edge = _estimate_avg_edge_length(flat_tiled)
+    if avg_edge > 0:
+        subdivisions = avg_edge / params.refine_edge_length_mm
+        estimated_tris = int(pre_refine_tris * subdivisions * subdivisions)
+        if estimated_tris > MAX_VERTICES:
+            raise ValueError(
+                f"Refinement would create ~{estimated_tris:,} triangles "
+                f"(limit: {MAX_VERTICES:,}). "
+                f"Increase refine_edge_length_mm or reduce tile count."
+            )
+    return flat_tiled.refine_to_length(params.refine_edge_length_mm)
+
+
+def _refine_adaptive(
+    uv_normalised: m3d.Manifold,
+    warps: List[Callable[[np.ndarray], np.ndarray]],
+    params: TilingParams,
+) -> m3d.Manifold:
+    """
+    Refine the normalised sheet where the given warps bend it (see refinement).
+
+    Raises:
+        ValueError: If refinement would exceed the triangle limit
+    """
+    mesh = uv_normalised.to_mesh()
+    verts, faces = refine_for_warp(
+        np.asarray(mesh.vert_properties, dtype=np.float64)[:, :3],
+        np.asarray(mesh.tri_verts, dtype=np.int64),
+        warps,
+        tolerance=params.refine_tolerance_mm,
+        min_edge_length=max(params.refine_edge_length_mm, 0.0),
+        max_triangles=MAX_VERTICES,
+    )
+    return m3d.Manifold(m3d.Mesh(
+        vert_properties=verts.astype(np.float32),
+        tri_verts=faces.astype(np.uint32),
+    ))
+
+
 def tile_scaffold_onto_surface(
     scaffold: m3d.Manifold,
     params: TilingParams,
+    scaffold_id: Optional[str] = None,
 ) -> Tuple[m3d.Manifold, dict]:
     """
     Tile a scaffold onto a curved 3D surface.
@@ -284,6 +597,9 @@ def tile_scaffold_onto_surface(
     Args:
         scaffold: Base scaffold unit (any manifold3d Manifold)
         params: Tiling configuration
+        scaffold_id: Identifies the scaffold across calls. When given, the
+            refined flat sheet is cached, and calls that only change the
+            target surface skip straight to warping.
 
     Returns:
         (tiled_manifold, stats_dict)
@@ -297,56 +613,56 @@ def tile_scaffold_onto_surface(
     if params.mode == TilingMode.VOLUME and params.num_layers < 1:
         raise ValueError("num_layers must be >= 1 for volume mode")
 
-    # Step 1: tile in flat XY plane
-    flat_tiled = _tile_flat(scaffold, params.num_tiles_u, params.num_tiles_v)
-
-    # Step 2: refine mesh for smooth warping
-    # Safety: estimate vertex count to avoid memory exhaustion
-    MAX_VERTICES = 5_000_000
-    if params.refine_edge_length_mm > 0:
-        pre_refine_tris = flat_tiled.num_tri()
-        avg_edge = _estimate_avg_edge_length(flat_tiled)
-        if avg_edge > 0:
-            subdivisions = avg_edge / params.refine_edge_length_mm
-            estimated_tris = int(pre_refine_tris * subdivisions * subdivisions)
-            if estimated_tris > MAX_VERTICES:
-                raise ValueError(
-                    f"Refinement would create ~{estimated_tris:,} triangles "
-                    f"(limit: {MAX_VERTICES:,}). "
-                    f"Increase refine_edge_length_mm or reduce tile count."
-                )
-        flat_tiled = flat_tiled.refine_to_length(params.refine_edge_length_mm)
+    # Steps 1-2: flat tiled sheet, refined for smooth warping
+    if scaffold_id is not None:
+        uniform = params.refinement == RefinementMode.UNIFORM
+        key = (scaffold_id, params.num_tiles_u, params.num_tiles_v,
+               float(params.refine_edge_length_mm) if uniform else None, params.weld_seams)
+        flat_tiled = _sheet_cache.get(key)
+        sheet_cached = flat_tiled is not None
+        if not sheet_cached:
+            flat_tiled = _build_flat_sheet(scaffold, params)
+            _sheet_cache.put(key, flat_tiled)
+    else:
+        flat_tiled = _build_flat_sheet(scaffold, params)
+        sheet_cached = False
 
     # Step 3: normalise to parametric UV space
     u_range, v_range = _get_parametric_bounds(params)
     uv_normalised = _normalise_to_uv(flat_tiled, u_range, v_range)
 
-    # Step 4: warp onto surface
-    warp_fn = _build_warp_func(params, layer_offset=0.0)
-    surface_layer = uv_normalised.warp_batch(warp_fn)
-
-    # Step 5: volume filling (multiple radial layers)
     # Layers are distributed symmetrically around the surface:
     #   num_layers=1 -> [0]
     #   num_layers=2 -> [0, +spacing]
     #   num_layers=3 -> [-spacing, 0, +spacing]
     #   num_layers=4 -> [-1.5*s, -0.5*s, +0.5*s, +1.5*s]
-    if params.mode == TilingMode.VOLUME and params.num_layers > 1:
+    volume_layers = params.mode == TilingMode.VOLUME and params.num_layers > 1
+    if volume_layers:
         spacing = params.layer_spacing_mm
         offsets = [
             (i - (params.num_layers - 1) / 2.0) * spacing
             for i in range(params.num_layers)
         ]
+    else:
+        offsets = [0.0]
+    layer_warps = [_build_warp_func(params, layer_offset=offset) for offset in offsets]
 
-        layers = []
-        for offset in offsets:
-            layer_warp = _build_warp_func(params, layer_offset=offset)
-            layer = uv_normalised.warp_batch(layer_warp)
-            layers.append(layer)
+    if params.refinement == RefinementMode.ADAPTIVE:
+        uv_normalised = _refine_adaptive(uv_normalised, layer_warps, params)
 
-        result = batch_union(layers)
+    # Step 4: warp onto surface
+    # Step 5: volume filling (multiple radial layers)
+    layer_combine = None
+    if volume_layers:
+        layers = _warp_layers(uv_normalised, layer_warps)
+        if _layers_disjoint(uv_normalised, offsets, layer_warps, params):
+            result = m3d.Manifold.compose(layers)
+            layer_combine = "concatenated"
+        else:
+            result = batch_union(layers)
+            layer_combine = "union"
     else:
-        result = surface_layer
+        result = uv_normalised.warp_batch(layer_warps[0])
 
     # Compute stats
     mesh = result.to_mesh()
@@ -362,7 +678,10 @@ def tile_scaffold_onto_surface(
         "num_tiles_u": params.num_tiles_u,
         "num_tiles_v": params.num_tiles_v,
         "num_layers": params.num_layers if params.mode == TilingMode.VOLUME else 1,
+        "layer_combine": layer_combine,
         "total_patches": params.num_tiles_u * params.num_tiles_v,
+        "refinement": params.refinement.value,
+        "flat_sheet_cached": sheet_cached,
     }
 
     return result, stats
@@ -0,0 +1,187 @@
+"""
+Warp-driven adaptive refinement of flat tile sheets.
+
+``refine_to_length`` splits every edge of the flat sheet to the same length
+in parametric space, although the warp bends the sheet very unevenly: a
+cylinder is straight along its axis, a sphere's longitude lines shrink
+towards the poles, a torus is tighter on its inner side. Uniform refinement
+has to satisfy the worst region everywhere.
+
+Here an edge is split only where the warp actually bends it. The chord
+error of an edge is the distance between the warped midpoint and the
+midpoint of the warped endpoints; that is exactly how far the straight
+edge left after warping its endpoints strays from the curve it stands for.
+Edges whose chord error exceeds the tolerance are bisected, every triangle
+is re-split with the red/green templates for its number of split edges
+(so neighbours share the new midpoints and the mesh stays closed), and the
+pass repeats until no edge is out of tolerance. The test is per edge, so
+refinement follows the curvature and distortion of the warp per region and
+per direction at once.
+
+Usage:
+    >>> verts, faces = refine_for_warp(verts, faces, [warp], tolerance=0.02)
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+WarpFunction = Callable[[np.ndarray], np.ndarray]
+
+# Hard cap on refinement passes; each pass at least halves the chord error
+# of the edges it splits
+_MAX_PASSES = 32
+
+
+def _unique_edges(faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Unique edges (E, 2) and each face's edge ids (M, 3), edge i = (v_i, v_i+1)."""
+    corners = np.stack([faces, np.roll(faces, -1, axis=1)], axis=2).reshape(-1, 2)
+    edges, face_edges = np.unique(np.sort(corners, axis=1), axis=0, return_inverse=True)
+    return edges, face_edges.reshape(-1, 3)
+
+
+def max_chord_error(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    warps: Sequence[WarpFunction],
+) -> float:
+    """
+    Largest chord error of any edge under any of the warps.
+
+    Args:
+        verts: Vertex array (N, 3) in the warp's input (parametric) space
+        faces: Face array (M, 3)
+        warps: Warp functions to check
+
+    Returns:
+        Maximum distance in millimeters between a warped edge's midpoint
+        and the midpoint of its warped endpoints
+    """
+    # Every edge appears once per face; duplicates don't change the maximum
+    faces = np.asarray(faces, dtype=np.int64)
+    edges = np.stack([faces, np.roll(faces, -1, axis=1)], axis=2).reshape(-1, 2)
+    verts = np.asarray(verts, dtype=np.float64)
+    mids = (verts[edges[:, 0]] + verts[edges[:, 1]]) / 2
+    worst = 0.0
+    for warp in warps:
+        points = np.asarray(warp(verts), dtype=np.float64)
+        chord = (points[edges[:, 0]] + points[edges[:, 1]]) / 2
+        error = np.linalg.norm(np.asarray(warp(mids), dtype=np.float64) - chord, axis=1)
+        worst = max(worst, float(error.max(initial=0.0)))
+    return worst
+
+
+def _split_faces(faces: np.ndarray, face_edges: np.ndarray, midpoint: np.ndarray) -> np.ndarray:
+    """
+    Re-triangulate faces around their split edges.
+
+    Args:
+        faces: Faces (M, 3)
+        face_edges: Edge ids of each face (M, 3)
+        midpoint: New vertex index per edge id, -1 where the edge is kept
+
+    Returns:
+        New faces with the original orientation
+    """
+    mids = midpoint[face_edges]
+    split = mids >= 0
+    count = split.sum(axis=1)
+    pieces = [faces[count == 0]]
+
+    # Rotate each face so its split pattern starts at edge 0 (one split) or
+    # leaves edge 2 whole (two splits); rotation keeps the winding
+    rotate = np.where(count == 1, np.argmax(split, axis=1), (np.argmin(split, axis=1) + 1) % 3)
+    order = (np.arange(3)[None, :] + rotate[:, None]) % 3
+    v = np.take_along_axis(faces, order, axis=1)
+    m = np.take_along_axis(mids, order, axis=1)
+
+    one = count == 1
+    v0, v1, v2, m0 = v[one, 0], v[one, 1], v[one, 2], m[one, 0]
+    pieces += [np.stack([v0, m0, v2], axis=1), np.stack([m0, v1, v2], axis=1)]
+
+    two = count == 2
+    v0, v1, v2, m0, m1 = v[two, 0], v[two, 1], v[two, 2], m[two, 0], m[two, 1]
+    pieces += [
+        np.stack([m0, v1, m1], axis=1),
+        np.stack([v0, m0, m1], axis=1),
+        np.stack([v0, m1, v2], axis=1),
+    ]
+
+    three = count == 3
+    v0, v1, v2 = v[three, 0], v[three, 1], v[three, 2]
+    m0, m1, m2 = m[three, 0], m[three, 1], m[three, 2]
+    pieces += [
+        np.stack([v0, m0, m2], axis=1),
+        np.stack([m0, v1, m1], axis=1),
+        np.stack([m2, m1, v2], axis=1),
+        np.stack([m0, m1, m2], axis=1),
+    ]
+    return np.concatenate(pieces)
+
+
+def refine_for_warp(
+    verts: np.ndarray,
+    faces: np.ndarray,
+    warps: Sequence[WarpFunction],
+    tolerance: float,
+    min_edge_length: float = 0.0,
+    max_triangles: int = 5_000_000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split edges until every warped edge is within ``tolerance`` of its curve.
+
+    Args:
+        verts: Vertex array (N, 3) in the warp's input (parametric) space
+        faces: Face array (M, 3) of a closed mesh
+        warps: Warp functions the mesh will be mapped through (e.g. one per
+            volume layer); an edge is split if any of them bends it too far
+        tolerance: Maximum chord error in millimeters
+        min_edge_length: Warped edges shorter than this are never split
+        max_triangles: Limit on the refined triangle count
+
+    Returns:
+        Tuple of (refined vertices, refined faces)
+
+    Raises:
+        ValueError: If the tolerance is not positive, or refinement would
+            exceed ``max_triangles``
+    """
+    if tolerance <= 0:
+        raise ValueError("refine_tolerance_mm must be > 0")
+
+    verts = np.asarray(verts, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    warped: List[np.ndarray] = [np.asarray(w(verts), dtype=np.float64) for w in warps]
+
+    for _ in range(_MAX_PASSES):
+        edges, face_edges = _unique_edges(faces)
+        mids = (verts[edges[:, 0]] + verts[edges[:, 1]]) / 2
+        warped_mids = [np.asarray(w(mids), dtype=np.float64) for w in warps]
+
+        split = np.zeros(len(edges), dtype=bool)
+        for points, warped_mid in zip(warped, warped_mids):
+            a, b = points[edges[:, 0]], points[edges[:, 1]]
+            chord_error = np.linalg.norm(warped_mid - (a + b) / 2, axis=1)
+            length = np.linalg.norm(b - a, axis=1)
+            split |= (chord_error > tolerance) & (length > min_edge_length)
+
+        n_split = int(split.sum())
+        if n_split == 0:
+            break
+
+        # Each split edge adds one triangle to each of its two faces
+        if len(faces) + 2 * n_split > max_triangles:
+            raise ValueError(
+                f"Adaptive refinement would create over {max_triangles:,} triangles. "
+                f"Increase refine_tolerance_mm or reduce tile count."
+            )
+
+        midpoint = np.full(len(edges), -1, dtype=np.int64)
+        midpoint[split] = len(verts) + np.arange(n_split)
+        faces = _split_faces(faces, face_edges, midpoint)
+        verts = np.concatenate([verts, mids[split]])
+        warped = [np.concatenate([p, wm[split]]) for p, wm in zip(warped, warped_mids)]
+
+    return verts, faces
@@ -10,6 +10,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from typing import Optional
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -123,7 +124,7 @@ def _create_dome_layer(radius: float, dome_height: float, resolution: int) -> m3
     Returns:
         Dome-shaped manifold
     """
-    sphere = m3d.Manifold.sphere(radius, resolution)
+    sphere = adaptive_sphere(radius, resolution)
 
     # Create cutting plane - keep everything above z=-(radius - dome_height)
     cut_z = -(radius - dome_height)
@@ -360,7 +361,7 @@ def _create_trigone(params: BladderParams, inner_radius: float, wall_thickness:
             x_pos = x_sign * half_spacing
 
             # Create cylindrical opening through wall
-            opening = m3d.Manifold.cylinder(
+            opening = adaptive_cylinder(
                 wall_thickness * 1.5,  # Extend through full wall
                 ureteral_radius,
                 ureteral_radius,
@@ -380,7 +381,7 @@ def _create_trigone(params: BladderParams, inner_radius: float, wall_thickness:
         urethral_y = inner_radius - wall_thickness / 2
 
         # Create cylindrical opening through wall
-        opening = m3d.Manifold.cylinder(
+        opening = adaptive_cylinder(
             wall_thickness * 1.5,
             urethral_radius,
             urethral_radius,
@@ -461,7 +462,7 @@ def _create_vascular_network(
 
             # Create short capillary segment (radially oriented)
             capillary_length = lamina_propria_thickness * 0.8
-            capillary = m3d.Manifold.cylinder(
+            capillary = adaptive_cylinder(
                 capillary_length,
                 capillary_radius,
                 capillary_radius,
@@ -582,7 +583,7 @@ def _create_muscle_bundles(
 
                     # Small cylinder segment representing bundle
                     bundle_length = min(spacing * 0.7, 2.0)
-                    bundle = m3d.Manifold.cylinder(
+                    bundle = adaptive_cylinder(
                         bundle_length,
                         bundle_radius,
                         bundle_radius,
@@ -604,7 +605,7 @@ def _create_muscle_bundles(
 
                 # Create bundle along meridian
                 bundle_length = params.dome_height_mm * 0.6
-                bundle = m3d.Manifold.cylinder(
+                bundle = adaptive_cylinder(
                     bundle_length,
                     bundle_radius,
                     bundle_radius,
@@ -694,7 +695,7 @@ def _create_pore_network(
                 break
 
         # Create pore
-        pore = m3d.Manifold.sphere(pore_radius, max(8, params.resolution // 2))
+        pore = adaptive_sphere(pore_radius, max(8, params.resolution // 2))
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -799,7 +800,7 @@ def _create_nerve_markers(
 
         # Create short cylindrical nerve marker
         nerve_length = nerve_spacing_mm * 0.5  # Short segment
-        nerve = m3d.Manifold.cylinder(
+        nerve = adaptive_cylinder(
             nerve_length,
             nerve_radius,
             nerve_radius,
@@ -851,7 +852,7 @@ def _create_nerve_markers(
 
         # Create short cylindrical nerve marker
         nerve_length = nerve_spacing_mm * 0.6  # Slightly longer in muscle layer
-        nerve = m3d.Manifold.cylinder(
+        nerve = adaptive_cylinder(
             nerve_length,
             nerve_radius,
             nerve_radius,
@@ -9,6 +9,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass, field
 from typing import Optional
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -164,8 +165,8 @@ def _make_elastic_lamina(
     inner_radius = radius - thickness_mm
 
     # Create the base lamina as a thin cylindrical shell
-    outer_cyl = m3d.Manifold.cylinder(height, radius, radius, resolution)
-    inner_cyl = m3d.Manifold.cylinder(height + 0.01, inner_radius, inner_radius, resolution)
+    outer_cyl = adaptive_cylinder(height, radius, radius, resolution)
+    inner_cyl = adaptive_cylinder(height + 0.01, inner_radius, inner_radius, resolution)
     lamina = outer_cyl - inner_cyl.translate([0, 0, -0.005])
 
     # Add fenestrations (small cylindrical holes)
@@ -187,7 +188,7 @@ def _make_elastic_lamina(
             fenestration_radius = base_fenestration_radius * size_variation
 
             # Create a small cylinder for the fenestration, oriented radially
-            fenestration = m3d.Manifold.cylinder(
+            fenestration = adaptive_cylinder(
                 thickness_mm * 3,  # Long enough to cut through
                 fenestration_radius,
                 fenestration_radius,
@@ -466,7 +467,7 @@ def _make_vasa_vasorum(
             length_noise = rng.uniform(-1, 1) * position_noise * height * 0.1
             channel_length = np.clip(base_length + length_noise, height * 0.2, height * 0.4)
 
-            channel = m3d.Manifold.cylinder(channel_length, channel_radius_mm,
+            channel = adaptive_cylinder(channel_length, channel_radius_mm,
                                              channel_radius_mm, 8)
             channel = channel.translate([x, y, z_pos - channel_length / 2])
             channels.append(channel)
@@ -474,7 +475,7 @@ def _make_vasa_vasorum(
             # Some channels run radially (perpendicular) - with stochastic variation
             radial_threshold = 0.6 + rng.uniform(-1, 1) * position_noise * 0.2
             if rng.random() > radial_threshold:
-                radial_channel = m3d.Manifold.cylinder(
+                radial_channel = adaptive_cylinder(
                     adventitia_thickness * 0.8,
                     channel_radius_mm * 0.7,
                     channel_radius_mm * 0.7,
@@ -548,7 +549,7 @@ def _make_radial_pores(
         pore_radius_mm = base_pore_radius_mm * size_variation
 
         # Pore runs radially through wall
-        pore = m3d.Manifold.cylinder(
+        pore = adaptive_cylinder(
             wall_thickness * 1.5,  # Longer to ensure full penetration
             pore_radius_mm,
             pore_radius_mm,
@@ -634,7 +635,7 @@ def _make_pore_network(
         y = r * np.sin(theta)
 
         # Create spherical pore
-        pore = m3d.Manifold.sphere(pore_radius_mm, max(8, resolution // 2))
+        pore = adaptive_sphere(pore_radius_mm, max(8, resolution // 2))
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -648,7 +649,7 @@ def _create_tapered_cylinder(
     resolution: int
 ) -> m3d.Manifold:
     """Create a tapered cylinder (truncated cone)."""
-    return m3d.Manifold.cylinder(height, radius_bottom, radius_top, resolution)
+    return adaptive_cylinder(height, radius_bottom, radius_top, resolution)
 
 
 def _create_tortuous_vessel_segment(
@@ -682,8 +683,8 @@ def _create_tortuous_vessel_segment(
     if tortuosity_index <= 0:
         # Straight vessel
         outer_radius = inner_radius + wall_thickness
-        outer = m3d.Manifold.cylinder(length, outer_radius, outer_radius, resolution)
-        inner = m3d.Manifold.cylinder(length + 0.2, inner_radius, inner_radius, resolution)
+        outer = adaptive_cylinder(length, outer_radius, outer_radius, resolution)
+        inner = adaptive_cylinder(length + 0.2, inner_radius, inner_radius, resolution)
         return outer - inner.translate([0, 0, -0.1])
 
     # Sinusoidal path parameters
@@ -703,9 +704,9 @@ def _create_tortuous_vessel_segment(
         x_end = amplitude * np.sin(2 * np.pi * z_end / wavelength_mm)
 
         # Create segment as cylinder
-        seg_outer = m3d.Manifold.cylinder(segment_length * 1.1, outer_radius,
+        seg_outer = adaptive_cylinder(segment_length * 1.1, outer_radius,
                                            outer_radius, resolution)
-        seg_inner = m3d.Manifold.cylinder(segment_length * 1.2, inner_radius,
+        seg_inner = adaptive_cylinder(segment_length * 1.2, inner_radius,
                                            inner_radius, resolution)
         segment = seg_outer - seg_inner.translate([0, 0, -0.05])
 
@@ -886,7 +887,7 @@ def generate_blood_vessel(params: BloodVesselParams) -> tuple[m3d.Manifold, dict
         main_vessel = batch_union([trunk, junction, branch1, branch2])
 
         # Carve out lumen through junction
-        lumen_carve = m3d.Manifold.cylinder(
+        lumen_carve = adaptive_cylinder(
             trunk_length + junction_height + 0.1,
             r0, r0 * daughter_ratio, params.resolution
         )
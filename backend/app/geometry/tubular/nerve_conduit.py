@@ -17,6 +17,7 @@ import numpy as np
 import math
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -192,7 +193,7 @@ def _create_fascicle_chambers(
     channels = []
     for (fx, fy) in fascicle_positions:
         # Each fascicle is a cylindrical void
-        channel = m3d.Manifold.cylinder(
+        channel = adaptive_cylinder(
             length + 0.4,
             fascicle_radius_mm,
             fascicle_radius_mm,
@@ -213,14 +214,14 @@ def _create_fascicle_chambers(
 
         for (fx, fy) in fascicle_positions:
             # Create thin shell around each fascicle
-            outer_shell = m3d.Manifold.cylinder(
+            outer_shell = adaptive_cylinder(
                 length + 0.2,
                 fascicle_radius_mm + perineurium_thickness_mm,
                 fascicle_radius_mm + perineurium_thickness_mm,
                 params.resolution
             ).translate([fx, fy, -0.1])
 
-            inner_shell = m3d.Manifold.cylinder(
+            inner_shell = adaptive_cylinder(
                 length + 0.4,
                 fascicle_radius_mm,
                 fascicle_radius_mm,
@@ -263,14 +264,14 @@ def _create_epineurium(
     new_outer_radius = outer_radius + epineurium_mm
 
     # Create epineurium shell
-    outer_cylinder = m3d.Manifold.cylinder(
+    outer_cylinder = adaptive_cylinder(
         length,
         new_outer_radius,
         new_outer_radius,
         params.resolution * 2
     )
 
-    inner_cylinder = m3d.Manifold.cylinder(
+    inner_cylinder = adaptive_cylinder(
         length + 0.2,
         outer_radius,
         outer_radius,
@@ -335,7 +336,7 @@ def _create_microgrooves(
         groove_radial_position = inner_radius - groove_depth_mm / 2
 
         # Use a small cylinder to approximate groove
-        groove_cyl = m3d.Manifold.cylinder(
+        groove_cyl = adaptive_cylinder(
             length + 0.2,
             groove_width_mm / 2,
             groove_width_mm / 2,
@@ -408,7 +409,7 @@ def _create_growth_factor_reservoirs(
             y = wall_midpoint * math.sin(angle)
 
             # Create spherical reservoir
-            sphere = m3d.Manifold.sphere(
+            sphere = adaptive_sphere(
                 reservoir_radius_mm,
                 max(8, params.resolution)
             ).translate([x, y, z_pos])
@@ -462,7 +463,7 @@ def _create_suture_holes(
             # Rotate cylinder to point radially
             hole_length = outer_radius * 2.5  # Ensure it goes through
 
-            hole = m3d.Manifold.cylinder(
+            hole = adaptive_cylinder(
                 hole_length,
                 hole_radius,
                 hole_radius,
@@ -543,7 +544,7 @@ def _create_spiral_channels(
                 local_radius = channel_radius_mm * variance_factor
 
             # Create small segment
-            segment = m3d.Manifold.cylinder(
+            segment = adaptive_cylinder(
                 segment_height * 1.2,  # Overlap slightly
                 local_radius,
                 local_radius,
@@ -616,7 +617,7 @@ def _create_wall_pores(
         x = radial_pos * math.cos(angle)
         y = radial_pos * math.sin(angle)
 
-        pore = m3d.Manifold.sphere(
+        pore = adaptive_sphere(
             inner_pore_radius,
             max(6, params.resolution // 2)
         ).translate([x, y, z_pos])
@@ -631,7 +632,7 @@ def _create_wall_pores(
         x = radial_pos * math.cos(angle)
         y = radial_pos * math.sin(angle)
 
-        pore = m3d.Manifold.sphere(
+        pore = adaptive_sphere(
             outer_pore_radius,
             max(6, params.resolution // 2)
         ).translate([x, y, z_pos])
@@ -681,13 +682,13 @@ def _create_flared_ends(
 
     # Bottom flare (z=0 to z=flare_length)
     # Outer cone: larger at z=0, regular at z=flare_length
-    bottom_outer = m3d.Manifold.cylinder(
+    bottom_outer = adaptive_cylinder(
         flare_length,
         flared_outer_radius,  # bottom (z=0)
         outer_radius,          # top (z=flare_length)
         params.resolution * 2
     )
-    bottom_inner = m3d.Manifold.cylinder(
+    bottom_inner = adaptive_cylinder(
         flare_length + 0.1,
         flared_inner_radius,
         inner_radius,
@@ -697,13 +698,13 @@ def _create_flared_ends(
     segments.append(bottom_flare)
 
     # Main body (z=flare_length to z=flare_length+main_length)
-    main_outer = m3d.Manifold.cylinder(
+    main_outer = adaptive_cylinder(
         main_length,
         outer_radius,
         outer_radius,
         params.resolution * 2
     ).translate([0, 0, flare_length])
-    main_inner = m3d.Manifold.cylinder(
+    main_inner = adaptive_cylinder(
         main_length + 0.1,
         inner_radius,
         inner_radius,
@@ -713,13 +714,13 @@ def _create_flared_ends(
     segments.append(main_body)
 
     # Top flare (z=flare_length+main_length to z=length)
-    top_outer = m3d.Manifold.cylinder(
+    top_outer = adaptive_cylinder(
         flare_length,
         outer_radius,          # bottom
         flared_outer_radius,   # top (z=length)
         params.resolution * 2
     ).translate([0, 0, flare_length + main_length])
-    top_inner = m3d.Manifold.cylinder(
+    top_inner = adaptive_cylinder(
         flare_length + 0.1,
         inner_radius,
         flared_inner_radius,
@@ -808,13 +809,13 @@ def generate_nerve_conduit(params: NerveConduitParams) -> tuple[m3d.Manifold, di
         # Cylindrical conduit with optional taper
         if params.taper_ratio != 1.0:
             # Tapered conduit (outer and inner diameters change along length)
-            outer = m3d.Manifold.cylinder(
+            outer = adaptive_cylinder(
                 length,
                 outer_radius_start,  # bottom radius
                 outer_radius_end,     # top radius
                 params.resolution * 2
             )
-            inner = m3d.Manifold.cylinder(
+            inner = adaptive_cylinder(
                 length + 0.2,
                 inner_radius_start,
                 inner_radius_end,
@@ -823,13 +824,13 @@ def generate_nerve_conduit(params: NerveConduitParams) -> tuple[m3d.Manifold, di
             conduit = outer - inner
         else:
             # Standard non-tapered cylindrical conduit
-            outer = m3d.Manifold.cylinder(
+            outer = adaptive_cylinder(
                 length,
                 outer_radius,
                 outer_radius,
                 params.resolution * 2
             )
-            inner = m3d.Manifold.cylinder(
+            inner = adaptive_cylinder(
                 length + 0.2,
                 inner_radius,
                 inner_radius,
@@ -873,7 +874,7 @@ def generate_nerve_conduit(params: NerveConduitParams) -> tuple[m3d.Manifold, di
         else:
             # Linear pattern (default)
             if params.num_channels == 1:
-                channel = m3d.Manifold.cylinder(
+                channel = adaptive_cylinder(
                     length + 0.4,
                     actual_channel_radius,
                     actual_channel_radius,
@@ -887,7 +888,7 @@ def generate_nerve_conduit(params: NerveConduitParams) -> tuple[m3d.Manifold, di
                 channel_positions = []
 
                 # Central channel
-                central = m3d.Manifold.cylinder(
+                central = adaptive_cylinder(
                     length + 0.4,
                     actual_channel_radius,
                     actual_channel_radius,
@@ -928,7 +929,7 @@ def generate_nerve_conduit(params: NerveConduitParams) -> tuple[m3d.Manifold, di
                         variance_factor = 1.0 + (rng.random() - 0.5) * 2 * params.channel_variance
                         local_radius = actual_channel_radius * variance_factor
 
-                    channel = m3d.Manifold.cylinder(
+                    channel = adaptive_cylinder(
                         length + 0.4,
                         local_radius,
                         local_radius,
@@ -970,7 +971,7 @@ def generate_nerve_conduit(params: NerveConduitParams) -> tuple[m3d.Manifold, di
                             variance_factor = 1.0 + (rng.random() - 0.5) * 2 * params.channel_variance
                             local_radius = actual_channel_radius * variance_factor
 
-                        channel = m3d.Manifold.cylinder(
+                        channel = adaptive_cylinder(
                             length + 0.4,
                             local_radius,
                             local_radius,
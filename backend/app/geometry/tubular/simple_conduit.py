@@ -13,6 +13,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from typing import Literal, Optional
+from ..tessellation import adaptive_cylinder
 
 
 @dataclass
@@ -50,7 +51,7 @@ def generate_tubular_conduit(params: TubularConduitParams) -> tuple[m3d.Manifold
         raise ValueError("Wall thickness exceeds radius - no inner channel possible")
 
     # Create outer cylinder (aligned along Z axis)
-    outer = m3d.Manifold.cylinder(
+    outer = adaptive_cylinder(
         params.length_mm,
         outer_radius,
         outer_radius,
@@ -58,7 +59,7 @@ def generate_tubular_conduit(params: TubularConduitParams) -> tuple[m3d.Manifold
     )
 
     # Create inner cylinder (slightly longer for clean boolean)
-    inner = m3d.Manifold.cylinder(
+    inner = adaptive_cylinder(
         params.length_mm + 0.2,
         inner_radius,
         inner_radius,
@@ -80,7 +81,7 @@ def generate_tubular_conduit(params: TubularConduitParams) -> tuple[m3d.Manifold
             y = groove_center_radius * np.sin(angle)
 
             # Create groove as thin cylinder
-            groove = m3d.Manifold.cylinder(
+            groove = adaptive_cylinder(
                 params.length_mm + 0.2,
                 params.groove_depth_mm / 2,
                 params.groove_depth_mm / 2,
@@ -111,7 +112,7 @@ def generate_tubular_conduit(params: TubularConduitParams) -> tuple[m3d.Manifold
                 y = inner_radius * np.sin(angle)
 
                 # Radial pore
-                pore = m3d.Manifold.cylinder(
+                pore = adaptive_cylinder(
                     params.wall_thickness_mm + 0.1,
                     pore_radius,
                     pore_radius,
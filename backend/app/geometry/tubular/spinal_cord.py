@@ -10,6 +10,7 @@ import manifold3d as m3d
 import numpy as np
 from dataclasses import dataclass
 from typing import Optional
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -315,7 +316,7 @@ def _create_central_canal(params: SpinalCordParams) -> m3d.Manifold:
     """
     canal_radius = params.central_canal_diameter_mm / 2
     # Make slightly longer to ensure clean subtraction
-    canal = m3d.Manifold.cylinder(
+    canal = adaptive_cylinder(
         params.length_mm + 0.4,
         canal_radius,
         canal_radius,
@@ -380,7 +381,7 @@ def _create_white_matter_columns(params: SpinalCordParams, gray_matter: m3d.Mani
     res = params.resolution
 
     # Create outer cord boundary
-    outer_cord = m3d.Manifold.cylinder(length, cord_radius, cord_radius, res)
+    outer_cord = adaptive_cylinder(length, cord_radius, cord_radius, res)
 
     if not params.enable_tract_columns:
         # Simple white matter: outer cord minus gray matter
@@ -403,11 +404,11 @@ def _create_white_matter_columns(params: SpinalCordParams, gray_matter: m3d.Mani
                              inner_r: float, outer_r: float) -> m3d.Manifold:
         """Create a cylindrical sector for a white matter column."""
         # Create full cylinder and subtract wedges to create sector
-        sector = m3d.Manifold.cylinder(length, outer_r, outer_r, res)
+        sector = adaptive_cylinder(length, outer_r, outer_r, res)
 
         # Subtract inner region
         if inner_r > 0:
-            inner = m3d.Manifold.cylinder(length + 0.2, inner_r, inner_r, res)
+            inner = adaptive_cylinder(length + 0.2, inner_r, inner_r, res)
             inner = inner.translate([0, 0, -0.1])
             sector = sector - inner
 
@@ -440,7 +441,7 @@ def _create_white_matter_columns(params: SpinalCordParams, gray_matter: m3d.Mani
 
     # Lateral columns (bilateral)
     for side in [-1, 1]:
-        lat_col = m3d.Manifold.cylinder(length,
+        lat_col = adaptive_cylinder(length,
                                         params.lateral_column_width_mm / 2,
                                         params.lateral_column_width_mm / 2,
                                         res)
@@ -493,8 +494,8 @@ def _create_meningeal_layers(params: SpinalCordParams, cord_radius: float) -> li
         pia_thickness = params.pia_mater_thickness_um / 1000.0  # Convert to mm
         pia_outer_r = current_radius + pia_thickness
 
-        pia_outer = m3d.Manifold.cylinder(length, pia_outer_r, pia_outer_r, res)
-        pia_inner = m3d.Manifold.cylinder(length + 0.2, current_radius, current_radius, res)
+        pia_outer = adaptive_cylinder(length, pia_outer_r, pia_outer_r, res)
+        pia_inner = adaptive_cylinder(length + 0.2, current_radius, current_radius, res)
         pia_inner = pia_inner.translate([0, 0, -0.1])
         pia = pia_outer - pia_inner
         meninges.append(pia)
@@ -508,8 +509,8 @@ def _create_meningeal_layers(params: SpinalCordParams, cord_radius: float) -> li
         arach_thickness = params.arachnoid_thickness_um / 1000.0
         arach_outer_r = current_radius + arach_thickness
 
-        arach_outer = m3d.Manifold.cylinder(length, arach_outer_r, arach_outer_r, res)
-        arach_inner = m3d.Manifold.cylinder(length + 0.2, current_radius, current_radius, res)
+        arach_outer = adaptive_cylinder(length, arach_outer_r, arach_outer_r, res)
+        arach_inner = adaptive_cylinder(length + 0.2, current_radius, current_radius, res)
         arach_inner = arach_inner.translate([0, 0, -0.1])
         arachnoid = arach_outer - arach_inner
         meninges.append(arachnoid)
@@ -520,8 +521,8 @@ def _create_meningeal_layers(params: SpinalCordParams, cord_radius: float) -> li
         dura_thickness = params.dura_mater_thickness_mm
         dura_outer_r = current_radius + dura_thickness
 
-        dura_outer = m3d.Manifold.cylinder(length, dura_outer_r, dura_outer_r, res)
-        dura_inner = m3d.Manifold.cylinder(length + 0.2, current_radius, current_radius, res)
+        dura_outer = adaptive_cylinder(length, dura_outer_r, dura_outer_r, res)
+        dura_inner = adaptive_cylinder(length + 0.2, current_radius, current_radius, res)
         dura_inner = dura_inner.translate([0, 0, -0.1])
         dura = dura_outer - dura_inner
         meninges.append(dura)
@@ -567,7 +568,7 @@ def _create_root_entry_zones(params: SpinalCordParams, cord_radius: float,
             dr_radius = params.dorsal_root_diameter_mm / 2
 
             # Create channel cylinder
-            dorsal_channel = m3d.Manifold.cylinder(
+            dorsal_channel = adaptive_cylinder(
                 channel_length, dr_radius, dr_radius, 8
             )
 
@@ -587,7 +588,7 @@ def _create_root_entry_zones(params: SpinalCordParams, cord_radius: float,
         for side in [-1, 1]:
             vr_radius = params.ventral_root_diameter_mm / 2
 
-            ventral_channel = m3d.Manifold.cylinder(
+            ventral_channel = adaptive_cylinder(
                 channel_length, vr_radius, vr_radius, 8
             )
 
@@ -642,7 +643,7 @@ def _create_pore_network(params: SpinalCordParams, cord_radius: float) -> list[m
         z = np.random.uniform(0, length)
 
         # Create small spherical pore
-        pore = m3d.Manifold.sphere(pore_radius_mm, params.resolution)
+        pore = adaptive_sphere(pore_radius_mm, params.resolution)
         pore = pore.translate([x, y, z])
         pores.append(pore)
 
@@ -665,7 +666,7 @@ def _create_vascular_channels(params: SpinalCordParams, cord_radius: float) -> l
         asa_radius = params.anterior_spinal_artery_diameter_mm / 2
 
         # Position in anterior median fissure (ventral midline)
-        asa = m3d.Manifold.cylinder(
+        asa = adaptive_cylinder(
             length + 0.4, asa_radius, asa_radius, params.resolution
         )
         # Place at ventral surface, slightly embedded
@@ -677,7 +678,7 @@ def _create_vascular_channels(params: SpinalCordParams, cord_radius: float) -> l
         psa_radius = params.posterior_spinal_artery_diameter_mm / 2
 
         for side in [-1, 1]:
-            psa = m3d.Manifold.cylinder(
+            psa = adaptive_cylinder(
                 length + 0.4, psa_radius, psa_radius, params.resolution
             )
             # Position dorsolateral (posterior-lateral)
@@ -753,7 +754,7 @@ def _create_guidance_channels(params: SpinalCordParams, cord_radius: float,
                 y += np.random.uniform(-1, 1) * params.position_noise
 
             if is_valid_position(x, y):
-                channel = m3d.Manifold.cylinder(
+                channel = adaptive_cylinder(
                     length + 0.4, channel_radius_mm, channel_radius_mm, 8
                 ).translate([x, y, -0.2])
                 channels.append(channel)
@@ -769,7 +770,7 @@ def _create_guidance_channels(params: SpinalCordParams, cord_radius: float,
                 y = (j - grid_size / 2 + 0.5) * spacing
 
                 if is_valid_position(x, y):
-                    channel = m3d.Manifold.cylinder(
+                    channel = adaptive_cylinder(
                         length + 0.4, channel_radius_mm, channel_radius_mm, 8
                     ).translate([x, y, -0.2])
                     channels.append(channel)
@@ -795,7 +796,7 @@ def _create_guidance_channels(params: SpinalCordParams, cord_radius: float,
             y = r * np.sin(angle)
 
             if is_valid_position(x, y):
-                channel = m3d.Manifold.cylinder(
+                channel = adaptive_cylinder(
                     length + 0.4, channel_radius_mm, channel_radius_mm, 8
                 ).translate([x, y, -0.2])
                 channels.append(channel)
@@ -843,7 +844,7 @@ def generate_spinal_cord(params: SpinalCordParams) -> tuple[m3d.Manifold, dict]:
         gray_matter = gray_matter - canal
 
     # === 3. Create white matter (outer cord minus gray matter) ===
-    outer_cord = m3d.Manifold.cylinder(
+    outer_cord = adaptive_cylinder(
         params.length_mm, cord_radius, cord_radius, params.resolution
     )
 
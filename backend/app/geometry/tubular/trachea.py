@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Tuple
 
 from ..helpers import tree_union, batch_union
+from ..tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -193,14 +194,14 @@ def _create_c_ring(
     cartilage_inner = max(inner_radius, outer_radius - ring_thickness)
 
     # Create full ring
-    outer_ring = m3d.Manifold.cylinder(
+    outer_ring = adaptive_cylinder(
         ring_height,
         cartilage_outer,
         cartilage_outer,
         resolution
     )
 
-    inner_ring = m3d.Manifold.cylinder(
+    inner_ring = adaptive_cylinder(
         ring_height + 0.2,
         cartilage_inner,
         cartilage_inner,
@@ -243,7 +244,7 @@ def _create_perichondrium_layer(
     peri_thick = perichondrium_thickness_mm
 
     # Outer perichondrium (outside cartilage)
-    outer_peri = m3d.Manifold.cylinder(
+    outer_peri = adaptive_cylinder(
         ring_height + peri_thick * 2,
         cartilage_outer_radius + peri_thick,
         cartilage_outer_radius + peri_thick,
@@ -251,7 +252,7 @@ def _create_perichondrium_layer(
     ).translate([0, 0, -peri_thick])
 
     # Inner boundary (cartilage surface)
-    inner_bound = m3d.Manifold.cylinder(
+    inner_bound = adaptive_cylinder(
         ring_height + peri_thick * 2 + 0.1,
         cartilage_outer_radius,
         cartilage_outer_radius,
@@ -261,14 +262,14 @@ def _create_perichondrium_layer(
     outer_shell = outer_peri - inner_bound
 
     # Inner perichondrium (inside cartilage)
-    inner_peri_out = m3d.Manifold.cylinder(
+    inner_peri_out = adaptive_cylinder(
         ring_height + peri_thick * 2,
         cartilage_inner_radius,
         cartilage_inner_radius,
         resolution
     ).translate([0, 0, -peri_thick])
 
-    inner_peri_in = m3d.Manifold.cylinder(
+    inner_peri_in = adaptive_cylinder(
         ring_height + peri_thick * 2 + 0.1,
         cartilage_inner_radius - peri_thick,
         cartilage_inner_radius - peri_thick,
@@ -310,20 +311,20 @@ def _create_mucosal_layers(
     r = lumen_radius
 
     # Epithelium (innermost)
-    outer_epi = m3d.Manifold.cylinder(length, r + epithelium_thick_mm, r + epithelium_thick_mm, resolution)
-    inner_epi = m3d.Manifold.cylinder(length + 0.2, r, r, resolution).translate([0, 0, -0.1])
+    outer_epi = adaptive_cylinder(length, r + epithelium_thick_mm, r + epithelium_thick_mm, resolution)
+    inner_epi = adaptive_cylinder(length + 0.2, r, r, resolution).translate([0, 0, -0.1])
     layers.append(outer_epi - inner_epi)
     r += epithelium_thick_mm
 
     # Lamina propria
-    outer_lp = m3d.Manifold.cylinder(length, r + lamina_propria_thick_mm, r + lamina_propria_thick_mm, resolution)
-    inner_lp = m3d.Manifold.cylinder(length + 0.2, r, r, resolution).translate([0, 0, -0.1])
+    outer_lp = adaptive_cylinder(length, r + lamina_propria_thick_mm, r + lamina_propria_thick_mm, resolution)
+    inner_lp = adaptive_cylinder(length + 0.2, r, r, resolution).translate([0, 0, -0.1])
     layers.append(outer_lp - inner_lp)
     r += lamina_propria_thick_mm
 
     # Submucosa
-    outer_sub = m3d.Manifold.cylinder(length, r + submucosa_thick_mm, r + submucosa_thick_mm, resolution)
-    inner_sub = m3d.Manifold.cylinder(length + 0.2, r, r, resolution).translate([0, 0, -0.1])
+    outer_sub = adaptive_cylinder(length, r + submucosa_thick_mm, r + submucosa_thick_mm, resolution)
+    inner_sub = adaptive_cylinder(length + 0.2, r, r, resolution).translate([0, 0, -0.1])
     layers.append(outer_sub - inner_sub)
 
     return layers
@@ -411,7 +412,7 @@ def _create_submucosal_glands(
         y = r * np.sin(theta)
 
         # Create spherical gland cavity
-        gland = m3d.Manifold.sphere(gland_radius, resolution // 2)
+        gland = adaptive_sphere(gland_radius, resolution // 2)
         gland = gland.translate([x, y, z])
         glands.append(gland)
 
@@ -452,7 +453,7 @@ def _create_vascular_channels(
         y = r * np.sin(theta)
 
         # Longitudinal cylinder
-        channel = m3d.Manifold.cylinder(length, channel_radius, channel_radius, resolution // 2)
+        channel = adaptive_cylinder(length, channel_radius, channel_radius, resolution // 2)
         channel = channel.translate([x, y, 0])
         channels.append(channel)
 
@@ -475,7 +476,7 @@ def _create_vascular_channels(
 
             # Small segment cylinder
             seg_len = np.sqrt((x2-x1)**2 + (y2-y1)**2)
-            seg = m3d.Manifold.cylinder(seg_len, channel_radius, channel_radius, 6)
+            seg = adaptive_cylinder(seg_len, channel_radius, channel_radius, 6)
 
             # Rotate to align with segment direction
             angle_deg = np.degrees(np.arctan2(y2-y1, x2-x1))
@@ -516,8 +517,8 @@ def _create_annular_ligaments(
         ligament_outer = inner_radius + ligament_thickness_mm
         ligament_inner = inner_radius
 
-        outer_cyl = m3d.Manifold.cylinder(ligament_height, ligament_outer, ligament_outer, resolution)
-        inner_cyl = m3d.Manifold.cylinder(ligament_height + 0.2, ligament_inner, ligament_inner, resolution)
+        outer_cyl = adaptive_cylinder(ligament_height, ligament_outer, ligament_outer, resolution)
+        inner_cyl = adaptive_cylinder(ligament_height + 0.2, ligament_inner, ligament_inner, resolution)
         inner_cyl = inner_cyl.translate([0, 0, -0.1])
 
         ligament = outer_cyl - inner_cyl
@@ -553,7 +554,7 @@ def _create_carina_bifurcation(
     """
     # Junction sphere at bifurcation point
     junction_radius = trachea_radius * 1.2
-    junction = m3d.Manifold.sphere(junction_radius, resolution)
+    junction = adaptive_sphere(junction_radius, resolution)
     junction = junction.translate([0, 0, trachea_end_z])
 
     # Carina ridge (sharp ridge at bifurcation)
@@ -564,14 +565,14 @@ def _create_carina_bifurcation(
 
     # Right main bronchus (steeper, larger)
     right_rad = right_diameter_mm / 2
-    right_cyl = m3d.Manifold.cylinder(branch_length, right_rad * 1.1, right_rad, resolution)
+    right_cyl = adaptive_cylinder(branch_length, right_rad * 1.1, right_rad, resolution)
     # Tilt toward right (positive X) and down (positive Z continues)
     right_cyl = right_cyl.rotate([0, right_angle_deg, 0])
     right_cyl = right_cyl.translate([0, 0, trachea_end_z])
 
     # Left main bronchus (more horizontal, smaller)
     left_rad = left_diameter_mm / 2
-    left_cyl = m3d.Manifold.cylinder(branch_length, left_rad * 1.1, left_rad, resolution)
+    left_cyl = adaptive_cylinder(branch_length, left_rad * 1.1, left_rad, resolution)
     # Tilt toward left (negative X) and down
     left_cyl = left_cyl.rotate([0, -left_angle_deg, 0])
     left_cyl = left_cyl.translate([0, 0, trachea_end_z])
@@ -613,7 +614,7 @@ def _create_cilia_markers(
         y = lumen_radius * np.sin(theta)
 
         # Small cylinder pointing inward
-        marker = m3d.Manifold.cylinder(marker_height, marker_radius, marker_radius * 0.5, 4)
+        marker = adaptive_cylinder(marker_height, marker_radius, marker_radius * 0.5, 4)
 
         # Orient toward center
         tilt = 90 + np.degrees(theta)
@@ -658,7 +659,7 @@ def _create_goblet_cell_markers(
         y = lumen_radius * np.sin(theta)
 
         # Small sphere for goblet cell
-        marker = m3d.Manifold.sphere(marker_radius, 6)
+        marker = adaptive_sphere(marker_radius, 6)
         marker = marker.translate([x, y, z])
         markers.append(marker)
 
@@ -691,14 +692,14 @@ def _create_full_cartilage_ring(
     cartilage_inner = max(inner_radius, outer_radius - ring_thickness)
 
     # Create full ring
-    outer_ring = m3d.Manifold.cylinder(
+    outer_ring = adaptive_cylinder(
         ring_height,
         cartilage_outer,
         cartilage_outer,
         resolution
     )
 
-    inner_ring = m3d.Manifold.cylinder(
+    inner_ring = adaptive_cylinder(
         ring_height + 0.2,
         cartilage_inner,
         cartilage_inner,
@@ -753,7 +754,7 @@ def _apply_cartilage_porosity(
         x = r * np.cos(theta)
         y = r * np.sin(theta)
 
-        pore = m3d.Manifold.sphere(pore_radius, resolution // 4)
+        pore = adaptive_sphere(pore_radius, resolution // 4)
         pore = pore.translate([x, y, z_position - ring_height/2 + z])
         pores.append(pore)
 
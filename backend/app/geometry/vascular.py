@@ -2,7 +2,8 @@
 Vascular network geometry generator.
 
 Generates branching tree structures that mimic blood vessel networks.
-Uses recursive branching with Murray's law for optimal flow characteristics.
+Branch skeletons are computed level by level with Murray's law radius ratios,
+then each inlet tree's geometry is built and unioned in parallel.
 
 Key features:
 - Deterministic (grid) or organic (random) inlet positioning
@@ -17,7 +18,8 @@ from typing import List, Optional, Tuple, Callable, Dict, Any
 from dataclasses import dataclass
 import numpy as np
 
-from .core import batch_union, get_manifold_module
+from .core import batch_union, get_manifold_module, union_groups
+from .tessellation import adaptive_cylinder, adaptive_sphere
 
 
 @dataclass
@@ -135,7 +137,7 @@ def make_cyl(
         The manifold3d cylinder convention has the larger radius at z=0
         and smaller at z=length, so we pass (r2, r1) to cylinder().
     """
-    m3d = get_manifold_module()
+    get_manifold_module()
 
     dx, dy, dz = x2 - x1, y2 - y1, z2 - z1
     length = np.sqrt(dx*dx + dy*dy + dz*dz)
@@ -144,7 +146,7 @@ def make_cyl(
         return None
 
     # Create cylinder (bottom radius, top radius)
-    cyl = m3d.Manifold.cylinder(length, r2, r1, resolution)
+    cyl = adaptive_cylinder(length, r2, r1, resolution)
 
     # Calculate rotation angles
     h = np.sqrt(dx*dx + dy*dy)  # horizontal distance
@@ -226,200 +228,247 @@ def _generate_inlet_positions(
     return randomized
 
 
-def _create_branch_recursive(
-    x: float, y: float, z: float,
-    r: float,
-    ang: float,
-    remaining_levels: int,
+@dataclass
+class VascularSkeleton:
+    """
+    Branch skeleton of a vascular network, one row per branch.
+
+    Attributes:
+        start: Branch start points (N, 3)
+        end: Branch end points (N, 3)
+        radius: Radius at the start (N,)
+        child_radius: Radius at the end, handed on to children (N,)
+        angle: Outward angle of the branch (N,)
+        start_dir: Direction the branch leaves its start with (N, 3)
+        remaining: Branching levels left below the branch (N,)
+        junction: Whether the branch splits at its end (N,)
+        inlet: Index of the inlet tree the branch belongs to (N,)
+    """
+    start: np.ndarray
+    end: np.ndarray
+    radius: np.ndarray
+    child_radius: np.ndarray
+    angle: np.ndarray
+    start_dir: np.ndarray
+    remaining: np.ndarray
+    junction: np.ndarray
+    inlet: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.radius)
+
+
+def build_vascular_skeleton(
+    inlet_positions: List[Tuple[float, float]],
+    out_angles: np.ndarray,
     params: VascularParams,
     net_r: float,
     net_bot: float,
-    rng: np.random.Generator,
-    channels: List,
-    parent_dir: Optional[Tuple[float, float, float]] = None
-) -> None:
+    rng: np.random.Generator
+) -> VascularSkeleton:
     """
-    Recursively generate a branching tree structure.
+    Compute all branch positions and radii level by level.
 
-    At each level:
-    1. Calculate target position with spread
-    2. Create curved path using Bezier interpolation
-    3. Add spheres along path for smooth geometry
-    4. Spawn child branches if levels remain
+    Every branch of a level shares its number of remaining levels, so a
+    whole level is advanced with array operations: z step, spread, angle
+    jitter and the child radius ratio (Murray's law) for all its branches
+    at once, then the children of every splitting branch form the next
+    level. Random draws are made per level, in the order of the rules
+    applied to each branch.
 
     Args:
-        x, y, z: Current branch start position
-        r: Current radius
-        ang: Current angle direction
-        remaining_levels: How many more levels to branch
+        inlet_positions: (x, y) of each inlet
+        out_angles: Initial outward angle of each inlet tree
         params: Generation parameters
         net_r: Network radius boundary
         net_bot: Bottom z boundary
         rng: Random number generator
-        channels: List to append manifold segments to
-        parent_dir: Direction vector from parent (for smooth curves)
+
+    Returns:
+        VascularSkeleton of all branches, level by level
     """
-    m3d = get_manifold_module()
+    det = params.deterministic
+    n = len(inlet_positions)
+    xy = np.asarray(inlet_positions, dtype=np.float64).reshape(n, 2)
+    x, y = xy[:, 0], xy[:, 1]
+    z = np.full(n, float(params.scaffold_height))
+    r = np.full(n, params.inlet_radius * 1.1)
+    ang = np.asarray(out_angles, dtype=np.float64)
+    sdir = np.tile([0.0, 0.0, -1.0], (n, 1))
+    inlet = np.arange(n)
+
+    rows: List[Dict[str, np.ndarray]] = []
+    for remaining in range(params.levels, -1, -1):
+        # Termination conditions
+        alive = (r >= 0.03) & (z > net_bot + 0.02)
+        x, y, z, r, ang, sdir, inlet = (
+            a[alive] for a in (x, y, z, r, ang, sdir, inlet)
+        )
+        n = len(r)
+        if n == 0:
+            break
 
-    # Termination conditions
-    if r < 0.03 or z <= net_bot + 0.02:
-        return
+        def jitter(lo: float, hi: float) -> np.ndarray:
+            return np.ones(n) if det else rng.uniform(lo, hi, n)
 
-    is_terminal = remaining_levels == 0
+        # Z step
+        if remaining > 0:
+            z_step = (z - net_bot) / (remaining + 1) * jitter(0.7, 1.3)
+        else:
+            z_step = z - net_bot - 0.02
+        nz = np.maximum(z - z_step, net_bot + 0.02)
 
-    # Calculate z step
-    if remaining_levels > 0:
-        base_z_step = (z - net_bot) / (remaining_levels + 1)
-        z_step = base_z_step * (1 if params.deterministic else rng.uniform(0.7, 1.3))
-    else:
-        z_step = z - net_bot - 0.02
+        # Spread (none for the inlet level)
+        if remaining < params.levels:
+            sp = params.spread * jitter(0.7, 1.3)
+        else:
+            sp = np.zeros(n)
 
-    nz = max(z - z_step, net_bot + 0.02)
+        # Angle with optional jitter
+        sa = ang if det else ang + rng.uniform(-0.4, 0.4, n)
 
-    # Calculate spread
-    if remaining_levels < params.levels:
-        sp = params.spread * (1 if params.deterministic else rng.uniform(0.7, 1.3))
-    else:
-        sp = 0
+        # New position, clamped to the boundary
+        nx = x + sp * np.cos(sa)
+        ny = y + sp * np.sin(sa)
+        d = np.sqrt(nx*nx + ny*ny)
+        clamp = np.where(d > net_r - 0.1, (net_r - 0.1) / np.maximum(d, 1e-12), 1.0)
+        nx, ny = nx * clamp, ny * clamp
+
+        # Child radius using ratio (with optional jitter)
+        cr = r * params.ratio * jitter(0.85, 1.15)
+
+        junction = np.full(n, remaining > 0) & (nz > net_bot + 0.05)
+        rows.append({
+            'start': np.stack([x, y, z], axis=1),
+            'end': np.stack([nx, ny, nz], axis=1),
+            'radius': r,
+            'child_radius': cr,
+            'angle': sa,
+            'start_dir': sdir,
+            'remaining': np.full(n, remaining),
+            'junction': junction,
+            'inlet': inlet,
+        })
+        if not junction.any():
+            break
+
+        # Children of every splitting branch
+        k = int(junction.sum())
+        if det:
+            if params.splits == 1:
+                child_angles = sa[junction][:, None]
+            else:
+                child_angles = np.tile(
+                    np.arange(params.splits) * 2 * np.pi / params.splits, (k, 1)
+                )
+        else:
+            base_step = 2 * np.pi / params.splits
+            start_rotation = rng.uniform(0, base_step, k)
+            child_angles = (
+                start_rotation[:, None]
+                + np.arange(params.splits) * base_step
+                + rng.uniform(-0.3, 0.3, (k, params.splits))
+            )
+
+        # Children leave along the parent's arrival direction
+        ned = np.stack([np.cos(sa) * 0.6, np.sin(sa) * 0.6, np.full(n, -0.5)], axis=1)
+        ned /= np.linalg.norm(ned, axis=1, keepdims=True)
 
-    # Calculate angle with optional jitter
-    sa = ang if params.deterministic else ang + rng.uniform(-0.4, 0.4)
+        per_parent = child_angles.shape[1]
+        x, y, z, r, sdir, inlet = (
+            np.repeat(a[junction], per_parent, axis=0)
+            for a in (nx, ny, nz, cr, ned, inlet)
+        )
+        ang = child_angles.ravel()
+
+    if not rows:
+        return VascularSkeleton(
+            start=np.empty((0, 3)), end=np.empty((0, 3)), radius=np.empty(0),
+            child_radius=np.empty(0), angle=np.empty(0), start_dir=np.empty((0, 3)),
+            remaining=np.empty(0, dtype=int), junction=np.empty(0, dtype=bool),
+            inlet=np.empty(0, dtype=int),
+        )
+    return VascularSkeleton(**{
+        key: np.concatenate([row[key] for row in rows]) for key in rows[0]
+    })
 
-    # New position
-    nx = x + sp * np.cos(sa)
-    ny = y + sp * np.sin(sa)
 
-    # Clamp to boundary
-    d = np.sqrt(nx*nx + ny*ny)
-    if d > net_r - 0.1:
-        nx, ny = nx * (net_r - 0.1) / d, ny * (net_r - 0.1) / d
+def _branch_channels(
+    skeleton: VascularSkeleton,
+    i: int,
+    params: VascularParams
+) -> List[Any]:
+    """
+    Channel geometry of one skeleton branch.
 
-    # Child radius using ratio (with optional jitter)
-    cr = r * params.ratio * (1 if params.deterministic else rng.uniform(0.85, 1.15))
+    Terminal branches in tips_down mode are cylinders along a Bezier curve
+    that arrives pointing down; other branches are spheres swept along a
+    Bezier curve. Splitting branches get a junction sphere at their end.
+    """
+    nx, ny, nz = skeleton.end[i]
+    r, cr = skeleton.radius[i], skeleton.child_radius[i]
+    sa = skeleton.angle[i]
+    sdir = skeleton.start_dir[i]
+    channels: List[Any] = []
 
-    # Starting direction (from parent or straight down)
-    sdir = np.array(parent_dir) if parent_dir else np.array([0., 0., -1.])
+    p0 = skeleton.start[i]
+    p3 = skeleton.end[i]
+    dist = np.linalg.norm(p3 - p0)
 
-    # Generate branch geometry
-    if params.tips_down and is_terminal:
+    if params.tips_down and skeleton.remaining[i] == 0:
         # Terminal branches curve downward
-        dist = np.sqrt((nx-x)**2 + (ny-y)**2 + (nz-z)**2)
-        p0 = np.array([x, y, z])
-        p3 = np.array([nx, ny, nz])
         p1 = p0 + sdir * dist * 0.4
         p2 = p3 + np.array([0, 0, dist * 0.35])
-
-        prev_pt = None
-        prev_r = r
-        for i in range(5):
-            t = i / 4
-            mt = 1 - t
-            # Cubic Bezier interpolation
-            pt = (mt**3 * p0 + 3*mt**2*t * p1 +
-                  3*mt*t**2 * p2 + t**3 * p3)
-            cur_r = r + (cr - r) * t
-
-            if prev_pt is not None:
-                seg = make_cyl(
-                    prev_pt[0], prev_pt[1], prev_pt[2],
-                    pt[0], pt[1], pt[2],
-                    prev_r, cur_r,
-                    params.resolution
-                )
-                if seg:
-                    channels.append(seg)
-                # Add sphere for smooth joint
-                channels.append(
-                    m3d.Manifold.sphere(cur_r * 1.02, params.resolution)
-                    .translate([pt[0], pt[1], pt[2]])
-                )
-
-            prev_pt = pt
-            prev_r = cur_r
-    else:
+        t = np.linspace(0, 1, 5)[:, None]
+        mt = 1 - t
+        # Cubic Bezier interpolation
+        pts = mt**3 * p0 + 3*mt**2*t * p1 + 3*mt*t**2 * p2 + t**3 * p3
+        radii = r + (cr - r) * t[:, 0]
+
+        for a, b, ra, rb in zip(pts[:-1], pts[1:], radii[:-1], radii[1:]):
+            seg = make_cyl(a[0], a[1], a[2], b[0], b[1], b[2], ra, rb, params.resolution)
+            if seg:
+                channels.append(seg)
+            # Add sphere for smooth joint
+            channels.append(
+                adaptive_sphere(rb * 1.02, params.resolution).translate([b[0], b[1], b[2]])
+            )
+    elif dist > 0.02:
         # Standard curved branch with Bezier
-        dist = np.sqrt((nx-x)**2 + (ny-y)**2 + (nz-z)**2)
-        if dist > 0.02:
-            cd = dist * (0.4 + params.curvature * 0.5)
-
-            # Control point 1: follow parent direction
-            c1 = np.array([
-                x + sdir[0]*cd,
-                y + sdir[1]*cd,
-                z + sdir[2]*cd - params.curvature*dist*0.15
-            ])
-
-            # Outward direction
-            out = np.array([np.cos(sa), np.sin(sa), 0.])
-
-            # End direction
-            edir = np.array([out[0]*0.6, out[1]*0.6, -0.5])
-            edir /= np.linalg.norm(edir)
-
-            # Control point 2: smooth arrival
-            c2 = np.array([
-                nx - edir[0]*cd*0.8,
-                ny - edir[1]*cd*0.8,
-                nz + cd*0.3*params.curvature
-            ])
-
-            # Sample points along curve
-            n_samples = max(8, int(dist/0.1)) + 1
-            for i in range(n_samples):
-                t = i / (n_samples - 1)
-                mt = 1 - t
-                mt2 = mt * mt
-                mt3 = mt2 * mt
-
-                # Cubic Bezier point
-                c = (mt3 * np.array([x, y, z]) +
-                     3*mt2*t * c1 +
-                     3*mt*t*t * c2 +
-                     t**3 * np.array([nx, ny, nz]))
-
-                # Interpolate radius
-                sphere_r = r + (cr - r) * t
-                channels.append(
-                    m3d.Manifold.sphere(sphere_r, params.resolution)
-                    .translate([c[0], c[1], c[2]])
-                )
+        cd = dist * (0.4 + params.curvature * 0.5)
+
+        # Control point 1: follow parent direction
+        c1 = p0 + sdir * cd - np.array([0, 0, params.curvature * dist * 0.15])
+
+        # End direction: outward and down
+        edir = np.array([np.cos(sa) * 0.6, np.sin(sa) * 0.6, -0.5])
+        edir /= np.linalg.norm(edir)
+
+        # Control point 2: smooth arrival
+        c2 = np.array([
+            nx - edir[0]*cd*0.8,
+            ny - edir[1]*cd*0.8,
+            nz + cd*0.3*params.curvature
+        ])
+
+        # Sample points along curve
+        n_samples = max(8, int(dist/0.1)) + 1
+        t = np.linspace(0, 1, n_samples)[:, None]
+        mt = 1 - t
+        pts = mt**3 * p0 + 3*mt**2*t * c1 + 3*mt*t**2 * c2 + t**3 * p3
+        radii = r + (cr - r) * t[:, 0]
+        for c, sphere_r in zip(pts, radii):
+            channels.append(
+                adaptive_sphere(sphere_r, params.resolution).translate([c[0], c[1], c[2]])
+            )
 
-    # Spawn children if levels remain
-    if remaining_levels > 0 and nz > net_bot + 0.05:
-        # Add junction sphere
+    if skeleton.junction[i]:
+        # Junction sphere where the children split off
         channels.append(
-            m3d.Manifold.sphere(cr * 1.15, params.resolution)
-            .translate([nx, ny, nz])
+            adaptive_sphere(cr * 1.15, params.resolution).translate([nx, ny, nz])
         )
 
-        # Calculate child angles
-        if params.deterministic:
-            if params.splits == 1:
-                child_angles = [sa]
-            else:
-                child_angles = [i * 2 * np.pi / params.splits
-                               for i in range(params.splits)]
-        else:
-            base_step = 2 * np.pi / params.splits
-            start_rotation = rng.uniform(0, base_step)
-            child_angles = [
-                start_rotation + i * base_step + rng.uniform(-0.3, 0.3)
-                for i in range(params.splits)
-            ]
-
-        # Recurse for each child
-        for child_ang in child_angles:
-            out = np.array([np.cos(sa), np.sin(sa), 0.])
-            ned = np.array([out[0]*0.6, out[1]*0.6, -0.5])
-            ned /= np.linalg.norm(ned)
-
-            _create_branch_recursive(
-                nx, ny, nz, cr, child_ang,
-                remaining_levels - 1,
-                params, net_r, net_bot, rng,
-                channels,
-                parent_dir=tuple(ned)
-            )
+    return channels
 
 
 def generate_vascular_network(
@@ -431,7 +480,7 @@ def generate_vascular_network(
 
     Creates a cylindrical scaffold body with internal branching
     vascular channels. The channels mimic blood vessel networks
-    using recursive branching with Murray's law ratios.
+    using level-by-level branching with Murray's law ratios.
 
     Args:
         params: VascularParams configuration object
@@ -448,7 +497,7 @@ def generate_vascular_network(
         body, channels, result = generate_vascular_network(params)
         # Export result as STL
     """
-    m3d = get_manifold_module()
+    get_manifold_module()
 
     # Derived geometry parameters
     net_r = params.inner_radius - 0.12
@@ -459,13 +508,13 @@ def generate_vascular_network(
         progress_callback("Building scaffold body...")
 
     # Create scaffold body
-    outer = m3d.Manifold.cylinder(
+    outer = adaptive_cylinder(
         params.height, params.outer_radius, params.outer_radius, 48
     )
-    inner_cut = m3d.Manifold.cylinder(
+    inner_cut = adaptive_cylinder(
         params.height + 0.02, params.inner_radius, params.inner_radius, 48
     ).translate([0, 0, -0.01])
-    body = m3d.Manifold.cylinder(
+    body = adaptive_cylinder(
         params.scaffold_height, params.inner_radius, params.inner_radius, 48
     )
     scaffold_body = (outer - inner_cut) + body
@@ -481,45 +530,51 @@ def generate_vascular_network(
     if progress_callback:
         progress_callback(f"Generating {len(inlet_positions)} inlet trees...")
 
-    channels: List = []
+    if not inlet_positions:
+        return scaffold_body, None, scaffold_body
 
-    # Create branching trees from each inlet
-    for ix, iy in inlet_positions:
-        # Inlet cylinder (vertical channel from top)
-        channels.append(
-            m3d.Manifold.cylinder(
-                params.height - net_top + 0.03,
-                params.inlet_radius,
-                params.inlet_radius,
-                params.resolution
-            ).translate([ix, iy, net_top - 0.01])
-        )
+    # Initial outward angle of each inlet tree
+    out_angles = np.array([
+        np.arctan2(iy, ix)
+        if params.deterministic and (abs(ix) > 0.01 or abs(iy) > 0.01)
+        else rng.uniform(0, 2 * np.pi)
+        for ix, iy in inlet_positions
+    ])
+
+    # Phase 1: branch skeleton of all trees, level by level
+    skeleton = build_vascular_skeleton(
+        inlet_positions, out_angles, params, net_r, net_bot, rng
+    )
 
-        # Calculate initial outward angle
-        if params.deterministic and (abs(ix) > 0.01 or abs(iy) > 0.01):
-            out_ang = np.arctan2(iy, ix)
-        else:
-            out_ang = rng.uniform(0, 2 * np.pi)
-
-        # Generate branching tree
-        _create_branch_recursive(
-            ix, iy, net_top,
-            params.inlet_radius * 1.1,
-            out_ang,
-            params.levels,
-            params, net_r, net_bot, rng,
-            channels,
-            parent_dir=None
+    def inlet_tree(index: int) -> Callable[[], List[Any]]:
+        def build() -> List[Any]:
+            ix, iy = inlet_positions[index]
+            # Inlet cylinder (vertical channel from top)
+            channels = [
+                adaptive_cylinder(
+                    params.height - net_top + 0.03,
+                    params.inlet_radius,
+                    params.inlet_radius,
+                    params.resolution
+                ).translate([ix, iy, net_top - 0.01])
+            ]
+            for i in np.flatnonzero(skeleton.inlet == index):
+                channels.extend(_branch_channels(skeleton, i, params))
+            return channels
+        return build
+
+    if progress_callback:
+        progress_callback(
+            f"Building {len(skeleton)} branches in {len(inlet_positions)} inlet trees..."
         )
 
-    if not channels:
-        return scaffold_body, None, scaffold_body
+    # Phase 2: geometry of each inlet tree, built and unioned in parallel
+    trees = union_groups([inlet_tree(i) for i in range(len(inlet_positions))])
 
     if progress_callback:
-        progress_callback(f"Combining {len(channels)} segments...")
+        progress_callback(f"Combining {len(trees)} inlet trees...")
 
-    # Combine all channel segments
-    combined = batch_union(channels, progress_callback=progress_callback)
+    combined = batch_union(trees, progress_callback=progress_callback)
 
     if progress_callback:
         progress_callback("Finalizing scaffold...")
@@ -2,11 +2,11 @@
 Vascular perfusion dish geometry generator.
 
 Generates branching tree structures with collision detection to avoid
-overlapping branches. Uses spatial hashing and vectorized distance
+overlapping branches. Uses a sorted-key uniform grid and vectorized distance
 calculations for efficient collision avoidance.
 
 Key features:
-- Collision detection with spatial hashing for efficient lookups
+- Collision broad phase on a NumPy uniform grid of segment bounding boxes
 - Vectorized NumPy collision checks
 - Adaptive branch positioning when collisions detected
 - All features from standard vascular network plus:
@@ -18,11 +18,12 @@ Key features:
 """
 
 from __future__ import annotations
-from typing import List, Optional, Tuple, Callable, Dict, Any, Set
+from typing import List, Optional, Tuple, Callable, Dict, Any
 from dataclasses import dataclass, field
 import numpy as np
 
 from .core import batch_union, get_manifold_module
+from .tessellation import adaptive_cylinder, adaptive_sphere
 
 
 # =============================================================================
@@ -31,66 +32,184 @@ from .core import batch_union, get_manifold_module
 
 class SpatialGrid:
     """
-    Spatial hashing grid for efficient collision queries.
-    Uses adaptive cell sizing based on average branch radius.
+    Uniform-grid broad phase over segment bounding boxes.
+
+    Each segment's axis-aligned bounding box, grown by its radius, is
+    rasterised into integer grid cells. The (cell key, branch index) pairs
+    are kept in flat arrays sorted by key, and queries look their own cells
+    up with ``np.searchsorted``; inserting and querying batches of segments
+    runs without Python loops over cells. Two capsules that touch have
+    overlapping boxes and therefore share a cell, so the candidates returned
+    are a superset of the colliding branches.
+
+    New entries go to a small pending buffer that is merged into the sorted
+    arrays once it outgrows a fraction of them, keeping inserts amortised.
     """
 
+    # Cell coordinates are offset by this and packed into 21 bits per axis
+    _KEY_OFFSET = 1 << 20
+    _KEY_BITS = 21
+
     def __init__(self, cell_size: float = 0.5):
         self.cell_size = cell_size
         self.inv_cell_size = 1.0 / cell_size
-        self.grid: Dict[Tuple[int, int, int], List[int]] = {}
+        self.clear()
 
     def clear(self):
-        self.grid.clear()
+        self._keys = np.empty(0, dtype=np.int64)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._pending_keys: List[np.ndarray] = []
+        self._pending_ids: List[np.ndarray] = []
+        self._pending_size = 0
+        self._pending_sorted: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Boxes as inserted, to rebuild the cells when the cell size changes
+        self._boxes: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
 
     def set_cell_size(self, avg_radius: float):
         """Adapt cell size based on average branch radius."""
         optimal = max(0.3, min(1.0, avg_radius * 2.5))
         if abs(optimal - self.cell_size) > 0.1:
+            boxes = self._boxes
             self.cell_size = optimal
             self.inv_cell_size = 1.0 / optimal
-
-    def _cell_key(self, x: float, y: float, z: float) -> Tuple[int, int, int]:
-        """Fast integer cell key computation."""
-        return (
-            int(x * self.inv_cell_size),
-            int(y * self.inv_cell_size),
-            int(z * self.inv_cell_size)
-        )
-
-    def _get_cells(self, start: np.ndarray, end: np.ndarray, radius: float) -> Set[Tuple[int, int, int]]:
-        """Get all cells that a segment passes through."""
-        t_samples = np.array([0.0, 0.33, 0.67, 1.0])
-        direction = end - start
-        points = start + np.outer(t_samples, direction)
-
-        r_cells = int(np.ceil(radius * self.inv_cell_size)) + 1
-        cells = set()
-
-        for p in points:
-            cx = int(p[0] * self.inv_cell_size)
-            cy = int(p[1] * self.inv_cell_size)
-            cz = int(p[2] * self.inv_cell_size)
-            for dx in range(-r_cells, r_cells + 1):
-                for dy in range(-r_cells, r_cells + 1):
-                    for dz in range(-r_cells, r_cells + 1):
-                        cells.add((cx + dx, cy + dy, cz + dz))
-        return cells
+            self.clear()
+            for ids, lo, hi in boxes:
+                self._insert_boxes(ids, lo, hi)
+
+    @staticmethod
+    def _segment_boxes(
+        starts: np.ndarray, ends: np.ndarray, radii: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Bounding boxes (lo, hi) of segments grown by their radii."""
+        starts = np.atleast_2d(np.asarray(starts, dtype=np.float64))
+        ends = np.atleast_2d(np.asarray(ends, dtype=np.float64))
+        pad = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(starts),))[:, None]
+        return np.minimum(starts, ends) - pad, np.maximum(starts, ends) + pad
+
+    def _box_cells(self, lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cells covered by each box.
+
+        Returns:
+            Tuple of (cell keys, index of the box each key belongs to)
+        """
+        limit = self._KEY_OFFSET - 1
+        cell_lo = np.clip(np.floor(lo * self.inv_cell_size), -limit, limit).astype(np.int64)
+        cell_hi = np.clip(np.floor(hi * self.inv_cell_size), -limit, limit).astype(np.int64)
+        dims = cell_hi - cell_lo + 1
+        counts = dims.prod(axis=1)
+
+        owner = np.repeat(np.arange(len(counts)), counts)
+        first = np.cumsum(counts) - counts
+        local = np.arange(int(counts.sum())) - first[owner]
+
+        # Unravel each box's local cell number into (x, y, z) offsets
+        ny, nz = dims[owner, 1], dims[owner, 2]
+        cells = cell_lo[owner] + np.stack([local // (ny * nz), (local // nz) % ny, local % nz], axis=1)
+        cells += self._KEY_OFFSET
+        keys = (cells[:, 0] << (2 * self._KEY_BITS)) | (cells[:, 1] << self._KEY_BITS) | cells[:, 2]
+        return keys, owner
+
+    def _insert_boxes(self, ids: np.ndarray, lo: np.ndarray, hi: np.ndarray):
+        keys, owner = self._box_cells(lo, hi)
+        self._boxes.append((ids, lo, hi))
+        self._pending_keys.append(keys)
+        self._pending_ids.append(ids[owner])
+        self._pending_size += len(keys)
+        self._pending_sorted = None
+        if self._pending_size > max(1024, len(self._keys) // 8):
+            self._merge_pending()
+
+    def _merge_pending(self):
+        keys = np.concatenate([self._keys] + self._pending_keys)
+        ids = np.concatenate([self._ids] + self._pending_ids)
+        order = np.argsort(keys, kind="stable")
+        self._keys, self._ids = keys[order], ids[order]
+        self._pending_keys, self._pending_ids = [], []
+        self._pending_size = 0
+        self._pending_sorted = None
+
+    def _sorted_pending(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Pending (keys, ids) sorted by key, cached until the next insert."""
+        if self._pending_sorted is None:
+            keys = np.concatenate(self._pending_keys)
+            ids = np.concatenate(self._pending_ids)
+            order = np.argsort(keys, kind="stable")
+            self._pending_sorted = (keys[order], ids[order])
+        return self._pending_sorted
+
+    def insert(self, ids: np.ndarray, starts: np.ndarray, ends: np.ndarray, radii: np.ndarray):
+        """
+        Add a batch of branch segments.
+
+        Args:
+            ids: Branch index of each segment (K,)
+            starts: Segment start points (K, 3)
+            ends: Segment end points (K, 3)
+            radii: Segment radii (K,) or a single radius
+        """
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.int64))
+        if len(ids) == 0:
+            return
+        lo, hi = self._segment_boxes(starts, ends, radii)
+        self._insert_boxes(ids, lo, hi)
 
     def add_branch(self, idx: int, start: np.ndarray, end: np.ndarray, radius: float):
         """Add branch to spatial grid."""
-        for cell in self._get_cells(start, end, radius):
-            if cell not in self.grid:
-                self.grid[cell] = []
-            self.grid[cell].append(idx)
-
-    def get_nearby_indices(self, start: np.ndarray, end: np.ndarray, radius: float) -> Set[int]:
+        self.insert(np.array([idx]), start, end, radius)
+
+    @staticmethod
+    def _lookup(
+        keys: np.ndarray, ids: np.ndarray, query_keys: np.ndarray, query_owner: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(query, branch) pairs for every stored entry matching a query key."""
+        left = np.searchsorted(keys, query_keys, side="left")
+        counts = np.searchsorted(keys, query_keys, side="right") - left
+        owner = np.repeat(query_owner, counts)
+        first = np.cumsum(counts) - counts
+        position = np.repeat(left - first, counts) + np.arange(int(counts.sum()))
+        return owner, ids[position]
+
+    def query(
+        self, starts: np.ndarray, ends: np.ndarray, radii: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Candidate branches near a batch of query segments.
+
+        Args:
+            starts: Query segment start points (Q, 3)
+            ends: Query segment end points (Q, 3)
+            radii: Reach of each query (Q,) or a single value; its capsule
+                is tested against the stored segments grown by their radii
+
+        Returns:
+            Tuple of (query indices, branch indices), unique pairs sorted by
+            query and then branch
+        """
+        lo, hi = self._segment_boxes(starts, ends, radii)
+        query_keys, query_owner = self._box_cells(lo, hi)
+
+        owners, branches = [], []
+        if len(self._keys):
+            o, b = self._lookup(self._keys, self._ids, query_keys, query_owner)
+            owners.append(o)
+            branches.append(b)
+        if self._pending_size:
+            o, b = self._lookup(*self._sorted_pending(), query_keys, query_owner)
+            owners.append(o)
+            branches.append(b)
+        if not owners:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        owner = np.concatenate(owners)
+        branch = np.concatenate(branches)
+        stride = int(branch.max(initial=0)) + 1
+        pairs = np.unique(owner * stride + branch)
+        return pairs // stride, pairs % stride
+
+    def get_nearby_indices(self, start: np.ndarray, end: np.ndarray, radius: float) -> np.ndarray:
         """Get indices of branches that might collide."""
-        nearby = set()
-        for cell in self._get_cells(start, end, radius):
-            if cell in self.grid:
-                nearby.update(self.grid[cell])
-        return nearby
+        return self.query(start, end, radius)[1]
 
 
 # =============================================================================
@@ -110,7 +229,6 @@ class BranchTracker:
         self._radii = np.zeros(max_branches, dtype=np.float32)
         self._count = 0
         self.spatial = SpatialGrid(cell_size=0.5)
-        self._t_samples = np.array([0.0, 0.33, 0.67, 1.0], dtype=np.float32)
 
     def clear(self):
         self._count = 0
@@ -151,169 +269,221 @@ class BranchTracker:
 
     def add_curved_branch(self, points: List[Tuple[float, float, float]], radius: float):
         """Add a curve as multiple segments."""
-        for i in range(len(points) - 1):
-            self.add_branch(
-                np.array(points[i], dtype=np.float32),
-                np.array(points[i + 1], dtype=np.float32),
-                radius
-            )
-
-    def _point_to_segments_dist_sq(
-        self, p: np.ndarray, seg_starts: np.ndarray, seg_ends: np.ndarray
-    ) -> np.ndarray:
-        """Vectorized point-to-multiple-segments squared distance."""
-        ab = seg_ends - seg_starts
-        ap = p - seg_starts
-
-        ab_sq = np.sum(ab * ab, axis=1)
-        ab_sq = np.maximum(ab_sq, 1e-10)
-
-        t = np.sum(ap * ab, axis=1) / ab_sq
-        t = np.clip(t, 0.0, 1.0)
+        points = np.asarray(points, dtype=np.float32)
+        n = len(points) - 1
+        if n <= 0:
+            return
+        while self._count + n > self.max_branches:
+            self._expand_arrays()
 
-        closest = seg_starts + t[:, np.newaxis] * ab
-        diff = p - closest
+        ids = np.arange(self._count, self._count + n)
+        self._starts[ids] = points[:-1]
+        self._ends[ids] = points[1:]
+        self._radii[ids] = radius
+        self._count += n
 
-        return np.sum(diff * diff, axis=1)
+        self.spatial.insert(ids, points[:-1], points[1:], radius)
 
+    @staticmethod
     def _segment_distances(
-        self, s1a: np.ndarray, s1b: np.ndarray,
-        candidates_start: np.ndarray, candidates_end: np.ndarray
+        p1: np.ndarray, q1: np.ndarray, p2: np.ndarray, q2: np.ndarray
     ) -> np.ndarray:
-        """Compute distances from one segment to multiple candidates."""
-        n = len(candidates_start)
-        if n == 0:
-            return np.array([], dtype=np.float32)
-
-        d1 = s1b - s1a
-        query_points = s1a + np.outer(self._t_samples, d1)
-        d2 = candidates_end - candidates_start
-
-        min_dists_sq = np.full(n, np.inf, dtype=np.float32)
+        """
+        Exact distances between segment pairs p1-q1 and p2-q2 (all (N, 3)).
+
+        Closest points via the clamped closed form (Ericson, Real-Time
+        Collision Detection, 5.1.9), evaluated for all pairs at once;
+        degenerate (point) segments are handled by the same clamps.
+        """
+        p1 = np.asarray(p1, dtype=np.float64)
+        p2 = np.asarray(p2, dtype=np.float64)
+        d1 = np.asarray(q1, dtype=np.float64) - p1
+        d2 = np.asarray(q2, dtype=np.float64) - p2
+        r = p1 - p2
+
+        a = np.einsum('ij,ij->i', d1, d1)
+        e = np.einsum('ij,ij->i', d2, d2)
+        b = np.einsum('ij,ij->i', d1, d2)
+        c = np.einsum('ij,ij->i', d1, r)
+        f = np.einsum('ij,ij->i', d2, r)
+        eps = 1e-12
+        safe_a = np.maximum(a, eps)
+        safe_e = np.maximum(e, eps)
+
+        # Closest point on the infinite lines, clamped to the first segment;
+        # parallel pairs (zero denominator) start from s = 0
+        denom = a * e - b * b
+        s = np.where(denom > eps * np.maximum(a * e, eps),
+                     np.clip((b * f - c * e) / np.where(denom > 0, denom, 1.0), 0.0, 1.0), 0.0)
+        t = (b * s + f) / safe_e
+
+        # Clamp t to the second segment and recompute s for the clamped end
+        s = np.where(t < 0.0, np.clip(-c / safe_a, 0.0, 1.0),
+                     np.where(t > 1.0, np.clip((b - c) / safe_a, 0.0, 1.0), s))
+        t = np.clip(t, 0.0, 1.0)
 
-        for t in self._t_samples:
-            cand_points = candidates_start + t * d2
-            for qp in query_points:
-                diffs = cand_points - qp
-                dists_sq = np.sum(diffs * diffs, axis=1)
-                min_dists_sq = np.minimum(min_dists_sq, dists_sq)
+        # Point segments
+        s = np.where(a <= eps, 0.0, s)
+        t = np.where(a <= eps, np.clip(f / safe_e, 0.0, 1.0), t)
+        t = np.where(e <= eps, 0.0, t)
+        s = np.where((e <= eps) & (a > eps), np.clip(-c / safe_a, 0.0, 1.0), s)
 
-        for endpoint in [s1a, s1b]:
-            dists_sq = self._point_to_segments_dist_sq(endpoint, candidates_start, candidates_end)
-            min_dists_sq = np.minimum(min_dists_sq, dists_sq)
+        diff = r + d1 * s[:, None] - d2 * t[:, None]
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
 
-        return np.sqrt(min_dists_sq)
+    def _collisions(
+        self, starts: np.ndarray, ends: np.ndarray, radius: float, buffer: float
+    ) -> np.ndarray:
+        """Collision flag (Q,) for each query segment of a batch."""
+        starts = np.asarray(starts, dtype=np.float32).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float32).reshape(-1, 3)
+        hits = np.zeros(len(starts), dtype=bool)
+        if len(starts) == 0 or self._count == 0:
+            return hits
+
+        query, cand = self.spatial.query(starts, ends, radius + buffer)
+        keep = cand < self._count
+        query, cand = query[keep], cand[keep]
+
+        # Filter out parent branches (ending at the query's start)
+        parent = np.sum((starts[query] - self._ends[cand]) ** 2, axis=1) < 0.001
+        query, cand = query[~parent], cand[~parent]
+        if len(query) == 0:
+            return hits
+
+        distances = self._segment_distances(
+            starts[query], ends[query], self._starts[cand], self._ends[cand]
+        )
+        colliding = distances < radius + self._radii[cand] + buffer
+        hits[query[colliding]] = True
+        return hits
 
     def check_collision(
         self, start: np.ndarray, end: np.ndarray, radius: float, buffer: float
-    ) -> bool:
-        """Check if segment collides with existing branches."""
-        start = np.asarray(start, dtype=np.float32)
-        end = np.asarray(end, dtype=np.float32)
-
-        nearby = self.spatial.get_nearby_indices(start, end, radius + buffer)
-        if not nearby:
-            return False
-
-        # Filter out parent branch (ends at our start)
-        indices = []
-        for idx in nearby:
-            if idx < self._count:
-                if np.sum((start - self._ends[idx])**2) < 0.001:
-                    continue
-                indices.append(idx)
-
-        if not indices:
-            return False
-
-        indices = np.array(indices, dtype=np.int32)
-        candidates_start = self._starts[indices]
-        candidates_end = self._ends[indices]
-        candidates_radii = self._radii[indices]
-
-        distances = self._segment_distances(start, end, candidates_start, candidates_end)
-        min_allowed = radius + candidates_radii + buffer
-
-        return np.any(distances < min_allowed)
+    ):
+        """
+        Check if segments collide with existing branches.
+
+        Args:
+            start: Segment start (3,) or a batch of starts (Q, 3)
+            end: Segment end (3,) or a batch of ends (Q, 3)
+            radius: Radius of the query segments
+            buffer: Extra clearance required between branches
+
+        Returns:
+            bool for a single segment, or a bool array (Q,) for a batch
+        """
+        hits = self._collisions(start, end, radius, buffer)
+        return bool(hits[0]) if np.ndim(start) == 1 else hits
+
+    def _curved_paths(
+        self, start: np.ndarray, ends: np.ndarray, curvature: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Straight sub-segments approximating the curved paths from ``start``.
+
+        Returns:
+            Tuple of (sub-segment starts, sub-segment ends, index of the path
+            each sub-segment belongs to); paths shorter than 0.02 have none
+        """
+        delta = ends - start
+        dist = np.linalg.norm(delta, axis=1)
+        n_samples = np.maximum(3, np.minimum(8, (dist / 0.2).astype(np.int64) + int(curvature * 3)))
+        n_samples[dist < 0.02] = 0
+
+        owner = np.repeat(np.arange(len(ends)), n_samples)
+        first = np.cumsum(n_samples) - n_samples
+        step = np.arange(len(owner)) - first[owner]
+
+        def point(t: np.ndarray) -> np.ndarray:
+            bulge = curvature * 0.15 * dist[owner] * np.sin(t * np.pi)
+            p = start + delta[owner] * t[:, None]
+            p[:, 2] -= bulge * 0.5
+            return p
+
+        count = n_samples[owner].astype(np.float32)
+        t0 = (step / count).astype(np.float32)
+        t1 = ((step + 1) / count).astype(np.float32)
+        return point(t0), point(t1), owner
 
     def check_curved_collision(
         self, start: np.ndarray, end: np.ndarray, radius: float,
         buffer: float, curvature: float
-    ) -> bool:
-        """Check collision along a curved path."""
+    ):
+        """
+        Check collision along curved paths from one start point.
+
+        Args:
+            start: Path start (3,)
+            end: Path end (3,) or a batch of ends (K, 3)
+            radius: Branch radius
+            buffer: Extra clearance required between branches
+            curvature: Downward bulge of the path
+
+        Returns:
+            bool for a single path, or a bool array (K,) for a batch
+        """
         start = np.asarray(start, dtype=np.float32)
-        end = np.asarray(end, dtype=np.float32)
-
-        dist = np.linalg.norm(end - start)
-        if dist < 0.02:
-            return False
-
-        n_samples = max(3, min(8, int(dist / 0.2) + int(curvature * 3)))
-        t_vals = np.linspace(0, 1, n_samples + 1, dtype=np.float32)
-        bulge_vals = curvature * 0.15 * dist * np.sin(t_vals * np.pi)
+        ends = np.asarray(end, dtype=np.float32).reshape(-1, 3)
 
-        points_x = start[0] + (end[0] - start[0]) * t_vals
-        points_y = start[1] + (end[1] - start[1]) * t_vals
-        points_z = start[2] + (end[2] - start[2]) * t_vals - bulge_vals * 0.5
-
-        for i in range(n_samples):
-            p1 = np.array([points_x[i], points_y[i], points_z[i]], dtype=np.float32)
-            p2 = np.array([points_x[i+1], points_y[i+1], points_z[i+1]], dtype=np.float32)
-            if self.check_collision(p1, p2, radius, buffer):
-                return True
-
-        return False
+        seg_starts, seg_ends, owner = self._curved_paths(start, ends, curvature)
+        hits = self._collisions(seg_starts, seg_ends, radius, buffer)
+        collides = np.bincount(owner[hits], minlength=len(ends)) > 0
+        return bool(collides[0]) if np.ndim(end) == 1 else collides
 
     def find_safe_position(
         self, start: np.ndarray, base_end: np.ndarray, radius: float,
         rng: np.random.Generator, buffer: float, curvature: float,
         max_attempts: int = 16
     ) -> Tuple[np.ndarray, float]:
-        """Find a position that doesn't collide."""
+        """
+        Find a position that doesn't collide.
+
+        Candidates are, in order of preference: ``base_end``, the same reach
+        rotated by alternating angle offsets of growing size, then random
+        directions at reduced reach. Each stage's candidates are checked in
+        one batched collision query and the first free one is returned.
+        Random angles are only drawn if the rotated candidates all collide.
+
+        Returns:
+            Tuple of (end point, angle offset from the base direction)
+        """
         start = np.asarray(start, dtype=np.float32)
         base_end = np.asarray(base_end, dtype=np.float32)
 
-        if not self.check_curved_collision(start, base_end, radius, buffer, curvature):
-            return base_end, 0.0
-
         dx = base_end[0] - start[0]
         dy = base_end[1] - start[1]
-        dz = base_end[2] - start[2]
-
         horiz_dist = np.sqrt(dx*dx + dy*dy)
+        base_angle = np.arctan2(dy, dx)
+
+        # Base direction first, then alternating offsets +1, -1, +2, -2 steps
+        i = np.arange(max_attempts if horiz_dist >= 0.01 else 0)
+        step = 2 * np.pi / max_attempts
+        offsets = np.concatenate([[0.0], ((i + 2) // 2) * step * np.where(i % 2 == 0, 1, -1)])
+        angles = base_angle + offsets
+        ends = np.empty((len(offsets), 3), dtype=np.float32)
+        ends[0] = base_end
+        ends[1:, 0] = start[0] + horiz_dist * np.cos(angles[1:])
+        ends[1:, 1] = start[1] + horiz_dist * np.sin(angles[1:])
+        ends[1:, 2] = base_end[2]
+
+        free = np.flatnonzero(~self.check_curved_collision(start, ends, radius, buffer, curvature))
+        if len(free):
+            return ends[free[0]], float(offsets[free[0]])
         if horiz_dist < 0.01:
             return base_end, 0.0
 
-        base_angle = np.arctan2(dy, dx)
-        step = 2 * np.pi / max_attempts
+        # Fallback: random directions with reduced spread
+        reach = np.repeat(horiz_dist * np.array([0.55, 0.35]), 4)
+        rand_angles = rng.uniform(0, 2 * np.pi, size=len(reach))
+        ends = np.empty((len(reach), 3), dtype=np.float32)
+        ends[:, 0] = start[0] + reach * np.cos(rand_angles)
+        ends[:, 1] = start[1] + reach * np.sin(rand_angles)
+        ends[:, 2] = base_end[2]
 
-        for i in range(max_attempts):
-            sign = 1 if i % 2 == 0 else -1
-            offset = ((i + 2) // 2) * step * sign
-            new_angle = base_angle + offset
-
-            new_end = np.array([
-                start[0] + horiz_dist * np.cos(new_angle),
-                start[1] + horiz_dist * np.sin(new_angle),
-                base_end[2]
-            ], dtype=np.float32)
-
-            if not self.check_curved_collision(start, new_end, radius, buffer, curvature):
-                return new_end, offset
-
-        # Fallback: try reduced spread
-        for reduction in [0.55, 0.35]:
-            reduced_horiz = horiz_dist * reduction
-            for _ in range(4):
-                rand_angle = rng.uniform(0, 2 * np.pi)
-                new_end = np.array([
-                    start[0] + reduced_horiz * np.cos(rand_angle),
-                    start[1] + reduced_horiz * np.sin(rand_angle),
-                    start[2] + dz
-                ], dtype=np.float32)
-
-                if not self.check_curved_collision(start, new_end, radius, buffer, curvature):
-                    return new_end, rand_angle - base_angle
+        free = np.flatnonzero(~self.check_curved_collision(start, ends, radius, buffer, curvature))
+        if len(free):
+            return ends[free[0]], float(rand_angles[free[0]] - base_angle)
 
         return base_end, 0.0
 
@@ -497,7 +667,7 @@ def _make_single_segment(
     if length < 0.01:
         return None
 
-    cyl = m3d.Manifold.cylinder(length, r2, r1, resolution)
+    cyl = adaptive_cylinder(length, r2, r1, resolution)
 
     h = np.sqrt(dx*dx + dy*dy)
     if h > 0.001 or abs(dz) > 0.001:
@@ -538,7 +708,7 @@ def _make_curved_branch(
         seg = _make_single_segment(m3d, x1, y1, z1, x2, y2, z2, r1, r2, resolution)
         if seg:
             segments.append(seg)
-        sphere = m3d.Manifold.sphere(r2 * 1.05, resolution)
+        sphere = adaptive_sphere(r2 * 1.05, resolution)
         segments.append(sphere.translate([x2, y2, z2]))
         return segments, path_points
 
@@ -558,7 +728,7 @@ def _make_curved_branch(
         segments.append(seg2)
 
     # Junction sphere at midpoint
-    sphere = m3d.Manifold.sphere(mr * 1.05, resolution)
+    sphere = adaptive_sphere(mr * 1.05, resolution)
     segments.append(sphere.translate([mx, my, mz]))
 
     return segments, path_points
@@ -603,7 +773,7 @@ def _make_tips_down_branch(
             )
             if seg:
                 segments.append(seg)
-            sph = m3d.Manifold.sphere(cur_r * 1.02, resolution)
+            sph = adaptive_sphere(cur_r * 1.02, resolution)
             segments.append(sph.translate([pt[0], pt[1], pt[2]]))
 
         path_points.append((pt[0], pt[1], pt[2]))
@@ -653,10 +823,10 @@ def generate_vascular_perfusion_dish(
     res = params.resolution
 
     # Build scaffold body
-    outer = m3d.Manifold.cylinder(height, outer_r, outer_r, 48)
-    inner_cut = m3d.Manifold.cylinder(height + 0.02, inner_r, inner_r, 48).translate([0, 0, -0.01])
+    outer = adaptive_cylinder(height, outer_r, outer_r, 48)
+    inner_cut = adaptive_cylinder(height + 0.02, inner_r, inner_r, 48).translate([0, 0, -0.01])
     ring = outer - inner_cut
-    body = m3d.Manifold.cylinder(scaffold_h, inner_r, inner_r, 48)
+    body = adaptive_cylinder(scaffold_h, inner_r, inner_r, 48)
     scaffold_body = ring + body
 
     # Add bottom section: solid floor + tapered void + rim walls
@@ -666,12 +836,12 @@ def generate_vascular_perfusion_dish(
         br = params.bottom_radius           # inner radius at floor
 
         # Full outer cylinder for bottom section
-        bottom_outer = m3d.Manifold.cylinder(bsh, outer_r, outer_r, 48)
+        bottom_outer = adaptive_cylinder(bsh, outer_r, outer_r, 48)
 
         # Tapered void: from bottom_radius at floor to inner_r at top
         void_h = bsh - bh
         if void_h > 0.01:
-            void_cone = m3d.Manifold.cylinder(void_h + 0.02, br, inner_r, 48)
+            void_cone = adaptive_cylinder(void_h + 0.02, br, inner_r, 48)
             void_cone = void_cone.translate([0, 0, bh - 0.01])
             bottom_section = bottom_outer - void_cone
         else:
@@ -829,7 +999,7 @@ def generate_vascular_perfusion_dish(
         # Continue branching (ensure children have room above bottom)
         child_min_z = net_bot + cr * 1.2
         if remaining_levels > 0 and nz > child_min_z + 0.05:
-            junction = m3d.Manifold.sphere(cr * 1.15, res)
+            junction = adaptive_sphere(cr * 1.15, res)
             channels.append(junction.translate([nx, ny, nz]))
 
             child_angles = []
@@ -881,7 +1051,7 @@ def generate_vascular_perfusion_dish(
             progress_callback(f"Processing inlet {idx + 1}/{len(randomized_inlets)}...")
 
         # Create inlet port
-        port = m3d.Manifold.cylinder(height - net_top + 0.03, params.inlet_radius, params.inlet_radius, res)
+        port = adaptive_cylinder(height - net_top + 0.03, params.inlet_radius, params.inlet_radius, res)
         port = port.translate([ix, iy, net_top - 0.01])
         channels.append(port)
 
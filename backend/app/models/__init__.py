@@ -8,6 +8,7 @@ from .scaffold import (
     PorePattern,
     InnerTexture,
     UnitCell,
+    TPMSSolidMode,
     PrimitiveShape,
     ModificationOperation,
     # Base Parameters
@@ -51,6 +52,7 @@ __all__ = [
     "PorePattern",
     "InnerTexture",
     "UnitCell",
+    "TPMSSolidMode",
     "PrimitiveShape",
     "ModificationOperation",
     # Base Parameters
@@ -96,6 +96,14 @@ class UnitCell(str, Enum):
     BCC = "bcc"
 
 
+class TPMSSolidMode(str, Enum):
+    """TPMS output forms."""
+
+    SURFACE = "surface"
+    SHEET = "sheet"
+    NETWORK = "network"
+
+
 class PrimitiveShape(str, Enum):
     """Primitive shape types."""
 
@@ -1132,6 +1140,14 @@ class GyroidParams(BaseParams):
     samples_per_cell: int = Field(
         default=20, ge=10, le=40, description="Samples per unit cell"
     )
+    solid_mode: TPMSSolidMode = Field(
+        default=TPMSSolidMode.SURFACE,
+        description="Output form: open surface, closed sheet solid or network solid",
+    )
+    adaptive_extraction: bool = Field(
+        default=False,
+        description="Mesh adaptively: fewer triangles on gently curved regions",
+    )
 
 
 class SchwarzPParams(BaseParams):
@@ -1155,6 +1171,14 @@ class SchwarzPParams(BaseParams):
     samples_per_cell: int = Field(
         default=20, ge=10, le=40, description="Samples per unit cell"
     )
+    solid_mode: TPMSSolidMode = Field(
+        default=TPMSSolidMode.SURFACE,
+        description="Output form: open surface, closed sheet solid or network solid",
+    )
+    adaptive_extraction: bool = Field(
+        default=False,
+        description="Mesh adaptively: fewer triangles on gently curved regions",
+    )
 
 
 class OctetTrussParams(BaseParams):
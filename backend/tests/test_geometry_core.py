@@ -0,0 +1,336 @@
+"""
+Tests for the geometry core boolean engine.
+
+Covers the per-request memory budget guard, the slab-wise
+difference fallback used for oversized subtractions, the
+adaptive tessellation policy, memoized generator stages and
+viewer mesh decimation.
+"""
+
+import numpy as np
+import pytest
+import manifold3d as m3d
+
+from app.geometry.core import (
+    batch_union,
+    budgeted_difference,
+    slab_difference,
+    slab_peak_bytes,
+    union_groups,
+)
+from app.geometry.decimation import decimate_mesh
+from app.geometry.stage_cache import StageCache, StagedBuild
+from app.geometry.stl_export import manifold_to_mesh_dict, manifold_to_stl_binary
+from app.geometry.tessellation import (
+    TessellationPolicy,
+    adaptive_cylinder,
+    adaptive_sphere,
+    tessellation_policy,
+)
+from app.geometry.memory_budget import (
+    MemoryBudgetExceeded,
+    default_process_limit_bytes,
+    estimate_boolean_peak_bytes,
+    get_active_budget,
+    memory_budget,
+)
+
+
+@pytest.fixture
+def drilled_block():
+    """Box with a row of cylindrical pores to subtract."""
+    base = m3d.Manifold.cube([10, 4, 2])
+    pores = [
+        m3d.Manifold.cylinder(2.2, 0.4, 0.4, 16).translate([1 + i, 2, -0.1])
+        for i in range(9)
+    ]
+    return base, batch_union(pores)
+
+
+@pytest.fixture
+def pore_row():
+    """Box with a row of cylindrical pores, kept as separate operands."""
+    base = m3d.Manifold.cube([10, 4, 2])
+    pores = [
+        m3d.Manifold.cylinder(2.2, 0.4, 0.4, 16).translate([1 + i, 2, -0.1])
+        for i in range(9)
+    ]
+    return base, pores
+
+
+class TestMemoryBudget:
+    def test_estimate_scales_with_triangles(self):
+        assert estimate_boolean_peak_bytes([1000, 1000]) == 2 * estimate_boolean_peak_bytes([1000])
+
+    def test_disabled_budget_yields_none(self):
+        with memory_budget(0) as budget:
+            assert budget is None
+            assert get_active_budget() is None
+
+    def test_budget_is_scoped_to_context(self):
+        with memory_budget(1024) as budget:
+            assert get_active_budget() is budget
+        assert get_active_budget() is None
+
+    def test_union_over_budget_raises(self):
+        spheres = [m3d.Manifold.sphere(1.0, 64).translate([i * 1.5, 0, 0]) for i in range(4)]
+        with memory_budget(0.001):
+            with pytest.raises(MemoryBudgetExceeded, match="memory budget"):
+                batch_union(spheres)
+
+    def test_union_within_budget_succeeds(self):
+        spheres = [m3d.Manifold.sphere(1.0, 16).translate([i * 1.5, 0, 0]) for i in range(4)]
+        with memory_budget(4096) as budget:
+            result = batch_union(spheres)
+        assert result.volume() > 0
+        assert budget.peak_mb * 2**20 == estimate_boolean_peak_bytes([s.num_tri() for s in spheres])
+
+    def test_other_allocations_are_not_charged(self):
+        spheres = [m3d.Manifold.sphere(1.0, 16).translate([i * 1.5, 0, 0]) for i in range(4)]
+        with memory_budget(1):
+            # Memory held elsewhere in the process (e.g. a concurrent request)
+            ballast = np.ones(64 * 2**20 // 8)
+            assert batch_union(spheres).volume() > 0
+        del ballast
+
+    def test_process_ceiling(self):
+        with memory_budget(4096, process_limit_mb=1) as budget:
+            with pytest.raises(MemoryBudgetExceeded, match="ceiling"):
+                budget.check("union")
+
+    def test_default_process_ceiling(self):
+        with memory_budget(4096) as budget:
+            assert budget.process_limit_bytes == default_process_limit_bytes() > 0
+        with memory_budget(4096, process_limit_mb=-1) as budget:
+            assert budget.process_limit_bytes == 0
+
+
+class TestUnionGroups:
+    @staticmethod
+    def _row(y):
+        return lambda: [m3d.Manifold.sphere(0.6, 16).translate([x, y, 0]) for x in range(4)]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_matches_single_union(self, workers):
+        groups = [self._row(y) for y in range(3)]
+        results = union_groups(groups, max_workers=workers)
+        assert len(results) == 3
+        combined = batch_union(results)
+        expected = batch_union([part for group in groups for part in group()])
+        assert combined.volume() == pytest.approx(expected.volume(), rel=1e-6)
+
+    def test_skips_empty_groups(self):
+        assert len(union_groups([lambda: [], self._row(0)], max_workers=2)) == 1
+
+    def test_workers_see_memory_budget(self):
+        with memory_budget(0.001):
+            with pytest.raises(MemoryBudgetExceeded):
+                union_groups([self._row(0), self._row(1)], max_workers=2)
+
+
+class TestSlabDifference:
+    def test_matches_direct_difference(self, drilled_block):
+        base, cutter = drilled_block
+        direct = base - cutter
+        slabbed = slab_difference(base, cutter, num_slabs=4)
+        assert slabbed.volume() == pytest.approx(direct.volume(), rel=1e-4)
+        assert slabbed.genus() == direct.genus()
+
+    def test_operands_match_direct_difference(self, pore_row):
+        base, pores = pore_row
+        direct = base - batch_union(pores)
+        slabbed = slab_difference(base, pores, num_slabs=4)
+        assert slabbed.volume() == pytest.approx(direct.volume(), rel=1e-4)
+        assert slabbed.genus() == direct.genus()
+
+    def test_slab_peak_charges_only_overlapping_operands(self, pore_row):
+        base, pores = pore_row
+        full = slab_peak_bytes(base, pores, 1)
+        assert slab_peak_bytes(base, pores, 8) < full / 2
+        # A single cutter manifold is trimmed whole in every slab
+        cutter = batch_union(pores)
+        assert slab_peak_bytes(base, cutter, 8) == slab_peak_bytes(base, cutter, 1)
+
+    def test_budgeted_difference_falls_back_to_slabs(self, pore_row):
+        base, pores = pore_row
+        full = slab_peak_bytes(base, pores, 1)
+        with memory_budget(0.9 * full / 2**20) as budget:
+            result = budgeted_difference(base, pores)
+        assert budget.peak_estimate_bytes <= 0.45 * full
+        assert result.volume() == pytest.approx((base - batch_union(pores)).volume(), rel=1e-4)
+
+    def test_budgeted_difference_without_budget(self, drilled_block):
+        base, cutter = drilled_block
+        assert budgeted_difference(base, cutter).volume() == pytest.approx((base - cutter).volume())
+
+    def test_budgeted_difference_fails_cleanly(self, drilled_block):
+        base, cutter = drilled_block
+        with memory_budget(0.0001):
+            with pytest.raises(MemoryBudgetExceeded):
+                budgeted_difference(base, cutter, max_slabs=2)
+
+
+class TestTessellationPolicy:
+    def test_segments_grow_with_radius(self):
+        policy = TessellationPolicy(printer_resolution_um=100.0)
+        small = policy.segments_for_radius(0.1)
+        large = policy.segments_for_radius(20.0)
+        assert small < large
+
+    def test_floor_and_ceiling(self):
+        policy = TessellationPolicy(printer_resolution_um=100.0, min_segments=6, max_segments=64)
+        assert policy.segments_for_radius(0.0075) == 6  # 15 um lacuna
+        assert policy.segments_for_radius(1000.0) == 64
+
+    def test_never_exceeds_requested(self):
+        policy = TessellationPolicy(printer_resolution_um=1.0)
+        assert policy.segments_for_radius(20.0, requested=16) == 16
+
+    def test_chordal_tolerance_respected(self):
+        import math
+        policy = TessellationPolicy(printer_resolution_um=50.0)
+        radius = 2.0
+        n = policy.segments_for_radius(radius)
+        sagitta = radius * (1 - math.cos(math.pi / n))
+        assert sagitta <= policy.chordal_tolerance_mm
+
+    def test_passthrough_without_policy(self):
+        sphere = adaptive_sphere(0.01, 32)
+        assert sphere.num_tri() == m3d.Manifold.sphere(0.01, 32).num_tri()
+
+    def test_policy_reduces_small_feature_triangles(self):
+        with tessellation_policy(TessellationPolicy(printer_resolution_um=100.0)):
+            lacuna = adaptive_cylinder(0.1, 0.0075, 0.0075, 32)
+            body = adaptive_cylinder(2.0, 20.0, 20.0, 32)
+        assert lacuna.num_tri() < m3d.Manifold.cylinder(0.1, 0.0075, 0.0075, 32).num_tri()
+        assert body.num_tri() == m3d.Manifold.cylinder(2.0, 20.0, 20.0, 32).num_tri()
+
+
+class TestStagedBuild:
+    @pytest.fixture
+    def cache(self):
+        return StageCache(max_entries=8)
+
+    def test_unchanged_inputs_reuse_stage(self, cache):
+        calls = []
+
+        def builder(rng):
+            calls.append(1)
+            return m3d.Manifold.cube([1, 1, 1])
+
+        first = StagedBuild("test", seed=1, cache=cache)
+        first.run("body", {"size": 1.0}, builder)
+        second = StagedBuild("test", seed=1, cache=cache)
+        second.run("body", {"size": 1.0}, builder)
+
+        assert len(calls) == 1
+        assert second.summary() == {"rebuilt": [], "reused": ["body"]}
+
+    def test_edit_rebuilds_only_affected_stage(self, cache):
+        def run(channel_count):
+            build = StagedBuild("test", seed=1, cache=cache)
+            build.run("layers", {"thickness": 2.0}, lambda rng: m3d.Manifold.cube([1, 1, 2]))
+            build.run("channels", {"count": channel_count}, lambda rng: m3d.Manifold.cube([1, 1, 1]))
+            return build.summary()
+
+        run(3)
+        summary = run(4)
+        assert summary["rebuilt"] == ["channels"]
+        assert summary["reused"] == ["layers"]
+
+    def test_stage_streams_are_independent(self):
+        build = StagedBuild("test", seed=7)
+        assert build.rng("a").random() == StagedBuild("test", seed=7).rng("a").random()
+        assert build.rng("a").random() != build.rng("b").random()
+
+    def test_policy_is_part_of_key(self, cache):
+        build = StagedBuild("test", seed=1, cache=cache)
+        with tessellation_policy(TessellationPolicy(printer_resolution_um=100.0)):
+            adaptive = StagedBuild("test", seed=1, cache=cache)
+        assert build.key("body", {}) != adaptive.key("body", {})
+
+    def test_lru_eviction(self):
+        cache = StageCache(max_entries=2)
+        for i in range(3):
+            StagedBuild("test", seed=1, cache=cache).run(f"s{i}", {}, lambda rng: i)
+        assert len(cache) == 2
+
+
+def _mesh_arrays(manifold):
+    mesh = manifold.to_mesh()
+    return np.array(mesh.vert_properties)[:, :3], np.array(mesh.tri_verts)
+
+
+class TestDecimation:
+    @pytest.fixture
+    def sphere(self):
+        return m3d.Manifold.sphere(5.0, 128)
+
+    def test_meets_triangle_budget(self, sphere):
+        verts, faces = _mesh_arrays(sphere)
+        _, reduced = decimate_mesh(verts, faces, target_triangles=2000)
+        assert 1900 <= len(reduced) <= 2000
+
+    def test_closed_surface_stays_closed(self, sphere):
+        verts, faces = _mesh_arrays(sphere)
+        verts, faces = decimate_mesh(verts, faces, target_triangles=1000)
+        decimated = m3d.Manifold(m3d.Mesh(
+            vert_properties=verts.astype(np.float32), tri_verts=faces.astype(np.uint32)
+        ))
+        assert decimated.status() == m3d.Error.NoError
+        radii = np.linalg.norm(verts, axis=1)
+        assert radii.min() > 4.9 and radii.max() < 5.05
+
+    def test_error_tolerance_bounds_deviation(self):
+        verts, faces = _mesh_arrays(m3d.Manifold.cube([4, 4, 4]).refine(8))
+        verts, faces = decimate_mesh(verts, faces, max_error_mm=0.01)
+        # Flat faces collapse freely, and every vertex stays on the box
+        assert len(faces) < 100
+        on_face = np.isclose(verts, 0, atol=1e-6) | np.isclose(verts, 4, atol=1e-6)
+        assert on_face.any(axis=1).all()
+        assert verts.min() > -1e-6 and verts.max() < 4 + 1e-6
+
+    def test_open_boundary_is_kept(self):
+        # Square sheet: the outline must survive decimation
+        n = 40
+        grid = np.stack(np.meshgrid(np.linspace(0, 1, n), np.linspace(0, 1, n), indexing="ij"), -1)
+        verts = np.column_stack([grid.reshape(-1, 2), np.zeros(n * n)])
+        i, j = np.meshgrid(np.arange(n - 1), np.arange(n - 1), indexing="ij")
+        v0 = (i * n + j).ravel()
+        faces = np.concatenate([
+            np.column_stack([v0, v0 + n, v0 + 1]),
+            np.column_stack([v0 + 1, v0 + n, v0 + n + 1]),
+        ])
+        verts, faces = decimate_mesh(verts, faces, target_triangles=200)
+        assert len(faces) <= 200
+        assert verts[:, 0].min() == pytest.approx(0) and verts[:, 0].max() == pytest.approx(1)
+        area = np.linalg.norm(np.cross(
+            verts[faces[:, 1]] - verts[faces[:, 0]], verts[faces[:, 2]] - verts[faces[:, 0]]
+        ), axis=1).sum() / 2
+        assert area == pytest.approx(1.0, rel=1e-6)
+
+    def test_time_limit_clusters_to_budget(self, sphere):
+        verts, faces = _mesh_arrays(sphere)
+        verts, faces = decimate_mesh(verts, faces, target_triangles=1000, max_seconds=0)
+        assert 0 < len(faces) <= 1000
+        radii = np.linalg.norm(verts, axis=1)
+        assert radii.min() > 4.5 and radii.max() < 5.05
+
+    def test_requires_a_limit(self, sphere):
+        verts, faces = _mesh_arrays(sphere)
+        with pytest.raises(ValueError, match="target triangle count or an error tolerance"):
+            decimate_mesh(verts, faces)
+
+    def test_viewer_mesh_decimated_stl_full(self, sphere):
+        full = sphere.num_tri()
+        mesh_dict = manifold_to_mesh_dict(sphere, max_triangles=1000)
+        assert mesh_dict["decimated"]
+        assert mesh_dict["triangle_count"] <= 1000
+        assert mesh_dict["source_triangle_count"] == full
+        stl_bytes = manifold_to_stl_binary(sphere)
+        assert int.from_bytes(stl_bytes[80:84], "little") == full
+
+    def test_small_mesh_untouched(self, sphere):
+        mesh_dict = manifold_to_mesh_dict(sphere, max_triangles=sphere.num_tri())
+        assert not mesh_dict["decimated"]
+        assert mesh_dict["triangle_count"] == sphere.num_tri()
@@ -0,0 +1,384 @@
+"""
+Tests for strut lattice generation.
+
+Covers the batched strut builder, the cubic/BCC/FCC lattice generator,
+the octet truss, periodic unit-cell tiling, Voronoi seeding and the Voronoi lattice generator.
+"""
+
+import pytest
+import numpy as np
+import manifold3d as m3d
+from scipy.spatial import Voronoi, cKDTree
+
+from app.geometry.lattice.basic import (
+    LatticeParams,
+    generate_lattice,
+    get_bcc_struts,
+    get_cubic_struts,
+    get_fcc_struts,
+)
+from app.geometry.lattice.octet_truss import (
+    OctetTrussParams,
+    generate_octet_truss,
+    octet_node_valence,
+)
+from app.geometry.lattice.periodic_struts import cell_neighbourhood, tile_unit_cell
+from app.geometry.lattice.seeding import lloyd_relax, mirror_points, poisson_disk_points
+from app.geometry.lattice.struts import build_struts, lattice_graph
+from app.geometry.lattice.voronoi import (
+    VoronoiParams,
+    calculate_gradient_factor,
+    collapse_short_edges,
+    generate_voronoi,
+    get_voronoi_edges,
+    make_strut,
+    seed_count_for_porosity,
+    voronoi_edge_indices,
+)
+
+
+class TestBuildStruts:
+    """Batched strut construction."""
+
+    def test_matches_cylinder_volume(self):
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(0, 5, (20, 3))
+        ends = starts + rng.normal(size=(20, 3))
+        struts = build_struts(starts, ends, 0.2, resolution=16)
+
+        lengths = np.linalg.norm(ends - starts, axis=1)
+        # Inscribed 16-gon area times length
+        expected = 0.5 * 16 * np.sin(2 * np.pi / 16) * 0.2 ** 2 * lengths
+        volumes = [s.volume() for s in struts]
+        assert volumes == pytest.approx(expected, rel=1e-4)
+        assert all(s.status() == m3d.Error.NoError for s in struts)
+
+    def test_axis_aligned_and_degenerate_struts(self):
+        starts = np.zeros((4, 3))
+        ends = np.array([[0, 0, 1.0], [0, 0, -1.0], [1.0, 0, 0], [0, 0, 0]])
+        struts = build_struts(starts, ends, 0.1, resolution=8)
+
+        # The zero-length strut is skipped
+        assert len(struts) == 3
+        for strut, end in zip(struts, ends):
+            lo, hi = np.array(strut.bounding_box()).reshape(2, 3)
+            assert np.allclose((lo + hi) / 2, end / 2, atol=0.1)
+            assert strut.volume() > 0
+
+    def test_profiles(self):
+        starts = np.zeros((2, 3))
+        ends = np.array([[0, 0, 2.0], [0, 2.0, 0]])
+        plain = build_struts(starts, ends, 0.2, resolution=8)
+        tapered = build_struts(starts, ends, 0.2, resolution=8, profile=np.array([1.0, 0.5, 1.0]))
+        per_strut = build_struts(starts, ends, 0.2, resolution=8,
+                                 profile=np.array([[1.0, 0.5, 1.0], [1.0, 1.0, 1.0]]))
+
+        assert tapered[0].volume() < plain[0].volume()
+        assert per_strut[0].volume() == pytest.approx(tapered[0].volume(), rel=1e-5)
+        assert per_strut[1].volume() == pytest.approx(plain[1].volume(), rel=1e-5)
+
+
+class TestLatticeGraph:
+    """Integer-keyed strut enumeration for cubic, BCC and FCC blocks."""
+
+    @pytest.mark.parametrize("get_struts", [get_cubic_struts, get_bcc_struts, get_fcc_struts])
+    def test_single_cell_matches_template(self, get_struts):
+        nodes, struts = lattice_graph(get_struts, (1, 1, 1))
+
+        assert len(struts) == len(get_struts(np.zeros(3), 1.0))
+        assert len(np.unique(nodes, axis=0)) == len(nodes)
+
+    def test_shared_struts_are_merged(self):
+        n = 3
+        nodes, struts = lattice_graph(get_cubic_struts, (n, n, n))
+        assert len(nodes) == (n + 1) ** 3
+        assert len(struts) == 3 * n * (n + 1) ** 2
+
+        nodes, struts = lattice_graph(get_bcc_struts, (n, n, n))
+        assert len(nodes) == (n + 1) ** 3 + n ** 3
+        assert len(struts) == 3 * n * (n + 1) ** 2 + 8 * n ** 3
+
+    def test_fcc_face_centers_shared(self):
+        nodes, struts = lattice_graph(get_fcc_struts, (2, 1, 1))
+
+        # Two cells share the face center at x = 1 cell (2 half-cells)
+        assert len(struts) == 2 * 24 - 4
+        assert [2, 1, 1] in nodes.tolist()
+
+    def test_generate_lattice(self):
+        base = dict(bounding_box_x_mm=4, bounding_box_y_mm=4, bounding_box_z_mm=4,
+                    unit_cell_size_mm=2, lattice_type='bcc')
+        plain, stats = generate_lattice(LatticeParams(**base))
+        tapered, _ = generate_lattice(LatticeParams(**base, strut_taper=0.3))
+        _, node_stats = generate_lattice(LatticeParams(**base, enable_node_spheres=True,
+                                                       enable_gradient_density=True))
+
+        assert stats['strut_count'] == 3 * 2 * 9 + 8 * 8
+        assert 0 < tapered.volume() < plain.volume()
+        assert node_stats['node_count'] == 27 + 8
+
+
+class TestPeriodicTiling:
+    """Unit-cell replication of uniform lattices."""
+
+    def test_tile_unit_cell(self):
+        def lattice(nodes, struts):
+            return sum(build_struts(nodes[struts[:, 0]], nodes[struts[:, 1]], 0.2, 8), m3d.Manifold())
+
+        def build_cell(outer):
+            nodes, struts = cell_neighbourhood(get_bcc_struts, 2.0, 0.4, outer)
+            return lattice(nodes, struts) ^ m3d.Manifold.cube([2.0] * 3)
+
+        block = tile_unit_cell(build_cell, 2.0, (2, 1, 3))
+        nodes, struts = lattice_graph(get_bcc_struts, (2, 1, 3))
+        full = lattice(nodes.astype(float), struts) ^ m3d.Manifold.cube([4.0, 2.0, 6.0])
+
+        assert block.status() == m3d.Error.NoError
+        assert block.volume() == pytest.approx(full.volume(), rel=1e-9)
+        assert np.allclose(np.array(block.bounding_box()).reshape(2, 3), [[0, 0, 0], [4, 2, 6]])
+        # One connected lattice
+        assert len(block.decompose()) == 1
+
+    def test_interior_cell_ignores_outer_faces(self):
+        nodes, struts = cell_neighbourhood(get_cubic_struts, 1.0, 0.2)
+        outer_nodes, outer_struts = cell_neighbourhood(get_cubic_struts, 1.0, 0.2, ((True, False),) * 3)
+
+        # Interior cell: the cell's 12 edges and the 3 struts leaving each corner
+        assert len(struts) == 12 + 3 * 8
+        # Low faces outer: corners keep the struts leaving through high faces
+        assert len(outer_struts) == 12 + 3 + 3 * 2 + 3 * 1
+        assert outer_nodes.min() == 0
+
+    @pytest.mark.parametrize("extra", [
+        dict(lattice_type='cubic'),
+        dict(lattice_type='fcc', enable_node_spheres=True),
+        dict(lattice_type='bcc', strut_taper=0.3),
+        # Struts reaching exactly to the middle of the cell
+        dict(lattice_type='bcc', strut_diameter_mm=2.0),
+        dict(lattice_type='cubic', strut_profile='square', strut_diameter_mm=1.4),
+    ])
+    def test_lattice_matches_full_build(self, extra):
+        base = dict(bounding_box_x_mm=12, bounding_box_y_mm=2, bounding_box_z_mm=2,
+                    unit_cell_size_mm=2, **extra)
+        tiled, stats = generate_lattice(LatticeParams(**base))
+        # A partial cell disables tiling; the extra slice is clipped off
+        full, full_stats = generate_lattice(LatticeParams(**base | dict(bounding_box_x_mm=12.5)))
+
+        assert stats['periodic_cell_tiling']
+        assert not full_stats['periodic_cell_tiling']
+        assert tiled.volume() == pytest.approx((full ^ m3d.Manifold.cube([12, 2, 2])).volume(), rel=1e-6)
+
+    def test_default_struts_tile_large_block(self):
+        params = LatticeParams(bounding_box_x_mm=20, bounding_box_y_mm=20, bounding_box_z_mm=20,
+                               unit_cell_size_mm=1)
+        result, stats = generate_lattice(params)
+
+        assert stats['periodic_cell_tiling']
+        assert result.volume() > 0
+
+    def test_octet_truss(self):
+        base = dict(bounding_box_x_mm=30, bounding_box_y_mm=5, bounding_box_z_mm=5,
+                    unit_cell_edge_mm=5, strut_diameter_mm=0.8, enable_node_spheres=True,
+                    node_fillet_radius_mm=0.4)
+        tiled, stats = generate_octet_truss(OctetTrussParams(**base))
+        full, full_stats = generate_octet_truss(OctetTrussParams(**base, enable_gradient=True,
+                                                                 gradient_start_density=0.5,
+                                                                 gradient_end_density=0.5))
+
+        assert stats['periodic_cell_tiling']
+        assert not full_stats['periodic_cell_tiling']
+        assert tiled.volume() == pytest.approx(full.volume(), rel=1e-6)
+
+
+class TestOctetTruss:
+    """Octet truss built from the integer lattice graph."""
+
+    def test_graph_counts(self):
+        _, stats = generate_octet_truss(OctetTrussParams(bounding_box_x_mm=10, bounding_box_y_mm=5,
+                                                         bounding_box_z_mm=5, unit_cell_edge_mm=5))
+
+        # 48 struts and 14 nodes per cell; the shared face has 8 struts and 5 nodes
+        assert stats['strut_count'] == 2 * 48 - 8
+        assert stats['node_count'] == 2 * 14 - 5
+
+    def test_full_node_valence(self):
+        corners = np.array([[0, 0, 0], [2, -4, 6]])
+        face_centers = np.array([[1, 1, 0], [0, 1, 1], [-1, 2, 3]])
+
+        assert octet_node_valence(corners).tolist() == [18, 18]
+        assert octet_node_valence(face_centers).tolist() == [12, 12, 12]
+
+    def test_node_spheres_sized_by_valence(self):
+        base = dict(bounding_box_x_mm=5, bounding_box_y_mm=5, bounding_box_z_mm=5,
+                    unit_cell_edge_mm=5, strut_diameter_mm=1.0, enable_node_spheres=True)
+        # Probe 0.9 mm above the bottom face center, clear of its struts; that
+        # node joins 8 of 12 struts, so its sphere is 1 + (factor - 1) * 2/3 strut radii
+        probe = m3d.Manifold.cube([0.04] * 3, center=True).translate([2.5, 2.5, 0.9])
+        small, _ = generate_octet_truss(OctetTrussParams(**base, node_sphere_factor=2.0))
+        large, _ = generate_octet_truss(OctetTrussParams(**base, node_sphere_factor=2.4))
+
+        assert (small ^ probe).is_empty()
+        assert not (large ^ probe).is_empty()
+
+    def test_taper_and_roughness(self):
+        base = dict(bounding_box_x_mm=5, bounding_box_y_mm=5, bounding_box_z_mm=5,
+                    unit_cell_edge_mm=5, seed=3)
+        plain, _ = generate_octet_truss(OctetTrussParams(**base))
+        tapered, _ = generate_octet_truss(OctetTrussParams(**base, strut_taper=0.3))
+        rough, _ = generate_octet_truss(OctetTrussParams(**base, strut_taper=0.3,
+                                                         strut_surface_roughness=50))
+        again, _ = generate_octet_truss(OctetTrussParams(**base, strut_taper=0.3,
+                                                         strut_surface_roughness=50))
+
+        assert 0 < tapered.volume() < plain.volume()
+        assert rough.volume() != pytest.approx(tapered.volume(), rel=1e-9)
+        assert rough.volume() == again.volume()
+
+
+class TestSeeding:
+    """Voronoi seed distributions."""
+
+    def test_poisson_disk_spacing(self):
+        rng = np.random.default_rng(0)
+        points = poisson_disk_points((5, 5, 5), 200, rng, radius=0.6)
+
+        assert len(points) == 200
+        assert points.min() >= 0 and points.max() <= 5
+        spacing, _ = cKDTree(points).query(points, 2)
+        assert spacing[:, 1].min() >= 0.6
+
+    def test_poisson_disk_stops_when_full(self):
+        rng = np.random.default_rng(0)
+        points = poisson_disk_points((1, 1, 1), 1000, rng, radius=0.5)
+
+        assert 0 < len(points) < 1000
+
+    def test_lloyd_evens_spacing(self):
+        rng = np.random.default_rng(1)
+        points = rng.uniform(0, 5, (150, 3))
+        relaxed = lloyd_relax(points, (5, 5, 5), iterations=4, rng=rng)
+
+        before, _ = cKDTree(points).query(points, 2)
+        after, _ = cKDTree(relaxed).query(relaxed, 2)
+        assert relaxed.min() >= 0 and relaxed.max() <= 5
+        assert after[:, 1].min() > before[:, 1].min()
+        assert after[:, 1].std() < before[:, 1].std()
+
+    def test_mirror_points(self):
+        points = np.array([[0.5, 2.0, 2.0], [3.5, 3.6, 2.0]])
+        mirrors = mirror_points(points, (4, 4, 4), threshold=1.0)
+
+        expected = [[-0.5, 2.0, 2.0], [4.5, 3.6, 2.0], [3.5, 4.4, 2.0]]
+        assert np.allclose(mirrors, expected)
+
+
+class TestVoronoiEdges:
+    """Vectorized Voronoi edge extraction."""
+
+    @pytest.fixture
+    def vor(self):
+        rng = np.random.default_rng(3)
+        return Voronoi(rng.uniform(0, 5, (60, 3)))
+
+    def test_edges_are_unique_ridge_edges(self, vor):
+        edges = voronoi_edge_indices(vor)
+
+        # The loop this replaced: first two vertices of each finite ridge
+        expected = set()
+        for ridge in vor.ridge_vertices:
+            if -1 not in ridge:
+                expected.add((min(ridge[:2]), max(ridge[:2])))
+        assert set(map(tuple, edges.tolist())) == expected
+        assert len(edges) == len(expected)
+
+    def test_all_edges_are_unique_polygon_edges(self, vor):
+        edges = voronoi_edge_indices(vor, all_edges=True)
+
+        expected = set()
+        for ridge in vor.ridge_vertices:
+            for a, b in zip(ridge, ridge[1:] + ridge[:1]):
+                if a >= 0 and b >= 0:
+                    expected.add((min(a, b), max(a, b)))
+        assert set(map(tuple, edges.tolist())) == expected
+        assert len(edges) == len(expected)
+
+    def test_edges_clipped_and_filtered(self, vor):
+        bbox = (5.0, 5.0, 5.0)
+        starts, ends = get_voronoi_edges(vor, bbox, margin=0.05, min_strut_length=0.2)
+
+        assert len(starts) > 0
+        assert starts.min() >= 0 and ends.max() <= 5.0
+        assert np.linalg.norm(ends - starts, axis=1).min() >= 0.2
+
+    def test_collapse_short_edges(self):
+        # A square with one tiny edge between vertices 1 and 2
+        vertices = np.array([[0, 0, 0], [1, 0, 0], [1, 0.01, 0], [0, 1, 0]], dtype=float)
+        edges = np.array([[0, 1], [1, 2], [2, 3], [0, 3]])
+        merged, kept = collapse_short_edges(vertices, edges, 0.1)
+
+        assert len(kept) == 3
+        lengths = np.linalg.norm(merged[kept[:, 1]] - merged[kept[:, 0]], axis=1)
+        assert lengths.min() > 0.9
+        assert [1, 0.005, 0] in merged.tolist()
+
+    def test_gradient_factor_batch_matches_single(self):
+        rng = np.random.default_rng(1)
+        p1 = rng.uniform(0, 4, (10, 3))
+        p2 = rng.uniform(0, 4, (10, 3))
+        for direction in ('x', 'z', 'radial'):
+            batch = calculate_gradient_factor(p1, p2, (4, 4, 4), direction, 0.2, 0.8)
+            single = [calculate_gradient_factor(a, b, (4, 4, 4), direction, 0.2, 0.8)
+                      for a, b in zip(p1, p2)]
+            assert batch == pytest.approx(single)
+
+
+class TestVoronoi:
+    """Voronoi lattice generator."""
+
+    def test_generate(self):
+        params = VoronoiParams(bounding_box_x_mm=4, bounding_box_y_mm=4, bounding_box_z_mm=4,
+                               seed_count=30, seed=7)
+        result, stats = generate_voronoi(params)
+
+        assert result.volume() > 0
+        assert stats['strut_count'] > 0
+        assert 0 < stats['relative_density'] < 1
+
+    def test_all_ridge_edges_seed_count_gives_target_porosity(self):
+        params = VoronoiParams(
+            bounding_box_x_mm=6.0, bounding_box_y_mm=6.0, bounding_box_z_mm=6.0,
+            target_porosity=0.7, strut_diameter_mm=0.5, seed=1, all_ridge_edges=True
+        )
+        _, stats = generate_voronoi(params)
+
+        assert stats['seed_count'] == seed_count_for_porosity(216.0, 0.7, 0.25)
+        assert stats['porosity'] == pytest.approx(0.7, abs=0.03)
+
+    def test_taper_and_roughness(self):
+        base = dict(bounding_box_x_mm=4, bounding_box_y_mm=4, bounding_box_z_mm=4,
+                    seed_count=30, seed=7)
+        plain, _ = generate_voronoi(VoronoiParams(**base))
+        tapered, _ = generate_voronoi(VoronoiParams(**base, strut_taper=0.5))
+        rough, stats = generate_voronoi(VoronoiParams(
+            **base, enable_strut_roughness=True, strut_roughness_amplitude=0.02))
+
+        assert tapered.volume() < plain.volume()
+        assert rough.volume() > 0
+        assert stats['roughness_enabled']
+
+    def test_poisson_lloyd_seeding(self):
+        params = VoronoiParams(bounding_box_x_mm=4, bounding_box_y_mm=4, bounding_box_z_mm=4,
+                               seed_count=30, seed=7, seed_distribution='poisson',
+                               lloyd_iterations=2)
+        result, stats = generate_voronoi(params)
+
+        assert result.volume() > 0
+        assert stats['seed_distribution'] == 'poisson'
+
+        with pytest.raises(ValueError, match="seed distribution"):
+            generate_voronoi(VoronoiParams(seed_count=30, seed_distribution='grid'))
+
+    def test_make_strut(self):
+        strut = make_strut(np.zeros(3), np.array([1.0, 1.0, 0.0]), 0.1, 8, taper=0.3)
+        assert strut.volume() > 0
+        assert make_strut(np.zeros(3), np.zeros(3), 0.1, 8).is_empty()
@@ -27,6 +27,9 @@ from app.geometry.primitives import (
     generate_primitive,
     generate_primitive_from_dict,
     PrimitiveParams,
+    get_subtree_cache,
+    optimize_csg_tree,
+    format_csg_tree,
 )
 
 
@@ -276,6 +279,140 @@ class TestCSGTree:
         # Intersection should be 5*5*5 = 125
         assert abs(result.volume() - 125) < 1
 
+    def test_csg_difference_multiple_cutters(self):
+        """Difference should subtract every cutter after the first child."""
+        box = {"primitive": "box", "dims": {"x_mm": 10, "y_mm": 10, "z_mm": 10}}
+        cutters = [
+            {"primitive": "box", "dims": {"x_mm": 2, "y_mm": 2, "z_mm": 12},
+             "transforms": [{"type": "translate", "x": x, "y": 0, "z": 0}]}
+            for x in (-3, 0, 3)
+        ]
+        result = evaluate_csg_tree({"op": "difference", "children": [box] + cutters})
+
+        # Three disjoint 2x2x10 channels removed
+        assert abs(result.volume() - (1000 - 3 * 40)) < 1
+
+    def test_csg_parallel_matches_sequential(self):
+        """Parallel evaluation of operation children gives the same result."""
+        def block(x):
+            return {
+                "op": "difference",
+                "children": [
+                    {"primitive": "box", "dims": {"x_mm": 4, "y_mm": 4, "z_mm": 4}},
+                    {"primitive": "sphere", "dims": {"radius_mm": 2}},
+                ],
+                "transforms": [{"type": "translate", "x": x, "y": 0, "z": 0}],
+            }
+        tree = {"op": "union", "children": [block(0), block(5), block(10)]}
+
+        sequential = evaluate_csg_tree(tree, max_workers=1, use_cache=False)
+        parallel = evaluate_csg_tree(tree, max_workers=3, use_cache=False)
+        assert abs(parallel.volume() - sequential.volume()) < 1e-6
+
+    def test_csg_identical_subtrees_memoized(self):
+        """Identical subtrees are reused within and across evaluations."""
+        cache = get_subtree_cache()
+        cache.clear()
+        hole = {"primitive": "cylinder", "dims": {"radius_mm": 1, "height_mm": 12}}
+        tree = {
+            "op": "difference",
+            "children": [
+                {"primitive": "box", "dims": {"x_mm": 10, "y_mm": 10, "z_mm": 10}},
+                hole,
+                dict(hole),
+            ],
+        }
+        evaluate_csg_tree(tree)
+        misses = cache.misses
+        evaluate_csg_tree(tree)
+
+        # The duplicate hole never reaches the shared cache; the rerun is all hits
+        assert misses == 3
+        assert cache.misses == misses
+        assert cache.hits == 3
+
+
+def _box(size, x=0.0, y=0.0, z=0.0):
+    return {"primitive": "box", "dims": {"x_mm": size, "y_mm": size, "z_mm": size},
+            "transforms": [{"type": "translate", "x": x, "y": y, "z": z}]}
+
+
+def _unit_bounds(leaf):
+    """Bounds of a translated box leaf without building geometry."""
+    half = leaf["dims"]["x_mm"] / 2
+    offset = [sum(t.get(axis, 0.0) for t in leaf.get("transforms", [])) for axis in "xyz"]
+    return tuple([c - half for c in offset] + [c + half for c in offset])
+
+
+class TestCSGOptimizer:
+    """Test the CSG optimizer pass."""
+
+    def test_flattens_nested_unions(self):
+        """Nested unions collapse into a single n-ary union."""
+        tree = {"op": "union", "children": [
+            {"op": "union", "children": [_box(2), _box(2, x=3)]},
+            _box(2, x=6),
+        ]}
+        optimized = optimize_csg_tree(tree, _unit_bounds)
+
+        assert optimized["op"] == "union"
+        assert len(optimized["children"]) == 3
+
+    def test_folds_transforms_into_leaves(self):
+        """Operation transforms move to the leaves without changing geometry."""
+        tree = {"op": "union", "children": [_box(2), _box(2, x=3)],
+                "transforms": [{"type": "translate", "x": 10, "y": 0, "z": 0}]}
+        optimized = optimize_csg_tree(tree, _unit_bounds)
+
+        assert "transforms" not in optimized
+        assert all(len(child["transforms"]) == 2 for child in optimized["children"])
+        assert evaluate_csg_tree(tree).bounding_box() == pytest.approx(
+            evaluate_csg_tree(tree, optimize=False).bounding_box())
+
+    def test_prunes_disjoint_intersection(self):
+        """Intersecting boxes that never meet is provably empty."""
+        tree = {"op": "union", "children": [
+            _box(2),
+            {"op": "intersection", "children": [_box(2, x=10), _box(2, x=20)]},
+        ]}
+        optimized = optimize_csg_tree(tree, _unit_bounds)
+
+        assert optimized == _box(2)
+
+    def test_prunes_non_overlapping_cutters(self):
+        """Cutters that miss the base are dropped from a difference."""
+        tree = {"op": "difference", "children": [_box(4), _box(1), _box(1, x=50)]}
+        optimized = optimize_csg_tree(tree, _unit_bounds)
+
+        assert optimized["children"] == [_box(4), _box(1)]
+
+    def test_optimized_matches_unoptimized(self):
+        """Optimization preserves the evaluated volume of a messy tree."""
+        tree = {"op": "difference", "children": [
+            {"op": "difference", "children": [_box(10), _box(2, x=-3)]},
+            {"op": "union", "children": [_box(2, x=3), _box(2, x=40)]},
+            {"op": "intersection", "children": [_box(4, z=30), _box(4, y=30)]},
+        ]}
+        optimized = evaluate_csg_tree(tree, use_cache=False)
+        direct = evaluate_csg_tree(tree, use_cache=False, optimize=False)
+
+        assert abs(optimized.volume() - direct.volume()) < 1e-6
+        assert abs(optimized.volume() - (1000 - 2 * 8)) < 1e-6
+
+    def test_fully_empty_tree(self):
+        """A provably empty tree evaluates to an empty manifold."""
+        tree = {"op": "intersection", "children": [_box(2), _box(2, x=10)]}
+        assert evaluate_csg_tree(tree).is_empty()
+
+    def test_format_csg_tree(self):
+        """Debug dump renders one indented line per node."""
+        text = format_csg_tree({"op": "union", "children": [_box(2), _box(2, x=3)]})
+        lines = text.splitlines()
+
+        assert lines[0] == "union"
+        assert len(lines) == 3
+        assert all(line.startswith("  box") for line in lines[1:])
+
 
 class TestLegacyAPI:
     """Test backwards compatibility with legacy API."""
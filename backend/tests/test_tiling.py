@@ -18,7 +18,9 @@ from app.geometry.tiling import (
     tile_scaffold_onto_surface,
     TilingParams,
     TilingMode,
+    RefinementMode,
     TargetShape,
+    get_flat_sheet_cache,
 )
 from app.geometry.tiling.surfaces import (
     SphereParams,
@@ -33,6 +35,8 @@ from app.geometry.tiling.surfaces import (
     make_superellipsoid_warp,
     sphere_normals,
 )
+from app.geometry.tiling.core import _tile_flat, _tile_flat_welded
+from app.geometry.tiling.refinement import max_chord_error, refine_for_warp, _unique_edges
 from app.geometry.stl_export import manifold_to_stl_binary, manifold_to_mesh_dict
 
 
@@ -54,6 +58,14 @@ def tube_scaffold():
     return outer - inner
 
 
+@pytest.fixture
+def perforated_scaffold():
+    """Plate with a through hole; every side face is a full rectangle."""
+    plate = m3d.Manifold.cube([2, 2, 1], True)
+    hole = m3d.Manifold.cylinder(2.0, 0.5, 0.5, circular_segments=16).translate([0, 0, -1])
+    return plate - hole
+
+
 # ---------------------------------------------------------------------------
 # Surface warp function tests
 # ---------------------------------------------------------------------------
@@ -138,6 +150,146 @@ class TestSphereNormals:
 # Core tiling tests
 # ---------------------------------------------------------------------------
 
+class TestFlatTiling:
+    def test_welded_sheet_is_one_solid(self, box_scaffold):
+        """Abutting boxes weld into a single box without a boolean union."""
+        sheet = _tile_flat_welded(box_scaffold, 3, 4)
+        assert sheet is not None
+        assert sheet.status() == m3d.Error.NoError
+        assert sheet.volume() == pytest.approx(12 * box_scaffold.volume())
+        assert sheet.genus() == 0
+        assert len(sheet.decompose()) == 1
+        np.testing.assert_allclose(sheet.bounding_box(), (-3, -4, 0, 3, 4, 0.5), atol=1e-6)
+
+    def test_welded_sheet_matches_union(self, perforated_scaffold):
+        welded = _tile_flat(perforated_scaffold, 4, 3)
+        union = _tile_flat(perforated_scaffold, 4, 3, weld_seams=False)
+        assert welded.volume() == pytest.approx(union.volume(), rel=1e-6)
+        assert welded.genus() == union.genus() == 12
+        np.testing.assert_allclose(welded.bounding_box(), union.bounding_box(), atol=1e-6)
+
+    def test_edge_contacts_stay_separate(self, tube_scaffold):
+        """Tubes only touch along lines; nothing is dropped or merged."""
+        sheet = _tile_flat_welded(tube_scaffold, 2, 2)
+        assert sheet is not None
+        assert sheet.num_tri() == 4 * tube_scaffold.num_tri()
+        assert sheet.volume() == pytest.approx(4 * tube_scaffold.volume(), rel=1e-6)
+
+    def test_mismatched_faces_fall_back_to_union(self):
+        """A notch on one side leaves opposite faces that don't line up."""
+        notched = m3d.Manifold.cube([2, 2, 1]) - m3d.Manifold.cube([0.5, 2, 0.5]).translate([1.5, 0, 0.5])
+        assert _tile_flat_welded(notched, 3, 1) is None
+        tiled = _tile_flat(notched, 3, 1)
+        assert tiled.volume() == pytest.approx(3 * notched.volume())
+
+    def test_tiling_result_independent_of_seam_welding(self, perforated_scaffold):
+        params = dict(target_shape=TargetShape.CYLINDER, radius=10.0, height=6.0,
+                      num_tiles_u=6, num_tiles_v=3, refine_edge_length_mm=1.0)
+        welded, _ = tile_scaffold_onto_surface(perforated_scaffold, TilingParams(**params))
+        union, _ = tile_scaffold_onto_surface(
+            perforated_scaffold, TilingParams(weld_seams=False, **params)
+        )
+        assert welded.volume() == pytest.approx(union.volume(), rel=0.01)
+
+
+class TestFlatSheetCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        get_flat_sheet_cache().clear()
+        yield
+        get_flat_sheet_cache().clear()
+
+    def test_surface_change_reuses_sheet(self, box_scaffold):
+        """Changing only the target radius re-warps the cached sheet."""
+        params = TilingParams(radius=10.0, num_tiles_u=3, num_tiles_v=3, refine_edge_length_mm=1.0)
+        _, first = tile_scaffold_onto_surface(box_scaffold, params, scaffold_id="box")
+        params.radius = 14.0
+        cached, second = tile_scaffold_onto_surface(box_scaffold, params, scaffold_id="box")
+        fresh, _ = tile_scaffold_onto_surface(box_scaffold, params)
+
+        assert not first["flat_sheet_cached"]
+        assert second["flat_sheet_cached"]
+        assert cached.num_tri() == fresh.num_tri()
+        assert cached.volume() == pytest.approx(fresh.volume())
+
+    def test_sheet_inputs_are_part_of_key(self, box_scaffold):
+        params = TilingParams(num_tiles_u=3, num_tiles_v=3, refine_edge_length_mm=1.0)
+        tile_scaffold_onto_surface(box_scaffold, params, scaffold_id="box")
+        params.refine_edge_length_mm = 0.8
+        _, stats = tile_scaffold_onto_surface(box_scaffold, params, scaffold_id="box")
+        assert not stats["flat_sheet_cached"]
+        params.num_tiles_v = 4
+        _, stats = tile_scaffold_onto_surface(box_scaffold, params, scaffold_id="box")
+        assert not stats["flat_sheet_cached"]
+
+    def test_no_caching_without_scaffold_id(self, box_scaffold):
+        params = TilingParams(num_tiles_u=2, num_tiles_v=2, refine_edge_length_mm=1.0)
+        tile_scaffold_onto_surface(box_scaffold, params)
+        _, stats = tile_scaffold_onto_surface(box_scaffold, params)
+        assert not stats["flat_sheet_cached"]
+        assert len(get_flat_sheet_cache()) == 0
+
+
+def _mesh_arrays(manifold):
+    mesh = manifold.to_mesh()
+    return (np.asarray(mesh.vert_properties, dtype=np.float64)[:, :3],
+            np.asarray(mesh.tri_verts, dtype=np.int64))
+
+
+class TestAdaptiveRefinement:
+    def test_refined_sheet_is_closed_and_unchanged(self):
+        """Splitting edges adds vertices on the flat geometry only."""
+        sheet = m3d.Manifold.cube([2.0, 1.0, 0.2])
+        verts, faces = _mesh_arrays(sheet)
+        warp = make_sphere_warp(SphereParams(radius=5.0))
+        verts, faces = refine_for_warp(verts, faces, [warp], tolerance=0.01)
+        refined = m3d.Manifold(m3d.Mesh(
+            vert_properties=verts.astype(np.float32), tri_verts=faces.astype(np.uint32)
+        ))
+        assert refined.status() == m3d.Error.NoError
+        assert refined.num_tri() > sheet.num_tri()
+        assert refined.volume() == pytest.approx(sheet.volume(), rel=1e-5)
+        assert max_chord_error(verts, faces, [warp]) <= 0.01
+
+    def test_linear_warp_needs_no_refinement(self):
+        verts, faces = _mesh_arrays(m3d.Manifold.cube([2.0, 1.0, 0.2]))
+        refined, _ = refine_for_warp(verts, faces, [lambda v: v * 3.0 + 1.0], tolerance=1e-6)
+        assert len(refined) == len(verts)
+
+    def test_cylinder_axis_is_not_split(self):
+        """The cylinder warp is straight along v; edges along it stay whole."""
+        verts, faces = _mesh_arrays(m3d.Manifold.cube([2.0, 10.0, 0.2]))
+        warp = make_cylinder_warp(CylinderParams(radius=10.0, height=10.0))
+        verts, faces = refine_for_warp(verts, faces, [warp], tolerance=0.01)
+        edges, _ = _unique_edges(faces)
+        span = np.abs(verts[edges[:, 0]] - verts[edges[:, 1]])
+        along_v = (span[:, 0] < 1e-9) & (span[:, 2] < 1e-9)
+        assert np.any(along_v & (span[:, 1] > 10.0 - 1e-9))
+        assert span[:, 0].max() < 2.0
+
+    def test_fewer_triangles_than_uniform_at_same_accuracy(self, box_scaffold):
+        base = dict(target_shape=TargetShape.CYLINDER, radius=10.0, height=20.0,
+                    num_tiles_u=8, num_tiles_v=4)
+        uniform, _ = tile_scaffold_onto_surface(
+            box_scaffold, TilingParams(refine_edge_length_mm=0.125, **base)
+        )
+        adaptive, stats = tile_scaffold_onto_surface(
+            box_scaffold,
+            TilingParams(refinement=RefinementMode.ADAPTIVE, refine_tolerance_mm=0.01,
+                         refine_edge_length_mm=0.0, **base),
+        )
+        assert stats["refinement"] == "adaptive"
+        assert adaptive.status() == m3d.Error.NoError
+        assert adaptive.num_tri() < uniform.num_tri() / 2
+        assert adaptive.volume() == pytest.approx(uniform.volume(), rel=1e-3)
+
+    def test_triangle_limit(self):
+        verts, faces = _mesh_arrays(m3d.Manifold.cube([6.0, 3.0, 0.2]))
+        warp = make_sphere_warp(SphereParams(radius=1.0))
+        with pytest.raises(ValueError, match="refine_tolerance_mm"):
+            refine_for_warp(verts, faces, [warp], tolerance=1e-5, max_triangles=1000)
+
+
 class TestTileOntoSphere:
     def test_basic_sphere_tiling(self, box_scaffold):
         """Box scaffold should tile onto a sphere."""
@@ -245,6 +397,61 @@ class TestVolumeFilling:
         assert volume_stats["triangle_count"] > surface_stats["triangle_count"]
         assert volume_stats["num_layers"] == 2
 
+    def test_separated_layers_are_concatenated(self, box_scaffold):
+        """Layers spaced wider than the sheet is thick skip the boolean union."""
+        params = TilingParams(
+            target_shape=TargetShape.SPHERE,
+            radius=10.0,
+            mode=TilingMode.VOLUME,
+            num_tiles_u=4,
+            num_tiles_v=3,
+            num_layers=3,
+            layer_spacing_mm=1.5,
+            refine_edge_length_mm=0.25,
+        )
+        result, stats = tile_scaffold_onto_surface(box_scaffold, params)
+        assert stats["layer_combine"] == "concatenated"
+        assert result.status() == m3d.Error.NoError
+        assert len(result.decompose()) == 3
+
+        # Shells of one flat sheet at radial offsets: volume adds up per layer
+        single, single_stats = tile_scaffold_onto_surface(
+            box_scaffold, TilingParams(**{**params.__dict__, "mode": TilingMode.SURFACE})
+        )
+        assert single_stats["layer_combine"] is None
+        assert stats["volume_mm3"] > 2.5 * single_stats["volume_mm3"]
+
+    def test_overlapping_layers_are_unioned(self, box_scaffold):
+        params = TilingParams(
+            target_shape=TargetShape.SPHERE,
+            radius=10.0,
+            mode=TilingMode.VOLUME,
+            num_tiles_u=4,
+            num_tiles_v=3,
+            num_layers=3,
+            layer_spacing_mm=0.3,
+            refine_edge_length_mm=0.5,
+        )
+        result, stats = tile_scaffold_onto_surface(box_scaffold, params)
+        assert stats["layer_combine"] == "union"
+        assert result.status() == m3d.Error.NoError
+
+    def test_layers_beyond_torus_reach_are_unioned(self, box_scaffold):
+        """Inward offsets past the tube radius fold through the torus centreline."""
+        params = TilingParams(
+            target_shape=TargetShape.TORUS,
+            major_radius=15.0,
+            minor_radius=2.0,
+            mode=TilingMode.VOLUME,
+            num_tiles_u=6,
+            num_tiles_v=3,
+            num_layers=4,
+            layer_spacing_mm=1.5,
+            refine_edge_length_mm=0.5,
+        )
+        _, stats = tile_scaffold_onto_surface(box_scaffold, params)
+        assert stats["layer_combine"] == "union"
+
 
 class TestSTLExport:
     def test_stl_export_produces_valid_binary(self, box_scaffold):
@@ -0,0 +1,373 @@
+"""
+Tests for TPMS surface extraction.
+
+Covers the slab-parallel marching cubes mesher, periodic unit-cell
+replication, adaptive octree extraction, field measurements, the
+implicit-surface engine and the generators built on top.
+"""
+
+import pytest
+import numpy as np
+import manifold3d as m3d
+from skimage.measure import marching_cubes
+
+from app.geometry.lattice.adaptive_marching import adaptive_marching_cubes
+from app.geometry.lattice.field_metrics import measure_field
+from app.geometry.lattice.gyroid import generate_gyroid_from_dict, gyroid_function
+from app.geometry.lattice.schwarz_p import generate_schwarz_p_from_dict
+from app.geometry.lattice.periodic_cell import periodic_marching_cubes
+from app.geometry.lattice.slab_marching import plan_slabs, slab_marching_cubes
+from app.geometry.tiling import TargetShape, TilingParams, tile_scaffold_onto_surface
+from app.geometry.lattice.tpms import (
+    build_tpms_solid,
+    estimate_solid_size,
+    extract_tpms_surface,
+    generate_tpms_from_dict,
+    get_tpms_cell_cache,
+    get_tpms_surface,
+    list_tpms_surfaces,
+    tpms_field,
+)
+from app.geometry.memory_budget import MemoryBudgetExceeded, memory_budget
+
+
+def _gyroid(X, Y, Z):
+    return gyroid_function(X, Y, Z, 1.5)
+
+
+def _surface_area(verts, faces):
+    a = verts[faces[:, 1]] - verts[faces[:, 0]]
+    b = verts[faces[:, 2]] - verts[faces[:, 0]]
+    return np.linalg.norm(np.cross(a, b), axis=1).sum() / 2
+
+
+def _boundary_edge_count(faces):
+    edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    return int((counts == 1).sum())
+
+
+@pytest.fixture
+def grid():
+    return np.linspace(0, 3, 40), np.linspace(0, 3, 36), np.linspace(0, 3, 45)
+
+
+class TestSlabMarchingCubes:
+    def test_slabs_share_boundary_planes(self):
+        slabs = plan_slabs(10, 10, 50, slab_bytes=10 * 10 * 4 * 8)
+        assert slabs[0][0] == 0
+        assert slabs[-1][1] == 49
+        for (_, stop), (start, _) in zip(slabs, slabs[1:]):
+            assert stop == start
+
+    def test_matches_single_pass(self, grid):
+        x, y, z = grid
+        X, Y, Z = np.meshgrid(x, y, z, indexing="ij")
+        spacing = (x[1] - x[0], y[1] - y[0], z[1] - z[0])
+        ref_verts, ref_faces, _, _ = marching_cubes(_gyroid(X, Y, Z), level=0.2, spacing=spacing)
+
+        verts, faces = slab_marching_cubes(
+            _gyroid, x, y, z, level=0.2, slab_bytes=40 * 36 * 4 * 6, max_workers=3
+        )
+
+        assert len(faces) == len(ref_faces)
+        assert len(verts) == len(ref_verts)
+        assert _surface_area(verts, faces) == pytest.approx(_surface_area(ref_verts, ref_faces))
+
+    def test_seams_are_welded(self, grid):
+        x, y, z = grid
+        _, ref_faces = slab_marching_cubes(_gyroid, x, y, z, level=0.2)
+        _, faces = slab_marching_cubes(_gyroid, x, y, z, level=0.2, slab_bytes=40 * 36 * 4 * 4)
+
+        # Slab seams add no open edges beyond the bounding-box boundary
+        assert _boundary_edge_count(faces) == _boundary_edge_count(ref_faces)
+
+    def test_level_outside_field_is_empty(self, grid):
+        x, y, z = grid
+        verts, faces = slab_marching_cubes(_gyroid, x, y, z, level=5.0)
+        assert len(verts) == 0
+        assert len(faces) == 0
+
+
+class TestPeriodicCell:
+    @pytest.mark.parametrize("extent", [(3.0, 3.0, 3.0), (2.4, 3.3, 1.2)])
+    def test_matches_full_box_extraction(self, extent):
+        period, cubes = 1.5, 12
+        spacing = period / cubes
+        x, y, z = [np.arange(round(size / spacing) + 1) * spacing for size in extent]
+        ref_verts, ref_faces = slab_marching_cubes(_gyroid, x, y, z, level=0.2)
+
+        verts, faces = periodic_marching_cubes(_gyroid, period, cubes, extent, level=0.2)
+
+        assert len(faces) == len(ref_faces)
+        assert len(verts) == len(ref_verts)
+        assert _boundary_edge_count(faces) == _boundary_edge_count(ref_faces)
+        assert _surface_area(verts, faces) == pytest.approx(_surface_area(ref_verts, ref_faces))
+
+    def test_bounds_snap_to_extent(self):
+        verts, _ = periodic_marching_cubes(_gyroid, 1.5, 12, (4.0, 2.0, 3.0), level=0.0)
+        assert verts.max(axis=0) == pytest.approx([4.0, 2.0, 3.0], abs=1.5 / 12)
+
+
+def _inner_boundary_edge_count(verts, faces, extent):
+    """Open edges that do not lie on the bounding box (i.e. cracks)."""
+    edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+    unique, counts = np.unique(edges, axis=0, return_counts=True)
+    open_edges = unique[counts == 1]
+    on_box = np.isclose(verts, 0, atol=1e-6) | np.isclose(verts, extent, atol=1e-6)
+    return int((~(on_box[open_edges[:, 0]] & on_box[open_edges[:, 1]]).any(axis=1)).sum())
+
+
+class TestAdaptiveMarchingCubes:
+    def test_mixed_levels_are_crack_free(self):
+        x = np.linspace(0, 4, 81)
+        field = tpms_field("schwarz_p", 2.0)
+        ref_verts, ref_faces = slab_marching_cubes(field, x, x, x, level=0.0)
+
+        verts, faces, stats = adaptive_marching_cubes(field, x, x, x, level=0.0, block_cubes=8)
+
+        assert stats.blocks_coarse > 0 and stats.blocks_fine > 0
+        assert stats.t_junctions_resolved > 0
+        assert _inner_boundary_edge_count(verts, faces, 4.0) == 0
+        assert stats.samples < stats.dense_samples
+        assert _surface_area(verts, faces) == pytest.approx(_surface_area(ref_verts, ref_faces), rel=0.01)
+
+    def test_gently_curved_surface_uses_fewer_triangles(self):
+        x = np.linspace(0, 4, 81)
+        field = tpms_field("gyroid", 2.0)
+        ref_verts, ref_faces = slab_marching_cubes(field, x, x, x, level=0.0)
+
+        verts, faces, stats = adaptive_marching_cubes(field, x, x, x, level=0.0)
+
+        assert len(faces) < len(ref_faces) / 2
+        assert stats.samples < stats.dense_samples / 2
+        assert _surface_area(verts, faces) == pytest.approx(_surface_area(ref_verts, ref_faces), rel=0.01)
+
+    def test_blocks_away_from_surface_are_culled(self):
+        def sphere(X, Y, Z):
+            return np.sqrt((X - 2) ** 2 + (Y - 2) ** 2 + (Z - 2) ** 2) - 1
+
+        x = np.linspace(0, 4, 65)
+        verts, faces, stats = adaptive_marching_cubes(sphere, x, x, x, level=0.0, block_cubes=8)
+
+        assert stats.blocks_culled > 0
+        assert stats.samples < stats.dense_samples / 4
+        assert _boundary_edge_count(faces) == 0
+        assert _surface_area(verts, faces) == pytest.approx(4 * np.pi, rel=0.01)
+
+    def test_zero_tolerance_matches_dense(self, grid):
+        x = np.linspace(0, 3, 41)
+        ref_verts, ref_faces = slab_marching_cubes(_gyroid, x, x, x, level=0.2)
+
+        verts, faces, stats = adaptive_marching_cubes(_gyroid, x, x, x, level=0.2, tolerance=0.0)
+
+        assert stats.blocks_coarse == 0
+        assert _boundary_edge_count(faces) == _boundary_edge_count(ref_faces)
+        assert _surface_area(verts, faces) == pytest.approx(_surface_area(ref_verts, ref_faces), rel=1e-3)
+
+    def test_odd_block_size_is_value_error(self, grid):
+        with pytest.raises(ValueError, match="even"):
+            adaptive_marching_cubes(_gyroid, *grid, block_cubes=5)
+
+
+class TestTPMSGenerators:
+    def test_gyroid_generates(self):
+        _, stats = generate_gyroid_from_dict({"bounding_box_mm": [3, 3, 3], "samples_per_cell": 10})
+        assert stats["triangle_count"] > 0
+        assert stats["periodic_cell_tiling"]
+
+    def test_adaptive_extraction_reports_stats(self):
+        _, stats = generate_gyroid_from_dict({
+            "bounding_box_mm": [3, 3, 3], "samples_per_cell": 40, "adaptive_extraction": True,
+        })
+        assert stats["triangle_count"] > 0
+        assert not stats["periodic_cell_tiling"]
+        assert stats["adaptive_extraction"]["samples"] < stats["adaptive_extraction"]["dense_samples"]
+
+    def test_schwarz_p_gradient_generates(self):
+        _, stats = generate_schwarz_p_from_dict(
+            {"bounding_box_mm": [3, 3, 3], "samples_per_cell": 10, "enable_gradient": True}
+        )
+        assert stats["triangle_count"] > 0
+        assert not stats["periodic_cell_tiling"]
+
+
+class TestTPMSEngine:
+    def test_registry_lists_surfaces(self):
+        assert {"gyroid", "schwarz_p", "diamond", "iwp", "neovius"} <= set(list_tpms_surfaces())
+
+    def test_unknown_surface_lists_available(self):
+        with pytest.raises(KeyError, match="diamond"):
+            get_tpms_surface("not_a_surface")
+
+    @pytest.mark.parametrize("name", ["gyroid", "schwarz_p", "diamond", "iwp", "neovius"])
+    def test_fields_are_periodic(self, name):
+        field = tpms_field(name, 2.0)
+        t = np.linspace(0, 2.0, 7)
+        X, Y, Z = t[:, None, None], t[None, :, None], t[None, None, :]
+        assert np.allclose(field(X, Y, Z), field(X + 2.0, Y, Z - 2.0))
+
+    @pytest.mark.parametrize("name", ["diamond", "iwp", "neovius"])
+    def test_new_surfaces_generate(self, name):
+        _, stats = generate_tpms_from_dict(
+            {"surface_type": name, "bounding_box_mm": [4, 4, 4], "samples_per_cell": 10}
+        )
+        assert stats["triangle_count"] > 0
+        assert stats["periodic_cell_tiling"]
+
+    def test_gradient_uses_slab_path(self):
+        _, stats = generate_tpms_from_dict({
+            "surface_type": "diamond", "bounding_box_mm": [4, 4, 4],
+            "samples_per_cell": 10, "enable_gradient": True,
+        })
+        assert stats["triangle_count"] > 0
+        assert not stats["periodic_cell_tiling"]
+
+    def test_unknown_surface_type_is_value_error(self):
+        with pytest.raises(ValueError, match="Unknown TPMS surface"):
+            generate_tpms_from_dict({"surface_type": "not_a_surface"})
+
+    def test_cell_field_reused_across_isovalues(self):
+        get_tpms_cell_cache().clear()
+        _, faces_a, info_a = extract_tpms_surface("neovius", 1.7, (3, 3, 3), 12, level=0.0)
+        _, faces_b, info_b = extract_tpms_surface("neovius", 1.7, (5, 3, 3), 12, level=0.5)
+        assert not info_a["cell_field_cached"]
+        assert info_b["cell_field_cached"]
+        assert len(faces_a) > 0 and len(faces_b) > 0
+
+    def test_non_integer_k_param_is_not_tiled(self):
+        _, _, info = extract_tpms_surface("schwarz_p", 2.0, (4, 4, 4), 10, k_param=1.5)
+        assert not info["periodic_cell_tiling"]
+
+
+class TestFieldMetrics:
+    # Surface area per unit cell volume of the gyroid and Schwarz P at level 0
+    GYROID_AREA = 3.0919
+    SCHWARZ_P_AREA = 2.3451
+
+    def test_gyroid_matches_reference(self):
+        _, _, info = extract_tpms_surface("gyroid", 1.0, (2, 2, 2), 20)
+        metrics = info["field_metrics"]
+        assert metrics["porosity"] == pytest.approx(0.5, abs=1e-3)
+        assert metrics["surface_area_density_per_mm"] == pytest.approx(self.GYROID_AREA, rel=0.01)
+        # Plate model: 2 * solid volume / area
+        assert metrics["wall_thickness_mm"] == pytest.approx(1.0 / self.GYROID_AREA, rel=0.01)
+
+    def test_slab_and_periodic_paths_agree(self):
+        _, _, tiled = extract_tpms_surface("schwarz_p", 1.0, (2, 2, 2), 20)
+        _, _, slabs = extract_tpms_surface("schwarz_p", 1.0, (2, 2, 2), 20, allow_periodic=False)
+        assert tiled["periodic_cell_tiling"] and not slabs["periodic_cell_tiling"]
+        for info in (tiled, slabs):
+            metrics = info["field_metrics"]
+            assert metrics["porosity"] == pytest.approx(0.5, abs=1e-3)
+            assert metrics["surface_area_density_per_mm"] == pytest.approx(self.SCHWARZ_P_AREA, rel=0.02)
+
+    @pytest.mark.parametrize("level", [-0.8, 0.5, 1.0])
+    def test_porosity_tracks_isovalue(self, level):
+        _, _, info = extract_tpms_surface("gyroid", 1.5, (3, 3, 3), 20, level=level)
+        t = (np.arange(150) + 0.5) * (1.5 / 150)
+        dense = gyroid_function(t[:, None, None], t[None, :, None], t[None, None, :], 1.5)
+        assert info["field_metrics"]["porosity"] == pytest.approx((dense > level).mean(), abs=0.005)
+
+    def test_slabs_add_up_to_whole_grid(self, grid):
+        whole = measure_field(_gyroid, *grid)
+        split = measure_field(_gyroid, *grid, slab_bytes=40 * 36 * 4 * 5)
+        assert split.volume_mm3 == pytest.approx(27.0)
+        # Gradients are one-sided on slab seams, so the split differs slightly
+        assert split.porosity == pytest.approx(whole.porosity, rel=1e-3)
+        assert split.surface_area_mm2 == pytest.approx(whole.surface_area_mm2, rel=1e-3)
+
+    def test_gradient_porosity_is_measured(self):
+        _, stats = generate_gyroid_from_dict({
+            "bounding_box_mm": [4, 4, 4], "samples_per_cell": 20, "enable_gradient": True,
+            "gradient_start_porosity": 0.4, "gradient_end_porosity": 0.7,
+        })
+        assert 0.45 < stats["porosity"] < 0.65
+        assert stats["field_metrics"]["pore_chord_mm"]["max"] > stats["field_metrics"]["pore_chord_mm"]["min"]
+
+    def test_adaptive_extraction_is_measured(self):
+        _, _, info = extract_tpms_surface("gyroid", 1.0, (2, 2, 2), 20, adaptive=True)
+        assert info["field_metrics"]["porosity"] == pytest.approx(0.5, abs=1e-3)
+
+    def test_solid_porosity_comes_from_volume(self):
+        _, stats = generate_gyroid_from_dict({
+            "bounding_box_mm": [3, 3, 3], "samples_per_cell": 12, "solid_mode": "network",
+        })
+        assert stats["porosity"] == pytest.approx(1 - stats["volume_mm3"] / 27.0)
+        assert stats["surface_area_density_per_mm"] > 0
+        assert stats["field_metrics"] is None
+
+
+class TestTPMSSolids:
+    @pytest.mark.parametrize("name", ["gyroid", "schwarz_p", "diamond", "iwp", "neovius"])
+    @pytest.mark.parametrize("mode", ["sheet", "network"])
+    def test_solids_are_watertight_and_fill_box(self, name, mode):
+        solid = build_tpms_solid(name, 2.0, (4, 4, 3), 12, mode=mode, thickness_mm=0.3)
+        assert isinstance(solid, m3d.Manifold)
+        assert solid.status() == m3d.Error.NoError
+        assert 0 < solid.volume() < 4 * 4 * 3
+        assert solid.bounding_box() == pytest.approx((0, 0, 0, 4, 4, 3), abs=1e-4)
+
+    def test_network_is_half_the_box_at_zero_isovalue(self):
+        solid = build_tpms_solid("gyroid", 2.0, (4, 4, 4), 16, mode="network")
+        assert solid.volume() / 64 == pytest.approx(0.5, abs=0.02)
+
+    def test_sheet_volume_grows_with_thickness(self):
+        thin = build_tpms_solid("gyroid", 2.0, (4, 4, 4), 16, mode="sheet", thickness_mm=0.1)
+        thick = build_tpms_solid("gyroid", 2.0, (4, 4, 4), 16, mode="sheet", thickness_mm=0.2)
+        # Wall volume ~ surface area x thickness (gyroid: ~3.09 / L per unit volume)
+        assert thin.volume() == pytest.approx(64 * 3.09 / 2.0 * 0.1, rel=0.05)
+        assert thick.volume() == pytest.approx(2 * thin.volume(), rel=0.05)
+
+    def test_adaptive_solid_is_watertight(self):
+        solid = build_tpms_solid("gyroid", 2.0, (4, 4, 3), 16, mode="network", adaptive=True)
+        dense = build_tpms_solid("gyroid", 2.0, (4, 4, 3), 16, mode="network")
+        assert solid.status() == m3d.Error.NoError
+        assert solid.volume() == pytest.approx(dense.volume(), rel=0.02)
+
+    def test_unknown_mode_is_value_error(self):
+        with pytest.raises(ValueError, match="solid mode"):
+            build_tpms_solid("gyroid", 2.0, (4, 4, 4), 12, mode="hollow")
+
+    def test_triangle_estimate(self):
+        solid = build_tpms_solid("diamond", 2.0, (4, 4, 3), 16, mode="sheet", thickness_mm=0.3)
+        _, triangles = estimate_solid_size(2.0, (4, 4, 3), [32, 32, 24], "sheet")
+        assert solid.num_tri() == pytest.approx(triangles, rel=0.5)
+
+    def test_thin_wall_is_rejected_before_sampling(self):
+        # A 1 um wall would need ~4000 cubes per cell
+        with pytest.raises(ValueError, match="wall thickness"):
+            build_tpms_solid("gyroid", 2.0, (20, 20, 20), 20, mode="sheet", thickness_mm=0.001)
+
+    def test_solid_over_memory_budget(self):
+        with memory_budget(1):
+            with pytest.raises(MemoryBudgetExceeded, match="TPMS sheet solid"):
+                build_tpms_solid("gyroid", 2.0, (4, 4, 4), 16, mode="sheet", thickness_mm=0.3)
+
+    def test_gyroid_solid_can_be_inverted_and_tiled(self):
+        solid, stats = generate_gyroid_from_dict({
+            "bounding_box_mm": [3, 3, 1.5], "unit_cell_size_mm": 1.5,
+            "samples_per_cell": 10, "solid_mode": "sheet",
+        })
+        assert isinstance(solid, m3d.Manifold)
+        assert stats["volume_mm3"] == pytest.approx(solid.volume())
+        assert 0 < stats["porosity"] < 1
+
+        inverted = m3d.Manifold.cube([3, 3, 1.5]) - solid
+        assert inverted.volume() == pytest.approx(3 * 3 * 1.5 - solid.volume(), rel=1e-3)
+
+        _, tiling_stats = tile_scaffold_onto_surface(
+            solid,
+            TilingParams(target_shape=TargetShape.SPHERE, radius=10.0,
+                         num_tiles_u=2, num_tiles_v=2, refine_edge_length_mm=1.0),
+        )
+        assert tiling_stats["volume_mm3"] > 0
+
+    def test_schwarz_p_gradient_network(self):
+        solid, stats = generate_schwarz_p_from_dict({
+            "bounding_box_mm": [3, 3, 3], "samples_per_cell": 10,
+            "enable_gradient": True, "solid_mode": "network",
+        })
+        assert isinstance(solid, m3d.Manifold)
+        assert stats["solid_mode"] == "network"
+        assert stats["volume_mm3"] > 0
@@ -0,0 +1,307 @@
+"""
+Tests for vascular network generation.
+
+Verifies the perfusion dish's spatial grid broad phase and collision
+queries against brute-force references, and the level-by-level branch
+skeletons of the vascular and perfusable networks.
+"""
+
+import sys
+import os
+import pytest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.geometry.vascular import VascularParams, build_vascular_skeleton
+from app.geometry.vascular_perfusion_dish import SpatialGrid, BranchTracker
+from app.geometry.microfluidic.perfusable_network import (
+    PerfusableNetworkParams,
+    VesselStats,
+    build_vessel_skeleton,
+    generate_perfusable_network,
+)
+
+
+def _random_segments(rng, n, extent=5.0, length=0.6):
+    starts = rng.uniform(-extent, extent, size=(n, 3))
+    ends = starts + rng.normal(scale=length, size=(n, 3))
+    radii = rng.uniform(0.05, 0.3, size=n)
+    return starts, ends, radii
+
+
+def _sampled_distances(a0, a1, b0, b1, samples=64):
+    """Upper bound on segment-segment distance from dense point samples."""
+    t = np.linspace(0, 1, samples)[:, None]
+    pa = a0 + t * (a1 - a0)
+    pb = b0 + t * (b1 - b0)
+    return np.linalg.norm(pa[:, None] - pb[None, :], axis=2).min()
+
+
+class TestSpatialGrid:
+    """Tests for the sorted-key uniform grid."""
+
+    def test_query_finds_every_touching_segment(self):
+        rng = np.random.default_rng(0)
+        starts, ends, radii = _random_segments(rng, 300)
+        grid = SpatialGrid(cell_size=0.5)
+        grid.insert(np.arange(300), starts, ends, radii)
+
+        q_starts, q_ends, q_radii = _random_segments(rng, 40)
+        query_idx, branch_idx = grid.query(q_starts, q_ends, q_radii)
+        found = set(zip(query_idx.tolist(), branch_idx.tolist()))
+
+        for q in range(40):
+            for b in range(300):
+                d = _sampled_distances(q_starts[q], q_ends[q], starts[b], ends[b])
+                if d < q_radii[q] + radii[b]:
+                    assert (q, b) in found
+
+    def test_query_pairs_are_unique_and_sorted(self):
+        rng = np.random.default_rng(1)
+        starts, ends, radii = _random_segments(rng, 100, extent=1.0)
+        grid = SpatialGrid()
+        grid.insert(np.arange(100), starts, ends, radii)
+
+        query_idx, branch_idx = grid.query(starts[:10], ends[:10], 0.2)
+        pairs = np.stack([query_idx, branch_idx], axis=1)
+        assert len(np.unique(pairs, axis=0)) == len(pairs)
+        assert np.all(np.diff(query_idx * 1000 + branch_idx) > 0)
+        # Every segment is near itself
+        assert set(range(10)) <= set(query_idx[query_idx == branch_idx].tolist())
+
+    def test_pending_and_merged_entries_agree(self):
+        rng = np.random.default_rng(2)
+        starts, ends, radii = _random_segments(rng, 500)
+
+        batched = SpatialGrid()
+        batched.insert(np.arange(500), starts, ends, radii)
+        single = SpatialGrid()
+        for i in range(500):
+            single.add_branch(i, starts[i], ends[i], radii[i])
+
+        q_starts, q_ends, _ = _random_segments(rng, 20)
+        for a, b in zip(batched.query(q_starts, q_ends, 0.3), single.query(q_starts, q_ends, 0.3)):
+            np.testing.assert_array_equal(a, b)
+
+    def test_set_cell_size_keeps_branches(self):
+        rng = np.random.default_rng(3)
+        starts, ends, radii = _random_segments(rng, 50)
+        grid = SpatialGrid(cell_size=0.5)
+        grid.insert(np.arange(50), starts, ends, radii)
+        before = set(grid.get_nearby_indices(starts[0], ends[0], 1.0).tolist())
+
+        grid.set_cell_size(0.4)
+        assert grid.cell_size == pytest.approx(1.0)
+        after = set(grid.get_nearby_indices(starts[0], ends[0], 1.0).tolist())
+        # Coarser cells only add candidates
+        assert before <= after
+
+    def test_empty_grid(self):
+        grid = SpatialGrid()
+        assert len(grid.get_nearby_indices(np.zeros(3), np.ones(3), 0.5)) == 0
+
+
+class TestBranchTracker:
+    """Tests for branch storage and collision checks."""
+
+    def test_curved_branch_adds_segments(self):
+        tracker = BranchTracker(max_branches=2)
+        points = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, -1.0), (3.0, 0.0, -1.0)]
+        tracker.add_curved_branch(points, 0.2)
+
+        assert tracker.branch_count == 3
+        np.testing.assert_allclose(tracker._starts[:3], points[:-1])
+        np.testing.assert_allclose(tracker._ends[:3], points[1:])
+
+    def test_collision_ignores_parent(self):
+        tracker = BranchTracker()
+        tracker.add_branch(np.array([0.0, 0.0, 0.0]), np.array([1.0, 0.0, 0.0]), 0.2)
+
+        # Child starting at the parent's end does not collide with it
+        assert not tracker.check_collision(
+            np.array([1.0, 0.0, 0.0]), np.array([1.0, 1.0, 0.0]), 0.2, 0.05
+        )
+        # A crossing segment does
+        assert tracker.check_collision(
+            np.array([0.5, -1.0, 0.0]), np.array([0.5, 1.0, 0.0]), 0.2, 0.05
+        )
+        # A distant one does not
+        assert not tracker.check_collision(
+            np.array([0.5, 3.0, 0.0]), np.array([0.5, 4.0, 0.0]), 0.2, 0.05
+        )
+
+    def test_segment_distances_match_dense_sampling(self):
+        rng = np.random.default_rng(4)
+        p1, q1, _ = _random_segments(rng, 200, extent=1.0)
+        p2, q2, _ = _random_segments(rng, 200, extent=1.0)
+        # Include parallel, collinear and degenerate pairs
+        p2[:20], q2[:20] = p1[:20] + 0.3, q1[:20] + 0.3
+        p2[20:30], q2[20:30] = p1[20:30], p1[20:30]
+        q1[30:40] = p1[30:40]
+
+        exact = BranchTracker._segment_distances(p1, q1, p2, q2)
+        sampled = np.array([
+            _sampled_distances(p1[i], q1[i], p2[i], q2[i], samples=400) for i in range(200)
+        ])
+        assert np.all(exact <= sampled + 1e-9)
+        np.testing.assert_allclose(exact, sampled, atol=0.02)
+
+    def test_crossing_segments_collide(self):
+        tracker = BranchTracker()
+        tracker.add_branch(np.array([-1.0, -1.0, 0.0]), np.array([1.0, 1.0, 0.0]), 0.05)
+
+        # Crosses the branch between any fixed sample points
+        start, end = np.array([-0.9, 1.1, 0.0]), np.array([1.1, -0.9, 0.0])
+        assert BranchTracker._segment_distances(
+            start[None], end[None], tracker._starts[:1], tracker._ends[:1]
+        )[0] == pytest.approx(0.0, abs=1e-6)
+        assert tracker.check_collision(start, end, 0.05, 0.0)
+
+    def test_batch_queries_match_single_queries(self):
+        rng = np.random.default_rng(5)
+        tracker = BranchTracker()
+        starts, ends, _ = _random_segments(rng, 200, extent=2.0)
+        for s, e in zip(starts, ends):
+            tracker.add_branch(s, e, 0.1)
+
+        q_starts, q_ends, _ = _random_segments(rng, 50, extent=2.0)
+        batch = tracker.check_collision(q_starts, q_ends, 0.1, 0.05)
+        single = [tracker.check_collision(s, e, 0.1, 0.05) for s, e in zip(q_starts, q_ends)]
+        assert batch.tolist() == single
+
+        origin = np.zeros(3)
+        curved = tracker.check_curved_collision(origin, q_ends, 0.1, 0.05, 0.5)
+        single = [tracker.check_curved_collision(origin, e, 0.1, 0.05, 0.5) for e in q_ends]
+        assert curved.tolist() == single
+        assert not tracker.check_curved_collision(origin, origin + 0.01, 0.1, 0.05, 0.5)
+
+    def test_find_safe_position_prefers_smallest_free_offset(self):
+        rng = np.random.default_rng(6)
+        tracker = BranchTracker()
+        starts, ends, _ = _random_segments(rng, 300, extent=2.0)
+        for s, e in zip(starts, ends):
+            tracker.add_branch(s, e, 0.1)
+
+        step = 2 * np.pi / 16
+        sequence = [0.0] + [((i + 2) // 2) * step * (1 if i % 2 == 0 else -1) for i in range(16)]
+        for _ in range(20):
+            start = rng.uniform(-2, 2, size=3).astype(np.float32)
+            base_end = (start + np.array([1.0, 0.0, -0.5])).astype(np.float32)
+            end, offset = tracker.find_safe_position(
+                start, base_end, 0.1, np.random.default_rng(0), 0.05, 0.5
+            )
+
+            # The first free candidate in the sequential search order
+            expected = None
+            for candidate in sequence:
+                angle = candidate
+                trial = np.array([start[0] + np.cos(angle), start[1] + np.sin(angle), base_end[2]],
+                                 dtype=np.float32)
+                if not tracker.check_curved_collision(start, trial, 0.1, 0.05, 0.5):
+                    expected = candidate
+                    break
+            if expected is None:
+                assert offset == 0.0 or not tracker.check_curved_collision(start, end, 0.1, 0.05, 0.5)
+            else:
+                assert offset == pytest.approx(expected)
+                assert not tracker.check_curved_collision(start, end, 0.1, 0.05, 0.5)
+
+    def test_find_safe_position_draws_random_angles_only_when_needed(self):
+        tracker = BranchTracker()
+        rng = np.random.default_rng(7)
+        state = rng.bit_generator.state
+        end, offset = tracker.find_safe_position(
+            np.zeros(3), np.array([1.0, 0.0, -1.0]), 0.1, rng, 0.05, 0.5
+        )
+        assert offset == 0.0
+        np.testing.assert_allclose(end, [1.0, 0.0, -1.0])
+        assert rng.bit_generator.state == state
+
+
+class TestVascularSkeleton:
+    """Tests for the level-by-level vascular network skeleton."""
+
+    def test_deterministic_tree_sizes_and_radii(self):
+        params = VascularParams(inlets=4, levels=2, splits=3, deterministic=True)
+        inlets = [(1.0, 1.0), (-1.0, 1.0), (-1.0, -1.0), (1.0, -1.0)]
+        skeleton = build_vascular_skeleton(
+            inlets, np.zeros(4), params, net_r=4.4, net_bot=0.06, rng=np.random.default_rng(0)
+        )
+        assert len(skeleton) == 4 * (1 + 3 + 9)
+        assert np.bincount(skeleton.inlet).tolist() == [13] * 4
+        assert np.bincount(skeleton.remaining).tolist() == [36, 12, 4]
+        assert np.all(skeleton.junction == (skeleton.remaining > 0))
+        np.testing.assert_allclose(skeleton.child_radius, skeleton.radius * params.ratio)
+
+        # Children start where their parent ends, with its child radius
+        parents, children = skeleton.remaining == 2, skeleton.remaining == 1
+        assert {tuple(p) for p in np.round(skeleton.start[children], 9)} == \
+            {tuple(p) for p in np.round(skeleton.end[parents], 9)}
+        np.testing.assert_allclose(
+            np.sort(skeleton.radius[children]),
+            np.sort(np.repeat(skeleton.child_radius[parents], 3))
+        )
+
+    def test_branches_descend_and_stay_inside(self):
+        params = VascularParams(inlets=9, levels=4, splits=3, spread=0.8, seed=3)
+        rng = np.random.default_rng(params.seed)
+        inlets = [(x, y) for x in (-2.0, 0.0, 2.0) for y in (-2.0, 0.0, 2.0)]
+        skeleton = build_vascular_skeleton(
+            inlets, rng.uniform(0, 2 * np.pi, 9), params, net_r=4.4, net_bot=0.06, rng=rng
+        )
+        assert np.all(skeleton.end[:, 2] <= skeleton.start[:, 2])
+        assert np.all(skeleton.end[:, 2] >= 0.06 + 0.02 - 1e-9)
+        assert np.all(np.hypot(skeleton.end[:, 0], skeleton.end[:, 1]) <= 4.4 - 0.1 + 1e-9)
+
+
+class TestPerfusableSkeleton:
+    """Tests for the level-by-level perfusable network skeleton."""
+
+    def test_bifurcating_tree_follows_murrays_law(self):
+        params = PerfusableNetworkParams(num_branching_generations=4)
+        endpoints, stats = [], VesselStats()
+        skeleton = build_vessel_skeleton(
+            np.array([[0.0, 0.0, 5.0]]), np.array([[0.0, 0.0, -1.0]]), np.array([2.5]),
+            np.array([0]), 4, params, params.bounding_box_mm, endpoints, stats,
+            np.random.default_rng(0)
+        )
+        assert len(skeleton) == 1 + 2 + 4 + 8
+        assert len(endpoints) == 8
+        assert stats.artery_count == 15
+        np.testing.assert_allclose(
+            skeleton.end_radius, skeleton.start_radius / params.murrays_law_ratio
+        )
+        assert np.all(np.abs(skeleton.end) <= 5.0 + 1e-9)
+
+    def test_wide_levels_split_into_subtrees(self):
+        params = PerfusableNetworkParams(num_branching_generations=6)
+        skeleton = build_vessel_skeleton(
+            np.array([[0.0, 0.0, 5.0]]), np.array([[0.0, 0.0, -1.0]]), np.array([2.5]),
+            np.array([0]), 6, params, params.bounding_box_mm, [], VesselStats(),
+            np.random.default_rng(0)
+        )
+        # Generations 0-3 stay with the root; each of the 16 generation-4
+        # branches roots a subtree with its 2 children
+        sizes = np.bincount(skeleton.subtree)
+        assert sizes[0] == 15
+        assert sorted(sizes[sizes > 0][1:].tolist()) == [3] * 16
+
+    def test_multiple_roots_grow_together(self):
+        params = PerfusableNetworkParams(num_branching_generations=5)
+        endpoints = []
+        skeleton = build_vessel_skeleton(
+            np.zeros((3, 3)), np.tile([1.0, 0.0, 0.0], (3, 1)), np.full(3, 1.0),
+            np.array([2, 3, 4]), 5, params, params.bounding_box_mm, endpoints, VesselStats(),
+            np.random.default_rng(1)
+        )
+        # 3 generations from gen 2, 2 from gen 3, 1 from gen 4
+        assert len(skeleton) == 7 + 3 + 1
+        assert len(endpoints) == 4 + 2 + 1
+
+    def test_segment_count_counts_skeleton_segments(self):
+        params = PerfusableNetworkParams(num_branching_generations=4, resolution=8)
+        _, stats = generate_perfusable_network(params)
+        # Inlet sphere plus the 1 + 2 + 4 + 8 branches, built as one subtree
+        assert stats['segment_count'] == 1 + 15
+        assert stats['subtree_union_count'] == 1
@@ -175,6 +175,7 @@ export const VORONOI_META: Record<string, ParamMeta> = {
   target_pore_radius_mm: { type: 'number', label: 'Target Pore Radius', min: 0.2, max: 1.2, step: 0.05, unit: 'mm', description: '0.3-0.9mm for bone scaffolds' },
   target_porosity: { type: 'number', label: 'Target Porosity', min: 0.5, max: 0.9, step: 0.02, description: '0.6-0.8 for trabecular-like' },
   seed_count: { type: 'number', label: 'Seed Count', min: 10, max: 200, step: 10, description: 'Number of Voronoi seed points' },
+  all_ridge_edges: { type: 'boolean', label: 'All Ridge Edges', description: 'Strut along every Voronoi cell edge; without a seed count, cells are sized for the target porosity', advanced: true },
   // === Strut Properties ===
   strut_diameter_mm: { type: 'number', label: 'Strut Diameter', min: 0.1, max: 0.8, step: 0.05, unit: 'mm', description: '0.2-0.5mm for bone scaffolds' },
   strut_taper: { type: 'number', label: 'Strut Taper', min: 0, max: 0.3, step: 0.05, description: 'Taper ratio from center to joints', advanced: true },
@@ -184,6 +185,8 @@ export const VORONOI_META: Record<string, ParamMeta> = {
   random_coefficient: { type: 'number', label: 'Random Coefficient', min: 0, max: 1, step: 0.1, description: 'Overall randomness (0=regular, 1=random)', advanced: true },
   irregularity: { type: 'number', label: 'Irregularity', min: 0, max: 1, step: 0.1, description: 'Shape irregularity factor', advanced: true },
   seed: { type: 'number', label: 'Random Seed', min: 0, max: 9999, step: 1, description: 'Seed for reproducibility' },
+  seed_distribution: { type: 'enum', label: 'Seed Distribution', options: [{ value: 'uniform', label: 'Uniform' }, { value: 'poisson', label: 'Poisson Disk' }], description: 'Random seeds, or seeds with a minimum spacing for even cell sizes', advanced: true },
+  lloyd_iterations: { type: 'number', label: 'Lloyd Iterations', min: 0, max: 10, step: 1, description: 'Relaxation steps that even out cell sizes', advanced: true },
   // === Gradient Features ===
   enable_gradient: { type: 'boolean', label: 'Enable Gradient', description: 'Enable density gradient', advanced: true },
   gradient_direction: { type: 'enum', label: 'Gradient Direction', options: [{ value: 'x', label: 'X' }, { value: 'y', label: 'Y' }, { value: 'z', label: 'Z' }], description: 'Direction for gradient', advanced: true },
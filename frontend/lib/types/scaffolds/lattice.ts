@@ -186,6 +186,7 @@ export interface VoronoiParams extends BaseParams {
   target_pore_radius_mm?: number;
   target_porosity?: number;
   seed_count?: number;
+  all_ridge_edges?: boolean;
   /** @deprecated Use seed_count instead */
   cell_count?: number;
 
@@ -199,6 +200,8 @@ export interface VoronoiParams extends BaseParams {
   random_coefficient?: number;
   irregularity?: number;
   seed?: number;
+  seed_distribution?: 'uniform' | 'poisson';
+  lloyd_iterations?: number;
 
   // === Gradient Features ===
   enable_gradient?: boolean;
@@ -428,6 +431,7 @@ export const DEFAULT_VORONOI: VoronoiParams = {
   target_porosity: 0.70,
   seed_count: undefined,
   cell_count: 30,
+  all_ridge_edges: false,
 
   // === Strut Properties ===
   strut_diameter_mm: 0.3,
@@ -439,6 +443,8 @@ export const DEFAULT_VORONOI: VoronoiParams = {
   random_coefficient: 0.5,
   irregularity: 0.5,
   seed: undefined,
+  seed_distribution: 'uniform',
+  lloyd_iterations: 0,
 
   // === Gradient Features ===
   enable_gradient: false,